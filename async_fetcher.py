@@ -0,0 +1,271 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    async_fetcher.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+asyncio 版本的直播间抓取
+
+与 DouyinLiveWebFetcher 共用处理函数、分发表、解压和预扫描，只把 I/O 换成异步：
+ttwid / room_id / 直播间状态用异步 HTTP，弹幕用异步 WebSocket，心跳交给进程内共用的心跳调度器（heartbeat.py），发送在事件循环上执行。
+一个进程、一个事件循环就能挂很多直播间，不再是每个直播间两个系统线程。
+
+    import asyncio
+    from async_fetcher import AsyncDouyinLiveWebFetcher, run_many
+
+    asyncio.run(AsyncDouyinLiveWebFetcher(live_id).run())
+    asyncio.run(run_many(['123', '456'], decoder='partial'))
+
+需要额外安装：
+    pip install aiohttp
+"""
+
+import asyncio
+import time
+
+from liveMan import DouyinLiveWebFetcher, HEARTBEAT_FRAME, PAGE_CHUNK_SIZE, generateMsToken
+from room_page import RoomPageScanner
+
+
+def _aiohttp():
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("异步抓取需要 aiohttp：pip install aiohttp") from e
+    return aiohttp
+
+
+def new_session():
+    """创建 aiohttp 会话；cookie 都由请求头显式携带，不让多个直播间共用一个 cookie jar"""
+    aiohttp = _aiohttp()
+    return aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar())
+
+
+class AsyncDouyinLiveWebFetcher(DouyinLiveWebFetcher):
+    """
+    参数:
+        live_id: 直播间 web_rid
+        session: 共用的 aiohttp.ClientSession，不传则 run() 内自己创建并关闭
+        其余参数同 DouyinLiveWebFetcher；pipeline 默认关闭，消息直接在事件循环上处理
+    """
+
+    def __init__(self, live_id, session=None, **kwargs):
+        kwargs.setdefault('pipeline', False)
+        super().__init__(live_id, **kwargs)
+        self.http = session
+        self.ws = None
+        self._ttwid = None
+        self._room_id = None
+        self._loop = None
+        self._wake_async = None
+
+    @property
+    def ttwid(self):
+        return self._ttwid
+
+    @property
+    def room_id(self):
+        return self._room_id
+
+    def invalidate_credentials(self, *keys):
+        super().invalidate_credentials(*keys)
+        if not keys or 'ttwid' in keys:
+            self._ttwid = None
+        if not keys or 'room_id' in keys:
+            self._room_id = None
+
+    async def fetch_ttwid(self):
+        if self._ttwid:
+            return self._ttwid
+        self._ttwid = self._cached('ttwid')
+        if self._ttwid:
+            return self._ttwid
+        try:
+            async with self.http.get(self.live_url, headers={"User-Agent": self.user_agent}) as resp:
+                resp.raise_for_status()
+                cookie = resp.cookies.get('ttwid')
+        except Exception as err:
+            msg = f"【X】Request the live url error: {err}"
+            print(msg)
+            self._tmp_log(msg)
+            return None
+        self._ttwid = cookie.value if cookie else None
+        self._cache('ttwid', self._ttwid)
+        return self._ttwid
+
+    async def fetch_room_id(self):
+        if self._room_id:
+            return self._room_id
+        self._room_id = self._cached('room_id')
+        if self._room_id:
+            return self._room_id
+
+        ttwid = await self.fetch_ttwid()
+        headers = {
+            "User-Agent": self.user_agent,
+            "cookie": f"ttwid={ttwid}&msToken={generateMsToken()}; __ac_nonce=0123407cc00a9e438deb4",
+        }
+        scanner = RoomPageScanner()
+        try:
+            async with self.http.get(self.live_url + self.live_id, headers=headers) as resp:
+                resp.raise_for_status()
+                async for chunk in resp.content.iter_chunked(PAGE_CHUNK_SIZE):
+                    if scanner.feed(chunk):
+                        break
+                # 没读完就断开连接，不放回连接池
+                resp.close()
+        except Exception as err:
+            msg = f"【X】Request the live room url error: {err}"
+            print(msg)
+            self._tmp_log(msg)
+            return None
+
+        self._room_id = self._room_page_scanned(scanner)
+        return self._room_id
+
+    async def fetch_room_status(self):
+        msToken = generateMsToken()
+        async with self.http.get(self.host, headers=self.headers) as resp:
+            cookie = resp.cookies.get('__ac_nonce')
+        nonce = cookie.value if cookie else None
+        signature = self.get_ac_signature(nonce)
+
+        # a_bogus 是同步的 JS 计算，放到线程池里，不卡事件循环
+        url = await asyncio.get_running_loop().run_in_executor(None, self._room_status_url, msToken)
+        headers = self._room_status_headers(nonce, signature)
+
+        async with self.http.get(url, headers=headers) as resp:
+            data = (await resp.json(content_type=None)).get('data')
+        self._report_room_status(data)
+
+    async def run(self, retry_interval=None):
+        """连接并保持，断线后按 self.reconnect 的策略重连，直到 stop()"""
+        _aiohttp()
+        if retry_interval is not None:
+            self.reconnect.backoff.base = retry_interval
+        self._loop = asyncio.get_running_loop()
+        self._wake_async = asyncio.Event()
+        self._running = True
+        self._draining = False
+        self._log_closed = False
+        self._open_recorder()
+        if self.pipeline is not None:
+            self.pipeline.start()
+
+        own_session = self.http is None
+        if own_session:
+            self.http = new_session()
+        try:
+            while self._running:
+                try:
+                    await self._connect()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if not self._running:
+                        break
+                    msg = f"【X】WebSocket异常: {e}"
+                    print(msg)
+                    self._tmp_log(msg)
+                    self._check_auth_error(e)
+
+                if self._running:
+                    delay = self._disconnected()
+                    try:
+                        await asyncio.wait_for(self._wake_async.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            self._shutdown()
+            if own_session:
+                await self.http.close()
+                self.http = None
+
+    async def _connect(self):
+        aiohttp = _aiohttp()
+        room_id = await self.fetch_room_id()
+        if not room_id:
+            raise RuntimeError("获取 room_id 失败")
+
+        headers = {
+            "cookie": f"ttwid={self.ttwid}",
+            'user-agent': self.user_agent,
+        }
+        async with self.http.ws_connect(self._wss_url(room_id), headers=headers, max_msg_size=0) as ws:
+            self.ws = ws
+            self._notice("【连接】WebSocket连接成功.")
+            self.reconnect.connected()
+
+            self._start_heartbeat(lambda: self._send_heartbeat_async(ws))
+            try:
+                async for message in ws:
+                    if message.type == aiohttp.WSMsgType.BINARY:
+                        await self._on_frame(ws, message.data)
+                    elif message.type == aiohttp.WSMsgType.ERROR:
+                        self._wsOnError(ws, ws.exception())
+                        break
+            finally:
+                self._stop_heartbeat()
+                self.ws = None
+
+        try:
+            await self.fetch_room_status()
+        except Exception as e:
+            print(f"【X】获取直播间状态失败: {e}")
+        self._notice("【连接】WebSocket connection closed.")
+
+    async def _on_frame(self, ws, message):
+        received = self._frame_received()
+        if self.recorder is not None:
+            self.recorder.write(message)
+        frame = self._unpack_frame(message)
+        if frame is None:
+            return
+        package, payload, ack = frame
+        if ack is not None:
+            start = time.perf_counter()
+            await ws.send_bytes(ack)
+            self._record_ack(start, received)
+
+        if self.pipeline is not None and self.pipeline.running:
+            self.pipeline.submit((package, payload))
+        else:
+            self._process_frame((package, payload))
+
+    def _send_heartbeat_async(self, ws):
+        """在心跳调度线程上调用：把发送交给事件循环，发送失败时取消心跳"""
+        if ws.closed:
+            raise ConnectionError("WebSocket 已关闭")
+        if not self._keepalive_check(lambda: self._loop.call_soon_threadsafe(lambda: asyncio.ensure_future(ws.close()))):
+            return
+        future = asyncio.run_coroutine_threadsafe(ws.send_bytes(HEARTBEAT_FRAME), self._loop)
+        future.add_done_callback(self._heartbeat_sent)
+        self._heartbeat_sent_notice()
+
+    def _heartbeat_sent(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            self._stop_heartbeat()
+            self._heartbeatFailed(future.exception())
+
+    def _request_stop(self):
+        """可在任意线程调用；关闭连接交给事件循环"""
+        super()._request_stop()
+        if self._loop is not None and not self._loop.is_closed() and self._wake_async is not None:
+            self._loop.call_soon_threadsafe(self._wake_async.set)
+
+    def _close_ws(self):
+        ws, self.ws = self.ws, None
+        if ws is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(lambda: asyncio.ensure_future(ws.close()))
+
+
+async def run_many(live_ids, retry_interval=None, **kwargs):
+    """在当前事件循环上同时抓取多个直播间，共用一个 HTTP 会话"""
+    async with new_session() as session:
+        fetchers = [AsyncDouyinLiveWebFetcher(live_id, session=session, **kwargs) for live_id in live_ids]
+        try:
+            await asyncio.gather(*(fetcher.run(retry_interval) for fetcher in fetchers))
+        finally:
+            for fetcher in fetchers:
+                fetcher.stop()
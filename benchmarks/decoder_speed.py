@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    decoder_speed.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+各解码后端的吞吐对比（消息/秒）
+
+在项目根目录运行：
+    python -m benchmarks.decoder_speed                      # 合成帧
+    python -m benchmarks.decoder_speed --frames frames.bin   # 录制的帧，录制方法见 recorder.py
+
+按 _wsOnMessage 的流程解码：PushFrame -> gunzip -> Response -> 逐条消息；
+解压单独计时，不计入解码吞吐。
+--scan 用 wire.MessageScanner 预扫描 Response（只读 method，未处理的消息不解码），
+分母仍是帧里的全部消息数
+"""
+
+import argparse
+import gzip
+import time
+
+from benchmarks.frames import synth_frames
+from decoder import BACKENDS, get_decoder
+from recorder import load_frames
+from wire import MessageScanner
+
+HANDLED = {
+    'WebcastImChatMessage', 'WebcastImGiftMessage', 'WebcastImLikeMessage', 'WebcastImMemberMessage',
+    'WebcastImSocialMessage', 'WebcastImRoomUserSeqMessage', 'WebcastImFansclubMessage',
+    'WebcastImControlMessage', 'WebcastImEmojiChatMessage', 'WebcastImRoomStatsMessage',
+    'WebcastImRoomMessage', 'WebcastImRoomRankMessage', 'WebcastImRoomStreamAdaptationMessage',
+}
+
+
+def run(backend: str, frames: list, rounds: int, scanner: MessageScanner = None) -> tuple:
+    decoder = get_decoder(backend)
+    parse = decoder.parse
+
+    payloads = [gzip.decompress(parse('WebcastImPushFrame', f).payload) for f in frames]
+    total = sum(len(parse('WebcastImResponse', p).messages) for p in payloads)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for frame, payload in zip(frames, payloads):
+            parse('WebcastImPushFrame', frame)
+            if scanner is not None:
+                for msg in scanner.scan(payload, HANDLED).messages:
+                    parse(msg.method, msg.payload)
+                continue
+            response = parse('WebcastImResponse', payload)
+            for msg in response.messages:
+                if msg.method in HANDLED:
+                    parse(msg.method, msg.payload)
+    cost = time.perf_counter() - start
+    return total * rounds, cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description="解码后端吞吐对比")
+    parser.add_argument("--frames", help="录制的帧文件（4 字节长度前缀）")
+    parser.add_argument("-n", "--count", type=int, default=200, help="合成帧数量")
+    parser.add_argument("-r", "--rounds", type=int, default=3)
+    parser.add_argument("-b", "--backend", action="append", choices=list(BACKENDS))
+    parser.add_argument("--scan", action="store_true", help="用预扫描代替完整解码 Response")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames) if args.frames else synth_frames(args.count)
+    print(f"【帧】{len(frames)} 帧, {sum(map(len, frames)) / 1024:.0f} KB")
+
+    for backend in args.backend or list(BACKENDS):
+        try:
+            scanner = MessageScanner() if args.scan else None
+            messages, cost = run(backend, frames, args.rounds, scanner)
+        except ImportError as e:
+            print(f"【{backend}】不可用: {e}")
+            continue
+        print(f"【{backend}】{messages / cost:,.0f} 消息/秒 ({cost / messages * 1e6:.1f} us/条)")
+        if scanner is not None:
+            for method, stat in scanner.stats().items():
+                print(f"    跳过 {method}: {stat['messages']} 条, {stat['bytes'] / 1024:.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    dispatch_cost.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+每条消息的分发开销（不含解码与处理函数本身）
+
+在项目根目录运行：
+    python -m benchmarks.dispatch_cost
+
+    rebuild   旧写法：每条消息重建 26 项的 handlers 字典再查表
+    table     dispatch.Dispatcher：实例创建时绑定一次，查表一次 dict.get
+    table-raw 同上，但 method 不是 intern 过的字符串（每次新解码出来的副本）
+"""
+
+import argparse
+import random
+import timeit
+
+from benchmarks.decoder_speed import HANDLED
+from dispatch import Dispatcher, handles
+
+_KINDS = sorted(m[len('WebcastIm'):-len('Message')] for m in HANDLED)
+
+
+def _make_owner():
+    namespace = {}
+    for kind in _KINDS:
+        func = handles(f'WebcastIm{kind}Message', f'Webcast{kind}Message')(lambda self, payload: None)
+        namespace[f'_parse{kind}Msg'] = func
+    return type('Owner', (), namespace)()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="消息分发开销")
+    parser.add_argument("-n", "--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    owner = _make_owner()
+    dispatcher = Dispatcher(owner)
+    rng = random.Random(1)
+    methods = [rng.choice(list(dispatcher.table)) for _ in range(1024)]
+    raw_methods = [m.encode().decode() for m in methods]
+
+    pairs = list(type(owner)._handler_names.items())
+
+    def rebuild():
+        for method in methods:
+            handlers = {m: getattr(owner, name) for m, name in pairs}
+            handlers.get(method)(b'')
+
+    def table():
+        get = dispatcher.table.get
+        for method in methods:
+            get(method)(b'')
+
+    def table_raw():
+        get = dispatcher.table.get
+        for method in raw_methods:
+            get(method)(b'')
+
+    rounds = max(1, args.count // len(methods))
+    for name, func in (('rebuild', rebuild), ('table', table), ('table-raw', table_raw)):
+        cost = min(timeit.repeat(func, number=rounds, repeat=3))
+        print(f"【{name}】{cost / (rounds * len(methods)) * 1e9:,.0f} ns/条")
+
+
+if __name__ == '__main__':
+    main()
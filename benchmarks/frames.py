@@ -0,0 +1,131 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    frames.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+基准测试用的 WebSocket 帧：合成接近真实直播间的帧
+
+录制文件格式与录制方法见 recorder.py：
+    DOUYIN_RECORD_FRAMES=frames-{live_id}.bin python main.py
+    python -m benchmarks.decoder_speed --frames frames-<live_id>.bin
+"""
+
+import gzip
+import random
+
+
+def _image(pb, rng):
+    uri = f"tos-cn-i-0813/{rng.getrandbits(64):016x}"
+    return pb.WebcastDataImage(
+        url_list=[f"https://p{i}-webcast.douyinpic.com/img/{uri}~tplv-obj.image" for i in range(3)],
+        uri=uri,
+        height=rng.choice((32, 48, 100)),
+        width=rng.choice((32, 48, 100)),
+        avg_color='#8CA0B4',
+    )
+
+
+def _user(pb, rng):
+    user = pb.WebcastDataUser(
+        id=rng.getrandbits(52),
+        short_id=rng.getrandbits(40),
+        nickname=rng.choice(('小明', '路人甲', 'bubu', '今天也要开心', 'A' * 12)),
+        gender=rng.randint(0, 1),
+        level=rng.randint(0, 60),
+        avatar_thumb=_image(pb, rng),
+        display_id=f"dy{rng.getrandbits(32)}",
+        sec_uid='MS4wLjABAAAA' + ''.join(rng.choice('abcdefXYZ0123456789_-') for _ in range(40)),
+    )
+    user.badge_image_list = [_image(pb, rng) for _ in range(rng.randint(0, 3))]
+    user.pay_grade.level = rng.randint(0, 40)
+    user.fans_club.data.club_name = '粉丝团'
+    user.fans_club.data.level = rng.randint(0, 20)
+    return user
+
+
+def _common(pb, rng, method, room_id):
+    return pb.WebcastImCommon(
+        method=method,
+        msg_id=rng.getrandbits(63),
+        room_id=room_id,
+        create_time=1700000000000 + rng.randint(0, 10 ** 7),
+        is_show_msg=True,
+    )
+
+
+def _message(pb, rng, room_id):
+    kind = rng.choices(
+        ('chat', 'gift', 'like', 'member', 'social', 'seq', 'rank', 'other'),
+        weights=(30, 10, 20, 25, 3, 5, 2, 5),
+    )[0]
+    if kind == 'chat':
+        method = 'WebcastImChatMessage'
+        msg = pb.WebcastImChatMessage(content=rng.choice(('666', '主播好', '哈哈哈哈哈哈', '来了来了')))
+        msg.user = _user(pb, rng)
+    elif kind == 'gift':
+        method = 'WebcastImGiftMessage'
+        msg = pb.WebcastImGiftMessage(gift_id=rng.randint(1, 5000), combo_count=rng.randint(1, 99),
+                                      repeat_count=rng.randint(1, 99), group_count=1)
+        msg.user = _user(pb, rng)
+        msg.to_user = _user(pb, rng)
+        msg.gift.name = rng.choice(('小心心', '玫瑰', '嘉年华'))
+        msg.gift.diamond_count = rng.choice((1, 10, 30000))
+        msg.gift.image = _image(pb, rng)
+        msg.tray_display_text.default_pattern = '{0:user} 送出了 {1:gift}'
+    elif kind == 'like':
+        method = 'WebcastImLikeMessage'
+        msg = pb.WebcastImLikeMessage(count=rng.randint(1, 15), total=rng.randint(1, 10 ** 6))
+        msg.user = _user(pb, rng)
+    elif kind == 'member':
+        method = 'WebcastImMemberMessage'
+        msg = pb.WebcastImMemberMessage(member_count=rng.randint(1, 10 ** 4))
+        msg.user = _user(pb, rng)
+    elif kind == 'social':
+        method = 'WebcastImSocialMessage'
+        msg = pb.WebcastImSocialMessage(action=1)
+        msg.user = _user(pb, rng)
+    elif kind == 'seq':
+        method = 'WebcastImRoomUserSeqMessage'
+        msg = pb.WebcastImRoomUserSeqMessage(total=rng.randint(1, 10 ** 4), total_pv_for_anchor=str(rng.randint(1, 10 ** 6)))
+    elif kind == 'rank':
+        method = 'WebcastImRoomRankMessage'
+        msg = pb.WebcastImRoomRankMessage()
+        for _ in range(3):
+            item = pb.WebcastImRoomRankMessageRoomRank(score_str=str(rng.randint(1, 10 ** 4)))
+            item.user = _user(pb, rng)
+            msg.ranks.append(item)
+    else:
+        method = 'WebcastImInRoomBannerMessage'
+        msg = pb.WebcastImChatMessage(content='x' * rng.randint(50, 400))
+    msg.common = _common(pb, rng, method, room_id)
+    return pb.WebcastImMessage(method=method, payload=bytes(msg), msg_id=msg.common.msg_id)
+
+
+def synth_frames(count: int = 200, per_frame: int = 12, seed: int = 1) -> list:
+    """合成 count 帧，每帧约 per_frame 条消息，消息类型比例大致接近热门直播间"""
+    import protobuf.douyin as pb
+
+    rng = random.Random(seed)
+    room_id = rng.getrandbits(62)
+    frames = []
+    for i in range(count):
+        response = pb.WebcastImResponse(
+            cursor=f"t-{1700000000000 + i}_r-1",
+            fetch_interval=1000,
+            now=1700000000000 + i * 1000,
+            internal_ext=f"internal_src:dim|wss_push_room_id:{room_id}|seq:{i}",
+            heartbeat_duration=10000,
+            need_ack=True,
+        )
+        response.messages = [_message(pb, rng, room_id) for _ in range(rng.randint(per_frame // 2, per_frame * 3 // 2))]
+        frame = pb.WebcastImPushFrame(
+            seq_id=i,
+            log_id=rng.getrandbits(63),
+            payload_encoding='gzip',
+            payload_type='msg',
+            payload=gzip.compress(bytes(response)),
+        )
+        frames.append(bytes(frame))
+    return frames
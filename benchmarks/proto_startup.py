@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    proto_startup.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+protobuf 模块冷启动对比：完整 import、惰性加载与精简热集合
+
+在项目根目录运行：
+    python -m benchmarks.proto_startup -r 5
+
+每次都在全新的子进程中测量，记录 import + 取出抓取器用到的消息类型的耗时和峰值内存
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# 抓取器实际用到的消息类型
+HOT_NAMES = [
+    'WebcastImPushFrame',
+    'WebcastImResponse',
+    'WebcastImChatMessage',
+    'WebcastImGiftMessage',
+    'WebcastImLikeMessage',
+    'WebcastImMemberMessage',
+    'WebcastImSocialMessage',
+    'WebcastImRoomUserSeqMessage',
+    'WebcastImFansclubMessage',
+    'WebcastImControlMessage',
+    'WebcastImEmojiChatMessage',
+    'WebcastImRoomStatsMessage',
+    'WebcastImRoomMessage',
+    'WebcastImRoomRankMessage',
+    'WebcastImRoomStreamAdaptationMessage',
+]
+
+MODULES = {
+    'full': 'protobuf.douyin',
+    'lazy': 'protobuf.douyin_lazy',
+    'hot': 'protobuf.douyin_hot',
+}
+
+_PROBE = r"""
+import importlib, json, sys, time
+import betterproto
+
+def rss_kb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset // 1024
+    except Exception:
+        return None
+
+base = rss_kb()
+start = time.perf_counter()
+mod = importlib.import_module(sys.argv[1])
+for name in sys.argv[2:]:
+    getattr(mod, name)
+cost = time.perf_counter() - start
+peak = rss_kb()
+print(json.dumps({"seconds": cost, "rss_kb": peak, "delta_kb": peak - base if peak and base else None}))
+"""
+
+
+def probe(module: str) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.check_output(
+        [sys.executable, '-c', _PROBE, module] + HOT_NAMES,
+        cwd=root,
+        encoding='utf-8',
+    )
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="protobuf 冷启动对比")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for mode, module in MODULES.items():
+        runs = [probe(module) for _ in range(args.repeat)]
+        seconds = sorted(r['seconds'] for r in runs)[len(runs) // 2]
+        delta = [r['delta_kb'] for r in runs if r['delta_kb'] is not None]
+        rss = f"{sorted(delta)[len(delta) // 2] / 1024:.1f} MB" if delta else "n/a"
+        print(f"【{mode:4}】{module}: import 中位数 {seconds * 1000:.0f} ms, 内存增量 {rss}")
+
+
+if __name__ == '__main__':
+    main()
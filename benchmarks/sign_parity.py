@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    sign_parity.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+sign_native 与 sign.js 的对拍与性能对比
+
+在项目根目录运行：
+    python -m benchmarks.sign_parity -n 5000
+
+对拍时把同一组随机数同时喂给 JS 的 Math.random 和 NativeSigner，
+两边的 bogusIndex 都从 0 开始，因此每个输入的签名都应完全一致。
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+
+from py_mini_racer import MiniRacer
+
+from sign_native import NativeSigner
+from signer import resource_path
+
+
+def load_js(script_file: str) -> MiniRacer:
+    with open(resource_path(script_file), 'r', encoding='utf-8') as f:
+        script = f.read()
+    ctx = MiniRacer()
+    ctx.eval(script)
+    return ctx
+
+
+def parity(count: int, seed: int, script_file: str) -> int:
+    rng = random.Random(seed)
+    ctx = load_js(script_file)
+    ctx.eval("var __seq = []; Math.random = function () { return __seq.shift(); };")
+
+    draws = []
+    native = NativeSigner(rand=lambda: draws.pop(0))
+
+    mismatches = 0
+    for i in range(count):
+        md5_param = hashlib.md5(rng.randbytes(16)).hexdigest()
+        seq = [rng.random() for _ in range(3)]
+
+        ctx.eval(f"__seq = {json.dumps(seq)};")
+        expected = ctx.call("get_sign", md5_param)
+        left = ctx.eval("__seq.length")
+
+        draws[:] = seq
+        actual = native.get_sign(md5_param)
+
+        if expected != actual or left:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"【X】#{i} {md5_param}: sign.js={expected} native={actual} 剩余随机数={left}")
+
+    print(f"【对拍】{count} 组输入，不一致 {mismatches} 组")
+    return mismatches
+
+
+def bench(count: int, script_file: str):
+    inputs = [hashlib.md5(str(i).encode()).hexdigest() for i in range(count)]
+
+    start = time.perf_counter()
+    ctx = load_js(script_file)
+    load_cost = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for md5_param in inputs:
+        ctx.call("get_sign", md5_param)
+    js_cost = time.perf_counter() - start
+
+    native = NativeSigner()
+    start = time.perf_counter()
+    for md5_param in inputs:
+        native.get_sign(md5_param)
+    native_cost = time.perf_counter() - start
+
+    print(f"【性能】MiniRacer 加载 {script_file}: {load_cost * 1000:.1f} ms")
+    print(f"【性能】MiniRacer: {js_cost / count * 1e6:.1f} us/次")
+    print(f"【性能】Python:    {native_cost / count * 1e6:.1f} us/次")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sign_native 对拍 & 性能对比")
+    parser.add_argument("-n", "--count", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=20240102)
+    parser.add_argument("--script", default="sign.js")
+    args = parser.parse_args()
+
+    mismatches = parity(args.count, args.seed, args.script)
+    bench(args.count, args.script)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
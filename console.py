@@ -0,0 +1,148 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    console.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+控制台输出：按消息类型限速、抽样，被略过的消息定期汇总成一行
+
+只影响打印，正式日志 / tmp.log 仍然记录每一条。消息类型取行首的【...】，例如【点赞msg】；
+抓取器自己的状态行也走这里：【心跳】【连接】【状态】【日志】，错误（【X】）不经过 ConsoleSink，总是打印。
+被略过的条数在下一次 write()（至少每次心跳一次）或 flush() 时汇总输出。
+
+    all       全部打印（默认，和原来一样）
+    throttle  按 rates 每类每秒最多打印几条、按 sample 抽样，其余每 summary_interval 秒汇总一次：
+              【汇总】[live_id] 最近 5 秒未显示：点赞msg 312 条，进场msg 40 条
+    quiet     完全不打印
+
+    console = ConsoleSink('throttle', rates={'点赞msg': 1}, sample={'进场msg': 0.1})
+    console.write(line)
+"""
+
+import random
+import sys
+import threading
+import time
+
+CONSOLE_MODES = ('all', 'throttle', 'quiet')
+
+# throttle 模式下默认的每类每秒打印条数；不在表里的类型不限速
+DEFAULT_RATES = {
+    '点赞msg': 2,
+    '进场msg': 2,
+    '统计msg': 0.2,
+    '直播间统计msg': 0.2,
+    '直播间排行榜msg': 0.1,
+    '聊天表情包msg': 2,
+    '心跳': 1 / 60,
+}
+
+
+def line_kind(line: str) -> str:
+    """行首【...】里的消息类型，没有时为空字符串"""
+    if line.startswith('【'):
+        end = line.find('】', 1)
+        if end > 0:
+            return line[1:end]
+    return ''
+
+
+class ConsoleSink:
+    """
+    参数:
+        mode:             见 CONSOLE_MODES
+        rates:            {类型: 每秒最多打印几条}，throttle 模式下默认 DEFAULT_RATES
+        sample:           {类型: 抽样比例 0~1}，先抽样再限速
+        summary_interval: 汇总间隔（秒），0 表示不汇总
+        name:             汇总行里的标识（多个直播间共用一个终端时区分）
+        stream:           输出流，默认 sys.stdout
+        clock / rng:      时钟与随机函数，可替换
+    """
+
+    def __init__(self, mode: str = 'all', rates: dict = None, sample: dict = None, summary_interval: float = 5,
+                 name: str = '', stream=None, clock=time.monotonic, rng=random.random):
+        if mode not in CONSOLE_MODES:
+            raise ValueError(f"未知的控制台模式: {mode}，可选 {CONSOLE_MODES}")
+        self.mode = mode
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.sample = dict(sample or {})
+        self.summary_interval = summary_interval
+        self.name = name
+        self.stream = stream
+        self.clock = clock
+        self.rng = rng
+
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._suppressed = {}
+        self._summary_at = clock()
+        self.printed = 0
+        self.suppressed = 0
+
+    def write(self, line: str):
+        if self.mode == 'quiet':
+            self.suppressed += 1
+            return
+        if self.mode == 'all':
+            self._print(line)
+            return
+
+        kind = line_kind(line)
+        with self._lock:
+            now = self.clock()
+            show = self._admit(kind, now)
+            if not show:
+                self._suppressed[kind] = self._suppressed.get(kind, 0) + 1
+                self.suppressed += 1
+            summary = self._take_summary(now)
+        if show:
+            self._print(line)
+        if summary:
+            self._print(summary)
+
+    def _admit(self, kind: str, now: float) -> bool:
+        fraction = self.sample.get(kind)
+        if fraction is not None and self.rng() >= fraction:
+            return False
+        rate = self.rates.get(kind)
+        if rate is None:
+            return True
+        # 每类一个令牌桶，容量 max(1, rate)
+        tokens, updated = self._buckets.get(kind, (max(1.0, rate), now))
+        tokens = min(max(1.0, rate), tokens + (now - updated) * rate)
+        if tokens < 1:
+            self._buckets[kind] = (tokens, now)
+            return False
+        self._buckets[kind] = (tokens - 1, now)
+        return True
+
+    def _take_summary(self, now: float, force: bool = False) -> str:
+        if not self.summary_interval:
+            return ''
+        elapsed = now - self._summary_at
+        if not force and elapsed < self.summary_interval:
+            return ''
+        self._summary_at = now
+        if not self._suppressed:
+            return ''
+        counts, self._suppressed = self._suppressed, {}
+        parts = "，".join(f"{kind or '其他'} {count} 条" for kind, count in counts.items())
+        who = f"[{self.name}] " if self.name else ""
+        return f"【汇总】{who}最近 {elapsed:.0f} 秒未显示：{parts}"
+
+    def flush(self):
+        """把还没输出的汇总打印出来（停止时调用）"""
+        if self.mode != 'throttle':
+            return
+        with self._lock:
+            summary = self._take_summary(self.clock(), force=True)
+        if summary:
+            self._print(summary)
+
+    def _print(self, line: str):
+        self.printed += 1
+        print(line, file=self.stream or sys.stdout)
+
+    def stats(self) -> dict:
+        return {"mode": self.mode, "printed": self.printed, "suppressed": self.suppressed}
@@ -0,0 +1,299 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    credentials.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+按 live_id 持久化的凭据缓存：ttwid、room_id、WebSocket 签名
+
+重连和重启时直接取缓存，不用再请求直播页、正则提取 room_id、重新计算签名。
+每一项都有有效期（TTL，墙钟时间，跨进程重启仍然有效）；服务器返回鉴权错误（401/403）时整组作废。
+
+    cache = get_credential_cache()                      # 默认 <项目目录>/credentials.json
+    cache = get_credential_cache('creds.db')            # .db / .sqlite 后缀用 sqlite
+    cache.set(live_id, 'room_id', '7392...')
+    cache.get(live_id, 'room_id')                       # 过期或不存在时为 None
+    cache.invalidate(live_id)                           # 作废这个直播间的全部凭据
+
+JSON 的读-改-写在 POSIX 上用 <path>.lock 文件锁串行，几个进程共用也不会丢更新；
+多进程（scheduler.py 的工作进程默认）更推荐 sqlite。
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows：没有 flock，只保证进程内串行
+    fcntl = None
+
+# 默认有效期（秒）。room_id 在主播重新开播后会变，给得比较短
+DEFAULT_TTL = {
+    'ttwid': 7 * 24 * 3600,
+    'room_id': 3600,
+    'signature': 3600,
+}
+
+AUTH_ERROR_STATUS = (401, 403)
+
+
+def is_auth_error(error) -> bool:
+    """websocket-client 的 WebSocketBadStatusException（status_code）或 aiohttp 的握手异常（status）"""
+    status = getattr(error, 'status_code', None) or getattr(error, 'status', None)
+    return status in AUTH_ERROR_STATUS
+
+
+class JsonStore:
+    """整个文件一个 JSON：{live_id: {key: [value, expires]}}；文件有变化时重新读取，改动在最新内容上进行后原子替换"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data = {}
+        self._mtime = None
+        self._load()
+
+    def _load(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"【!】凭据缓存读取失败，忽略: {e}")
+            return
+        self._mtime = mtime
+        self._data = data
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """跨进程的读-改-写：持有文件锁期间重新读取、修改并写回"""
+        if fcntl is None:
+            yield
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._mtime = os.stat(self.path).st_mtime_ns
+
+    def get(self, live_id: str, key: str):
+        self._load()
+        return self._data.get(live_id, {}).get(key)
+
+    def set(self, live_id: str, key: str, value, expires: float):
+        with self._locked():
+            self._load()
+            self._data.setdefault(live_id, {})[key] = [value, expires]
+            self._save()
+
+    def delete(self, live_id: str, keys=None):
+        with self._locked():
+            self._load()
+            entries = self._data.get(live_id)
+            if not entries:
+                return
+            if keys is None:
+                del self._data[live_id]
+            else:
+                for key in keys:
+                    entries.pop(key, None)
+            self._save()
+
+    def purge(self, now: float) -> int:
+        with self._locked():
+            self._load()
+            removed = 0
+            for live_id in list(self._data):
+                entries = self._data[live_id]
+                for key in [k for k, (_, expires) in entries.items() if expires <= now]:
+                    del entries[key]
+                    removed += 1
+                if not entries:
+                    del self._data[live_id]
+            if removed:
+                self._save()
+            return removed
+
+    def close(self):
+        pass
+
+
+class SqliteStore:
+    """sqlite 一张表；多进程共用一个文件时由 sqlite 自己加锁"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS credentials ("
+            " live_id TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires REAL NOT NULL,"
+            " PRIMARY KEY (live_id, key))"
+        )
+
+    def get(self, live_id: str, key: str):
+        row = self._conn.execute(
+            "SELECT value, expires FROM credentials WHERE live_id = ? AND key = ?", (live_id, key)
+        ).fetchone()
+        if row is None:
+            return None
+        return [json.loads(row[0]), row[1]]
+
+    def set(self, live_id: str, key: str, value, expires: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO credentials (live_id, key, value, expires) VALUES (?, ?, ?, ?)",
+            (live_id, key, json.dumps(value, ensure_ascii=False), expires),
+        )
+
+    def delete(self, live_id: str, keys=None):
+        if keys is None:
+            self._conn.execute("DELETE FROM credentials WHERE live_id = ?", (live_id,))
+        else:
+            self._conn.executemany(
+                "DELETE FROM credentials WHERE live_id = ? AND key = ?", [(live_id, key) for key in keys]
+            )
+
+    def purge(self, now: float) -> int:
+        return self._conn.execute("DELETE FROM credentials WHERE expires <= ?", (now,)).rowcount
+
+    def close(self):
+        self._conn.close()
+
+
+class CredentialCache:
+    """
+    参数:
+        path:  缓存文件；.db / .sqlite / .sqlite3 后缀用 sqlite，其余用 JSON
+        ttl:   覆盖 DEFAULT_TTL 中的有效期
+        clock: 墙钟时间函数，默认 time.time
+    """
+
+    def __init__(self, path: str, ttl: dict = None, clock=time.time):
+        self.path = path
+        self.ttl = dict(DEFAULT_TTL, **(ttl or {}))
+        self.clock = clock
+        if os.path.splitext(path)[1].lower() in ('.db', '.sqlite', '.sqlite3'):
+            self._store = SqliteStore(path)
+        else:
+            self._store = JsonStore(path)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+
+    def get(self, live_id, key: str):
+        live_id = str(live_id)
+        with self._lock:
+            try:
+                entry = self._store.get(live_id, key)
+            except Exception as e:
+                print(f"【!】凭据缓存读取失败: {e}")
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires = entry
+            if expires <= self.clock():
+                self.expired += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value
+
+    def set(self, live_id, key: str, value, ttl: float = None):
+        if value is None:
+            return
+        if ttl is None:
+            ttl = self.ttl.get(key, 3600)
+        with self._lock:
+            try:
+                self._store.set(str(live_id), key, value, self.clock() + ttl)
+            except Exception as e:
+                # 缓存写不进去只影响下次启动的速度，不影响当前连接
+                print(f"【!】凭据缓存写入失败: {e}")
+
+    def invalidate(self, live_id, *keys):
+        """作废指定的凭据；不传 keys 作废这个直播间的全部凭据"""
+        with self._lock:
+            self.invalidations += 1
+            try:
+                self._store.delete(str(live_id), keys or None)
+            except Exception as e:
+                print(f"【!】凭据缓存作废失败: {e}")
+
+    def purge(self) -> int:
+        """清理所有已过期的条目，返回清理的条数"""
+        with self._lock:
+            return self._store.purge(self.clock())
+
+    def close(self):
+        with self._lock:
+            self._store.close()
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "invalidations": self.invalidations,
+        }
+
+
+def default_path(suffix: str = '.json') -> str:
+    """<项目目录>/credentials.json；suffix='.db' 时为 sqlite 文件"""
+    if getattr(sys, 'frozen', False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, "credentials" + suffix)
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # sqlite 连接不能跨 fork 使用，子进程重新打开
+    global _caches, _caches_lock
+    _caches = {}
+    _caches_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_credential_cache(path: str = None) -> CredentialCache:
+    """获取进程内共享的凭据缓存，同一个文件只会有一个实例"""
+    path = os.path.abspath(path or default_path())
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = CredentialCache(path)
+        return cache
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    decoder.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+可切换的 protobuf 解码后端
+
+    betterproto  纯 Python，消息类来自 protobuf.messages（默认热集合）
+    upb          官方 protobuf 运行时（C 实现），需要 pip install protobuf
+    partial      按 PARTIAL_FIELDS 只扫描处理函数读取的字段，其余字段直接跳过
+
+各后端按 betterproto 的类名取消息类型，返回对象上处理函数读取的字段名一致
+"""
+
+import threading
+
+
+class BetterprotoDecoder:
+    name = 'betterproto'
+
+    def __init__(self):
+        from protobuf import messages
+
+        self._module = messages.module
+        self._classes = {}
+
+    def parse(self, type_name: str, data: bytes):
+        cls = self._classes.get(type_name)
+        if cls is None:
+            cls = self._classes[type_name] = getattr(self._module, type_name)
+        return cls().parse(data)
+
+
+class UpbDecoder:
+    name = 'upb'
+
+    def __init__(self):
+        from protobuf import douyin_upb
+
+        self._parsers = {name: getattr(douyin_upb, name).FromString for name in douyin_upb.__all__}
+
+    def parse(self, type_name: str, data: bytes):
+        return self._parsers[type_name](data)
+
+
+# 处理函数实际读取的字段，partial 后端只解出这些
+PARTIAL_FIELDS = {
+    'WebcastImPushFrame': ['log_id', 'headers.key', 'headers.value', 'payload_encoding', 'payload_type', 'payload'],
+    'WebcastImResponse': ['messages.method', 'messages.payload', 'need_ack', 'internal_ext',
+                          'heartbeat_duration', 'fetch_interval'],
+    'WebcastImChatMessage': ['common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'content'],
+    'WebcastImGiftMessage': ['common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'gift_id',
+                             'gift.name', 'gift.diamond_count', 'combo_count', 'repeat_count', 'group_count'],
+    'WebcastImLikeMessage': ['common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'count', 'total'],
+    'WebcastImMemberMessage': ['common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'user.gender',
+                               'member_count'],
+    'WebcastImSocialMessage': ['common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'follow_count'],
+    'WebcastImRoomUserSeqMessage': ['common.msg_id', 'common.create_time', 'total', 'total_pv_for_anchor'],
+    'WebcastImFansclubMessage': ['common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'action',
+                                 'content'],
+    'WebcastImControlMessage': ['common.msg_id', 'common.create_time', 'action'],
+    'WebcastImEmojiChatMessage': ['common.msg_id', 'common.create_time', 'emoji_id', 'user.nickname', 'user.id',
+                                  'default_content'],
+    'WebcastImRoomStatsMessage': ['common.msg_id', 'common.create_time', 'display_long', 'total'],
+    'WebcastImRoomMessage': ['common.msg_id', 'common.create_time', 'common.room_id'],
+    'WebcastImRoomRankMessage': ['common.msg_id', 'common.create_time', 'ranks.user.nickname', 'ranks.score_str'],
+    'WebcastImRoomStreamAdaptationMessage': ['common.msg_id', 'common.create_time', 'adaptation_type'],
+}
+
+
+class PartialDecoder:
+    name = 'partial'
+
+    def __init__(self, fields: dict = None):
+        import wire
+        from protobuf.schema import parse_proto
+
+        self._extract = wire.extract
+        messages = parse_proto()
+        self._plans = {
+            type_name: wire.compile_plan(messages, type_name, paths)
+            for type_name, paths in (fields or PARTIAL_FIELDS).items()
+        }
+
+    def parse(self, type_name: str, data):
+        return self._extract(self._plans[type_name], data)
+
+
+BACKENDS = {
+    'betterproto': BetterprotoDecoder,
+    'upb': UpbDecoder,
+    'partial': PartialDecoder,
+}
+
+_decoders = {}
+_decoders_lock = threading.Lock()
+
+
+def get_decoder(backend: str = 'betterproto'):
+    """获取进程内共享的解码器"""
+    if backend not in BACKENDS:
+        raise ValueError(f"未知的解码后端: {backend}")
+    with _decoders_lock:
+        decoder = _decoders.get(backend)
+        if decoder is None:
+            decoder = _decoders[backend] = BACKENDS[backend]()
+        return decoder
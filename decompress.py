@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    decompress.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+PushFrame.payload 的解压
+
+压缩格式优先看 payload_encoding，为空时看 headers 里的 compress_type；
+gzip 用 zlib.decompressobj(wbits=31) 解，并用 max_length 限制输出大小，
+超过 max_size 的帧直接拒绝（PayloadTooLarge），不会把接收线程卡在一次超大的解压上。
+"""
+
+import time
+import zlib
+
+from metrics import Histogram
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# 解压耗时（毫秒）与压缩比的分桶
+LATENCY_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+RATIO_BOUNDS = (1, 2, 3, 4, 6, 8, 12, 16, 32, 64)
+
+_RAW_ENCODINGS = ('', 'none', 'raw', 'pb')
+
+
+class PayloadTooLarge(ValueError):
+    pass
+
+
+def header_value(headers, key: str) -> str:
+    """从 PushFrame.headers（key/value 列表）里取值"""
+    for header in headers or ():
+        if header.key == key:
+            return header.value
+    return ''
+
+
+class PayloadDecompressor:
+    """
+    参数:
+        max_size: 单帧解压后的最大字节数，默认 16 MB
+    """
+
+    def __init__(self, max_size: int = 16 * 1024 * 1024):
+        self.max_size = max_size
+        # 预先建好一个 gzip 解压器，每帧 copy() 一份，省去重复初始化
+        self._template = zlib.decompressobj(wbits=31)
+        self.latency = Histogram(LATENCY_BOUNDS_MS)
+        self.ratio = Histogram(RATIO_BOUNDS)
+        self.raw = 0
+        self.rejected = 0
+
+    def decompress(self, payload, encoding: str = '', headers=()) -> bytes:
+        encoding = (encoding or header_value(headers, 'compress_type')).lower()
+
+        if encoding in _RAW_ENCODINGS and payload[:2] != GZIP_MAGIC:
+            self.raw += 1
+            return payload
+        if encoding not in _RAW_ENCODINGS and encoding != 'gzip':
+            raise ValueError(f"不支持的压缩格式: {encoding}")
+
+        start = time.perf_counter()
+        inflater = self._template.copy()
+        data = inflater.decompress(payload, self.max_size + 1)
+        if len(data) > self.max_size or inflater.unconsumed_tail:
+            self.rejected += 1
+            raise PayloadTooLarge(f"解压后超过 {self.max_size} 字节（压缩前 {len(payload)} 字节）")
+        if not inflater.eof:
+            raise EOFError("gzip 数据不完整")
+
+        self.latency.record((time.perf_counter() - start) * 1000)
+        if payload:
+            self.ratio.record(len(data) / len(payload))
+        return data
+
+    def stats(self) -> dict:
+        return {
+            "max_size": self.max_size,
+            "raw": self.raw,
+            "rejected": self.rejected,
+            "latency_ms": self.latency.snapshot(),
+            "ratio": self.ratio.snapshot(),
+        }
@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    dispatch.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+消息分发表
+
+处理函数用 @handles 标记自己负责的 method，类的 method -> 函数名 映射只在第一次用到时收集一次；
+每个实例在创建时绑定一次，分发时就是一次 dict.get。
+
+    class Fetcher:
+        @handles('WebcastImChatMessage', 'WebcastChatMessage')
+        def _parseChatMsg(self, payload): ...
+
+    dispatcher = Dispatcher(fetcher)
+    dispatcher.register('WebcastImLinkMicMessage', on_link_mic)   # 运行时追加
+    dispatcher.register_plugin(plugin)                             # plugin.handlers() -> {method: callable}
+    dispatcher.get(method)(payload)
+
+注册/注销采用写时复制：写操作生成新表再整体替换，接收线程读到的总是完整的表，读路径不加锁。
+method 名统一 sys.intern，与 wire.MessageScanner 产生的 method 是同一个对象，查表走身份比较。
+"""
+
+import sys
+import threading
+
+_ATTR = '_handles_methods'
+
+
+def handles(*methods: str):
+    """标记处理函数负责的 method（新旧协议名可以同时写）"""
+    def decorator(func):
+        setattr(func, _ATTR, getattr(func, _ATTR, ()) + tuple(sys.intern(m) for m in methods))
+        return func
+    return decorator
+
+
+def handler_names(cls) -> dict:
+    """类上 method -> 处理函数名 的映射，按 MRO 收集，每个类只收集一次"""
+    table = cls.__dict__.get('_handler_names')
+    if table is None:
+        table = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                for method in getattr(value, _ATTR, ()):
+                    table[method] = name
+        cls._handler_names = table
+    return table
+
+
+class Dispatcher:
+    """某个实例的分发表：method -> 绑定好的处理函数"""
+
+    def __init__(self, owner=None):
+        self._lock = threading.Lock()
+        self._plugins = []
+        if owner is None:
+            self.table = {}
+        else:
+            self.table = {method: getattr(owner, name) for method, name in handler_names(type(owner)).items()}
+
+    def __contains__(self, method) -> bool:
+        return method in self.table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def get(self, method: str):
+        return self.table.get(method)
+
+    def register(self, method: str, handler=None):
+        """注册处理函数（已存在则覆盖）；不传 handler 时当装饰器用"""
+        if handler is None:
+            def decorator(func):
+                self.register(method, func)
+                return func
+            return decorator
+        with self._lock:
+            table = dict(self.table)
+            table[sys.intern(method)] = handler
+            self.table = table
+        return handler
+
+    def unregister(self, method: str):
+        with self._lock:
+            if method in self.table:
+                table = dict(self.table)
+                del table[method]
+                self.table = table
+
+    def register_plugin(self, plugin):
+        """插件需要提供 handlers() -> {method: callable(payload)}，一次性并入分发表"""
+        handlers = plugin.handlers()
+        with self._lock:
+            table = dict(self.table)
+            for method, handler in handlers.items():
+                table[sys.intern(method)] = handler
+            self.table = table
+            self._plugins.append(plugin)
+        print(f"【√】已加载插件 {type(plugin).__name__}: {', '.join(handlers)}")
+
+    @property
+    def plugins(self) -> list:
+        return list(self._plugins)
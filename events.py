@@ -0,0 +1,250 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    events.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+直播消息的结构化事件
+
+处理函数只把解码结果填进事件（__slots__，没有实例字典），格式化成日志行只在 sink 里做一次；
+其他输出（JSON Lines、列式存档等）直接读字段，不用再解析中文文本。
+
+每个事件都带：
+    msg_id / create_time   服务器的消息 id 与创建时间（毫秒），来自 common
+    time                   本地收到时间 "%Y-%m-%d %H:%M:%S"，日志行末尾的 [time]
+类属性：
+    kind    英文类型名（chat / gift / ...），序列化时使用
+    tag     日志行首的【...】，控制台按它限速
+    target  写到哪里：log 正式日志；tmp 临时日志；auto 已开始正式日志时写正式日志，否则写临时日志
+    fields  字段顺序
+"""
+
+import json
+
+from logwriter import GroupCommitWriter
+
+
+class Event:
+    __slots__ = ('msg_id', 'create_time', 'time')
+
+    kind = 'event'
+    tag = ''
+    target = 'log'
+    fields = ('msg_id', 'create_time', 'time')
+
+    def __init__(self, **values):
+        for name in self.fields:
+            setattr(self, name, values.get(name))
+
+    def format(self) -> str:
+        """通用格式：【tag】字段=值 ... [time]；子类按各自的日志格式覆盖"""
+        values = " ".join(f"{name}={getattr(self, name)}" for name in self.fields if name not in Event.fields)
+        return f"【{self.tag or type(self).__name__}】{values} [{self.time}]"
+
+    def to_dict(self) -> dict:
+        data = {"kind": self.kind}
+        for name in self.fields:
+            data[name] = getattr(self, name)
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values})"
+
+
+class UserEvent(Event):
+    __slots__ = ('user_id', 'user_name')
+    fields = Event.fields + ('user_id', 'user_name')
+
+
+class ChatEvent(UserEvent):
+    __slots__ = ('content',)
+    kind = 'chat'
+    tag = '聊天msg'
+    fields = UserEvent.fields + ('content',)
+
+    def format(self) -> str:
+        return f"【聊天msg】[{self.user_id}] {self.user_name}: {self.content} [{self.time}]"
+
+
+class GiftEvent(UserEvent):
+    __slots__ = ('gift_id', 'gift_name', 'count', 'repeat_count', 'group_count', 'diamond_count')
+    kind = 'gift'
+    tag = '礼物msg'
+    fields = UserEvent.fields + __slots__
+
+    def format(self) -> str:
+        return f"【礼物msg】{self.user_name} 送出了 {self.gift_name}x{self.count} [{self.time}]"
+
+
+class LikeEvent(UserEvent):
+    __slots__ = ('count', 'total')
+    kind = 'like'
+    tag = '点赞msg'
+    fields = UserEvent.fields + __slots__
+
+    def format(self) -> str:
+        return f"【点赞msg】{self.user_name} 点了{self.count}个赞 [{self.time}]"
+
+
+class MemberEvent(UserEvent):
+    __slots__ = ('gender', 'member_count')
+    kind = 'member'
+    tag = '进场msg'
+    fields = UserEvent.fields + __slots__
+
+    def format(self) -> str:
+        gender = ("女", "男")[self.gender] if self.gender in (0, 1) else "未知"
+        return f"【进场msg】[{self.user_id}][{gender}] {self.user_name} 进入了直播间 [{self.time}]"
+
+
+class SocialEvent(UserEvent):
+    __slots__ = ('follow_count',)
+    kind = 'social'
+    tag = '关注msg'
+    fields = UserEvent.fields + __slots__
+
+    def format(self) -> str:
+        return f"【关注msg】[{self.user_id}]{self.user_name} 关注了主播 [{self.time}]"
+
+
+class EmojiChatEvent(UserEvent):
+    __slots__ = ('emoji_id', 'content')
+    kind = 'emoji_chat'
+    tag = '聊天表情包msg'
+    fields = UserEvent.fields + __slots__
+
+    def format(self) -> str:
+        return f"【聊天表情包msg】[{self.user_id}] {self.user_name}: {self.content} (emoji_id={self.emoji_id}) [{self.time}]"
+
+
+class FansclubEvent(UserEvent):
+    __slots__ = ('action', 'content')
+    kind = 'fansclub'
+    tag = '粉丝团msg'
+    fields = UserEvent.fields + __slots__
+
+    def format(self) -> str:
+        return f"【粉丝团msg】{self.content} [{self.time}]"
+
+
+class StatsEvent(Event):
+    """观众人数（RoomUserSeqMessage）"""
+
+    __slots__ = ('current', 'total_pv')
+    kind = 'stats'
+    tag = '统计msg'
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        return f"【统计msg】当前观看人数: {self.current}, 累计观看人数: {self.total_pv} [{self.time}]"
+
+
+class RoomStatsEvent(Event):
+    __slots__ = ('display_long', 'total')
+    kind = 'room_stats'
+    tag = '直播间统计msg'
+    target = 'tmp'
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        return f"【直播间统计msg】{self.display_long} [{self.time}]"
+
+
+class RankEvent(Event):
+    """ranks: ((nickname, score_str), ...)，按名次排列"""
+
+    __slots__ = ('ranks',)
+    kind = 'rank'
+    tag = '直播间排行榜msg'
+    target = 'auto'  # 未直播的时候不触发开播
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        simple = [f"{i}. {nick} {score}".strip() for i, (nick, score) in enumerate(self.ranks, start=1)]
+        return "【直播间排行榜msg】" + " | ".join(simple) + f" [{self.time}]"
+
+
+class ControlEvent(Event):
+    """action 3 表示直播结束"""
+
+    __slots__ = ('action',)
+    kind = 'control'
+    tag = '控制msg'
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        if self.action == 3:
+            return f"【控制msg】直播间已结束 [{self.time}]"
+        return f"【控制msg】action={self.action} [{self.time}]"
+
+
+class RoomEvent(Event):
+    __slots__ = ('room_id',)
+    kind = 'room'
+    tag = '直播间msg'
+    target = 'tmp'
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        return f"【直播间msg】直播间id:{self.room_id} [{self.time}]"
+
+
+class StreamAdaptationEvent(Event):
+    __slots__ = ('adaptation_type',)
+    kind = 'stream_adaptation'
+    tag = '直播间流适配msg'
+    target = 'tmp'
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        return f"【直播间流适配msg】adaptationType={self.adaptation_type} [{self.time}]"
+
+
+class TextEvent(Event):
+    """插件等直接给出文本的消息（_emit 传入字符串时）"""
+
+    __slots__ = ('line', 'target')
+    kind = 'text'
+    fields = Event.fields + __slots__
+
+    def format(self) -> str:
+        return self.line
+
+
+EVENT_TYPES = {cls.kind: cls for cls in (
+    ChatEvent, GiftEvent, LikeEvent, MemberEvent, SocialEvent, EmojiChatEvent, FansclubEvent,
+    StatsEvent, RoomStatsEvent, RankEvent, ControlEvent, RoomEvent, StreamAdaptationEvent, TextEvent,
+)}
+
+
+class JsonLinesSink:
+    """
+    每个事件一行 JSON，组提交写盘（见 logwriter.GroupCommitWriter）
+
+        fetcher.add_event_sink(JsonLinesSink('events.jsonl', kinds=('chat', 'gift')))
+
+    参数:
+        kinds: 只写这些类型，默认全部
+    """
+
+    def __init__(self, path: str, kinds=None, durability: str = 'flush'):
+        self.kinds = frozenset(kinds) if kinds else None
+        self._writer = GroupCommitWriter(path, durability)
+
+    def __call__(self, event: Event):
+        if self.kinds is None or event.kind in self.kinds:
+            self._writer.write(event.to_json())
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        self._writer.close()
+
+    def stats(self) -> dict:
+        return self._writer.stats()
@@ -0,0 +1,331 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    heartbeat.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+进程内共用的心跳调度：一个线程 + 哈希时间轮
+
+每条连接在打开时 register 一次，拿到 Heartbeat 句柄；连接关闭时 cancel。
+到期时在调度线程里调用 send()，按各自的 interval 重新排进时间轮；
+interval 可随时修改（例如服务器下发的 heartbeat_duration），变短时立即按新间隔重排。
+send() 抛异常视为连接已失效，自动取消并回调 on_error。
+
+    heartbeat = get_heartbeat_scheduler().register(lambda: ws.send(frame, opcode), interval=10, name=live_id)
+    heartbeat.interval = 8
+    heartbeat.cancel()
+
+send() 在调度线程上同步执行，应当是非阻塞或很快返回的调用。
+
+时间取自 clock（与 reconnect.py 相同）；autostart=False 时不启动调度线程，由调用方 advance() 逐格推进，
+配合 FakeClock 可以不真正等待地验证时间轮：
+
+    clock = FakeClock()
+    scheduler = HeartbeatScheduler(clock=clock, autostart=False)
+    scheduler.register(send, interval=60)
+    scheduler.advance(600)
+"""
+
+import os
+import threading
+
+from reconnect import SYSTEM_CLOCK
+
+
+class Heartbeat:
+    """一条连接的心跳句柄"""
+
+    __slots__ = ('_scheduler', 'send', 'name', 'on_error', '_interval', '_rounds', '_slot',
+                 'cancelled', 'sent', 'failures', 'last_sent')
+
+    def __init__(self, scheduler, send, interval: float, name: str = '', on_error=None):
+        self._scheduler = scheduler
+        self.send = send
+        self.name = name
+        self.on_error = on_error
+        self._interval = interval
+        self._rounds = 0
+        self._slot = None
+        self.cancelled = False
+        self.sent = 0
+        self.failures = 0
+        self.last_sent = None
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @interval.setter
+    def interval(self, seconds: float):
+        if seconds <= 0 or seconds == self._interval:
+            return
+        shorter = seconds < self._interval
+        self._interval = seconds
+        if shorter:
+            self._scheduler._reschedule(self, self._due_in())
+
+    def _due_in(self) -> float:
+        if self.last_sent is None:
+            return 0
+        return max(0.0, self.last_sent + self._interval - self._scheduler.clock.monotonic())
+
+    def cancel(self):
+        self._scheduler._cancel(self)
+
+
+class HeartbeatScheduler:
+    """
+    参数:
+        tick:      时间轮刻度（秒），心跳时间精度
+        slots:     时间轮格数；间隔超过 tick * slots 的条目会多转几圈
+        clock:     时钟，默认系统时钟
+        autostart: False 时不启动调度线程，由调用方 advance() 推进
+    """
+
+    def __init__(self, tick: float = 0.1, slots: int = 512, clock=SYSTEM_CLOCK, autostart: bool = True):
+        self.tick = tick
+        self.clock = clock
+        self.autostart = autostart
+        self._slots = slots
+        self._wheel = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._cond = threading.Condition()
+        self._entries = set()
+        self._thread = None
+
+    def register(self, send, interval: float, name: str = '', on_error=None, delay: float = 0) -> Heartbeat:
+        """登记一条连接；delay 为第一次发送前的等待（默认下一刻度立即发送）"""
+        heartbeat = Heartbeat(self, send, interval, name, on_error)
+        with self._cond:
+            self._entries.add(heartbeat)
+            self._insert(heartbeat, delay)
+            if self._thread is None and self.autostart:
+                self._thread = threading.Thread(target=self._run, name="heartbeat-wheel", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return heartbeat
+
+    def _insert(self, heartbeat: Heartbeat, delay: float):
+        ticks = max(1, int(round(delay / self.tick)))
+        heartbeat._rounds = (ticks - 1) // self._slots
+        heartbeat._slot = (self._cursor + ticks) % self._slots
+        self._wheel[heartbeat._slot].append(heartbeat)
+
+    def _remove(self, heartbeat: Heartbeat):
+        if heartbeat._slot is not None:
+            try:
+                self._wheel[heartbeat._slot].remove(heartbeat)
+            except ValueError:
+                pass
+            heartbeat._slot = None
+
+    def _reschedule(self, heartbeat: Heartbeat, delay: float):
+        with self._cond:
+            if heartbeat.cancelled or heartbeat._slot is None:
+                return
+            self._remove(heartbeat)
+            self._insert(heartbeat, delay)
+
+    def _cancel(self, heartbeat: Heartbeat):
+        with self._cond:
+            heartbeat.cancelled = True
+            self._remove(heartbeat)
+            self._entries.discard(heartbeat)
+
+    def _run(self):
+        next_tick = self.clock.monotonic()
+        while True:
+            with self._cond:
+                while not self._entries:
+                    self._cond.wait()
+                    next_tick = self.clock.monotonic()
+
+            next_tick += self.tick
+            self.clock.sleep(next_tick - self.clock.monotonic())
+            self._turn()
+
+    def advance(self, ticks: int = 1):
+        """手动推进 ticks 格（autostart=False 时使用）：每格先让时钟走一个 tick，再处理到期的心跳"""
+        for _ in range(ticks):
+            self.clock.sleep(self.tick)
+            self._turn()
+
+    def _turn(self):
+        """时间轮前进一格，发送这一格里到期的心跳"""
+        with self._cond:
+            self._cursor = (self._cursor + 1) % self._slots
+            bucket = self._wheel[self._cursor]
+            due = []
+            keep = []
+            for heartbeat in bucket:
+                if heartbeat._rounds > 0:
+                    heartbeat._rounds -= 1
+                    keep.append(heartbeat)
+                else:
+                    heartbeat._slot = None
+                    due.append(heartbeat)
+            self._wheel[self._cursor] = keep
+
+        for heartbeat in due:
+            self._fire(heartbeat)
+
+    def _fire(self, heartbeat: Heartbeat):
+        try:
+            heartbeat.send()
+        except Exception as e:
+            heartbeat.failures += 1
+            self._cancel(heartbeat)
+            if heartbeat.on_error is not None:
+                try:
+                    heartbeat.on_error(e)
+                except Exception:
+                    pass
+            return
+
+        heartbeat.sent += 1
+        heartbeat.last_sent = self.clock.monotonic()
+        with self._cond:
+            if not heartbeat.cancelled and heartbeat._slot is None:
+                self._insert(heartbeat, heartbeat.interval)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._cond:
+            entries = list(self._entries)
+        return {
+            "connections": len(entries),
+            "tick": self.tick,
+            "entries": {
+                h.name or str(id(h)): {"interval": h.interval, "sent": h.sent, "failures": h.failures}
+                for h in entries
+            },
+        }
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # 子进程里没有父进程的调度线程，重新创建
+    global _scheduler, _scheduler_lock
+    _scheduler = None
+    _scheduler_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_heartbeat_scheduler() -> HeartbeatScheduler:
+    """获取进程内共享的心跳调度器"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = HeartbeatScheduler()
+        return _scheduler
+
+
+class Keepalive:
+    """
+    一条连接的自适应心跳间隔，每次心跳前由 next() 决定下一次间隔
+
+        base:     服务器下发的 heartbeat_duration，没有时用 interval 参数
+        收到帧    连接确认存活，间隔按 1.5 倍放宽，上限是服务器的 heartbeat_duration（没下发时为 max_interval）
+        没有帧    超过 2 个期望帧间隔（服务器的 fetch_interval，没下发时为 base 的一半）没收到任何帧，
+                  间隔减半，最低 min_interval，尽快探测
+        判死      超过 dead_after 秒没收到任何帧，返回 'dead'，由调用方断开重连；默认 3 个 base
+
+    参数:
+        adaptive: False 时只跟随服务器下发的间隔，不放宽、不收紧、不判死（原来的固定心跳）
+        clock:    时钟，默认系统时钟
+    """
+
+    OK = 'ok'
+    SILENT = 'silent'
+    DEAD = 'dead'
+
+    def __init__(self, interval: float = 10, min_interval: float = 2, max_interval: float = 20,
+                 dead_after: float = None, adaptive: bool = True, clock=SYSTEM_CLOCK):
+        self.clock = clock
+        self.default_interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.dead_after = dead_after
+        self.adaptive = adaptive
+        self.server_interval = None
+        self.fetch_interval = None
+        self.interval = interval
+        self.state = self.OK
+        self.last_frame = self.clock.monotonic()
+        self.tightened = 0
+        self.deaths = 0
+
+    @property
+    def base(self) -> float:
+        return self.server_interval or self.default_interval
+
+    @property
+    def ceiling(self) -> float:
+        return self.server_interval or max(self.max_interval, self.default_interval)
+
+    def reset(self):
+        """新连接建立时调用"""
+        self.interval = self.base
+        self.state = self.OK
+        self.last_frame = self.clock.monotonic()
+
+    def frame(self):
+        """收到任意一帧（接收线程上调用，只记时间）"""
+        self.last_frame = self.clock.monotonic()
+
+    def update(self, heartbeat_duration: int, fetch_interval: int) -> bool:
+        """服务器下发的 heartbeat_duration / fetch_interval（毫秒，0 表示未下发），心跳间隔变化时返回 True"""
+        if fetch_interval > 0:
+            self.fetch_interval = fetch_interval / 1000.0
+        if heartbeat_duration <= 0:
+            return False
+        interval = heartbeat_duration / 1000.0
+        if interval == self.server_interval:
+            return False
+        self.server_interval = interval
+        if not self.adaptive or self.interval > interval:
+            self.interval = interval
+        return True
+
+    def next(self) -> tuple:
+        """返回 (下一次心跳间隔, 状态)"""
+        if not self.adaptive:
+            self.interval = self.base
+            return self.interval, self.OK
+
+        silence = self.clock.monotonic() - self.last_frame
+        dead_after = self.dead_after or 3 * self.base
+        if silence >= dead_after:
+            self.state = self.DEAD
+            self.deaths += 1
+            return self.interval, self.state
+
+        gap = max(self.fetch_interval or self.base / 2, self.min_interval / 2)
+        if silence > 2 * gap:
+            self.state = self.SILENT
+            self.tightened += 1
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.state = self.OK
+            self.interval = min(self.ceiling, self.interval * 1.5)
+        return self.interval, self.state
+
+    def stats(self) -> dict:
+        return {
+            "interval": self.interval,
+            "server_interval": self.server_interval,
+            "fetch_interval": self.fetch_interval,
+            "state": self.state,
+            "silence": round(self.clock.monotonic() - self.last_frame, 3),
+            "tightened": self.tightened,
+            "deaths": self.deaths,
+        }
@@ -6,11 +6,8 @@
 # @Author:      bubu
 # @Project:     douyinLiveWebFetcher
 
-import codecs
-import gzip
 import hashlib
 import random
-import re
 import string
 import subprocess
 import threading
@@ -18,40 +15,40 @@ import time
 from datetime import datetime
 import os
 import sys
-import execjs
 import urllib.parse
+import zlib
 from contextlib import contextmanager
 from unittest.mock import patch
 
 import requests
 import websocket
-from py_mini_racer import MiniRacer
 
 from ac_signature import get__ac_signature
-from protobuf.douyin import *
+# execute_js / resource_path 原来定义在本模块，继续从这里导出（见 __all__），外部脚本不用改
+from signer import execute_js, get_abogus_signer, get_signer, resource_path
+from decoder import get_decoder
+from console import ConsoleSink
+from archive import ColumnarArchiveSink
+from credentials import get_credential_cache, is_auth_error
+from decompress import PayloadDecompressor, PayloadTooLarge
+from dispatch import Dispatcher, handles
+from recorder import FrameRecorder
+from events import (
+    ChatEvent, ControlEvent, EmojiChatEvent, FansclubEvent, GiftEvent, LikeEvent, MemberEvent, RankEvent,
+    RoomEvent, RoomStatsEvent, SocialEvent, StatsEvent, StreamAdaptationEvent, TextEvent,
+)
+from heartbeat import Keepalive, get_heartbeat_scheduler
+from reconnect import ReconnectPolicy
+from room_page import LIVE_STATUS, RoomPageScanner
+from pipeline import Pipeline, Stage
+from logwriter import GroupCommitWriter, get_segmented_log
+from metrics import LatencyStats
+from wire import MessageScanner, peek_ack
+from protobuf.messages import WebcastImPushFrame
 
 from urllib3.util.url import parse_url
 
 
-def resource_path(relative_path: str) -> str:
-    """
-    获取资源文件的实际路径，兼容 PyInstaller 打包后的环境
-    """
-    if hasattr(sys, '_MEIPASS'):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(__file__)
-    return os.path.join(base_path, relative_path)
-
-
-def execute_js(js_file: str):
-    js_path = resource_path(js_file)
-    with open(js_path, 'r', encoding='utf-8') as file:
-        js_code = file.read()
-    ctx = execjs.compile(js_code)
-    return ctx
-
-
 @contextmanager
 def patched_popen_encoding(encoding='utf-8'):
     original_popen_init = subprocess.Popen.__init__
@@ -62,6 +59,16 @@ def patched_popen_encoding(encoding='utf-8'):
         yield
 
 
+__all__ = [
+    'DouyinLiveWebFetcher', 'generateSignature', 'generateMsToken', 'patched_popen_encoding',
+    'HEARTBEAT_FRAME', 'PAGE_CHUNK_SIZE', 'execute_js', 'resource_path',
+]
+
+HEARTBEAT_FRAME = WebcastImPushFrame(payload_type="hb").SerializeToString()
+
+PAGE_CHUNK_SIZE = 16 * 1024
+
+
 def generateSignature(wss, script_file='sign.js'):
     params = ("live_id,aid,version_code,webcast_sdk_version,"
               "room_id,sub_room_id,sub_channel_id,did_rule,"
@@ -77,20 +84,17 @@ def generateSignature(wss, script_file='sign.js'):
     md5.update(param.encode())
     md5_param = md5.hexdigest()
 
-    script_path = resource_path(script_file)
-    with codecs.open(script_path, 'r', encoding='utf8') as f:
-        script = f.read()
-
-    ctx = MiniRacer()
-    ctx.eval(script)
-
     try:
-        signature = ctx.call("get_sign", md5_param)
+        signature = get_signer(script_file).sign(md5_param)
         return signature
     except Exception as e:
         print(e)
 
 
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
 def generateMsToken(length=182):
     random_str = ''
     base_str = string.ascii_letters + string.digits + '-_'
@@ -102,32 +106,60 @@ def generateMsToken(length=182):
 
 class DouyinLiveWebFetcher:
 
-    def _trim_tmp_log(self, keep_lines=500):
-        try:
-            if not os.path.exists(self.tmp_log_path):
-                return
-
-            with open(self.tmp_log_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            if len(lines) > keep_lines:
-                with open(self.tmp_log_path, "w", encoding="utf-8") as f:
-                    f.writelines(lines[-keep_lines:])
-
-                print(f"【√】tmp.log 已瘦身，只保留最后 {keep_lines} 行")
-                self._tmp_log(f"【√】tmp.log 已瘦身，只保留最后 {keep_lines} 行")
-        except Exception as e:
-            print(f"【X】tmp.log 瘦身失败: {e}")
-            self._tmp_log(f"【X】tmp.log 瘦身失败: {e}")
-
-    def __init__(self, live_id, abogus_file='a_bogus.js', log_dir='logs'):
+    def __init__(self, live_id, abogus_file='a_bogus.js', log_dir='logs', abogus_backend='mini_racer',
+                 decoder='betterproto', max_payload_size=16 * 1024 * 1024,
+                 pipeline=True, decode_workers=1, queue_size=1024, drop_policy='block', adaptive_heartbeat=True,
+                 reconnect_policy: ReconnectPolicy = None, credential_cache=None,
+                 log_durability='fsync', log_commit_interval=0.05, log_commit_lines=256, console='all',
+                 archive=None, record_frames=None):
 
-        self.heartbeat_interval = 10
+        # 心跳间隔跟随服务器下发的 heartbeat_duration，并按收帧情况放宽/收紧，见 heartbeat.Keepalive
+        self.keepalive = Keepalive(10, adaptive=adaptive_heartbeat)
+        self._heartbeat = None
         self.abogus_file = abogus_file
+        self.abogus_backend = abogus_backend
+        self.decoder = get_decoder(decoder)
+        self.decompressor = PayloadDecompressor(max_payload_size)
+        self.scanner = MessageScanner()
+        self.ack_lag = LatencyStats()
+        self.ack_send = LatencyStats()
+        self.ack_rtt = LatencyStats()
+        self._ack_sent_at = None
+        self.dispatcher = Dispatcher(self)
+
+        # 接收线程只解帧头、解压并回 ACK；消息解析在 decode 线程，打印与写日志在 sink 线程
+        # decode_workers > 1 时不同帧之间的消息顺序不再保证
+        self.pipeline = None
+        if pipeline:
+            self._sink = Stage('sink', self._write, 1, queue_size, drop_policy)
+            self.pipeline = Pipeline(
+                Stage('decode', self._process_frame, decode_workers, queue_size, drop_policy),
+                self._sink,
+            )
         self.__ttwid = None
         self.__room_id = None
+        # 直播页里提取到的启动字段：room_id / nickname / status，见 room_page.py
+        self.room_info = {}
+        # ttwid / room_id / 签名按 live_id 持久化，重连、重启时不用重新请求和计算；传 False 只在内存里缓存
+        # 也可以传缓存文件路径（.db / .sqlite 用 sqlite），见 credentials.py
+        if credential_cache is None or isinstance(credential_cache, str):
+            credential_cache = get_credential_cache(credential_cache)
+        self.credentials = credential_cache or None
         self.session = requests.Session()
         self.live_id = live_id
+        # 控制台输出：all / throttle / quiet 或自定义的 ConsoleSink，只影响打印，日志照常全量写入
+        if not isinstance(console, ConsoleSink):
+            console = ConsoleSink(console, name=str(live_id))
+        self.console = console
+        self.event_sinks = ()
+        # 每场的事件另存为列式文件：parquet / arrow（需要 pyarrow），见 archive.py
+        if archive:
+            self.add_event_sink(ColumnarArchiveSink(fmt=archive))
+        # 录制收到的原始帧，给 benchmarks 用；也可以设置环境变量 DOUYIN_RECORD_FRAMES，见 recorder.py
+        record_frames = record_frames or os.environ.get('DOUYIN_RECORD_FRAMES')
+        self.record_frames = record_frames.replace('{live_id}', str(live_id)) if record_frames else None
+        self.recorder = None
+        self._open_recorder()
         self.host = "https://www.douyin.com/"
         self.live_url = "https://live.douyin.com/"
         self.user_agent = (
@@ -137,7 +169,13 @@ class DouyinLiveWebFetcher:
         self.headers = {'User-Agent': self.user_agent}
 
         self._running = False
+        self._wake = threading.Event()
+        self._shutdown_lock = threading.Lock()
+        # stop() 时已入队的帧照常处理完；直播结束时剩下的帧直接丢弃
+        self._draining = False
         self._disconnect_count = 0
+        # 断线重连：指数退避 + 抖动、熔断、进程内重连限速，见 reconnect.py
+        self.reconnect = reconnect_policy or ReconnectPolicy()
         self._mail_sent = False
 
         if log_dir and os.path.isabs(log_dir):
@@ -152,86 +190,209 @@ class DouyinLiveWebFetcher:
 
         os.makedirs(self.log_dir, exist_ok=True)
 
+        # 正式日志由后台线程组提交，见 logwriter.py
         self._log_file = None
         self._log_session_start = None
+        # 收尾关闭后不再打开新的日志文件（stop() 之后接收线程上仍可能有帧在处理），再次 start() 时复位
+        self._log_lock = threading.Lock()
+        self._log_closed = False
+        self.log_durability = log_durability
+        self.log_commit_interval = log_commit_interval
+        self.log_commit_lines = log_commit_lines
 
         # 临时日志路径
         if getattr(sys, 'frozen', False):
             base_dir = os.path.dirname(sys.executable)
         else:
             base_dir = os.path.dirname(__file__)
+        # tmp.log 常开一个句柄，按段轮转（tmp.log / tmp.log.1），同一路径的抓取器共用
+        self._tmp_sink = None
         self.tmp_log_path = os.path.join(base_dir, "tmp.log")
 
+    @property
+    def tmp_log_path(self) -> str:
+        return self._tmp_log_path
+
+    @tmp_log_path.setter
+    def tmp_log_path(self, path: str):
+        self._tmp_log_path = path
+        self._tmp_sink = None
+
+    @property
+    def heartbeat_interval(self) -> float:
+        return self.keepalive.interval
+
+    @heartbeat_interval.setter
+    def heartbeat_interval(self, seconds: float):
+        self.keepalive.default_interval = seconds
+        self.keepalive.interval = seconds
+
+    def _open_recorder(self):
+        """按 record_frames 打开录制文件（追加写），stop() 时关闭，再次 start() 时重新打开"""
+        if self.record_frames and self.recorder is None:
+            self.recorder = FrameRecorder(self.record_frames)
+
     def _tmp_log(self, msg: str):
         """写入临时日志（非直播类消息）"""
         try:
-            with open(self.tmp_log_path, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
+            sink = self._tmp_sink
+            if sink is None:
+                sink = self._tmp_sink = get_segmented_log(self.tmp_log_path)
+            sink.write(msg)
         except:
             pass
 
+    def _notice(self, msg: str):
+        """状态类输出（连接、心跳、直播间状态）：经 self.console 打印（按类型限速，quiet 时不打印），并写临时日志；
+        错误（【X】）仍然直接 print"""
+        self.console.write(msg)
+        self._tmp_log(msg)
+
     def _ensure_log_file(self, now_str: str):
         if self._log_file is None:
             safe_name = now_str.replace(":", "-").replace(" ", "_")
             filename = f"{safe_name}.txt"
             full_path = os.path.join(self.log_dir, filename)
 
-            self._log_file = open(full_path, "a", encoding="utf-8", buffering=1)
+            self._log_file = GroupCommitWriter(
+                full_path, self.log_durability, self.log_commit_interval, self.log_commit_lines)
             self._log_session_start = now_str
 
-            msg = f"【日志】本场直播日志文件: {full_path}"
-            print(msg)
-            self._tmp_log(msg)
+            self._notice(f"【日志】本场直播日志文件: {full_path}")
 
-            self._trim_tmp_log()
+            # 事件 sink 的场次与正式日志一致（如 archive.ColumnarArchiveSink）
+            for sink in self.event_sinks:
+                open_session = getattr(sink, 'open_session', None)
+                if open_session is not None:
+                    open_session(safe_name, self.log_dir)
 
     def _log(self, line: str, now_str: str = None):
         try:
             if now_str is None:
                 now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            self._ensure_log_file(now_str)
-
-            if self._log_file:
-                self._log_file.write(line + "\n")
-                self._log_file.flush()
-                os.fsync(self._log_file.fileno())
+            with self._log_lock:
+                if self._log_closed:
+                    # 已收尾：写临时日志，不重新打开正式日志
+                    self._tmp_log(line)
+                    return
+                self._ensure_log_file(now_str)
+                if self._log_file:
+                    self._log_file.write(line)
 
         except Exception as e:
             msg = f"【日志写入失败】{e}"
             print(msg)
             self._tmp_log(msg)
+    def _emit(self, event, now: str = None, target: str = 'log'):
+        """
+        输出一条直播消息（events.Event）：打印、写日志并交给事件 sink，流水线运行时交给 sink 线程
+        兼容直接传文本：_emit(line, now, target)，target 含义见 events.Event
+        """
+        if not self._running and not self._draining:
+            # 已停止（如直播结束后队列里剩下的帧），不再开新的日志文件
+            return
+        if isinstance(event, str):
+            event = TextEvent(time=now, line=event, target=target)
+        if self.pipeline is not None and self.pipeline.running:
+            self._sink.put(event)
+        else:
+            self._write(event)
+
+    def _write(self, event):
+        # 日志行只在这里格式化一次
+        line = event.format()
+        self.console.write(line)
+        target = event.target
+        if target == 'tmp' or (target == 'auto' and not self._log_file):
+            self._tmp_log(line)
+        else:
+            self._log(line, event.time)
+        for sink in self.event_sinks:
+            try:
+                sink(event)
+            except Exception as e:
+                print(f"【X】事件输出失败 {sink!r}: {e}")
+
+    def add_event_sink(self, sink):
+        """
+        追加结构化事件的输出，sink(event)；可选方法：
+            flush()                         stop() 时调用
+            open_session(name, log_dir)     正式日志文件打开（一场开始）时调用
+            close_session()                 正式日志文件关闭时调用
+        """
+        self.event_sinks = self.event_sinks + (sink,)
+
     def _close_log_file(self):
-        if self._log_file:
+        with self._log_lock:
+            self._log_closed = True
+            log_file, self._log_file = self._log_file, None
+        if log_file:
             try:
-                self._log_file.close()
+                # 先提交还没写盘的行
+                log_file.close()
             except:
                 pass
-        self._log_file = None
+            for sink in self.event_sinks:
+                close_session = getattr(sink, 'close_session', None)
+                if close_session is not None:
+                    close_session()
         self._log_session_start = None
 
-    def start(self, retry_interval=5):
-        self._running = True
-        while self._running:
-            try:
-                self._connectWebSocket()
-            except Exception as e:
-                if not self._running:
-                    break
-                msg = f"【X】WebSocket异常: {e}"
-                print(msg)
-                self._tmp_log(msg)
-
-            if self._running:
-                self._disconnect_count += 1
-                msg = f"【!】连接已断开，第 {self._disconnect_count} 次，{retry_interval} 秒后尝试重连..."
-                print(msg)
-                self._tmp_log(msg)
+    def log_stats(self) -> dict:
+        """正式日志的写入统计：提交批数、批大小、提交耗时"""
+        log_file = self._log_file
+        return log_file.stats() if log_file else {}
 
-                if self._disconnect_count > 5 and not self._mail_sent:
-                    self._notify_disconnect()
+    def start(self, retry_interval=None):
+        """连接并保持，断线后按 self.reconnect 的策略重连；retry_interval 为退避的初始等待上限（秒）"""
+        if retry_interval is not None:
+            self.reconnect.backoff.base = retry_interval
+        self._running = True
+        self._draining = False
+        self._log_closed = False
+        self._open_recorder()
+        self._wake.clear()
+        if self.pipeline is not None:
+            self.pipeline.start()
+        try:
+            while self._running:
+                try:
+                    self._connectWebSocket()
+                except Exception as e:
+                    if not self._running:
+                        break
+                    msg = f"【X】WebSocket异常: {e}"
+                    print(msg)
+                    self._tmp_log(msg)
+
+                if self._running:
+                    delay = self._disconnected()
+                    # stop() 会唤醒，不用等完整个退避
+                    self._wake.wait(delay)
+        finally:
+            self._shutdown()
+
+    def _disconnected(self) -> float:
+        """记一次断线，返回重连前要等的秒数"""
+        self._disconnect_count += 1
+        breaker = self.reconnect.breaker
+        trips = breaker.trips
+        delay = self.reconnect.next_delay()
+        if breaker.trips > trips or self.reconnect.flapped:
+            # 连续连不上、或握手后马上被断开时，room_id 可能已经变了（主播重新开播），下次重新获取
+            self.invalidate_credentials('room_id', 'signature')
+        if breaker.state == breaker.OPEN:
+            msg = (f"【X】连续失败 {breaker.failures} 次，暂停重连，"
+                   f"{delay:.1f} 秒后试探连接（第 {self._disconnect_count} 次断开）")
+            print(msg)
+            self._tmp_log(msg)
+        else:
+            self._notice(f"【连接】连接已断开，第 {self._disconnect_count} 次，{delay:.1f} 秒后尝试重连...")
 
-                time.sleep(retry_interval)
+        if self._disconnect_count > 5 and not self._mail_sent:
+            self._notify_disconnect()
+        return delay
 
     def _notify_disconnect(self):
         self._mail_sent = True
@@ -255,17 +416,63 @@ class DouyinLiveWebFetcher:
             self._tmp_log(msg)
 
     def stop(self):
+        self._draining = True
+        self._request_stop()
+        self._shutdown()
+
+    def _request_stop(self):
+        """只结束 start() 的循环并断开连接，不等待；流水线线程里（处理函数中）只能调用这个"""
         self._running = False
-        self._close_log_file()
+        self._wake.set()
+        self._stop_heartbeat()
+        self._close_ws()
 
+    def _close_ws(self):
         try:
             if hasattr(self, "ws") and self.ws:
                 self.ws.close()
         except:
             pass
 
+    def _shutdown(self):
+        """收尾：排空流水线、输出汇总、关闭日志和事件 sink 的场次；可重复调用"""
+        with self._shutdown_lock:
+            if self.pipeline is not None:
+                self.pipeline.stop()
+            self.console.flush()
+            for sink in self.event_sinks:
+                flush = getattr(sink, 'flush', None)
+                if flush is not None:
+                    flush()
+            self._close_log_file()
+            recorder, self.recorder = self.recorder, None
+            if recorder is not None:
+                recorder.close()
+            self._draining = False
+
+    def _cached(self, key: str):
+        if self.credentials is None:
+            return None
+        return self.credentials.get(self.live_id, key)
+
+    def _cache(self, key: str, value):
+        if self.credentials is not None and value:
+            self.credentials.set(self.live_id, key, value)
+
+    def invalidate_credentials(self, *keys):
+        """作废 ttwid / room_id / signature（不传则全部），下次连接重新获取"""
+        if self.credentials is not None:
+            self.credentials.invalidate(self.live_id, *keys)
+        if not keys or 'ttwid' in keys:
+            self.__ttwid = None
+        if not keys or 'room_id' in keys:
+            self.__room_id = None
+
     @property
     def ttwid(self):
+        if self.__ttwid:
+            return self.__ttwid
+        self.__ttwid = self._cached('ttwid')
         if self.__ttwid:
             return self.__ttwid
         headers = {"User-Agent": self.user_agent}
@@ -278,10 +485,14 @@ class DouyinLiveWebFetcher:
             self._tmp_log(msg)
         else:
             self.__ttwid = resp.cookies.get('ttwid')
+            self._cache('ttwid', self.__ttwid)
             return self.__ttwid
 
     @property
     def room_id(self):
+        if self.__room_id:
+            return self.__room_id
+        self.__room_id = self._cached('room_id')
         if self.__room_id:
             return self.__room_id
 
@@ -291,22 +502,36 @@ class DouyinLiveWebFetcher:
             "cookie": f"ttwid={self.ttwid}&msToken={generateMsToken()}; __ac_nonce=0123407cc00a9e438deb4",
         }
 
+        # 流式读取直播页，找到 room_id 等字段就断开，不下载整个页面
+        scanner = RoomPageScanner()
         try:
-            resp = self.session.get(url, headers=headers)
-            resp.raise_for_status()
+            with self.session.get(url, headers=headers, stream=True) as resp:
+                resp.raise_for_status()
+                for chunk in resp.iter_content(PAGE_CHUNK_SIZE):
+                    if scanner.feed(chunk):
+                        break
         except Exception as err:
             msg = f"【X】Request the live room url error: {err}"
             print(msg)
             self._tmp_log(msg)
-        else:
-            match = re.search(r'roomId\\":\\"(\d+)\\"', resp.text)
-            if match is None or len(match.groups()) < 1:
-                msg = "【X】No match found for roomId"
-                print(msg)
-                self._tmp_log(msg)
+            return None
+        return self._room_page_scanned(scanner)
 
-            self.__room_id = match.group(1)
-            return self.__room_id
+    def _room_page_scanned(self, scanner: RoomPageScanner):
+        """记录直播页提取结果，返回 room_id（没找到时为 None）"""
+        if scanner.room_id is None:
+            msg = f"【X】No match found for roomId（已读取 {scanner.bytes_read} 字节）"
+            print(msg)
+            self._tmp_log(msg)
+            return None
+
+        self.room_info = scanner.result
+        self.__room_id = scanner.room_id
+        self._cache('room_id', self.__room_id)
+        nickname = scanner.result.get('nickname', '')
+        status = LIVE_STATUS.get(scanner.result.get('status'), '状态未知')
+        self._notice(f"【状态】直播间 {self.live_id}：{nickname} room_id={self.__room_id}，{status}（读取 {scanner.bytes_read} 字节）")
+        return self.__room_id
 
     def get_ac_nonce(self):
         return self.session.get(self.host, headers=self.headers).cookies.get("__ac_nonce")
@@ -318,14 +543,10 @@ class DouyinLiveWebFetcher:
 
     def get_a_bogus(self, url_params: dict):
         url = urllib.parse.urlencode(url_params)
-        ctx = execute_js(self.abogus_file)
-        return ctx.call("get_ab", url, self.user_agent)
-
-    def get_room_status(self):
-        msToken = generateMsToken()
-        nonce = self.get_ac_nonce()
-        signature = self.get_ac_signature(nonce)
+        signer = get_abogus_signer(self.abogus_file, self.abogus_backend)
+        return signer.get_ab(url, self.user_agent)
 
+    def _room_status_url(self, msToken: str) -> str:
         url = ('https://live.douyin.com/webcast/room/web/enter/?aid=6383'
                '&app_name=douyin_web&live_id=1&device_platform=web&language=zh-CN&enter_from=page_refresh'
                '&cookie_enabled=true&screen_width=5120&screen_height=1440&browser_language=zh-CN&browser_platform=Win32'
@@ -336,26 +557,37 @@ class DouyinLiveWebFetcher:
 
         query = parse_url(url).query
         params = {i[0]: i[1] for i in [j.split('=') for j in query.split('&')]}
-        url += f"&a_bogus={self.get_a_bogus(params)}"
+        return url + f"&a_bogus={self.get_a_bogus(params)}"
 
+    def _room_status_headers(self, nonce: str, signature: str) -> dict:
         headers = self.headers.copy()
         headers.update({
             'Referer': f'https://live.douyin.com/{self.live_id}',
             'Cookie': f'ttwid={self.ttwid};__ac_nonce={nonce}; __ac_signature={signature}',
         })
+        return headers
 
-        resp = self.session.get(url, headers=headers)
-        data = resp.json().get('data')
-
+    def _report_room_status(self, data: dict):
         if data:
             room_status = data.get('room_status')
             user = data.get('user')
             user_id = user.get('id_str')
             nickname = user.get('nickname')
-            msg = f"【{nickname}】[{user_id}]直播间：{['正在直播','已结束'][bool(room_status)]}."
-            print(msg)
-            self._tmp_log(msg)
-    def _connectWebSocket(self):
+            self._notice(f"【状态】{nickname}[{user_id}]直播间：{['正在直播','已结束'][bool(room_status)]}.")
+
+    def get_room_status(self):
+        msToken = generateMsToken()
+        nonce = self.get_ac_nonce()
+        signature = self.get_ac_signature(nonce)
+
+        url = self._room_status_url(msToken)
+        headers = self._room_status_headers(nonce, signature)
+
+        resp = self.session.get(url, headers=headers)
+        self._report_room_status(resp.json().get('data'))
+
+    def _wss_url(self, room_id: str) -> str:
+        """带 signature 的弹幕 WebSocket 地址"""
         wss = (
             "wss://webcast100-ws-web-lq.douyin.com/webcast/im/push/v2/?app_name=douyin_web"
             "&version_code=180800&webcast_sdk_version=1.0.14-beta.0"
@@ -366,16 +598,31 @@ class DouyinLiveWebFetcher:
             "%20like%20Gecko)%20Chrome/126.0.0.0%20Safari/537.36"
             "&browser_online=true&tz_name=Asia/Shanghai"
             "&cursor=d-1_u-1_fh-7392091211001140287_t-1721106114633_r-1"
-            f"&internal_ext=internal_src:dim|wss_push_room_id:{self.room_id}|wss_push_did:7319483754668557238"
+            f"&internal_ext=internal_src:dim|wss_push_room_id:{room_id}|wss_push_did:7319483754668557238"
             f"|first_req_ms:1721106114541|fetch_time:1721106114633|seq:1|wss_info:0-1721106114633-0-0|"
             f"wrds_v:7392094459690748497"
             f"&host=https://live.douyin.com&aid=6383&live_id=1&did_rule=3&endpoint=live_pc&support_wrds=1"
             f"&user_unique_id=7319483754668557238&im_path=/webcast/im/fetch/&identity=audience"
-            f"&need_persist_msg_count=15&insert_task_id=&live_reason=&room_id={self.room_id}&heartbeatDuration=0"
+            f"&need_persist_msg_count=15&insert_task_id=&live_reason=&room_id={room_id}&heartbeatDuration=0"
         )
 
-        signature = generateSignature(wss)
+        # 除 room_id 外参数都是固定的，签名连同 room_id 一起缓存，room_id 变了就重新计算
+        cached = self._cached('signature')
+        if cached and cached[0] == room_id:
+            signature = cached[1]
+        else:
+            signature = generateSignature(wss)
+            if signature:
+                self._cache('signature', [room_id, signature])
         wss += f"&signature={signature}"
+        return wss
+
+    def _connectWebSocket(self):
+        # 只取一次：没取到时 room_id 属性每次读取都会重新请求直播页
+        room_id = self.room_id
+        if not room_id:
+            raise RuntimeError("获取 room_id 失败")
+        wss = self._wss_url(room_id)
 
         headers = {
             "cookie": f"ttwid={self.ttwid}",
@@ -399,241 +646,322 @@ class DouyinLiveWebFetcher:
             self._tmp_log(msg)
             raise
 
-    def _sendHeartbeat(self):
-        while self._running:
-            try:
-                heartbeat_frame = WebcastImPushFrame(
-                    payload_type="hb"
-                ).SerializeToString()
-
-                self.ws.send(heartbeat_frame, websocket.ABNF.OPCODE_BINARY)
+    def _sendHeartbeat(self, ws):
+        """发送一个业务心跳包，由进程内共用的心跳调度器按 heartbeat_interval 调用"""
+        if not self._keepalive_check(ws.close):
+            return
+        ws.send(HEARTBEAT_FRAME, websocket.ABNF.OPCODE_BINARY)
+        self._heartbeat_sent_notice()
+
+    def _heartbeat_sent_notice(self):
+        # 经 console 输出：throttle 模式下被略过的消息即使之后没有新消息，也会在心跳时汇总出来
+        self._notice(f"【心跳】发送业务心跳包 [{_now()}]")
+
+    def _heartbeatFailed(self, error):
+        print(f"【X】心跳发送失败: {error}")
+
+    def _start_heartbeat(self, send):
+        """为当前连接登记心跳（先取消上一条连接的）"""
+        self._stop_heartbeat()
+        self.keepalive.reset()
+        self._heartbeat = get_heartbeat_scheduler().register(
+            send, self.heartbeat_interval, name=str(self.live_id), on_error=self._heartbeatFailed)
+
+    def _stop_heartbeat(self):
+        heartbeat, self._heartbeat = self._heartbeat, None
+        if heartbeat is not None:
+            heartbeat.cancel()
+
+    def _keepalive_check(self, close) -> bool:
+        """每次心跳前调用：按收帧情况调整下一次间隔；连接判死时取消心跳、调用 close() 断开并返回 False"""
+        keepalive = self.keepalive
+        previous = keepalive.state
+        interval, state = keepalive.next()
+        silence = time.monotonic() - keepalive.last_frame
+
+        if state == Keepalive.DEAD:
+            msg = f"【X】{silence:.0f} 秒没有收到任何帧，判定连接已失效，主动断开重连"
+            print(msg)
+            self._tmp_log(msg)
+            self._stop_heartbeat()
+            close()
+            return False
 
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self._tmp_log(f"【心跳】发送业务心跳包 [{now}]")   
+        if state != previous:
+            if state == Keepalive.SILENT:
+                self._notice(f"【心跳】{silence:.0f} 秒没有收到帧，心跳间隔收紧到 {interval:g} 秒")
+            else:
+                self._notice(f"【心跳】重新收到帧，心跳间隔恢复为 {interval:g} 秒")
 
-                print(f"【√】发送业务心跳包 [{now}]")
+        heartbeat = self._heartbeat
+        if heartbeat is not None:
+            heartbeat.interval = interval
+        return True
 
-                time.sleep(self.heartbeat_interval)
+    def register_handler(self, method: str, handler):
+        """运行时追加/覆盖某个 method 的处理函数，handler(payload)"""
+        self.dispatcher.register(method, handler)
 
-            except Exception as e:
-                print(f"【X】心跳发送失败: {e}")
-                break
+    def register_plugin(self, plugin):
+        """加载插件，plugin.handlers() 返回 {method: handler(payload)}"""
+        self.dispatcher.register_plugin(plugin)
 
     def _wsOnOpen(self, ws):
-        msg = "【√】WebSocket连接成功."
-        print(msg)
-        self._tmp_log(msg)
-        threading.Thread(target=self._sendHeartbeat).start()
+        self._notice("【连接】WebSocket连接成功.")
+        self.reconnect.connected()
+        # 绑定本次连接的 ws，断线重连后旧连接的心跳随 _wsOnClose 取消，不会再往旧 ws 上发
+        self._start_heartbeat(lambda: self._sendHeartbeat(ws))
+
+    def _frame_received(self) -> float:
+        received = time.perf_counter()
+        self.keepalive.frame()
+        if self._ack_sent_at is not None:
+            # 上一个 ACK 发出到服务器推来下一帧的间隔
+            self.ack_rtt.record(received - self._ack_sent_at)
+            self._ack_sent_at = None
+        return received
 
     def _wsOnMessage(self, ws, message):
-        package = WebcastImPushFrame().parse(message)
-        response = WebcastImResponse().parse(gzip.decompress(package.payload))
+        received = self._frame_received()
+        if self.recorder is not None:
+            self.recorder.write(message)
+        frame = self._receive_frame(ws, message, received)
+        if frame is None:
+            return
+        if self.pipeline is not None and self.pipeline.running:
+            self.pipeline.submit(frame)
+        else:
+            self._process_frame(frame)
 
-        # 如果服务器下发了新的心跳间隔，这里会自动同步
-        # if hasattr(response, "heartbeat_duration") and response.heartbeat_duration > 0:
-        #     self.heartbeat_interval = response.heartbeat_duration / 1000.0
-        #     print(f"【√】服务器心跳间隔: {self.heartbeat_interval} 秒")
+    def _unpack_frame(self, message):
+        """解 PushFrame、解压，直接从线上格式取 need_ack/internal_ext 生成 ACK 帧（不需要回 ACK 时为 None）"""
+        package = self.decoder.parse('WebcastImPushFrame', message)
+        try:
+            payload = self.decompressor.decompress(package.payload, package.payload_encoding, package.headers)
+        except (PayloadTooLarge, ValueError, EOFError, zlib.error) as e:
+            msg = f"【X】丢弃无法解压的帧 log_id={package.log_id}: {e}"
+            print(msg)
+            self._tmp_log(msg)
+            return None
 
-        if response.need_ack:
+        ack = None
+        need_ack, internal_ext = peek_ack(payload)
+        if need_ack:
             ack = WebcastImPushFrame(
                 log_id=package.log_id,
                 payload_type='ack',
-                payload=response.internal_ext.encode('utf-8')
+                payload=internal_ext.encode('utf-8')
             ).SerializeToString()
+        return package, payload, ack
+
+    def _record_ack(self, start: float, received: float):
+        self._ack_sent_at = sent = time.perf_counter()
+        self.ack_send.record(sent - start)
+        self.ack_lag.record(sent - received)
+
+    def _receive_frame(self, ws, message, received: float):
+        """接收线程上的工作：解帧、解压并立即回 ACK，消息解析留给后面的阶段"""
+        frame = self._unpack_frame(message)
+        if frame is None:
+            return None
+        package, payload, ack = frame
+        if ack is not None:
+            start = time.perf_counter()
             ws.send(ack, websocket.ABNF.OPCODE_BINARY)
+            self._record_ack(start, received)
+        return package, payload
+
+    def _process_frame(self, frame):
+        if not self._running and not self._draining:
+            return
+        package, payload = frame
+
+        # 分发表由 @handles 在类上收集、实例创建时绑定，这里只取引用（注册插件时整体替换）
+        # 预扫描：每条消息只读 method，没有处理函数的消息不解码，只计入 self.scanner.stats()
+        handlers = self.dispatcher.table
+        response = self.scanner.scan(payload, handlers)
+        # 收到能解出的帧才算连接恢复，见 reconnect.ReconnectPolicy
+        self.reconnect.healthy()
+
+        # 如果服务器下发了新的心跳间隔 / 推送间隔，这里会自动同步
+        if self.keepalive.update(response.heartbeat_duration, response.fetch_interval):
+            heartbeat = self._heartbeat
+            if heartbeat is not None:
+                heartbeat.interval = self.keepalive.interval
+            self.console.write(f"【心跳】服务器心跳间隔: {self.keepalive.server_interval:g} 秒")
+
+        # Debug：如果遇到没处理的消息类型，可以看到具体名称（每种只提示一次）
+        for method in response.unhandled:
+            self.console.write(f"【?】未处理的消息类型: {method}")
 
         # 新 protobuf 的消息字段名是 messages（不是 messages_list）
         for msg in response.messages:
             method = msg.method
-
-            # 旧 method 名（兼容历史）
-            # 新 method 名（WebcastImXXXXXMessage）
-            handlers = {
-                'WebcastImChatMessage': self._parseChatMsg,
-                'WebcastImGiftMessage': self._parseGiftMsg,
-                'WebcastImLikeMessage': self._parseLikeMsg,
-                'WebcastImMemberMessage': self._parseMemberMsg,
-                'WebcastImSocialMessage': self._parseSocialMsg,
-                'WebcastImRoomUserSeqMessage': self._parseRoomUserSeqMsg,
-                'WebcastImFansclubMessage': self._parseFansclubMsg,
-                'WebcastImControlMessage': self._parseControlMsg,
-                'WebcastImEmojiChatMessage': self._parseEmojiChatMsg,
-                'WebcastImRoomStatsMessage': self._parseRoomStatsMsg,
-                'WebcastImRoomMessage': self._parseRoomMsg,
-                'WebcastImRoomRankMessage': self._parseRankMsg,
-                'WebcastImRoomStreamAdaptationMessage': self._parseRoomStreamAdaptationMsg,
-
-                # 兼容旧 method 字符串（抖音旧协议）
-                'WebcastChatMessage': self._parseChatMsg,
-                'WebcastGiftMessage': self._parseGiftMsg,
-                'WebcastLikeMessage': self._parseLikeMsg,
-                'WebcastMemberMessage': self._parseMemberMsg,
-                'WebcastSocialMessage': self._parseSocialMsg,
-                'WebcastRoomUserSeqMessage': self._parseRoomUserSeqMsg,
-                'WebcastFansclubMessage': self._parseFansclubMsg,
-                'WebcastControlMessage': self._parseControlMsg,
-                'WebcastEmojiChatMessage': self._parseEmojiChatMsg,
-                'WebcastRoomStatsMessage': self._parseRoomStatsMsg,
-                'WebcastRoomMessage': self._parseRoomMsg,
-                'WebcastRoomRankMessage': self._parseRankMsg,
-                'WebcastRoomStreamAdaptationMessage': self._parseRoomStreamAdaptationMsg,
-            }
-
-            handler = handlers.get(method)
-            if handler:
-                try:
-                    handler(msg.payload)
-                except Exception as e:
-                    print(f"【X】解析 {method} 失败: {e}")
-            else:
-                # Debug：如果遇到没处理的消息类型，可以看到具体名称
-                print(f"【?】未处理的消息类型: {method}")
-                pass
+            try:
+                handlers[method](msg.payload)
+            except Exception as e:
+                print(f"【X】解析 {method} 失败: {e}")
+
+    def ack_stats(self) -> dict:
+        """
+        lag:  收到帧到 ACK 发出
+        send: ws.send 本身的耗时
+        rtt:  ACK 发出到服务器推来下一帧
+        """
+        return {
+            "lag": self.ack_lag.snapshot(),
+            "send": self.ack_send.snapshot(),
+            "rtt": self.ack_rtt.snapshot(),
+        }
 
     def _wsOnError(self, ws, error):
         msg = f"WebSocket error: {error}"
         print(msg)
         self._tmp_log(msg)
+        self._check_auth_error(error)
+
+    def _check_auth_error(self, error):
+        """握手被拒（401/403）说明缓存的凭据已失效，全部作废，下次重连重新获取"""
+        if is_auth_error(error):
+            msg = "【!】服务器拒绝鉴权，已作废缓存的 ttwid / room_id / 签名"
+            print(msg)
+            self._tmp_log(msg)
+            self.invalidate_credentials()
 
     def _wsOnClose(self, ws, *args):
+        self._stop_heartbeat()
         self.get_room_status()
-        msg = "WebSocket connection closed."
-        print(msg)
-        self._tmp_log(msg)
+        self._notice("【连接】WebSocket connection closed.")
 
+    @handles('WebcastImChatMessage', 'WebcastChatMessage')
     def _parseChatMsg(self, payload):
-        message = WebcastImChatMessage().parse(payload)
-        user_name = message.user.nickname
-        user_id = message.user.id
-        content = message.content
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"【聊天msg】[{user_id}] {user_name}: {content} [{now}]"
-        print(line)
-        self._log(line, now)
+        message = self.decoder.parse('WebcastImChatMessage', payload)
+        common = message.common
+        self._emit(ChatEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            content=message.content,
+        ))
 
+    @handles('WebcastImGiftMessage', 'WebcastGiftMessage')
     def _parseGiftMsg(self, payload):
-        message = WebcastImGiftMessage().parse(payload)
-        user_name = message.user.nickname
-        gift_name = message.gift.name
-        gift_cnt = message.combo_count
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"【礼物msg】{user_name} 送出了 {gift_name}x{gift_cnt} [{now}]"
-        print(line)
-        self._log(line, now)
-
+        message = self.decoder.parse('WebcastImGiftMessage', payload)
+        common = message.common
+        gift = message.gift
+        self._emit(GiftEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            gift_id=message.gift_id, gift_name=gift.name, count=message.combo_count,
+            repeat_count=message.repeat_count, group_count=message.group_count, diamond_count=gift.diamond_count,
+        ))
+
+    @handles('WebcastImLikeMessage', 'WebcastLikeMessage')
     def _parseLikeMsg(self, payload):
-        message = WebcastImLikeMessage().parse(payload)
-        user_name = message.user.nickname
-        count = message.count
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"【点赞msg】{user_name} 点了{count}个赞 [{now}]"
-        print(line)
-        self._log(line, now)
-    def _parseMemberMsg(self, payload):
-        message = WebcastImMemberMessage().parse(payload)
-        user_name = message.user.nickname
-        user_id = message.user.id
-        gender = ["女", "男"][message.user.gender]
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        message = self.decoder.parse('WebcastImLikeMessage', payload)
+        common = message.common
+        self._emit(LikeEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            count=message.count, total=message.total,
+        ))
 
-        line = f"【进场msg】[{user_id}][{gender}] {user_name} 进入了直播间 [{now}]"
-        print(line)
-        self._log(line, now)
+    @handles('WebcastImMemberMessage', 'WebcastMemberMessage')
+    def _parseMemberMsg(self, payload):
+        message = self.decoder.parse('WebcastImMemberMessage', payload)
+        common = message.common
+        self._emit(MemberEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            gender=message.user.gender, member_count=message.member_count,
+        ))
 
+    @handles('WebcastImSocialMessage', 'WebcastSocialMessage')
     def _parseSocialMsg(self, payload):
-        message = WebcastImSocialMessage().parse(payload)
-        user_name = message.user.nickname
-        user_id = message.user.id
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        line = f"【关注msg】[{user_id}]{user_name} 关注了主播 [{now}]"
-        print(line)
-        self._log(line, now)
+        message = self.decoder.parse('WebcastImSocialMessage', payload)
+        common = message.common
+        self._emit(SocialEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            follow_count=message.follow_count,
+        ))
 
+    @handles('WebcastImRoomUserSeqMessage', 'WebcastRoomUserSeqMessage')
     def _parseRoomUserSeqMsg(self, payload):
-        message = WebcastImRoomUserSeqMessage().parse(payload)
-        current = message.total
-        total = message.total_pv_for_anchor
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        line = f"【统计msg】当前观看人数: {current}, 累计观看人数: {total} [{now}]"
-        print(line)
-        self._log(line, now)
+        message = self.decoder.parse('WebcastImRoomUserSeqMessage', payload)
+        common = message.common
+        self._emit(StatsEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            current=message.total, total_pv=message.total_pv_for_anchor,
+        ))
 
+    @handles('WebcastImFansclubMessage', 'WebcastFansclubMessage')
     def _parseFansclubMsg(self, payload):
-        message = WebcastImFansclubMessage().parse(payload)
-        content = message.content
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        line = f"【粉丝团msg】{content} [{now}]"
-        print(line)
-        self._log(line, now)
+        message = self.decoder.parse('WebcastImFansclubMessage', payload)
+        common = message.common
+        self._emit(FansclubEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            action=message.action, content=message.content,
+        ))
 
+    @handles('WebcastImEmojiChatMessage', 'WebcastEmojiChatMessage')
     def _parseEmojiChatMsg(self, payload):
-        message = WebcastImEmojiChatMessage().parse(payload)
-        emoji_id = message.emoji_id
-        user_name = message.user.nickname
-        user_id = message.user.id
-        default_content = message.default_content or "发送了表情"
-
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"【聊天表情包msg】[{user_id}] {user_name}: {default_content} (emoji_id={emoji_id}) [{now}]"
-        print(line)
-        self._log(line, now)
+        message = self.decoder.parse('WebcastImEmojiChatMessage', payload)
+        common = message.common
+        self._emit(EmojiChatEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            user_id=message.user.id, user_name=message.user.nickname,
+            emoji_id=message.emoji_id, content=message.default_content or "发送了表情",
+        ))
 
+    @handles('WebcastImRoomMessage', 'WebcastRoomMessage')
     def _parseRoomMsg(self, payload):
-        message = WebcastImRoomMessage().parse(payload)
+        message = self.decoder.parse('WebcastImRoomMessage', payload)
         common = message.common
-        room_id = common.room_id
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        line = f"【直播间msg】直播间id:{room_id} [{now}]"
-        print(line)
-        self._tmp_log(line)
+        self._emit(RoomEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            room_id=common.room_id,
+        ))
 
+    @handles('WebcastImRoomStatsMessage', 'WebcastRoomStatsMessage')
     def _parseRoomStatsMsg(self, payload):
-        message = WebcastImRoomStatsMessage().parse(payload)
-        display_long = message.display_long
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        line = f"【直播间统计msg】{display_long} [{now}]"
-        print(line)
-        self._tmp_log(line)
+        message = self.decoder.parse('WebcastImRoomStatsMessage', payload)
+        common = message.common
+        self._emit(RoomStatsEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            display_long=message.display_long, total=message.total,
+        ))
 
+    @handles('WebcastImRoomRankMessage', 'WebcastRoomRankMessage')
     def _parseRankMsg(self, payload):
-        message = WebcastImRoomRankMessage().parse(payload)
-        ranks_list = message.ranks
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        simple = []
-        for i, item in enumerate(ranks_list, start=1):
-            nick = item.user.nickname
-            score = getattr(item, "score_str", "")
-            simple.append(f"{i}. {nick} {score}".strip())
-
-        line = "【直播间排行榜msg】" + " | ".join(simple) + f" [{now}]"
-        print(line)
-        if self._log_file:
-            self._log(line, now) #未直播的时候不触发开播
-        else:
-            self._tmp_log(line)
-
+        message = self.decoder.parse('WebcastImRoomRankMessage', payload)
+        common = message.common
+        self._emit(RankEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            ranks=tuple((item.user.nickname, getattr(item, "score_str", "")) for item in message.ranks),
+        ))
 
+    @handles('WebcastImControlMessage', 'WebcastControlMessage')
     def _parseControlMsg(self, payload):
-        message = WebcastImControlMessage().parse(payload)
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        if message.status == 3:
-            line = f"【控制msg】直播间已结束 [{now}]"
-            print(line)
-            self._log(line, now)
-            self.stop()
-
+        message = self.decoder.parse('WebcastImControlMessage', payload)
+
+        # ControlMessage 没有 status 字段，直播结束是 action == 3
+        if message.action == 3:
+            common = message.common
+            self._emit(ControlEvent(
+                msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+                action=message.action,
+            ))
+            # 下一场是新的 room_id，不能在缓存有效期内重启时连回已结束的直播间
+            self.invalidate_credentials('room_id', 'signature')
+            # 这里在 decode 线程上：只停止并断开，流水线和日志由 start() 退出时收尾
+            self._request_stop()
+
+    @handles('WebcastImRoomStreamAdaptationMessage', 'WebcastRoomStreamAdaptationMessage')
     def _parseRoomStreamAdaptationMsg(self, payload):
-        message = WebcastImRoomStreamAdaptationMessage().parse(payload)
-        adaptationType = message.adaptation_type
-
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"【直播间流适配msg】adaptationType={adaptationType} [{now}]"
-        print(line)
-        self._tmp_log(line)
+        message = self.decoder.parse('WebcastImRoomStreamAdaptationMessage', payload)
+        common = message.common
+        self._emit(StreamAdaptationEvent(
+            msg_id=common.msg_id, create_time=common.create_time, time=_now(),
+            adaptation_type=message.adaptation_type,
+        ))
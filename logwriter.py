@@ -0,0 +1,238 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    logwriter.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+正式日志的组提交写入：写日志的线程只把行放进内存，后台线程攒成一批再写盘
+
+每 interval 秒或攒够 max_lines 行提交一次，提交后按 durability 落盘：
+    none   只写入 Python 的文件缓冲，由缓冲区满或关闭时写出
+    flush  每批 flush 到操作系统（进程崩溃不丢，断电可能丢最近一批）
+    fsync  每批 flush + fsync（断电最多丢最近 interval 秒）
+
+    writer = GroupCommitWriter(path, durability='fsync')
+    writer.write(line)
+    writer.flush()        # 等当前已写入的行全部提交
+    writer.close()        # 提交剩余的行并关闭文件
+"""
+
+import os
+import threading
+import time
+
+from metrics import Histogram, LatencyStats
+
+DURABILITY = ('none', 'flush', 'fsync')
+
+BATCH_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class GroupCommitWriter:
+    """
+    参数:
+        path:        日志文件（追加写）
+        durability:  每批提交后的落盘方式，见 DURABILITY
+        interval:    最长攒批时间（秒）
+        max_lines:   攒够多少行立即提交（写入比磁盘快时，一批会把积压的行全部带走）
+        max_pending: 未提交的行数上限，超过时 write() 阻塞（磁盘跟不上时的背压）
+    """
+
+    def __init__(self, path: str, durability: str = 'fsync', interval: float = 0.05, max_lines: int = 256,
+                 max_pending: int = 100000):
+        if durability not in DURABILITY:
+            raise ValueError(f"未知的落盘方式: {durability}，可选 {DURABILITY}")
+        self.path = path
+        self.durability = durability
+        self.interval = interval
+        self.max_lines = max_lines
+        self.max_pending = max_pending
+
+        self._file = open(path, "a", encoding="utf-8")
+        self._cond = threading.Condition()
+        self._pending = []
+        self._written = 0
+        self._committed = 0
+        self._flush_to = 0
+        self._closed = False
+
+        self.batch_size = Histogram(BATCH_BOUNDS)
+        self.commit_latency = LatencyStats()
+        self.lines = 0
+        self.batches = 0
+        self.errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str):
+        with self._cond:
+            if self._closed:
+                raise ValueError("日志文件已关闭")
+            while len(self._pending) >= self.max_pending and not self._closed:
+                self._cond.wait()
+            self._pending.append(line)
+            self._written += 1
+            if len(self._pending) == 1 or len(self._pending) >= self.max_lines:
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """等到调用前写入的行都已提交，超时返回 False"""
+        with self._cond:
+            target = self._written
+            self._flush_to = max(self._flush_to, target)
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._committed >= target or not self._thread.is_alive(), timeout)
+
+    def close(self, timeout: float = None):
+        """提交剩余的行并关闭文件，可重复调用"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # 等第一行到来，再最多等 interval 秒攒批；攒够、要求 flush 或关闭时立即提交
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.interval
+                while (not self._closed and len(self._pending) < self.max_lines
+                       and self._flush_to <= self._committed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch, self._pending = self._pending, []
+                closing = self._closed
+                self._cond.notify_all()
+
+            if batch:
+                self._commit(batch)
+            with self._cond:
+                self._committed += len(batch)
+                self._cond.notify_all()
+            if closing and not self._pending:
+                break
+
+        try:
+            self._file.close()
+        except Exception as e:
+            print(f"【日志写入失败】{e}")
+
+    def _commit(self, batch: list):
+        start = time.perf_counter()
+        try:
+            self._file.write("\n".join(batch) + "\n")
+            if self.durability != 'none':
+                self._file.flush()
+                if self.durability == 'fsync':
+                    os.fsync(self._file.fileno())
+        except Exception as e:
+            self.errors += 1
+            print(f"【日志写入失败】{e}")
+        self.commit_latency.record(time.perf_counter() - start)
+        self.batch_size.record(len(batch))
+        self.lines += len(batch)
+        self.batches += 1
+
+    def stats(self) -> dict:
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            "path": self.path,
+            "durability": self.durability,
+            "lines": self.lines,
+            "batches": self.batches,
+            "pending": pending,
+            "errors": self.errors,
+            "batch_size": self.batch_size.snapshot(),
+            "commit_latency": self.commit_latency.snapshot(),
+        }
+
+
+class SegmentedLog:
+    """
+    常开句柄的分段日志（tmp.log 用）：当前段写满 max_lines 行或 max_bytes 字节就轮转
+        tmp.log -> tmp.log.1 -> ... -> tmp.log.<backups>，最旧的一段直接被覆盖
+    轮转只是改名和重新打开，不读回文件；每行一次 write（行缓冲），不再每行打开、关闭一次文件。
+    线程安全；同一路径请用 get_segmented_log 共用一个实例。
+    """
+
+    def __init__(self, path: str, max_lines: int = 500, max_bytes: int = 1024 * 1024, backups: int = 1):
+        self.path = path
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._file = None
+        self._lines = 0
+        self._bytes = 0
+        self.rotations = 0
+
+    def _open(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+        # 沿用已有文件时按大小继续计，行数从 0 计（不读回文件）
+        self._bytes = self._file.tell()
+        self._lines = 0
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                src = f"{self.path}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotations += 1
+        self._open()
+
+    def write(self, line: str):
+        data = line + "\n"
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self._lines >= self.max_lines or self._bytes >= self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._lines += 1
+            self._bytes += len(data.encode("utf-8")) if not data.isascii() else len(data)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def segments(self) -> list:
+        """当前段在前，按新到旧列出存在的段文件"""
+        paths = [self.path] + [f"{self.path}.{i}" for i in range(1, self.backups + 1)]
+        return [path for path in paths if os.path.exists(path)]
+
+
+_segmented = {}
+_segmented_lock = threading.Lock()
+
+
+def get_segmented_log(path: str) -> SegmentedLog:
+    """获取进程内共享的分段日志，同一个文件只有一个句柄"""
+    path = os.path.abspath(path)
+    with _segmented_lock:
+        log = _segmented.get(path)
+        if log is None:
+            log = _segmented[path] = SegmentedLog(path)
+        return log
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    metrics.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+运行期统计工具：调用计数、耗时统计、分桶直方图
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class LatencyStats:
+    """线程安全的耗时统计，记录总体计数/均值/极值，并保留最近一段窗口用于分位数"""
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if self.min is None or seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+            self._recent.append(seconds)
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def snapshot(self) -> dict:
+        """返回毫秒单位的统计快照"""
+        with self._lock:
+            recent = sorted(self._recent)
+            count = self.count
+            total = self.total
+            low = self.min or 0.0
+            high = self.max
+
+        def pct(p):
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(len(recent) * p))] * 1000
+
+        return {
+            "count": count,
+            "avg_ms": total / count * 1000 if count else 0.0,
+            "min_ms": low * 1000,
+            "max_ms": high * 1000,
+            "p50_ms": pct(0.50),
+            "p99_ms": pct(0.99),
+        }
+
+
+class Histogram:
+    """线程安全的分桶直方图，bounds 为各桶上界（升序），超出最后一个上界的计入 +Inf"""
+
+    def __init__(self, bounds):
+        self._lock = threading.Lock()
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            count = self.count
+            total = self.total
+        labels = [f"<={b:g}" for b in self.bounds] + ["+Inf"]
+        return {
+            "count": count,
+            "avg": total / count if count else 0.0,
+            "buckets": dict(zip(labels, counts)),
+        }
@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    pipeline.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+分级处理流水线：有界队列 + 工作线程
+
+    receive（WebSocket 接收线程） --frames--> decode（N 个线程） --lines--> sink（1 个线程）
+
+每一级是一个 Stage：有界队列满了以后按 policy 处理
+    block        阻塞生产者（背压，接收线程会被拖慢，但不丢数据）
+    drop_newest  丢掉新来的
+    drop_oldest  丢掉队列里最旧的，再放入新来的
+并统计队列深度、排队耗时、处理耗时、丢弃与异常次数。
+"""
+
+import queue
+import threading
+import time
+
+from metrics import LatencyStats
+
+POLICIES = ('block', 'drop_newest', 'drop_oldest')
+
+_STOP = object()
+
+
+class Stage:
+    """
+    参数:
+        name:    名称（线程名、统计用）
+        func:    处理函数 func(item)，异常会被计数并打印，不会让线程退出
+        workers: 工作线程数
+        maxsize: 队列上限
+        policy:  队列满时的处理方式，见 POLICIES
+    """
+
+    def __init__(self, name: str, func, workers: int = 1, maxsize: int = 1024, policy: str = 'block'):
+        if policy not in POLICIES:
+            raise ValueError(f"未知的丢弃策略: {policy}，可选 {POLICIES}")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.policy = policy
+        self._queue = queue.Queue(maxsize)
+        self._threads = []
+        self._lock = threading.Lock()
+        self.wait = LatencyStats()
+        self.latency = LatencyStats()
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.high_water = 0
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item) -> bool:
+        """放入一项，被丢弃时返回 False"""
+        entry = (time.perf_counter(), item)
+        if self.policy == 'block':
+            self._queue.put(entry)
+        else:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                if self.policy == 'drop_newest':
+                    self._drop()
+                    return False
+                try:
+                    self._queue.get_nowait()
+                    self._drop()
+                except queue.Empty:
+                    pass
+                try:
+                    self._queue.put_nowait(entry)
+                except queue.Full:
+                    self._drop()
+                    return False
+
+        depth = self._queue.qsize()
+        if depth > self.high_water:
+            self.high_water = depth
+        return True
+
+    def _drop(self):
+        with self._lock:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            if entry is _STOP:
+                break
+            queued_at, item = entry
+            start = time.perf_counter()
+            self.wait.record(start - queued_at)
+            try:
+                self.func(item)
+            except Exception as e:
+                with self._lock:
+                    self.errors += 1
+                print(f"【X】流水线 {self.name} 处理失败: {e}")
+            self.latency.record(time.perf_counter() - start)
+            with self._lock:
+                self.processed += 1
+
+    def stop(self, timeout: float = None):
+        """处理完已入队的项后停止；在本级线程里调用时不会等待自己"""
+        current = threading.current_thread()
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            if thread is not current:
+                thread.join(timeout)
+        self._threads = []
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "policy": self.policy,
+            "depth": self._queue.qsize(),
+            "maxsize": self._queue.maxsize,
+            "high_water": self.high_water,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "wait": self.wait.snapshot(),
+            "latency": self.latency.snapshot(),
+        }
+
+
+class Pipeline:
+    """按顺序串起来的若干 Stage；submit 进入第一级，停止时从前往后依次排空"""
+
+    def __init__(self, *stages: Stage):
+        self.stages = stages
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        for stage in self.stages:
+            stage.start()
+        self.running = True
+
+    def submit(self, item) -> bool:
+        return self.stages[0].put(item)
+
+    def stop(self):
+        if not self.running:
+            return
+        # 排空期间上游还会往下游投递，全部停完才标记为未运行
+        for stage in self.stages:
+            stage.stop()
+        self.running = False
+
+    def stats(self) -> dict:
+        return {stage.name: stage.stats() for stage in self.stages}
@@ -0,0 +1,140 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    build_hot.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+从 douyin.proto 生成精简的 "热集合" betterproto 模块 protobuf/douyin_hot.py
+
+以抓取器实际处理的消息类型为根，沿字段引用收集依赖闭包，只为这些消息生成代码。
+生成的类名、字段名与 protoc + betterproto 插件的输出一致，可以直接替换 douyin.py 使用。
+热集合里的消息不保留未知字段（直接丢弃，不再逐段拼接 bytes），重新序列化时不会带上它们。
+
+在项目根目录运行：
+    python -m protobuf.build_hot
+    python -m protobuf.build_hot --check    # 校验生成结果与完整 douyin.py 的字段一致
+"""
+
+import argparse
+import os
+
+from betterproto import casing
+
+from protobuf.schema import PROTO_PATH, ROOTS, ProtoField, class_name, closure, parse_proto, resolve
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'douyin_hot.py')
+
+# proto 标量类型 -> (python 注解, betterproto 字段函数, map 用的 TYPE_ 常量)
+SCALARS = {
+    'double': ('float', 'double_field', 'TYPE_DOUBLE'),
+    'float': ('float', 'float_field', 'TYPE_FLOAT'),
+    'int32': ('int', 'int32_field', 'TYPE_INT32'),
+    'int64': ('int', 'int64_field', 'TYPE_INT64'),
+    'uint32': ('int', 'uint32_field', 'TYPE_UINT32'),
+    'uint64': ('int', 'uint64_field', 'TYPE_UINT64'),
+    'sint32': ('int', 'sint32_field', 'TYPE_SINT32'),
+    'sint64': ('int', 'sint64_field', 'TYPE_SINT64'),
+    'fixed32': ('int', 'fixed32_field', 'TYPE_FIXED32'),
+    'fixed64': ('int', 'fixed64_field', 'TYPE_FIXED64'),
+    'sfixed32': ('int', 'sfixed32_field', 'TYPE_SFIXED32'),
+    'sfixed64': ('int', 'sfixed64_field', 'TYPE_SFIXED64'),
+    'bool': ('bool', 'bool_field', 'TYPE_BOOL'),
+    'string': ('str', 'string_field', 'TYPE_STRING'),
+    'bytes': ('bytes', 'bytes_field', 'TYPE_BYTES'),
+}
+
+def render_field(messages: dict, owner: str, field: ProtoField) -> str:
+    name = casing.safe_snake_case(field.name)
+    if field.key_type:
+        key_ann, _, key_const = SCALARS[field.key_type]
+        if field.type in SCALARS:
+            value_ann, _, value_const = SCALARS[field.type]
+        else:
+            value_ann, value_const = f'"{class_name(resolve(messages, owner, field.type))}"', 'TYPE_MESSAGE'
+        return (f"    {name}: Dict[{key_ann}, {value_ann}] = betterproto.map_field(\n"
+                f"        {field.number}, betterproto.{key_const}, betterproto.{value_const}\n"
+                f"    )\n")
+
+    if field.type in SCALARS:
+        ann, func, _ = SCALARS[field.type]
+    else:
+        ann, func = f'"{class_name(resolve(messages, owner, field.type))}"', 'message_field'
+    if field.repeated:
+        ann = f"List[{ann}]"
+    return f"    {name}: {ann} = betterproto.{func}({field.number})\n"
+
+
+def render(messages: dict, names: list) -> str:
+    out = [
+        "# Generated by protobuf/build_hot.py from douyin.proto.  DO NOT EDIT!\n",
+        f"# roots: {', '.join(class_name(r) for r in ROOTS)}\n",
+        "\n",
+        "__all__ = (\n",
+    ]
+    out += [f'    "{class_name(n)}",\n' for n in names]
+    out += [
+        ")\n\n\n",
+        "from dataclasses import dataclass\n",
+        "from typing import (\n    Dict,\n    List,\n)\n\n",
+        "import betterproto\n\n\n",
+        "class _HotMessage(betterproto.Message):\n",
+        '    """未知字段直接丢弃，不在实例上累积"""\n\n',
+        "    _unknown_fields = property(lambda self: b\"\", lambda self, value: None)\n",
+    ]
+    for name in names:
+        out.append(f"\n\n@dataclass(eq=False, repr=False)\nclass {class_name(name)}(_HotMessage):\n")
+        fields = messages[name]
+        if not fields:
+            out.append("    pass\n")
+        for field in fields:
+            out.append(render_field(messages, name, field))
+    return ''.join(out)
+
+
+def check(output_path: str) -> int:
+    """逐个类对比字段（名字、编号、类型）与完整 douyin.py 是否一致"""
+    import dataclasses
+    import importlib.util
+    import sys
+
+    import protobuf.douyin as full
+
+    spec = importlib.util.spec_from_file_location('douyin_hot_check', output_path)
+    hot = sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hot)
+
+    def describe(cls):
+        return sorted(
+            (f.name, f.metadata['betterproto'].number, f.metadata['betterproto'].proto_type, str(f.type))
+            for f in dataclasses.fields(cls)
+        )
+
+    errors = 0
+    for name in hot.__all__:
+        if describe(getattr(hot, name)) != describe(getattr(full, name)):
+            errors += 1
+            print(f"【X】{name} 与 douyin.py 不一致")
+    print(f"【校验】{len(hot.__all__)} 个类，不一致 {errors} 个")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成精简的 protobuf 热集合模块")
+    parser.add_argument("--proto", default=PROTO_PATH)
+    parser.add_argument("--output", default=OUTPUT_PATH)
+    parser.add_argument("--check", action="store_true", help="生成后与 douyin.py 对比字段")
+    args = parser.parse_args()
+
+    messages = parse_proto(args.proto)
+    names = closure(messages, ROOTS)
+    with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(render(messages, names))
+    print(f"【√】{len(names)}/{len(messages)} 个消息类型已写入 {args.output}")
+
+    if args.check and check(args.output):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
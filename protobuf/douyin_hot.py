@@ -0,0 +1,6660 @@
+# Generated by protobuf/build_hot.py from douyin.proto.  DO NOT EDIT!
+# roots: WebcastImPushFrame, WebcastImResponse, WebcastImMessage, WebcastImChatMessage, WebcastImGiftMessage, WebcastImLikeMessage, WebcastImMemberMessage, WebcastImSocialMessage, WebcastImRoomUserSeqMessage, WebcastImFansclubMessage, WebcastImControlMessage, WebcastImEmojiChatMessage, WebcastImRoomStatsMessage, WebcastImRoomMessage, WebcastImRoomRankMessage, WebcastImRoomStreamAdaptationMessage
+
+__all__ = (
+    "WebcastImPushFrame",
+    "WebcastImPushHeader",
+    "WebcastImResponse",
+    "WebcastImMessage",
+    "WebcastImCommon",
+    "WebcastImPublicAreaCommon",
+    "WebcastImHoverInfo",
+    "WebcastImPersonalizedDisplayInfo",
+    "WebcastImSuffixText",
+    "WebcastImLandscapeAreaCommon",
+    "WebcastImChatMessage",
+    "WebcastImEmojiChatMessage",
+    "WebcastImControlMessage",
+    "WebcastImControlMessageExtra",
+    "WebcastImPicoDisplayInfo",
+    "WebcastImDoubleLikeDetail",
+    "WebcastImDisplayControlInfo",
+    "WebcastImLikeMessage",
+    "WebcastImFansclubMessage",
+    "WebcastImFansclubMessageUpgradePrivilege",
+    "WebcastImGiftMessage",
+    "WebcastImGiftMessageTextEffect",
+    "WebcastImGiftMessageTextEffectDetail",
+    "WebcastImRoomHotInfo",
+    "WebcastImMemberMessage",
+    "WebcastImMemberMessageEffectConfig",
+    "WebcastImMemberMessagePicoEffectConfig",
+    "WebcastImRoomUserSeqMessage",
+    "WebcastImRoomUserSeqMessageContributor",
+    "WebcastImRoomMessage",
+    "WebcastImSocialMessage",
+    "WebcastImRoomRankMessage",
+    "WebcastImRoomRankMessageRoomRank",
+    "WebcastImRoomStatsMessage",
+    "WebcastImRoomStreamAdaptationMessage",
+    "WebcastImRoomMsgExtra",
+    "WebcastImRoomMsgGiftExtra",
+    "WebcastDataPatternRef",
+    "WebcastDataTextFormat",
+    "WebcastDataTextPieceUser",
+    "WebcastDataTextPieceGift",
+    "WebcastDataTextPieceHeart",
+    "WebcastDataTextPiecePatternRef",
+    "WebcastDataTextPieceImage",
+    "WebcastDataTextPiece",
+    "WebcastDataText",
+    "WebcastDataSchemaInfo",
+    "WebcastDataUser",
+    "WebcastDataUserUserPermissionGrant",
+    "WebcastDataUserFollowInfo",
+    "WebcastDataUserPayGrade",
+    "WebcastDataUserPayGradeGradeIcon",
+    "WebcastDataUserFansClub",
+    "WebcastDataUserFansClubFansClubData",
+    "WebcastDataUserFansClubFansClubDataUserBadge",
+    "WebcastDataUserBorder",
+    "WebcastDataUserUserAttr",
+    "WebcastDataUserOwnRoom",
+    "WebcastDataUserAnchorInfo",
+    "WebcastDataUserAnchorLevel",
+    "WebcastDataUserAuthorStats",
+    "WebcastDataUserXiguaParams",
+    "WebcastDataUserXiguaParamsUserExtendInfo",
+    "WebcastDataUserXiguaParamsUserExtendInfoRocketSchema",
+    "WebcastDataUserActivityInfo",
+    "WebcastDataUserNobleLevelInfo",
+    "WebcastDataUserBrotherhoodInfo",
+    "WebcastDataUserAuthenticationInfo",
+    "WebcastDataUserAuthenticationInfoAccountTypeInfo",
+    "WebcastDataUserPoiInfo",
+    "WebcastDataUserFansGroupInfo",
+    "WebcastDataUserJAccreditInfo",
+    "WebcastDataUserSubscribe",
+    "WebcastDataUserProfileStyleParams",
+    "WebcastDataUserUserDressInfo",
+    "WebcastDataUserBizRelation",
+    "WebcastDataUserPublicAreaBadgeInfo",
+    "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList",
+    "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule",
+    "WebcastDataUserExtraInfo",
+    "WebcastDataUserUserStats",
+    "WebcastDataUserUserSettingInfo",
+    "WebcastDataMemberEntranceInfo",
+    "WebcastDataIndustryCertification",
+    "WebcastDataIndustryCertificationProfile",
+    "WebcastDataIndustryCertificationRoom",
+    "WebcastDataIndustryCertificationRoomRoomOwner",
+    "WebcastDataImage",
+    "WebcastDataImageContent",
+    "WebcastDataImageNinePatchSetting",
+    "WebcastDataVipBadge",
+    "WebcastDataUserVipInfo",
+    "WebcastDataGradeBuffInfo",
+    "WebcastDataGameExtra",
+    "WebcastDataMatchRoomInfo",
+    "WebcastDataMainCameraMatchInfo",
+    "WebcastDataLeagueInfo",
+    "WebcastDataMatchRoomImInfo",
+    "WebcastDataMatchTabFrame",
+    "WebcastDataClientComponent",
+    "WebcastDataClientComponentInfo",
+    "WebcastDataClientComponentFunctionInfo",
+    "WebcastDataRoom",
+    "WebcastDataGroupLiveData",
+    "WebcastDataCloudCollaborateData",
+    "WebcastDataFeaturedPublicScreenConf",
+    "WebcastDataPublicScreenSpeedConf",
+    "WebcastDataShareComponentInfo",
+    "WebcastDataRoomPlatformComponentsData",
+    "WebcastDataPaidLiveSubscribe",
+    "WebcastDataRoomTitle",
+    "WebcastDataRoomAvator",
+    "WebcastDataProfileViewData",
+    "WebcastDataRoomFeedData",
+    "WebcastDataRoomFeedDataStreamCutPosition",
+    "WebcastDataRoomFeedDataFollowTopAppearance",
+    "WebcastDataRoomFeedDataDrawerConfig",
+    "WebcastDataRoomFeedDataDrawerConfigSpecialConfig",
+    "WebcastDataRoomFeedDataDrawerConfigAvatarArea",
+    "WebcastDataRoomFeedDataDrawerConfigEntranceIcon",
+    "WebcastDataRoomFeedDataDrawerConfigEntranceTitle",
+    "WebcastDataRoomFeedDataDrawerConfigArrowView",
+    "WebcastDataRoomFeedDataDrawerConfigEntranceLayout",
+    "WebcastDataRoomFeedDataDrawerConfigFreqInfo",
+    "WebcastDataVrInfo",
+    "WebcastDataVrInfoVrSixdofTransferInfo",
+    "WebcastDataPicoInfo",
+    "WebcastDataPicoInfoVirtualLiveBgImages",
+    "WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage",
+    "WebcastDataOpenContentData",
+    "WebcastDataOpenActivityData",
+    "WebcastDataPublicScreenBottomInfo",
+    "WebcastDataPublicScreenBottomInfoBottomCard",
+    "WebcastDataShareResource",
+    "WebcastDataMatchChatConfig",
+    "WebcastDataCommentaryRoomInfo",
+    "WebcastDataRoomBasisData",
+    "WebcastDataRoomInteractData",
+    "WebcastDataRoomRevenueData",
+    "WebcastDataRoomReqUserData",
+    "WebcastDataRoomAnchorData",
+    "WebcastDataGameAnchorInfo",
+    "WebcastDataRoomOthersData",
+    "WebcastDataWebLivePortOptimization",
+    "WebcastDataWebLivePortConfig",
+    "WebcastDataWebSkinData",
+    "WebcastDataWebProgramme",
+    "WebcastDataLiveMatrixInfo",
+    "WebcastDataRoomGameData",
+    "WebcastDataAppointmentData",
+    "WebcastDataMorePanelData",
+    "WebcastDataActivityData",
+    "WebcastDataCastScreenData",
+    "WebcastDataCastOttPermission",
+    "WebcastDataDesireInfo",
+    "WebcastDataFeedbackCard",
+    "WebcastDataFeedbackCardClientImpression",
+    "WebcastDataFeedbackCardOption",
+    "WebcastDataFeedbackCardRoomCardStruct",
+    "WebcastDataFeedbackCardQuestion",
+    "WebcastDataFeedbackCardCondition",
+    "WebcastDataUpperRightWidgetData",
+    "WebcastDataVipData",
+    "WebcastDataAnchorTabLabel",
+    "WebcastDataBeautifyInfo",
+    "WebcastDataUnionLiveInfo",
+    "WebcastDataUnionLiveInfoGuestAnchor",
+    "WebcastDataRoomSpecificSceneTypeInfo",
+    "WebcastDataRelevantRecommendation",
+    "WebcastDataRelevantRecommendationHighLightInfo",
+    "WebcastDataRelevantRecommendationEcomInfo",
+    "WebcastDataRelevantRecommendationEpisode",
+    "WebcastDataRelevantRecommendationVsInfo",
+    "WebcastDataRelevantRecommendationWhiteCategoryInfo",
+    "WebcastDataIndustryServiceInfo",
+    "WebcastDataIndustryServiceInfoConsultInfo",
+    "WebcastDataEcomData",
+    "WebcastDataAvatarLiveInfo",
+    "WebcastDataWelfareProjectInfo",
+    "WebcastDataCornerMarkReach",
+    "WebcastDataVerticalTypeInfo",
+    "WebcastDataFilterWord",
+    "WebcastDataLabelInfo",
+    "WebcastDataVsLinkInfo",
+    "WebcastDataVsLinkNode",
+    "WebcastDataSpliceLabel",
+    "WebcastDataProfilePicSpliceLabel",
+    "WebcastDataLabelProfileItem",
+    "WebcastDataLiveStatusInfo",
+    "WebcastDataShortTouchAuth",
+    "WebcastDataEpisodeMod",
+    "WebcastDataToolbarItemConfig",
+    "WebcastDataToast",
+    "WebcastDataWatchInfo",
+    "WebcastDataEpisodeExtraInfo",
+    "WebcastDataTitleIcon",
+    "WebcastDataVsConfigDrawer",
+    "WebcastDataVsPremiereToast",
+    "WebcastDataCommentConfig",
+    "WebcastDataCommentMedal",
+    "WebcastDataCommentColor",
+    "WebcastDataCommentRole",
+    "WebcastDataBonus",
+    "WebcastDataBonusCommerce",
+    "WebcastDataBonusAuthor",
+    "WebcastDataBorderInfo",
+    "WebcastDataStaticBorderInfo",
+    "WebcastDataDynamicBorderInfo",
+    "WebcastDataLinkerUsers",
+    "WebcastDataOfficialChannelInfo",
+    "WebcastDataOfficialChannelExtraInfo",
+    "WebcastDataRoomShortTouchAreaConfig",
+    "WebcastDataRoomShortTouchAreaConfigElement",
+    "WebcastDataRoomShortTouchAreaConfigForbiddenType",
+    "WebcastDataRoomShortTouchAreaConfigTempStateType",
+    "WebcastDataRoomShortTouchAreaConfigTempStateCondition",
+    "WebcastDataRoomShortTouchAreaConfigTempStateStrategy",
+    "WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo",
+    "WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition",
+    "WebcastDataMatchInfo",
+    "WebcastDataMatchSkinInfo",
+    "WebcastDataMatchSkinInfoFollowBtnSkin",
+    "WebcastDataRoomActivityTag",
+    "WebcastDataRoomAuthStatus",
+    "WebcastDataRoomAuthStatusRoomAuthOffReasons",
+    "WebcastDataRoomAuthStatusRoomAuthSpecialStyle",
+    "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle",
+    "WebcastDataMoreEntrance",
+    "WebcastDataRoomTab",
+    "WebcastDataRoomExtra",
+    "WebcastDataSafeReason",
+    "WebcastDataRegionRestriction",
+    "WebcastDataRegionMatch",
+    "WebcastDataStreamUrl",
+    "WebcastDataStreamUrlStreamUrlExtra",
+    "WebcastDataStreamUrlStreamUrlExtraSuperResolution",
+    "WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo",
+    "WebcastDataStreamUrlStreamUrlExtraAdaptionInfo",
+    "WebcastDataStreamUrlLiveCoreSdkData",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullData",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay",
+    "WebcastDataStreamUrlLiveCoreSdkDataPushData",
+    "WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams",
+    "WebcastDataStreamUrlPlaySetting",
+    "WebcastDataVsCameraInfo",
+    "WebcastDataCameraPaidInfo",
+    "WebcastDataCameraPaidInfoPriceInfo",
+    "WebcastDataCameraPaidInfoPaidLiveBizExtra",
+    "WebcastDataCameraMatchInfo",
+    "WebcastDataPaidLiveBaseInfo",
+    "WebcastDataLinkMic",
+    "WebcastDataLinkMicLinkMicChannelInfo",
+    "WebcastDataLinkMicLinkMicBattleScore",
+    "WebcastDataLinkMicLinkMicBattleSetting",
+    "WebcastDataReservation",
+    "WebcastDataDecotationDetail",
+    "WebcastDataDecoration",
+    "WebcastDataDecorationFontConfig",
+    "WebcastDataRoomStats",
+    "WebcastDataRoomStatsUserCountComposition",
+    "WebcastDataRoomViewStats",
+    "WebcastDataTopFan",
+    "WebcastDataRoomUserAttr",
+    "WebcastDataBurstInfo",
+    "WebcastDataRoomHealthScoreInfo",
+    "WebcastDataTvStation",
+    "WebcastDataCommentBox",
+    "WebcastDataRoomCartV2",
+    "WebcastDataRoomCart",
+    "WebcastDataCartVertical",
+    "WebcastDataCartHorizontal",
+    "WebcastDataGlobalCustomIcons",
+    "WebcastDataQuizExtra",
+    "WebcastDataAudioSpeakingImageList",
+    "WebcastDataAudioSpeakingImageListSpeakingImage",
+    "WebcastDataShowArea",
+    "WebcastDataAnimatedBgInfo",
+    "WebcastDataAudioBgData",
+    "WebcastDataActivityRoomSkinInfo",
+    "WebcastDataRoomReplayInfo",
+    "WebcastDataCommentWallInfo",
+    "WebcastDataCommentWallPosition",
+    "WebcastDataAnnouncementInfo",
+    "WebcastDataRoomImInfo",
+    "WebcastDataInteractOpenExtra",
+    "WebcastDataLinkerDetail",
+    "WebcastDataPreviewExposeData",
+    "WebcastDataPreviewExposeDataPreviewGuide",
+    "WebcastDataPreviewExposeDataMeta",
+    "WebcastDataPreviewExposeDataMetaHost",
+    "WebcastDataPreviewExposeDataChatMessage",
+    "WebcastDataPreviewExposeDataPreviewExtendArea",
+    "WebcastDataPreviewExposeDataPreviewExtendAreaPart",
+    "WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig",
+    "WebcastDataPreviewExposeDataPreviewSwitch",
+    "WebcastDataPreviewExposeDataPreviewPromotion",
+    "WebcastDataPreviewExposeDataPreviewImExtend",
+    "WebcastDataPreviewExposeDataEtData",
+    "WebcastDataPreviewExposeDataGrowthTask",
+    "WebcastDataPreviewExposeDataPreviewPromotionSyncData",
+    "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag",
+    "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney",
+    "WebcastDataPreviewExposeDataPreviewExitGuide",
+    "WebcastDataChatGroupExtendData",
+    "WebcastDataPaidLiveData",
+    "WebcastDataAsyncAuthData",
+    "WebcastDataPaidLivePriceInfo",
+    "WebcastDataTicketData",
+    "WebcastDataTicketDataPaidLivePriceInfoV2",
+    "WebcastDataTicketDataTicketSkuDetail",
+    "WebcastDataOrderData",
+    "WebcastDataAppearance",
+    "WebcastDataAppearanceBubble",
+    "WebcastDataAppearanceContentTag",
+    "WebcastDataAppearanceWideCover",
+    "WebcastDataGameCpData",
+    "WebcastDataGamePlayData",
+    "WebcastDataRoomGameDataChannelConfig",
+    "WebcastDataToolBarComponentData",
+    "WebcastDataToolBarData",
+    "WebcastDataLifeGrouponInfo",
+    "WebcastDataPreviewLabel",
+    "WebcastDataHotRoomInfo",
+    "WebcastDataActivityLiveRecommendConfig",
+    "WebcastDataActivityLiveRecommendConfigEpisodeInfo",
+    "WebcastDataRoomChannelData",
+    "WebcastDataPackMetaInfo",
+    "WebcastDataLikeDisplayConfig",
+    "WebcastDataMatchRoomData",
+    "WebcastDataMatchUserInfo",
+    "WebcastDataTeamInfo",
+    "WebcastDataEnterPublicAreaAnimation",
+    "WebcastDataGiftPanelTopperTray",
+    "WebcastDataGiftPanelTopperTrayPeriodText",
+    "WebcastDataGameTagInfo",
+    "WebcastDataEnterGiftAnimation",
+    "WebcastDataEmojiDetail",
+    "WebcastDataCircleInfo",
+    "WebcastDataEasterEggData",
+    "WebcastDataEcomLiveCard",
+    "WebcastDataEcomProduct",
+    "WebcastDataEcomPrice",
+    "WebcastDataEcomIcon",
+    "WebcastDataEcomCampaign",
+    "WebcastDataEcomAuction",
+    "WebcastDataEcomBidder",
+    "WebcastDataEcomAvatar",
+    "WebcastDataEcomPop",
+    "WebcastDataCoupon",
+    "WebcastDataRedpack",
+    "WebcastDataEcomGoodsCard",
+    "WebcastDataRedsShowInfo",
+    "WebcastDataOfficialRoomInfo",
+    "WebcastDataVsEpisodeHighLight",
+    "WebcastDataEpisodePremierePlay",
+    "WebcastDataVsWatermark",
+    "WebcastDataVsWatermarkIcon",
+    "WebcastDataVsBar",
+    "WebcastDataVsItemComment",
+    "WebcastDataVsItemBar",
+    "WebcastDataEpisodePreviewImage",
+    "WebcastDataVsGiftPannel",
+    "WebcastDataEpisodePreviewBottom",
+    "WebcastDataVsPannelIcon",
+    "WebcastDataMultiCameraBasicInfo",
+    "WebcastDataSharePosterInfo",
+    "WebcastDataSharePosterInfoPosterData",
+    "WebcastDataBusinessConfigure",
+    "WebcastDataResourceConfigure",
+    "WebcastDataBarrageConfigure",
+    "WebcastDataScreenBarConfigure",
+    "WebcastDataMultiTab",
+    "WebcastDataMultiTabBubble",
+    "WebcastDataMultiTabTabItem",
+    "WebcastDataToolbarBizSkin",
+    "WebcastDataComponentSkin",
+    "WebcastDataBlockComponent",
+    "WebcastDataToolbarPermutation",
+    "WebcastDataToolbarPermutationRule",
+    "WebcastDataRoomChannelInfo",
+    "WebcastDataRtcExtInfo",
+    "WebcastDataSecretChatInfo",
+    "WebcastDataFansChannelCreateInfo",
+    "WebcastDataPlayByPlayItemInfo",
+    "WebcastDataPlayerInfo",
+    "WebcastDataGoalStageDetail",
+    "WebcastDataAgainst",
+    "WebcastDataToutiaoMatchData",
+    "WebcastDataTeamStats",
+    "WebcastDataPlayerStats",
+    "WebcastDataMatchShareBackground",
+    "WebcastDataMatchTitle",
+    "WebcastDataMatchTitleTitleIcon",
+    "WebcastDataMatchTab",
+    "WebcastDataMatchDrawer",
+    "WebcastDataBasketBallGoalStageDetail",
+    "WebcastDataBasketballStage",
+    "WebcastDataESportsStage",
+    "WebcastDataPaidLiveItemInfo",
+    "WebcastDataPrivilegeInfo",
+    "WebcastDataPrivilegeBaseInfo",
+    "WebcastDataPrivilegeUrl",
+    "WebcastDataPaidLiveConfig",
+    "WebcastDataPaidLiveConfigPriceInfo",
+    "WebcastDataPaidLiveConfigUserRight",
+    "WebcastDataPaidLiveUiBaseConfig",
+    "WebcastDataRoomPublicScreenInfo",
+    "WebcastDataRoomPublicScreenAttachments",
+    "WebcastDataRoomFullVideoBtn",
+    "WebcastDataRoomBanner",
+    "WebcastDataAvatorBorder",
+    "WebcastDataRoomCore",
+    "WebcastDataIosFragment",
+    "WebcastDataIosContainerLayoutRule",
+    "WebcastDataIosContainerLayout",
+    "WebcastDataIosClientComponent",
+    "WebcastDataProductsData",
+    "WebcastDataProductsDataToolBar",
+    "WebcastDataProductsDataExplainCard",
+    "WebcastDataProduct",
+    "WebcastDataFilterReason",
+    "WebcastDataProductBasicInfo",
+    "WebcastDataParentProductSimpleData",
+    "WebcastDataPurchaseSimpleData",
+    "WebcastDataBindSubProductData",
+    "WebcastDataCombined",
+    "WebcastDataShareTicket",
+    "WebcastDataPrivilegeTicket",
+    "WebcastDataPrivilegeTicketPrivilegeConfigure",
+    "WebcastDataRating",
+    "WebcastDataComments",
+    "WebcastDataCommentsTextInfo",
+    "WebcastDataCommentsTextInfoUserInfo",
+    "WebcastDataAuthor",
+    "WebcastDataAuthorAuthorBasicInfo",
+    "WebcastDataPaymentArea",
+    "WebcastDataPaymentAreaPayButton",
+    "WebcastDataPaymentAreaAdditionalButton",
+    "WebcastDataLiveInfo",
+    "WebcastDataItemInfo",
+    "WebcastDataContentInfo",
+    "WebcastDataIntroduction",
+    "WebcastDataProductPriceStruct",
+    "WebcastDataProductRichText",
+    "WebcastDataProductRichTextText",
+    "WebcastDataProductRichTextImage",
+    "WebcastDataProductRichTextCountDown",
+    "WebcastDataProductPriceRichText",
+    "WebcastDataSku",
+    "WebcastDataSkuRelatedSkuSimpleInfo",
+    "WebcastDataSkuCaremaInfo",
+    "WebcastDataSkuEntityIDsMap",
+    "WebcastDataSkuLimitedFreeNotice",
+    "WebcastDataHeaderMedia",
+    "WebcastDataHeaderMediaViewButton",
+    "WebcastDataProductTag",
+    "WebcastDataDslDetail",
+    "WebcastDataDslDetailExtraInfo",
+    "WebcastDataRoomIntroLabel",
+    "WebcastDataChatReplyRespInfo",
+    "WebcastDataGiftImPriority",
+    "WebcastDataSendInteractEmojiConfig",
+    "WebcastDataEmojiInteractResource",
+    "WebcastDataGiftPreviewInfo",
+    "WebcastDataBuffLockInfo",
+    "WebcastDataGiftBuffInfo",
+    "WebcastDataGiftTip",
+    "WebcastDataGiftStruct",
+    "WebcastDataGiftStructGiftStructFansClubInfo",
+    "WebcastDataGiftStructGiftMsgBoard",
+    "WebcastDataGoodsBizItem",
+    "WebcastDataBizGoods",
+    "WebcastDataBizEntrance",
+    "WebcastDataGiftConfirmInfo",
+    "WebcastDataGiftUnselectedBottomInfo",
+    "WebcastDataGiftTouchLabel",
+    "WebcastDataGiftGroupInfo",
+    "WebcastDataGiftPanelOperation",
+    "WebcastDataLuckyMoneyGiftMeta",
+    "WebcastDataAnchorGiftData",
+    "WebcastDataGiftBanner",
+    "WebcastDataEffectMixImageInfo",
+    "WebcastDataAssetEffectMixInfo",
+    "WebcastDataGiftTrayInfo",
+    "WebcastDataTrayPreEffect",
+    "WebcastDataTrayPostEffect",
+    "WebcastDataSeriesPlayGift",
+    "WebcastDataSeriesTrayInfo",
+    "WebcastDataDiyGiftCardButton",
+    "WebcastDataSendTogether",
+    "WebcastDataExtraEffect",
+    "WebcastDataGoodsStruct",
+    "WebcastDataOpenHostInfo",
+    "WebcastDataContainerLayout",
+    "WebcastDataOpenGame",
+    "WebcastDataAnchorBottomToolBar",
+    "WebcastDataAnchorLinkmicEntranceInfo",
+    "WebcastDataAnchorLinkmicEntranceInfoLeadInfo",
+    "WebcastDataAudienceLinkmicEntranceInfo",
+    "WebcastDataAnchorLinkmic",
+    "WebcastDataStreamRecognitionCandidate",
+    "WebcastDataStreamRecognitionContainers",
+    "WebcastDataGameRoomSticker",
+    "WebcastDataSandwichBorderInfo",
+    "WebcastDataWebEnterBenefitPointData",
+    "WebcastDataAddressInfo",
+    "WebcastDataLocationInfo",
+    "WebcastDataOpenStreamUrlEncrypt",
+    "WebcastDataSubscribeMemberMark",
+    "WebcastDataToolbarExtraInfo",
+    "WebcastDataAnchorTogetherLive",
+    "WebcastDataWebData",
+    "WebcastDataMetricTrackerData",
+    "WebcastDataSubscribeMember",
+    "WebcastDataProductBanner",
+    "WebcastDataProductSaleInfo",
+    "WebcastDataContentTip",
+    "WebcastDataProductSellingPoint",
+    "WebcastDataRecentPurchasedUser",
+    "WebcastDataProductComments",
+    "WebcastDataProductCommentUser",
+    "WebcastDataProductComment",
+    "WebcastDataInputDefaultConfig",
+    "WebcastDataChatMentionInfo",
+    "WebcastDataEffectMixTextInfo",
+)
+
+
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    List,
+)
+
+import betterproto
+
+
+class _HotMessage(betterproto.Message):
+    """未知字段直接丢弃，不在实例上累积"""
+
+    _unknown_fields = property(lambda self: b"", lambda self, value: None)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPushFrame(_HotMessage):
+    seq_id: int = betterproto.uint64_field(1)
+    log_id: int = betterproto.uint64_field(2)
+    service: int = betterproto.int32_field(3)
+    method: int = betterproto.int32_field(4)
+    headers: List["WebcastImPushHeader"] = betterproto.message_field(5)
+    payload_encoding: str = betterproto.string_field(6)
+    payload_type: str = betterproto.string_field(7)
+    payload: bytes = betterproto.bytes_field(8)
+    lod_id_new: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPushHeader(_HotMessage):
+    key: str = betterproto.string_field(1)
+    value: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImResponse(_HotMessage):
+    messages: List["WebcastImMessage"] = betterproto.message_field(1)
+    cursor: str = betterproto.string_field(2)
+    fetch_interval: int = betterproto.uint64_field(3)
+    now: int = betterproto.uint64_field(4)
+    internal_ext: str = betterproto.string_field(5)
+    fetch_type: int = betterproto.int32_field(6)
+    route_params: Dict[str, str] = betterproto.map_field(
+        7, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    heartbeat_duration: int = betterproto.uint64_field(8)
+    need_ack: bool = betterproto.bool_field(9)
+    push_server: str = betterproto.string_field(10)
+    live_cursor: str = betterproto.string_field(11)
+    history_no_more: bool = betterproto.bool_field(12)
+    proxy_server: str = betterproto.string_field(13)
+    push_server_v2: str = betterproto.string_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImMessage(_HotMessage):
+    method: str = betterproto.string_field(1)
+    payload: bytes = betterproto.bytes_field(2)
+    msg_id: int = betterproto.uint64_field(3)
+    msg_type: int = betterproto.int32_field(4)
+    offset: int = betterproto.uint64_field(5)
+    need_wrds_store: bool = betterproto.bool_field(6)
+    wrds_version: int = betterproto.uint64_field(7)
+    wrds_sub_key: str = betterproto.string_field(8)
+    message_extra: Dict[str, str] = betterproto.map_field(
+        9, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    tenant_id: str = betterproto.string_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImCommon(_HotMessage):
+    method: str = betterproto.string_field(1)
+    msg_id: int = betterproto.uint64_field(2)
+    room_id: int = betterproto.uint64_field(3)
+    create_time: int = betterproto.uint64_field(4)
+    monitor: int = betterproto.int32_field(5)
+    is_show_msg: bool = betterproto.bool_field(6)
+    describe: str = betterproto.string_field(7)
+    display_text: "WebcastDataText" = betterproto.message_field(8)
+    fold_type: int = betterproto.uint64_field(9)
+    anchor_fold_type: int = betterproto.uint64_field(10)
+    priority_score: int = betterproto.uint64_field(11)
+    log_id: str = betterproto.string_field(12)
+    msg_process_filter_k: str = betterproto.string_field(13)
+    msg_process_filter_v: str = betterproto.string_field(14)
+    user: "WebcastDataUser" = betterproto.message_field(15)
+    room: "WebcastDataRoom" = betterproto.message_field(16)
+    anchor_fold_type_v2: int = betterproto.uint64_field(17)
+    process_at_sei_time_ms: int = betterproto.uint64_field(18)
+    random_dispatch_ms: int = betterproto.uint64_field(19)
+    is_dispatch: bool = betterproto.bool_field(20)
+    channel_id: int = betterproto.uint64_field(21)
+    diff_sei2_abs_second: int = betterproto.uint64_field(22)
+    anchor_fold_duration: int = betterproto.uint64_field(23)
+    app_id: int = betterproto.uint64_field(24)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPublicAreaCommon(_HotMessage):
+    user_label: "WebcastDataImage" = betterproto.message_field(1)
+    user_consume_in_room: int = betterproto.uint64_field(2)
+    user_send_gift_cnt_in_room: int = betterproto.uint64_field(3)
+    individual_priority: int = betterproto.uint64_field(4)
+    individual_strategy_result: Dict[str, str] = betterproto.map_field(
+        5, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    support_pin: int = betterproto.uint64_field(6)
+    suffix_text: "WebcastImSuffixText" = betterproto.message_field(7)
+    im_action: int = betterproto.int32_field(8)
+    forbidden_profile: bool = betterproto.bool_field(9)
+    reply_resp: "WebcastDataChatReplyRespInfo" = betterproto.message_field(10)
+    tracking_params: Dict[str, str] = betterproto.map_field(
+        11, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    is_featured: int = betterproto.uint64_field(12)
+    need_filter_display: bool = betterproto.bool_field(13)
+    personalized_display_info: "WebcastImPersonalizedDisplayInfo" = betterproto.message_field(14)
+    force_insertion_priority: int = betterproto.uint64_field(15)
+    mention_info: "WebcastDataChatMentionInfo" = betterproto.message_field(16)
+    hover_info: "WebcastImHoverInfo" = betterproto.message_field(17)
+    show_in_danmaku: bool = betterproto.bool_field(18)
+    is_like_comment: bool = betterproto.bool_field(19)
+    batch_refresh: bool = betterproto.bool_field(20)
+    is_ai_msg: bool = betterproto.bool_field(21)
+    should_log_light_interact_mob: bool = betterproto.bool_field(22)
+    light_interact_mob_params: Dict[str, str] = betterproto.map_field(
+        23, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImHoverInfo(_HotMessage):
+    is_hover: bool = betterproto.bool_field(1)
+    priority: int = betterproto.uint64_field(2)
+    duration: int = betterproto.uint64_field(3)
+    duration_involve_display_time: int = betterproto.uint64_field(4)
+    duration_threshold: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPersonalizedDisplayInfo(_HotMessage):
+    is_personalized: bool = betterproto.bool_field(1)
+    fold_type: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImSuffixText(_HotMessage):
+    biz_type: int = betterproto.uint64_field(1)
+    text: "WebcastDataText" = betterproto.message_field(2)
+    tags: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImLandscapeAreaCommon(_HotMessage):
+    show_head: bool = betterproto.bool_field(1)
+    show_nickname: bool = betterproto.bool_field(2)
+    show_font_color: bool = betterproto.bool_field(3)
+    color_value: List[str] = betterproto.string_field(4)
+    comment_type_tags: List[int] = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImChatMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    user: "WebcastDataUser" = betterproto.message_field(2)
+    content: str = betterproto.string_field(3)
+    visible_to_sender: bool = betterproto.bool_field(4)
+    background_image: "WebcastDataImage" = betterproto.message_field(5)
+    full_screen_text_color: str = betterproto.string_field(6)
+    background_image_v2: "WebcastDataImage" = betterproto.message_field(7)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(9)
+    gift_image: "WebcastDataImage" = betterproto.message_field(10)
+    agree_msg_id: int = betterproto.uint64_field(11)
+    priority_level: int = betterproto.int32_field(12)
+    landscape_area_common: "WebcastImLandscapeAreaCommon" = betterproto.message_field(13)
+    event_time: int = betterproto.uint64_field(15)
+    send_review: bool = betterproto.bool_field(16)
+    from_intercom: bool = betterproto.bool_field(17)
+    intercom_hide_user_card: bool = betterproto.bool_field(18)
+    chat_tags: List[int] = betterproto.int32_field(19)
+    chat_by: int = betterproto.uint64_field(20)
+    individual_chat_priority: int = betterproto.int32_field(21)
+    rtf_content: "WebcastDataText" = betterproto.message_field(40)
+    rtf_content_v2: "WebcastDataText" = betterproto.message_field(41)
+    model_info: Dict[str, str] = betterproto.map_field(
+        200, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImEmojiChatMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    user: "WebcastDataUser" = betterproto.message_field(2)
+    emoji_id: int = betterproto.uint64_field(3)
+    emoji_content: "WebcastDataText" = betterproto.message_field(4)
+    default_content: str = betterproto.string_field(5)
+    background_image: "WebcastDataImage" = betterproto.message_field(6)
+    from_intercom: bool = betterproto.bool_field(7)
+    intercom_hide_user_card: bool = betterproto.bool_field(8)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImControlMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    action: int = betterproto.uint64_field(2)
+    tips: str = betterproto.string_field(3)
+    extra: "WebcastImControlMessageExtra" = betterproto.message_field(4)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImControlMessageExtra(_HotMessage):
+    ban_info_url: str = betterproto.string_field(1)
+    reason_no: int = betterproto.uint64_field(2)
+    title: "WebcastDataText" = betterproto.message_field(3)
+    violation_reason: "WebcastDataText" = betterproto.message_field(4)
+    content: "WebcastDataText" = betterproto.message_field(5)
+    got_it_button: "WebcastDataText" = betterproto.message_field(6)
+    ban_detail_button: "WebcastDataText" = betterproto.message_field(7)
+    source: str = betterproto.string_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPicoDisplayInfo(_HotMessage):
+    combo_sum_count: int = betterproto.uint64_field(1)
+    emoji: str = betterproto.string_field(2)
+    emoji_icon: "WebcastDataImage" = betterproto.message_field(3)
+    emoji_text: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImDoubleLikeDetail(_HotMessage):
+    double_flag: bool = betterproto.bool_field(1)
+    seq_id: int = betterproto.int32_field(2)
+    renewals_num: int = betterproto.int32_field(3)
+    triggers_num: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImDisplayControlInfo(_HotMessage):
+    show_text: bool = betterproto.bool_field(1)
+    show_icons: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImLikeMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    count: int = betterproto.uint64_field(2)
+    total: int = betterproto.uint64_field(3)
+    color: int = betterproto.uint64_field(4)
+    user: "WebcastDataUser" = betterproto.message_field(5)
+    icon: str = betterproto.string_field(6)
+    double_like_detail: "WebcastImDoubleLikeDetail" = betterproto.message_field(7)
+    display_control_info: "WebcastImDisplayControlInfo" = betterproto.message_field(8)
+    linkmic_guest_uid: int = betterproto.uint64_field(9)
+    scene: str = betterproto.string_field(10)
+    pico_display_info: "WebcastImPicoDisplayInfo" = betterproto.message_field(11)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImFansclubMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    action: int = betterproto.int32_field(2)
+    content: str = betterproto.string_field(3)
+    user: "WebcastDataUser" = betterproto.message_field(4)
+    upgrade_privilege: "WebcastImFansclubMessageUpgradePrivilege" = betterproto.message_field(5)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(6)
+    left_diamond: int = betterproto.uint64_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImFansclubMessageUpgradePrivilege(_HotMessage):
+    content: str = betterproto.string_field(1)
+    description: str = betterproto.string_field(2)
+    button_type: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImGiftMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    gift_id: int = betterproto.uint64_field(2)
+    fan_ticket_count: int = betterproto.uint64_field(3)
+    group_count: int = betterproto.uint64_field(4)
+    repeat_count: int = betterproto.uint64_field(5)
+    combo_count: int = betterproto.uint64_field(6)
+    user: "WebcastDataUser" = betterproto.message_field(7)
+    to_user: "WebcastDataUser" = betterproto.message_field(8)
+    repeat_end: int = betterproto.int32_field(9)
+    text_effect: "WebcastImGiftMessageTextEffect" = betterproto.message_field(10)
+    group_id: int = betterproto.uint64_field(11)
+    income_taskgifts: int = betterproto.uint64_field(12)
+    room_fan_ticket_count: int = betterproto.uint64_field(13)
+    priority: "WebcastDataGiftImPriority" = betterproto.message_field(14)
+    gift: "WebcastDataGiftStruct" = betterproto.message_field(15)
+    log_id: str = betterproto.string_field(16)
+    send_type: int = betterproto.uint64_field(17)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(18)
+    tray_display_text: "WebcastDataText" = betterproto.message_field(19)
+    banned_display_effects: int = betterproto.uint64_field(20)
+    tray_info: "WebcastDataGiftTrayInfo" = betterproto.message_field(21)
+    asset_effect_mix_info: "WebcastDataAssetEffectMixInfo" = betterproto.message_field(24)
+    display_for_self: bool = betterproto.bool_field(25)
+    interact_gift_info: str = betterproto.string_field(26)
+    diy_item_info: str = betterproto.string_field(27)
+    min_asset_set: List[int] = betterproto.uint64_field(28)
+    total_count: int = betterproto.uint64_field(29)
+    client_gift_source: int = betterproto.int32_field(30)
+    anchor_gift: "WebcastDataAnchorGiftData" = betterproto.message_field(31)
+    to_user_ids: List[int] = betterproto.uint64_field(32)
+    send_time: int = betterproto.uint64_field(33)
+    force_display_effects: int = betterproto.uint64_field(34)
+    trace_id: str = betterproto.string_field(35)
+    effect_display_ts: int = betterproto.uint64_field(36)
+    send_together: "WebcastDataSendTogether" = betterproto.message_field(37)
+    extra_effect: "WebcastDataExtraEffect" = betterproto.message_field(38)
+    room_hot_info: "WebcastImRoomHotInfo" = betterproto.message_field(39)
+    gift_play_param: str = betterproto.string_field(40)
+    multi_send_effect_level: int = betterproto.int32_field(41)
+    series_gift_data: List["WebcastDataSeriesPlayGift"] = betterproto.message_field(42)
+    use_room_message: bool = betterproto.bool_field(43)
+    count: int = betterproto.uint64_field(44)
+    to_openids: List[str] = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImGiftMessageTextEffect(_HotMessage):
+    portrait: "WebcastImGiftMessageTextEffectDetail" = betterproto.message_field(1)
+    landscape: "WebcastImGiftMessageTextEffectDetail" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImGiftMessageTextEffectDetail(_HotMessage):
+    text: "WebcastDataText" = betterproto.message_field(1)
+    text_font_size: int = betterproto.int32_field(2)
+    background: "WebcastDataImage" = betterproto.message_field(3)
+    start: int = betterproto.int32_field(4)
+    duration: int = betterproto.int32_field(5)
+    x: int = betterproto.int32_field(6)
+    y: int = betterproto.int32_field(7)
+    width: int = betterproto.int32_field(8)
+    height: int = betterproto.int32_field(9)
+    shadow_dx: int = betterproto.int32_field(10)
+    shadow_dy: int = betterproto.int32_field(11)
+    shadow_radius: int = betterproto.int32_field(12)
+    shadow_color: str = betterproto.string_field(13)
+    stroke_color: str = betterproto.string_field(14)
+    stroke_width: int = betterproto.int32_field(15)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomHotInfo(_HotMessage):
+    local_hot_strategy: int = betterproto.int32_field(1)
+    public_area_level: int = betterproto.int32_field(2)
+    gift_level: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImMemberMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    user: "WebcastDataUser" = betterproto.message_field(2)
+    member_count: int = betterproto.uint64_field(3)
+    operator: "WebcastDataUser" = betterproto.message_field(4)
+    is_set_to_admin: bool = betterproto.bool_field(5)
+    is_top_user: bool = betterproto.bool_field(6)
+    rank_score: int = betterproto.uint64_field(7)
+    top_user_no: int = betterproto.uint64_field(8)
+    enter_type: int = betterproto.uint64_field(9)
+    action: int = betterproto.uint64_field(10)
+    action_description: str = betterproto.string_field(11)
+    user_id: int = betterproto.uint64_field(12)
+    effect_config: "WebcastImMemberMessageEffectConfig" = betterproto.message_field(13)
+    pop_str: str = betterproto.string_field(14)
+    enter_effect_config: "WebcastImMemberMessageEffectConfig" = betterproto.message_field(15)
+    background_image: "WebcastDataImage" = betterproto.message_field(16)
+    background_image_v2: "WebcastDataImage" = betterproto.message_field(17)
+    anchor_display_text: "WebcastDataText" = betterproto.message_field(18)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(19)
+    user_enter_tip_type: int = betterproto.uint64_field(20)
+    anchor_enter_tip_type: int = betterproto.uint64_field(21)
+    buried_point: Dict[str, str] = betterproto.map_field(
+        22, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    alternative_effect_config: Dict[str, "WebcastImMemberMessageEffectConfig"] = betterproto.map_field(
+        23, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    pico_enter_effect_config: "WebcastImMemberMessagePicoEffectConfig" = betterproto.message_field(24)
+    unset_admin_type: int = betterproto.int32_field(25)
+    user_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImMemberMessageEffectConfig(_HotMessage):
+    type: int = betterproto.uint64_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    avatar_pos: int = betterproto.uint64_field(3)
+    text: "WebcastDataText" = betterproto.message_field(4)
+    text_icon: "WebcastDataImage" = betterproto.message_field(5)
+    stay_time: int = betterproto.int32_field(6)
+    anim_asset_id: int = betterproto.uint64_field(7)
+    badge: "WebcastDataImage" = betterproto.message_field(8)
+    flex_setting_array: List[int] = betterproto.uint64_field(9)
+    text_icon_overlay: "WebcastDataImage" = betterproto.message_field(10)
+    animated_badge: "WebcastDataImage" = betterproto.message_field(11)
+    has_sweep_light: bool = betterproto.bool_field(12)
+    text_flex_setting_array: List[int] = betterproto.uint64_field(13)
+    center_anim_asset_id: int = betterproto.uint64_field(14)
+    dynamic_image: "WebcastDataImage" = betterproto.message_field(15)
+    extra: Dict[str, str] = betterproto.map_field(
+        16, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    mp4_anim_asset_id: int = betterproto.uint64_field(17)
+    priority: int = betterproto.uint64_field(18)
+    max_wait_time: int = betterproto.uint64_field(19)
+    dress_id: str = betterproto.string_field(20)
+    alignment: int = betterproto.uint64_field(21)
+    alignment_offset: int = betterproto.uint64_field(22)
+    effect_scene: str = betterproto.string_field(23)
+    piece_values: Dict[str, "WebcastDataTextPiece"] = betterproto.map_field(
+        24, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImMemberMessagePicoEffectConfig(_HotMessage):
+    type: int = betterproto.uint64_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    text: "WebcastDataText" = betterproto.message_field(3)
+    text_icon: "WebcastDataImage" = betterproto.message_field(4)
+    stay_time: int = betterproto.int32_field(5)
+    badge: "WebcastDataImage" = betterproto.message_field(6)
+    center_anim_asset_id: int = betterproto.uint64_field(7)
+    extra: Dict[str, str] = betterproto.map_field(
+        8, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    dress_id: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomUserSeqMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    ranks: List["WebcastImRoomUserSeqMessageContributor"] = betterproto.message_field(2)
+    total: int = betterproto.uint64_field(3)
+    pop_str: str = betterproto.string_field(4)
+    seats: List["WebcastImRoomUserSeqMessageContributor"] = betterproto.message_field(5)
+    popularity: int = betterproto.uint64_field(6)
+    total_user: int = betterproto.uint64_field(7)
+    total_user_str: str = betterproto.string_field(8)
+    total_str: str = betterproto.string_field(9)
+    online_user_for_anchor: str = betterproto.string_field(10)
+    total_pv_for_anchor: str = betterproto.string_field(11)
+    up_right_stats_str: str = betterproto.string_field(12)
+    up_right_stats_str_complete: str = betterproto.string_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomUserSeqMessageContributor(_HotMessage):
+    score: int = betterproto.uint64_field(1)
+    user: "WebcastDataUser" = betterproto.message_field(2)
+    rank: int = betterproto.uint64_field(3)
+    delta: int = betterproto.uint64_field(4)
+    is_hidden: bool = betterproto.bool_field(5)
+    score_description: str = betterproto.string_field(6)
+    exactly_score: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    content: str = betterproto.string_field(2)
+    supprot_landscape: bool = betterproto.bool_field(3)
+    room_message_type: int = betterproto.int32_field(4)
+    system_top_msg: bool = betterproto.bool_field(5)
+    forced_guarantee: bool = betterproto.bool_field(6)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(7)
+    biz_scene: str = betterproto.string_field(20)
+    buried_point: Dict[str, str] = betterproto.map_field(
+        30, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    extra: "WebcastImRoomMsgExtra" = betterproto.message_field(40)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImSocialMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    user: "WebcastDataUser" = betterproto.message_field(2)
+    share_type: int = betterproto.uint64_field(3)
+    action: int = betterproto.uint64_field(4)
+    share_target: str = betterproto.string_field(5)
+    follow_count: int = betterproto.uint64_field(6)
+    public_area_common: "WebcastImPublicAreaCommon" = betterproto.message_field(7)
+    share_total_count: int = betterproto.uint64_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomRankMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    ranks: List["WebcastImRoomRankMessageRoomRank"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomRankMessageRoomRank(_HotMessage):
+    user: "WebcastDataUser" = betterproto.message_field(1)
+    score_str: str = betterproto.string_field(2)
+    profile_hidden: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomStatsMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    display_short: str = betterproto.string_field(2)
+    display_middle: str = betterproto.string_field(3)
+    display_long: str = betterproto.string_field(4)
+    display_value: int = betterproto.uint64_field(5)
+    display_version: int = betterproto.uint64_field(6)
+    incremental: bool = betterproto.bool_field(7)
+    is_hidden: bool = betterproto.bool_field(8)
+    total: int = betterproto.uint64_field(9)
+    display_type: int = betterproto.uint64_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomStreamAdaptationMessage(_HotMessage):
+    common: "WebcastImCommon" = betterproto.message_field(1)
+    adaptation_type: int = betterproto.int32_field(2)
+    adaptation_height_ratio: float = betterproto.float_field(3)
+    adaptation_body_center_ratio: float = betterproto.float_field(4)
+    adaptation_content_top_ratio: float = betterproto.float_field(5)
+    adaptation_content_bottom_ratio: float = betterproto.float_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomMsgExtra(_HotMessage):
+    gift_extra: "WebcastImRoomMsgGiftExtra" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImRoomMsgGiftExtra(_HotMessage):
+    gift_id: int = betterproto.uint64_field(1)
+    gift_name: str = betterproto.string_field(2)
+    gift_count: int = betterproto.uint64_field(3)
+    image: "WebcastDataImage" = betterproto.message_field(4)
+    webp_image: "WebcastDataImage" = betterproto.message_field(5)
+    group_id: int = betterproto.uint64_field(6)
+    client_gift_source: int = betterproto.int32_field(7)
+    describe: str = betterproto.string_field(8)
+    diamond_count: int = betterproto.uint64_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPatternRef(_HotMessage):
+    key: str = betterproto.string_field(1)
+    default_pattern: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextFormat(_HotMessage):
+    color: str = betterproto.string_field(1)
+    bold: bool = betterproto.bool_field(2)
+    italic: bool = betterproto.bool_field(3)
+    weight: int = betterproto.int32_field(4)
+    italic_angle: int = betterproto.int32_field(5)
+    font_size: int = betterproto.int32_field(6)
+    use_heigh_light_color: bool = betterproto.bool_field(7)
+    use_remote_clor: bool = betterproto.bool_field(8)
+    ignore_color_mapping: bool = betterproto.bool_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceUser(_HotMessage):
+    user: "WebcastDataUser" = betterproto.message_field(1)
+    with_colon: bool = betterproto.bool_field(2)
+    self_show_real_name: bool = betterproto.bool_field(3)
+    left_show_extension: int = betterproto.int32_field(4)
+    left_additional_content: str = betterproto.string_field(5)
+    right_additional_content: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceGift(_HotMessage):
+    gift_id: int = betterproto.uint64_field(1)
+    name_ref: "WebcastDataPatternRef" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceHeart(_HotMessage):
+    color: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPiecePatternRef(_HotMessage):
+    key: str = betterproto.string_field(1)
+    default_pattern: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceImage(_HotMessage):
+    image: "WebcastDataImage" = betterproto.message_field(1)
+    scaling_rate: float = betterproto.float_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPiece(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    format: "WebcastDataTextFormat" = betterproto.message_field(2)
+    value_ref: str = betterproto.string_field(3)
+    string_value: str = betterproto.string_field(11)
+    user_value: "WebcastDataTextPieceUser" = betterproto.message_field(21)
+    gift_value: "WebcastDataTextPieceGift" = betterproto.message_field(22)
+    heart_value: "WebcastDataTextPieceHeart" = betterproto.message_field(23)
+    pattern_ref_value: "WebcastDataTextPiecePatternRef" = betterproto.message_field(24)
+    image_value: "WebcastDataTextPieceImage" = betterproto.message_field(25)
+    schema_key: str = betterproto.string_field(100)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataText(_HotMessage):
+    key: str = betterproto.string_field(1)
+    default_pattern: str = betterproto.string_field(2)
+    default_format: "WebcastDataTextFormat" = betterproto.message_field(3)
+    pieces: List["WebcastDataTextPiece"] = betterproto.message_field(4)
+    schema_infos: Dict[str, "WebcastDataSchemaInfo"] = betterproto.map_field(
+        20, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSchemaInfo(_HotMessage):
+    schema_url: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUser(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    short_id: int = betterproto.uint64_field(2)
+    nickname: str = betterproto.string_field(3)
+    gender: int = betterproto.int32_field(4)
+    signature: str = betterproto.string_field(5)
+    level: int = betterproto.int32_field(6)
+    birthday: int = betterproto.uint64_field(7)
+    telephone: str = betterproto.string_field(8)
+    avatar_thumb: "WebcastDataImage" = betterproto.message_field(9)
+    avatar_medium: "WebcastDataImage" = betterproto.message_field(10)
+    avatar_large: "WebcastDataImage" = betterproto.message_field(11)
+    verified: bool = betterproto.bool_field(12)
+    experience: int = betterproto.int32_field(13)
+    city: str = betterproto.string_field(14)
+    status: int = betterproto.int32_field(15)
+    create_time: int = betterproto.uint64_field(16)
+    modify_time: int = betterproto.uint64_field(17)
+    secret: int = betterproto.int32_field(18)
+    share_qrcode_uri: str = betterproto.string_field(19)
+    income_share_percent: int = betterproto.int32_field(20)
+    badge_image_list: List["WebcastDataImage"] = betterproto.message_field(21)
+    follow_info: "WebcastDataUserFollowInfo" = betterproto.message_field(22)
+    pay_grade: "WebcastDataUserPayGrade" = betterproto.message_field(23)
+    fans_club: "WebcastDataUserFansClub" = betterproto.message_field(24)
+    border: "WebcastDataUserBorder" = betterproto.message_field(25)
+    special_id: str = betterproto.string_field(26)
+    avatar_border: "WebcastDataImage" = betterproto.message_field(27)
+    medal: "WebcastDataImage" = betterproto.message_field(28)
+    real_time_icons: List["WebcastDataImage"] = betterproto.message_field(29)
+    new_real_time_icons: List["WebcastDataImage"] = betterproto.message_field(30)
+    top_vip_no: int = betterproto.uint64_field(31)
+    user_attr: "WebcastDataUserUserAttr" = betterproto.message_field(32)
+    own_room: "WebcastDataUserOwnRoom" = betterproto.message_field(33)
+    pay_score: int = betterproto.uint64_field(34)
+    ticket_count: int = betterproto.uint64_field(35)
+    anchor_info: "WebcastDataUserAnchorInfo" = betterproto.message_field(36)
+    link_mic_stats: int = betterproto.int32_field(37)
+    display_id: str = betterproto.string_field(38)
+    with_commerce_permission: bool = betterproto.bool_field(39)
+    with_fusion_shop_entry: bool = betterproto.bool_field(40)
+    total_recharge_diamond_count: int = betterproto.uint64_field(41)
+    webcast_anchor_level: "WebcastDataUserAnchorLevel" = betterproto.message_field(42)
+    verified_content: str = betterproto.string_field(43)
+    author_stats: "WebcastDataUserAuthorStats" = betterproto.message_field(44)
+    top_fans: List["WebcastDataUser"] = betterproto.message_field(45)
+    sec_uid: str = betterproto.string_field(46)
+    user_role: int = betterproto.int32_field(47)
+    xigua_info: "WebcastDataUserXiguaParams" = betterproto.message_field(48)
+    activity_reward: "WebcastDataUserActivityInfo" = betterproto.message_field(49)
+    noble_info: "WebcastDataUserNobleLevelInfo" = betterproto.message_field(50)
+    brotherhood_info: "WebcastDataUserBrotherhoodInfo" = betterproto.message_field(51)
+    personal_card: "WebcastDataImage" = betterproto.message_field(52)
+    authentication_info: "WebcastDataUserAuthenticationInfo" = betterproto.message_field(53)
+    authorization_info: int = betterproto.int32_field(54)
+    adversary_authorization_info: int = betterproto.int32_field(55)
+    poi_info: "WebcastDataUserPoiInfo" = betterproto.message_field(56)
+    media_badge_image_list: List["WebcastDataImage"] = betterproto.message_field(57)
+    adversary_user_status: int = betterproto.int32_field(58)
+    user_vip_info: "WebcastDataUserVipInfo" = betterproto.message_field(59)
+    commerce_webcast_config_ids: List[int] = betterproto.uint64_field(60)
+    badge_image_list_v2: List["WebcastDataImage"] = betterproto.message_field(61)
+    industry_certification: "WebcastDataIndustryCertification" = betterproto.message_field(62)
+    location_city: str = betterproto.string_field(63)
+    fans_group_info: "WebcastDataUserFansGroupInfo" = betterproto.message_field(64)
+    remark_name: str = betterproto.string_field(65)
+    mystery_man: int = betterproto.int32_field(66)
+    web_rid: str = betterproto.string_field(67)
+    desensitized_nickname: str = betterproto.string_field(68)
+    j_accredit_info: "WebcastDataUserJAccreditInfo" = betterproto.message_field(69)
+    subscribe: "WebcastDataUserSubscribe" = betterproto.message_field(70)
+    is_anonymous: bool = betterproto.bool_field(71)
+    consume_diamond_level: int = betterproto.int32_field(72)
+    webcast_uid: str = betterproto.string_field(73)
+    profile_style_params: "WebcastDataUserProfileStyleParams" = betterproto.message_field(74)
+    user_dress_info: "WebcastDataUserUserDressInfo" = betterproto.message_field(75)
+    biz_relation: "WebcastDataUserBizRelation" = betterproto.message_field(76)
+    member_entrance_info: "WebcastDataMemberEntranceInfo" = betterproto.message_field(77)
+    public_area_badge_info: "WebcastDataUserPublicAreaBadgeInfo" = betterproto.message_field(78)
+    extra_info: "WebcastDataUserExtraInfo" = betterproto.message_field(79)
+    user_setting_info: "WebcastDataUserUserSettingInfo" = betterproto.message_field(80)
+    public_area_oper_freq: int = betterproto.uint64_field(81)
+    user_permission_grant_info: "WebcastDataUserUserPermissionGrant" = betterproto.message_field(82)
+    user_canceled: bool = betterproto.bool_field(83)
+    allow_be_located: bool = betterproto.bool_field(1001)
+    allow_find_by_contacts: bool = betterproto.bool_field(1002)
+    allow_others_download_video: bool = betterproto.bool_field(1003)
+    allow_others_download_when_sharing_video: bool = betterproto.bool_field(1004)
+    allow_share_show_profile: bool = betterproto.bool_field(1005)
+    allow_show_in_gossip: bool = betterproto.bool_field(1006)
+    allow_show_my_action: bool = betterproto.bool_field(1007)
+    allow_strange_comment: bool = betterproto.bool_field(1008)
+    allow_unfollower_comment: bool = betterproto.bool_field(1009)
+    allow_use_linkmic: bool = betterproto.bool_field(1010)
+    anchor_level: "WebcastDataUserAnchorLevel" = betterproto.message_field(1011)
+    avatar_jpg: "WebcastDataImage" = betterproto.message_field(1012)
+    bg_img_url: str = betterproto.string_field(1013)
+    birthday_description: str = betterproto.string_field(1014)
+    birthday_valid: bool = betterproto.bool_field(1015)
+    block_status: int = betterproto.int32_field(1016)
+    comment_restrict: int = betterproto.int32_field(1017)
+    constellation: str = betterproto.string_field(1018)
+    disable_ichat: int = betterproto.int32_field(1019)
+    enable_ichat_img: int = betterproto.uint64_field(1020)
+    exp: int = betterproto.int32_field(1021)
+    fan_ticket_count: int = betterproto.uint64_field(1022)
+    fold_stranger_chat: bool = betterproto.bool_field(1023)
+    follow_status: int = betterproto.uint64_field(1024)
+    hotsoon_verified: bool = betterproto.bool_field(1025)
+    hotsoon_verified_reason: str = betterproto.string_field(1026)
+    ichat_restrict_type: int = betterproto.int32_field(1027)
+    id_str: str = betterproto.string_field(1028)
+    is_follower: bool = betterproto.bool_field(1029)
+    is_following: bool = betterproto.bool_field(1030)
+    need_profile_guide: bool = betterproto.bool_field(1031)
+    pay_scores: int = betterproto.uint64_field(1032)
+    push_comment_status: bool = betterproto.bool_field(1033)
+    push_digg: bool = betterproto.bool_field(1034)
+    push_follow: bool = betterproto.bool_field(1035)
+    push_friend_action: bool = betterproto.bool_field(1036)
+    push_ichat: bool = betterproto.bool_field(1037)
+    push_status: bool = betterproto.bool_field(1038)
+    push_video_post: bool = betterproto.bool_field(1039)
+    push_video_recommend: bool = betterproto.bool_field(1040)
+    stats: "WebcastDataUserUserStats" = betterproto.message_field(1041)
+    verified_mobile: bool = betterproto.bool_field(1042)
+    verified_reason: str = betterproto.string_field(1043)
+    with_car_management_permission: bool = betterproto.bool_field(1044)
+    age_range: int = betterproto.int32_field(1045)
+    watch_duration_month: int = betterproto.uint64_field(1046)
+    foreign_user: int = betterproto.int32_field(1047)
+    user_open_id: str = betterproto.string_field(5000)
+    host_info: "WebcastDataOpenHostInfo" = betterproto.message_field(5001)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserPermissionGrant(_HotMessage):
+    hide_on_private_room: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFollowInfo(_HotMessage):
+    following_count: int = betterproto.uint64_field(1)
+    follower_count: int = betterproto.uint64_field(2)
+    follow_status: int = betterproto.uint64_field(3)
+    push_status: int = betterproto.uint64_field(4)
+    remark_name: str = betterproto.string_field(5)
+    follower_count_str: str = betterproto.string_field(6)
+    following_count_str: str = betterproto.string_field(7)
+    invalid_follow_status: bool = betterproto.bool_field(8)
+    follwer_count_display: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPayGrade(_HotMessage):
+    total_diamond_count: int = betterproto.uint64_field(1)
+    diamond_icon: "WebcastDataImage" = betterproto.message_field(2)
+    name: str = betterproto.string_field(3)
+    icon: "WebcastDataImage" = betterproto.message_field(4)
+    next_name: str = betterproto.string_field(5)
+    level: int = betterproto.uint64_field(6)
+    next_icon: "WebcastDataImage" = betterproto.message_field(7)
+    next_diamond: int = betterproto.uint64_field(8)
+    now_diamond: int = betterproto.uint64_field(9)
+    this_grade_min_diamond: int = betterproto.uint64_field(10)
+    this_grade_max_diamond: int = betterproto.uint64_field(11)
+    pay_diamond_bak: int = betterproto.uint64_field(12)
+    grade_describe: str = betterproto.string_field(13)
+    grade_icon_list: List["WebcastDataUserPayGradeGradeIcon"] = betterproto.message_field(14)
+    screen_chat_type: int = betterproto.uint64_field(15)
+    im_icon: "WebcastDataImage" = betterproto.message_field(16)
+    im_icon_with_level: "WebcastDataImage" = betterproto.message_field(17)
+    live_icon: "WebcastDataImage" = betterproto.message_field(18)
+    new_im_icon_with_level: "WebcastDataImage" = betterproto.message_field(19)
+    new_live_icon: "WebcastDataImage" = betterproto.message_field(20)
+    upgrade_need_consume: int = betterproto.uint64_field(21)
+    next_privileges: str = betterproto.string_field(22)
+    background: "WebcastDataImage" = betterproto.message_field(23)
+    background_back: "WebcastDataImage" = betterproto.message_field(24)
+    score: int = betterproto.uint64_field(25)
+    buff_info: "WebcastDataGradeBuffInfo" = betterproto.message_field(26)
+    grade_describe_shining: bool = betterproto.bool_field(27)
+    grade_banner: str = betterproto.string_field(1001)
+    profile_dialog_bg: "WebcastDataImage" = betterproto.message_field(1002)
+    profile_dialog_bg_back: "WebcastDataImage" = betterproto.message_field(1003)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPayGradeGradeIcon(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    icon_diamond: int = betterproto.uint64_field(2)
+    level: int = betterproto.uint64_field(3)
+    level_str: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansClub(_HotMessage):
+    data: "WebcastDataUserFansClubFansClubData" = betterproto.message_field(1)
+    prefer_data: Dict[int, "WebcastDataUserFansClubFansClubData"] = betterproto.map_field(
+        2, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansClubFansClubData(_HotMessage):
+    club_name: str = betterproto.string_field(1)
+    level: int = betterproto.int32_field(2)
+    user_fans_club_status: int = betterproto.int32_field(3)
+    badge: "WebcastDataUserFansClubFansClubDataUserBadge" = betterproto.message_field(4)
+    available_gift_ids: List[int] = betterproto.uint64_field(5)
+    anchor_id: int = betterproto.uint64_field(6)
+    badge_type: int = betterproto.int32_field(7)
+    user_guard_status: int = betterproto.int32_field(8)
+    guard_expired_time: int = betterproto.uint64_field(9)
+    anchor_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansClubFansClubDataUserBadge(_HotMessage):
+    icons: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        1, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    title: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBorder(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    level: int = betterproto.uint64_field(2)
+    thumb_icon: "WebcastDataImage" = betterproto.message_field(3)
+    dress_id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserAttr(_HotMessage):
+    is_muted: bool = betterproto.bool_field(1)
+    is_admin: bool = betterproto.bool_field(2)
+    is_super_admin: bool = betterproto.bool_field(3)
+    admin_privileges: List[int] = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserOwnRoom(_HotMessage):
+    room_ids: List[int] = betterproto.uint64_field(1)
+    room_ids_str: List[str] = betterproto.string_field(2)
+    room_ids_display: List[int] = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAnchorInfo(_HotMessage):
+    level: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAnchorLevel(_HotMessage):
+    level: int = betterproto.uint64_field(1)
+    experience: int = betterproto.uint64_field(2)
+    lowest_experience_this_level: int = betterproto.uint64_field(3)
+    highest_experience_this_level: int = betterproto.uint64_field(4)
+    task_start_experience: int = betterproto.uint64_field(5)
+    task_start_time: int = betterproto.uint64_field(6)
+    task_decrease_experience: int = betterproto.uint64_field(7)
+    task_target_experience: int = betterproto.uint64_field(8)
+    task_end_time: int = betterproto.uint64_field(9)
+    profile_dialog_bg: "WebcastDataImage" = betterproto.message_field(10)
+    profile_dialog_bg_back: "WebcastDataImage" = betterproto.message_field(11)
+    stage_level: "WebcastDataImage" = betterproto.message_field(12)
+    small_icon: "WebcastDataImage" = betterproto.message_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAuthorStats(_HotMessage):
+    video_total_count: int = betterproto.uint64_field(1)
+    video_total_play_count: int = betterproto.uint64_field(2)
+    video_total_share_count: int = betterproto.uint64_field(3)
+    video_total_series_count: int = betterproto.uint64_field(4)
+    variety_show_play_count: int = betterproto.uint64_field(5)
+    video_total_favorite_count: int = betterproto.uint64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserXiguaParams(_HotMessage):
+    user_auth_info: str = betterproto.string_field(1)
+    ugc_publish_media_id: int = betterproto.uint64_field(2)
+    media_id: int = betterproto.uint64_field(3)
+    author_desc: str = betterproto.string_field(4)
+    description: str = betterproto.string_field(5)
+    user_verified: bool = betterproto.bool_field(6)
+    user_extend_info: "WebcastDataUserXiguaParamsUserExtendInfo" = betterproto.message_field(7)
+    xigua_uid: int = betterproto.uint64_field(8)
+    nick_name: str = betterproto.string_field(9)
+    avatar_thumb: "WebcastDataImage" = betterproto.message_field(10)
+    avatar_medium: "WebcastDataImage" = betterproto.message_field(11)
+    avatar_large: "WebcastDataImage" = betterproto.message_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserXiguaParamsUserExtendInfo(_HotMessage):
+    share_url: str = betterproto.string_field(1)
+    r_schema_url: str = betterproto.string_field(2)
+    rocket_schema_info: "WebcastDataUserXiguaParamsUserExtendInfoRocketSchema" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserXiguaParamsUserExtendInfoRocketSchema(_HotMessage):
+    r_schema: str = betterproto.string_field(1)
+    r_token: str = betterproto.string_field(2)
+    download_url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserActivityInfo(_HotMessage):
+    badge: "WebcastDataImage" = betterproto.message_field(1)
+    story_tag: "WebcastDataImage" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserNobleLevelInfo(_HotMessage):
+    noble_background: "WebcastDataImage" = betterproto.message_field(1)
+    noble_level: int = betterproto.uint64_field(2)
+    noble_icon: "WebcastDataImage" = betterproto.message_field(3)
+    noble_name: str = betterproto.string_field(4)
+    expire_time: int = betterproto.uint64_field(5)
+    noble_big_icon: "WebcastDataImage" = betterproto.message_field(6)
+    noble_icon_with_back: "WebcastDataImage" = betterproto.message_field(7)
+    noble_boarder: "WebcastDataImage" = betterproto.message_field(8)
+    noble_background_color: List[str] = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBrotherhoodInfo(_HotMessage):
+    name: str = betterproto.string_field(1)
+    level: int = betterproto.uint64_field(2)
+    background: "WebcastDataImage" = betterproto.message_field(3)
+    font_color: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAuthenticationInfo(_HotMessage):
+    custom_verify: str = betterproto.string_field(1)
+    enterprise_verify_reason: str = betterproto.string_field(2)
+    authentication_badge: "WebcastDataImage" = betterproto.message_field(3)
+    level_list: int = betterproto.int32_field(4)
+    account_type_info: "WebcastDataUserAuthenticationInfoAccountTypeInfo" = betterproto.message_field(10)
+    authentication_badge_v2: "WebcastDataImage" = betterproto.message_field(11)
+    account_cert_info: str = betterproto.string_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAuthenticationInfoAccountTypeInfo(_HotMessage):
+    account_type_map: Dict[int, bool] = betterproto.map_field(
+        1, betterproto.TYPE_INT64, betterproto.TYPE_BOOL
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPoiInfo(_HotMessage):
+    is_poi_enabled: bool = betterproto.bool_field(1)
+    poi_id: int = betterproto.uint64_field(2)
+    poi_name: str = betterproto.string_field(3)
+    poi_id_str: str = betterproto.string_field(4)
+    follower_count_permission: int = betterproto.uint64_field(5)
+    white_user_permission: int = betterproto.uint64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansGroupInfo(_HotMessage):
+    list_fans_group_url: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserJAccreditInfo(_HotMessage):
+    j_accredit_basic: int = betterproto.int32_field(1)
+    j_accredit_advance: int = betterproto.int32_field(2)
+    j_accredit_content: int = betterproto.int32_field(3)
+    j_accredit_live: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserSubscribe(_HotMessage):
+    is_member: bool = betterproto.bool_field(1)
+    level: int = betterproto.uint64_field(2)
+    identity_type: int = betterproto.uint64_field(3)
+    buy_type: int = betterproto.uint64_field(4)
+    open: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserProfileStyleParams(_HotMessage):
+    profile_style: int = betterproto.uint64_field(1)
+    smart_switch: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserDressInfo(_HotMessage):
+    dress_wear_ids: List[str] = betterproto.string_field(1)
+    dress_own_ids: List[str] = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBizRelation(_HotMessage):
+    shop_fans_club_reverse: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPublicAreaBadgeInfo(_HotMessage):
+    badge_info_map: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        1, betterproto.TYPE_INT64, betterproto.TYPE_MESSAGE
+    )
+    badge_list: List[int] = betterproto.uint64_field(2)
+    webcast_dsl_badge_list: List["WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList(_HotMessage):
+    badge_list: List[int] = betterproto.uint64_field(1)
+    target_dsl_rule: "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule" = betterproto.message_field(2)
+    filter_dsl_rule: "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule(_HotMessage):
+    app_id: List[int] = betterproto.uint64_field(1)
+    version_code: List[int] = betterproto.uint64_field(2)
+    ab_params: Dict[str, str] = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserExtraInfo(_HotMessage):
+    is_contract: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserStats(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    id_str: str = betterproto.string_field(2)
+    following_count: int = betterproto.uint64_field(3)
+    follower_count: int = betterproto.uint64_field(4)
+    record_count: int = betterproto.uint64_field(5)
+    total_duration: int = betterproto.uint64_field(6)
+    daily_fan_ticket_count: int = betterproto.uint64_field(7)
+    daily_income: int = betterproto.uint64_field(8)
+    item_count: int = betterproto.uint64_field(9)
+    favorite_item_count: int = betterproto.uint64_field(10)
+    diamond_count: int = betterproto.uint64_field(11)
+    diamond_consumed_count: int = betterproto.uint64_field(12)
+    tuwen_item_count: int = betterproto.uint64_field(13)
+    open_id: str = betterproto.string_field(5000)
+    open_id_str: str = betterproto.string_field(5001)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserSettingInfo(_HotMessage):
+    live_visitor_switch: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMemberEntranceInfo(_HotMessage):
+    type: int = betterproto.uint64_field(1)
+    show_entrance: bool = betterproto.bool_field(2)
+    schema: str = betterproto.string_field(3)
+    single_entrance_icon: "WebcastDataImage" = betterproto.message_field(4)
+    double_entrance_icon: "WebcastDataImage" = betterproto.message_field(5)
+    is_member: bool = betterproto.bool_field(6)
+    tracking_params: Dict[str, str] = betterproto.map_field(
+        50, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertification(_HotMessage):
+    profile: "WebcastDataIndustryCertificationProfile" = betterproto.message_field(1)
+    room: "WebcastDataIndustryCertificationRoom" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertificationProfile(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    content: str = betterproto.string_field(2)
+    schema: str = betterproto.string_field(3)
+    content_color: str = betterproto.string_field(4)
+    bg_color: str = betterproto.string_field(5)
+    cert_type: int = betterproto.uint64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertificationRoom(_HotMessage):
+    room_owner: "WebcastDataIndustryCertificationRoomRoomOwner" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertificationRoomRoomOwner(_HotMessage):
+    title: "WebcastDataImage" = betterproto.message_field(1)
+    sub_title: str = betterproto.string_field(2)
+    left_color: str = betterproto.string_field(3)
+    right_color: str = betterproto.string_field(4)
+    anchor_industry_type: int = betterproto.int32_field(5)
+    brand_store_title: "WebcastDataImage" = betterproto.message_field(6)
+    brand_store_background: "WebcastDataImage" = betterproto.message_field(7)
+    anchor_reds_icon: "WebcastDataImage" = betterproto.message_field(8)
+    anchor_reds_small_icon: "WebcastDataImage" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataImage(_HotMessage):
+    url_list: List[str] = betterproto.string_field(1)
+    uri: str = betterproto.string_field(2)
+    height: int = betterproto.uint64_field(3)
+    width: int = betterproto.uint64_field(4)
+    avg_color: str = betterproto.string_field(5)
+    image_type: int = betterproto.int32_field(6)
+    open_web_url: str = betterproto.string_field(7)
+    content: "WebcastDataImageContent" = betterproto.message_field(8)
+    is_animated: bool = betterproto.bool_field(9)
+    flex_setting_list: List["WebcastDataImageNinePatchSetting"] = betterproto.message_field(10)
+    text_setting_list: List["WebcastDataImageNinePatchSetting"] = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataImageContent(_HotMessage):
+    name: str = betterproto.string_field(1)
+    font_color: str = betterproto.string_field(2)
+    level: int = betterproto.uint64_field(3)
+    alternative_text: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataImageNinePatchSetting(_HotMessage):
+    setting_list: List[int] = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVipBadge(_HotMessage):
+    icons: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        1, betterproto.TYPE_INT64, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserVipInfo(_HotMessage):
+    vip_level: int = betterproto.uint64_field(1)
+    vip_level_name: str = betterproto.string_field(2)
+    status: int = betterproto.int32_field(3)
+    start_time: int = betterproto.uint64_field(4)
+    end_time: int = betterproto.uint64_field(5)
+    remaining_days: int = betterproto.uint64_field(6)
+    total_consume: int = betterproto.uint64_field(7)
+    target_consume: int = betterproto.uint64_field(8)
+    badge: "WebcastDataVipBadge" = betterproto.message_field(9)
+    privileges: Dict[int, bool] = betterproto.map_field(
+        10, betterproto.TYPE_INT64, betterproto.TYPE_BOOL
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGradeBuffInfo(_HotMessage):
+    buff_level: int = betterproto.uint64_field(1)
+    status: int = betterproto.int32_field(2)
+    end_time: int = betterproto.uint64_field(3)
+    stats_info: Dict[int, int] = betterproto.map_field(
+        4, betterproto.TYPE_INT64, betterproto.TYPE_INT64
+    )
+    buff_badge: "WebcastDataImage" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameExtra(_HotMessage):
+    kind: int = betterproto.int32_field(1)
+    status: int = betterproto.int32_field(2)
+    game_id: int = betterproto.uint64_field(3)
+    gift_limit: int = betterproto.int32_field(4)
+    round_id: int = betterproto.uint64_field(5)
+    game_kind: int = betterproto.int32_field(6)
+    chat: int = betterproto.uint64_field(7)
+    loader: int = betterproto.uint64_field(8)
+    reload: int = betterproto.uint64_field(9)
+    data: Dict[str, str] = betterproto.map_field(
+        10, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchRoomInfo(_HotMessage):
+    match_tab_frame: "WebcastDataMatchTabFrame" = betterproto.message_field(1)
+    match_title: "WebcastDataMatchTitle" = betterproto.message_field(2)
+    match_data: "WebcastDataToutiaoMatchData" = betterproto.message_field(3)
+    match_host_channel: Dict[int, int] = betterproto.map_field(
+        4, betterproto.TYPE_INT64, betterproto.TYPE_INT64
+    )
+    match_hash_tag: str = betterproto.string_field(5)
+    background_image_url_list: List["WebcastDataImage"] = betterproto.message_field(6)
+    share_icon: "WebcastDataImage" = betterproto.message_field(7)
+    im_info: "WebcastDataMatchRoomImInfo" = betterproto.message_field(8)
+    match_share_background: "WebcastDataMatchShareBackground" = betterproto.message_field(9)
+    theme_id: str = betterproto.string_field(10)
+    match_live_share_background: "WebcastDataMatchShareBackground" = betterproto.message_field(11)
+    match_id: int = betterproto.uint64_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMainCameraMatchInfo(_HotMessage):
+    match_data: "WebcastDataToutiaoMatchData" = betterproto.message_field(1)
+    match_id: int = betterproto.uint64_field(2)
+    event_ids: List[int] = betterproto.uint64_field(3)
+    content_id: int = betterproto.uint64_field(4)
+    league_info: "WebcastDataLeagueInfo" = betterproto.message_field(5)
+    is_display_score_type: bool = betterproto.bool_field(6)
+    hide_tab_ids: List[int] = betterproto.uint64_field(7)
+    match_id_str: str = betterproto.string_field(8)
+    content_id_str: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLeagueInfo(_HotMessage):
+    league_id: int = betterproto.uint64_field(1)
+    cnn_name: str = betterproto.string_field(2)
+    enn_name: str = betterproto.string_field(3)
+    season: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchRoomImInfo(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    title: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTabFrame(_HotMessage):
+    tabs: List["WebcastDataMatchTab"] = betterproto.message_field(1)
+    replay_tabs: List["WebcastDataMatchTab"] = betterproto.message_field(2)
+    color: str = betterproto.string_field(3)
+    background_color: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataClientComponent(_HotMessage):
+    portrait_component_map: Dict[str, "WebcastDataClientComponentInfo"] = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    landscape_component_map: Dict[str, "WebcastDataClientComponentInfo"] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    is_open: bool = betterproto.bool_field(3)
+    template_id: int = betterproto.uint64_field(4)
+    preview_default_component_map: Dict[str, "WebcastDataClientComponentInfo"] = betterproto.map_field(
+        5, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataClientComponentInfo(_HotMessage):
+    container_id: str = betterproto.string_field(1)
+    function_detail: "WebcastDataClientComponentFunctionInfo" = betterproto.message_field(2)
+    is_open: bool = betterproto.bool_field(3)
+    dsl_detail: "WebcastDataDslDetail" = betterproto.message_field(4)
+    dsl_layout: str = betterproto.string_field(5)
+    container_layout: "WebcastDataContainerLayout" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataClientComponentFunctionInfo(_HotMessage):
+    function_id: str = betterproto.string_field(1)
+    data: Dict[str, str] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoom(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    id_str: str = betterproto.string_field(2)
+    status: int = betterproto.uint64_field(3)
+    owner_user_id: int = betterproto.uint64_field(4)
+    title: str = betterproto.string_field(5)
+    user_count: int = betterproto.uint64_field(6)
+    create_time: int = betterproto.uint64_field(7)
+    linkmic_layout: int = betterproto.uint64_field(8)
+    finish_time: int = betterproto.uint64_field(9)
+    extra: "WebcastDataRoomExtra" = betterproto.message_field(10)
+    dynamic_cover_uri: str = betterproto.string_field(11)
+    dynamic_cover_dict: Dict[int, str] = betterproto.map_field(
+        12, betterproto.TYPE_INT64, betterproto.TYPE_STRING
+    )
+    last_ping_time: int = betterproto.uint64_field(13)
+    live_id: int = betterproto.uint64_field(14)
+    stream_provider: int = betterproto.uint64_field(15)
+    os_type: int = betterproto.uint64_field(16)
+    client_version: int = betterproto.uint64_field(17)
+    with_linkmic: bool = betterproto.bool_field(18)
+    enable_room_perspective: bool = betterproto.bool_field(19)
+    cover: "WebcastDataImage" = betterproto.message_field(20)
+    dynamic_cover: "WebcastDataImage" = betterproto.message_field(21)
+    dynamic_cover_low: "WebcastDataImage" = betterproto.message_field(22)
+    share_url: str = betterproto.string_field(23)
+    anchor_share_text: str = betterproto.string_field(24)
+    user_share_text: str = betterproto.string_field(25)
+    stream_id: int = betterproto.uint64_field(26)
+    stream_id_str: str = betterproto.string_field(27)
+    stream_url: "WebcastDataStreamUrl" = betterproto.message_field(28)
+    mosaic_status: int = betterproto.uint64_field(29)
+    mosaic_tip: str = betterproto.string_field(30)
+    cell_style: int = betterproto.uint64_field(31)
+    link_mic: "WebcastDataLinkMic" = betterproto.message_field(32)
+    luckymoney_num: int = betterproto.uint64_field(33)
+    deco_list: List["WebcastDataDecoration"] = betterproto.message_field(34)
+    top_fans: List["WebcastDataTopFan"] = betterproto.message_field(35)
+    stats: "WebcastDataRoomStats" = betterproto.message_field(36)
+    sun_daily_icon_content: str = betterproto.string_field(37)
+    distance: str = betterproto.string_field(38)
+    distance_city: str = betterproto.string_field(39)
+    location: str = betterproto.string_field(40)
+    real_distance: str = betterproto.string_field(41)
+    feed_room_label: "WebcastDataImage" = betterproto.message_field(42)
+    common_label_list: str = betterproto.string_field(43)
+    living_room_attrs: "WebcastDataRoomUserAttr" = betterproto.message_field(44)
+    admin_user_ids: List[int] = betterproto.uint64_field(45)
+    owner: "WebcastDataUser" = betterproto.message_field(46)
+    private_info: str = betterproto.string_field(47)
+    has_commerce_goods: bool = betterproto.bool_field(48)
+    live_type_normal: bool = betterproto.bool_field(49)
+    live_type_linkmic: bool = betterproto.bool_field(50)
+    live_type_audio: bool = betterproto.bool_field(51)
+    live_type_third_party: bool = betterproto.bool_field(52)
+    live_type_screenshot: bool = betterproto.bool_field(53)
+    live_type_sandbox: bool = betterproto.bool_field(54)
+    live_type_official: bool = betterproto.bool_field(55)
+    group_id: int = betterproto.uint64_field(59)
+    orientation: int = betterproto.uint64_field(60)
+    category: int = betterproto.uint64_field(61)
+    tags: List[int] = betterproto.uint64_field(62)
+    start_time: int = betterproto.uint64_field(63)
+    popularity: int = betterproto.uint64_field(64)
+    popularity_str: str = betterproto.string_field(65)
+    fcdn_appid: int = betterproto.uint64_field(66)
+    sell_goods: bool = betterproto.bool_field(68)
+    web_count: int = betterproto.uint64_field(69)
+    vertical_cover_uri: str = betterproto.string_field(70)
+    base_category: int = betterproto.uint64_field(71)
+    room_auth: "WebcastDataRoomAuthStatus" = betterproto.message_field(72)
+    room_tabs: List["WebcastDataRoomTab"] = betterproto.message_field(73)
+    introduction: str = betterproto.string_field(74)
+    burst: "WebcastDataBurstInfo" = betterproto.message_field(75)
+    health_score: "WebcastDataRoomHealthScoreInfo" = betterproto.message_field(76)
+    is_replay: bool = betterproto.bool_field(77)
+    vid: str = betterproto.string_field(78)
+    group_source: int = betterproto.uint64_field(79)
+    lottery_finish_time: int = betterproto.uint64_field(80)
+    activity_tag: "WebcastDataRoomActivityTag" = betterproto.message_field(81)
+    portrait_cover: "WebcastDataImage" = betterproto.message_field(82)
+    background: "WebcastDataImage" = betterproto.message_field(83)
+    layout: int = betterproto.uint64_field(84)
+    wait_copy: str = betterproto.string_field(85)
+    guide_button: "WebcastDataImage" = betterproto.message_field(86)
+    preview_copy: str = betterproto.string_field(87)
+    is_show_inquiry_ball: bool = betterproto.bool_field(88)
+    match_info: "WebcastDataMatchInfo" = betterproto.message_field(89)
+    use_filter: bool = betterproto.bool_field(90)
+    gift_msg_style: int = betterproto.uint64_field(91)
+    distance_km: str = betterproto.string_field(92)
+    finish_url: str = betterproto.string_field(93)
+    official_room_info: "WebcastDataOfficialRoomInfo" = betterproto.message_field(94)
+    is_show_user_card_switch: bool = betterproto.bool_field(95)
+    video_feed_tag: str = betterproto.string_field(96)
+    forum_extra_data: str = betterproto.string_field(97)
+    fansclub_msg_style: int = betterproto.uint64_field(98)
+    follow_msg_style: int = betterproto.uint64_field(99)
+    share_msg_style: int = betterproto.uint64_field(100)
+    room_layout: int = betterproto.uint64_field(101)
+    short_title: str = betterproto.string_field(102)
+    short_touch_area_config: "WebcastDataRoomShortTouchAreaConfig" = betterproto.message_field(103)
+    book_time: int = betterproto.uint64_field(104)
+    book_end_time: int = betterproto.uint64_field(105)
+    room_audit_status: int = betterproto.uint64_field(106)
+    live_distribution: List[int] = betterproto.uint64_field(107)
+    tv: "WebcastDataTvStation" = betterproto.message_field(108)
+    replay: bool = betterproto.bool_field(109)
+    challenge_info: str = betterproto.string_field(110)
+    like_count: int = betterproto.uint64_field(111)
+    search_id: int = betterproto.uint64_field(112)
+    anchor_scheduled_time_text: str = betterproto.string_field(113)
+    hot_sentence_info: str = betterproto.string_field(114)
+    replay_location: int = betterproto.uint64_field(115)
+    stream_close_time: int = betterproto.uint64_field(116)
+    content_tag: str = betterproto.string_field(117)
+    content_label: "WebcastDataImage" = betterproto.message_field(118)
+    operation_label: "WebcastDataImage" = betterproto.message_field(119)
+    anchor_tab_type: int = betterproto.int32_field(120)
+    game_extra: "WebcastDataGameExtra" = betterproto.message_field(121)
+    official_channel: "WebcastDataOfficialChannelInfo" = betterproto.message_field(122)
+    stamps: str = betterproto.string_field(123)
+    comment_box: "WebcastDataCommentBox" = betterproto.message_field(124)
+    business_live: int = betterproto.int32_field(125)
+    with_ktv: bool = betterproto.bool_field(126)
+    with_draw_something: bool = betterproto.bool_field(127)
+    webcast_comment_tcs: int = betterproto.uint64_field(128)
+    room_tag: int = betterproto.uint64_field(129)
+    linker_map: Dict[str, int] = betterproto.map_field(
+        130, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+    finish_reason: int = betterproto.int32_field(131)
+    room_cart: "WebcastDataRoomCart" = betterproto.message_field(132)
+    scroll_config: str = betterproto.string_field(133)
+    relation_tag: str = betterproto.string_field(134)
+    owner_device_id: int = betterproto.uint64_field(135)
+    auto_cover: int = betterproto.uint64_field(136)
+    app_id: int = betterproto.uint64_field(137)
+    webcast_sdk_version: int = betterproto.uint64_field(138)
+    comment_name_mode: int = betterproto.uint64_field(139)
+    room_create_ab_param: str = betterproto.string_field(140)
+    pre_enter_time: int = betterproto.uint64_field(141)
+    ranklist_audience_type: int = betterproto.uint64_field(142)
+    preview_flow_tag: int = betterproto.uint64_field(143)
+    preview_tag_url: "WebcastDataImage" = betterproto.message_field(144)
+    quiz_extra: "WebcastDataQuizExtra" = betterproto.message_field(145)
+    anchor_ab_map: Dict[str, str] = betterproto.map_field(
+        146, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    linker_users: "WebcastDataLinkerUsers" = betterproto.message_field(147)
+    linkmic_display_type: int = betterproto.uint64_field(148)
+    audio_room_bg_image: "WebcastDataAudioBgData" = betterproto.message_field(149)
+    city_top_linker_users: "WebcastDataLinkerUsers" = betterproto.message_field(150)
+    border_info: "WebcastDataBorderInfo" = betterproto.message_field(151)
+    city_top_background: "WebcastDataImage" = betterproto.message_field(152)
+    city_top_distance: str = betterproto.string_field(153)
+    live_room_mode: int = betterproto.uint64_field(154)
+    bonus: "WebcastDataBonus" = betterproto.message_field(155)
+    highlight: bool = betterproto.bool_field(156)
+    is_official_channel_room: bool = betterproto.bool_field(157)
+    activity_room_skin_info: "WebcastDataActivityRoomSkinInfo" = betterproto.message_field(158)
+    fans_group_admin_user_ids: List[int] = betterproto.uint64_field(159)
+    replay_info: "WebcastDataRoomReplayInfo" = betterproto.message_field(160)
+    official_channel_uid: int = betterproto.uint64_field(161)
+    live_platform_source: str = betterproto.string_field(162)
+    acquaintance_status: int = betterproto.uint64_field(163)
+    comment_wall_info: "WebcastDataCommentWallInfo" = betterproto.message_field(164)
+    comment_wall_position: "WebcastDataCommentWallPosition" = betterproto.message_field(165)
+    live_type_vs_live: bool = betterproto.bool_field(166)
+    live_type_vs_premiere: bool = betterproto.bool_field(167)
+    episode_extra: "WebcastDataEpisodeExtraInfo" = betterproto.message_field(168)
+    vs_roles: List[int] = betterproto.int32_field(169)
+    item_explicit_info: str = betterproto.string_field(170)
+    short_touch_auth: "WebcastDataShortTouchAuth" = betterproto.message_field(171)
+    sofa_layout: int = betterproto.uint64_field(172)
+    announcement_info: "WebcastDataAnnouncementInfo" = betterproto.message_field(173)
+    is_need_check_list: bool = betterproto.bool_field(174)
+    live_status_info: "WebcastDataLiveStatusInfo" = betterproto.message_field(175)
+    im_info: "WebcastDataRoomImInfo" = betterproto.message_field(176)
+    assist_label: "WebcastDataLabelInfo" = betterproto.message_field(177)
+    interact_open_extra: "WebcastDataInteractOpenExtra" = betterproto.message_field(178)
+    vertical_type_info: "WebcastDataVerticalTypeInfo" = betterproto.message_field(179)
+    filter_words: List["WebcastDataFilterWord"] = betterproto.message_field(180)
+    dynamic_label: "WebcastDataLabelInfo" = betterproto.message_field(181)
+    linker_detail: "WebcastDataLinkerDetail" = betterproto.message_field(182)
+    visibility_range: int = betterproto.int32_field(183)
+    corner_mark_reach: "WebcastDataCornerMarkReach" = betterproto.message_field(184)
+    preview_expose: "WebcastDataPreviewExposeData" = betterproto.message_field(185)
+    welfare_project_info: "WebcastDataWelfareProjectInfo" = betterproto.message_field(186)
+    game_room_type: int = betterproto.int32_field(187)
+    paid_live_data: "WebcastDataPaidLiveData" = betterproto.message_field(188)
+    easter_egg_data: "WebcastDataEasterEggData" = betterproto.message_field(189)
+    title_recommend: bool = betterproto.bool_field(190)
+    danmaku_detail: int = betterproto.uint64_field(191)
+    avatar_live_info: "WebcastDataAvatarLiveInfo" = betterproto.message_field(192)
+    circle_info: "WebcastDataCircleInfo" = betterproto.message_field(193)
+    has_promotion_games: int = betterproto.uint64_field(194)
+    screenshot_sover: "WebcastDataImage" = betterproto.message_field(195)
+    appearance: "WebcastDataAppearance" = betterproto.message_field(196)
+    ecom_data: "WebcastDataEcomData" = betterproto.message_field(197)
+    industry_service_info: "WebcastDataIndustryServiceInfo" = betterproto.message_field(198)
+    relevant_recommendation: "WebcastDataRelevantRecommendation" = betterproto.message_field(199)
+    scene_type_info: "WebcastDataRoomSpecificSceneTypeInfo" = betterproto.message_field(200)
+    game_cp: "WebcastDataGameCpData" = betterproto.message_field(201)
+    game_play: "WebcastDataGamePlayData" = betterproto.message_field(202)
+    union_live_info: "WebcastDataUnionLiveInfo" = betterproto.message_field(203)
+    beautify_info: "WebcastDataBeautifyInfo" = betterproto.message_field(204)
+    toolbar_data: "WebcastDataToolBarData" = betterproto.message_field(205)
+    anchor_tab_label: "WebcastDataAnchorTabLabel" = betterproto.message_field(206)
+    life_groupon_info: "WebcastDataLifeGrouponInfo" = betterproto.message_field(207)
+    vip_data: "WebcastDataVipData" = betterproto.message_field(208)
+    toutiao_cover_recommend_level: int = betterproto.uint64_field(209)
+    toutiao_title_recommend_level: int = betterproto.uint64_field(210)
+    upper_right_widget_data_list: List["WebcastDataUpperRightWidgetData"] = betterproto.message_field(211)
+    live_feedback_card: "WebcastDataFeedbackCard" = betterproto.message_field(212)
+    assist_label_list: List["WebcastDataLabelInfo"] = betterproto.message_field(213)
+    desire_info: "WebcastDataDesireInfo" = betterproto.message_field(214)
+    hot_room_info: "WebcastDataHotRoomInfo" = betterproto.message_field(215)
+    with_aggregate_column: bool = betterproto.bool_field(216)
+    cast_screen_data: "WebcastDataCastScreenData" = betterproto.message_field(217)
+    official_channel_extra: "WebcastDataOfficialChannelExtraInfo" = betterproto.message_field(218)
+    auth_city: str = betterproto.string_field(219)
+    activity_live_recommend_config: "WebcastDataActivityLiveRecommendConfig" = betterproto.message_field(220)
+    room_channel: "WebcastDataRoomChannelData" = betterproto.message_field(221)
+    pack_meta: "WebcastDataPackMetaInfo" = betterproto.message_field(222)
+    activity_data: "WebcastDataActivityData" = betterproto.message_field(223)
+    like_display_config: "WebcastDataLikeDisplayConfig" = betterproto.message_field(224)
+    room_view_stats: "WebcastDataRoomViewStats" = betterproto.message_field(225)
+    match: "WebcastDataMatchRoomData" = betterproto.message_field(226)
+    commentary_room_info: "WebcastDataCommentaryRoomInfo" = betterproto.message_field(227)
+    redpacket_audience_auth: int = betterproto.uint64_field(228)
+    match_chat_config: "WebcastDataMatchChatConfig" = betterproto.message_field(229)
+    vs_main_replay_id: int = betterproto.uint64_field(230)
+    screen_capture_sharing_title: str = betterproto.string_field(231)
+    share_resource: "WebcastDataShareResource" = betterproto.message_field(232)
+    sharing_music_id_list: List[str] = betterproto.string_field(233)
+    public_screen_bottom_info: "WebcastDataPublicScreenBottomInfo" = betterproto.message_field(234)
+    push_stream_hkt: "WebcastDataStreamUrl" = betterproto.message_field(235)
+    basis: "WebcastDataRoomBasisData" = betterproto.message_field(300)
+    interact: "WebcastDataRoomInteractData" = betterproto.message_field(301)
+    revenue: "WebcastDataRoomRevenueData" = betterproto.message_field(302)
+    req_user: "WebcastDataRoomReqUserData" = betterproto.message_field(303)
+    anchor_data: "WebcastDataRoomAnchorData" = betterproto.message_field(304)
+    others: "WebcastDataRoomOthersData" = betterproto.message_field(305)
+    pico_info: "WebcastDataPicoInfo" = betterproto.message_field(306)
+    game_data: "WebcastDataRoomGameData" = betterproto.message_field(307)
+    feed_data: "WebcastDataRoomFeedData" = betterproto.message_field(308)
+    open_content_data: "WebcastDataOpenContentData" = betterproto.message_field(309)
+    client_component_data: "WebcastDataClientComponent" = betterproto.message_field(310)
+    platform_components_data: "WebcastDataRoomPlatformComponentsData" = betterproto.message_field(311)
+    ios_client_component_data: "WebcastDataIosClientComponent" = betterproto.message_field(312)
+    owner_open_id: str = betterproto.string_field(5000)
+    admin_user_open_ids: List[str] = betterproto.string_field(5001)
+    fans_group_admin_user_open_ids: List[str] = betterproto.string_field(5002)
+    official_channel_open_id: str = betterproto.string_field(5003)
+    cover_gauss: "WebcastDataImage" = betterproto.message_field(5004)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGroupLiveData(_HotMessage):
+    is_group_live: int = betterproto.uint64_field(1)
+    group_live_mode: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCloudCollaborateData(_HotMessage):
+    collaborate_room_id: int = betterproto.uint64_field(1)
+    collaborate_room_id_str: str = betterproto.string_field(2)
+    rejoin_time: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeaturedPublicScreenConf(_HotMessage):
+    status: int = betterproto.uint64_field(1)
+    mode: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPublicScreenSpeedConf(_HotMessage):
+    update_interval: int = betterproto.uint64_field(1)
+    scroll_size: int = betterproto.int32_field(2)
+    fold_size: int = betterproto.int32_field(3)
+    scroll_speed: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareComponentInfo(_HotMessage):
+    int64_string: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomPlatformComponentsData(_HotMessage):
+    room_title: "WebcastDataRoomTitle" = betterproto.message_field(1)
+    room_count: "WebcastDataRoomViewStats" = betterproto.message_field(2)
+    room_avator: "WebcastDataRoomAvator" = betterproto.message_field(3)
+    public_screen_info: "WebcastDataRoomPublicScreenInfo" = betterproto.message_field(4)
+    full_video_btn: "WebcastDataRoomFullVideoBtn" = betterproto.message_field(5)
+    banner: "WebcastDataRoomBanner" = betterproto.message_field(6)
+    core: "WebcastDataRoomCore" = betterproto.message_field(7)
+    share_component_info: "WebcastDataShareComponentInfo" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveSubscribe(_HotMessage):
+    paid_live_type: int = betterproto.uint64_field(1)
+    subscribe_event_time: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomTitle(_HotMessage):
+    title: str = betterproto.string_field(1)
+    introduction: str = betterproto.string_field(2)
+    left_tag: int = betterproto.uint64_field(3)
+    left_period: str = betterproto.string_field(4)
+    left_toast: str = betterproto.string_field(5)
+    left_icon: "WebcastDataTitleIcon" = betterproto.message_field(6)
+    ui_type: int = betterproto.int32_field(7)
+    portrait_show: bool = betterproto.bool_field(8)
+    landscape_show: bool = betterproto.bool_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAvator(_HotMessage):
+    avatar: "WebcastDataImage" = betterproto.message_field(1)
+    authentication_info: "WebcastDataImage" = betterproto.message_field(2)
+    nick_name: str = betterproto.string_field(3)
+    has_fans_club: bool = betterproto.bool_field(4)
+    follow_status: int = betterproto.uint64_field(5)
+    invalid_follow_status: bool = betterproto.bool_field(6)
+    follow_report_scene: int = betterproto.uint64_field(7)
+    border: "WebcastDataAvatorBorder" = betterproto.message_field(8)
+    first_label: List[int] = betterproto.uint64_field(9)
+    second_label: List[int] = betterproto.uint64_field(10)
+    fans_club_type: int = betterproto.uint64_field(11)
+    animation_type: int = betterproto.uint64_field(12)
+    uid: int = betterproto.uint64_field(13)
+    sec_uid: str = betterproto.string_field(14)
+    fan_ticket: int = betterproto.uint64_field(15)
+    like_count: int = betterproto.uint64_field(16)
+    total_user_str: str = betterproto.string_field(17)
+    secret: int = betterproto.int32_field(18)
+    first_tab_label: "WebcastDataAnchorTabLabel" = betterproto.message_field(19)
+    second_tab_label: "WebcastDataAnchorTabLabel" = betterproto.message_field(20)
+    profile_view_data: List["WebcastDataProfileViewData"] = betterproto.message_field(21)
+    open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProfileViewData(_HotMessage):
+    title: "WebcastDataText" = betterproto.message_field(2)
+    sub_title: "WebcastDataText" = betterproto.message_field(3)
+    show_duration: int = betterproto.uint64_field(4)
+    source: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedData(_HotMessage):
+    relation_label: "WebcastDataLabelInfo" = betterproto.message_field(1)
+    follow_top_appearance: "WebcastDataRoomFeedDataFollowTopAppearance" = betterproto.message_field(2)
+    cut_position: "WebcastDataRoomFeedDataStreamCutPosition" = betterproto.message_field(3)
+    drawer_config: "WebcastDataRoomFeedDataDrawerConfig" = betterproto.message_field(4)
+    can_show_inner_card: bool = betterproto.bool_field(5)
+    share_count: int = betterproto.uint64_field(6)
+    module_title: str = betterproto.string_field(7)
+    is_superior: bool = betterproto.bool_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataStreamCutPosition(_HotMessage):
+    x1: float = betterproto.double_field(1)
+    y1: float = betterproto.double_field(2)
+    x2: float = betterproto.double_field(3)
+    y2: float = betterproto.double_field(4)
+    source_width: int = betterproto.int32_field(5)
+    source_height: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataFollowTopAppearance(_HotMessage):
+    style: int = betterproto.int32_field(1)
+    cut_position: "WebcastDataRoomFeedDataStreamCutPosition" = betterproto.message_field(2)
+    image: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfig(_HotMessage):
+    avatar_area: "WebcastDataRoomFeedDataDrawerConfigAvatarArea" = betterproto.message_field(1)
+    entrance_icon: "WebcastDataRoomFeedDataDrawerConfigEntranceIcon" = betterproto.message_field(2)
+    entrace_title: "WebcastDataRoomFeedDataDrawerConfigEntranceTitle" = betterproto.message_field(3)
+    arrow_view: "WebcastDataRoomFeedDataDrawerConfigArrowView" = betterproto.message_field(4)
+    entrance_layout: "WebcastDataRoomFeedDataDrawerConfigEntranceLayout" = betterproto.message_field(5)
+    special_config: "WebcastDataRoomFeedDataDrawerConfigSpecialConfig" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigSpecialConfig(_HotMessage):
+    entrace_title: "WebcastDataRoomFeedDataDrawerConfigEntranceTitle" = betterproto.message_field(1)
+    more_live_tab: int = betterproto.int32_field(2)
+    insert_room_reason: int = betterproto.int32_field(3)
+    freq_info: "WebcastDataRoomFeedDataDrawerConfigFreqInfo" = betterproto.message_field(4)
+    current_talent: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigAvatarArea(_HotMessage):
+    can_show_follow: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigEntranceIcon(_HotMessage):
+    image: "WebcastDataImage" = betterproto.message_field(1)
+    anim_show_method: int = betterproto.int32_field(2)
+    anim_stop_method: int = betterproto.int32_field(3)
+    height: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigEntranceTitle(_HotMessage):
+    text: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigArrowView(_HotMessage):
+    visibility: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigEntranceLayout(_HotMessage):
+    layout_params: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigFreqInfo(_HotMessage):
+    show_duration: int = betterproto.int32_field(1)
+    freq_key: str = betterproto.string_field(2)
+    freq_duration: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVrInfo(_HotMessage):
+    vr_transfer_type: int = betterproto.uint64_field(1)
+    stream_mapping: Dict[str, int] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+    vr_sixdof_transfer_info: "WebcastDataVrInfoVrSixdofTransferInfo" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVrInfoVrSixdofTransferInfo(_HotMessage):
+    material_id: int = betterproto.uint64_field(1)
+    material_url: str = betterproto.string_field(2)
+    layer_status: Dict[str, int] = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfo(_HotMessage):
+    pico_live_type: int = betterproto.uint64_field(1)
+    pico_virtual_live_bg_image_uri: str = betterproto.string_field(2)
+    pico_create_scene: str = betterproto.string_field(3)
+    custom_info: str = betterproto.string_field(4)
+    pico_virtual_live_bg_image_digest: str = betterproto.string_field(5)
+    virtual_live_bg_images: "WebcastDataPicoInfoVirtualLiveBgImages" = betterproto.message_field(6)
+    pitch: float = betterproto.float_field(7)
+    client_live_type: int = betterproto.uint64_field(8)
+    pico_vr_transfer: int = betterproto.int32_field(9)
+    pico_live_mode: int = betterproto.uint64_field(11)
+    stream_mapping: Dict[str, str] = betterproto.map_field(
+        13, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfoVirtualLiveBgImages(_HotMessage):
+    original_image: "WebcastDataImage" = betterproto.message_field(1)
+    original_digest: str = betterproto.string_field(2)
+    is_upright: bool = betterproto.bool_field(3)
+    converted_images: List["WebcastDataImage"] = betterproto.message_field(4)
+    converted_list: List["WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage(_HotMessage):
+    quality: int = betterproto.uint64_field(1)
+    image: "WebcastDataImage" = betterproto.message_field(2)
+    digest: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenContentData(_HotMessage):
+    open_activity_data: "WebcastDataOpenActivityData" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenActivityData(_HotMessage):
+    cover_label: "WebcastDataImage" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPublicScreenBottomInfo(_HotMessage):
+    bottom_cards: "WebcastDataPublicScreenBottomInfoBottomCard" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPublicScreenBottomInfoBottomCard(_HotMessage):
+    name: str = betterproto.string_field(1)
+    priority: int = betterproto.uint64_field(2)
+    duration: int = betterproto.uint64_field(3)
+    biz_params: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareResource(_HotMessage):
+    toast_background: "WebcastDataImage" = betterproto.message_field(1)
+    qrcode: Dict[str, str] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    ug_share_info: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchChatConfig(_HotMessage):
+    main_group_icon_url: str = betterproto.string_field(1)
+    main_group_background_url: str = betterproto.string_field(2)
+    guest_group_icon_url: str = betterproto.string_field(3)
+    guest_group_background_url: str = betterproto.string_field(4)
+    aggregate_icon_url: List[str] = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentaryRoomInfo(_HotMessage):
+    user_id: int = betterproto.uint64_field(1)
+    avatar: "WebcastDataImage" = betterproto.message_field(2)
+    nickname: str = betterproto.string_field(3)
+    title: str = betterproto.string_field(4)
+    room_id: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomBasisData(_HotMessage):
+    next_ping: int = betterproto.uint64_field(1)
+    is_customize_audio_room: bool = betterproto.bool_field(2)
+    need_request_luckybox: int = betterproto.uint64_field(3)
+    secret_room: int = betterproto.uint64_field(4)
+    foreign_user_room: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomInteractData(_HotMessage):
+    landscape_comment_style: int = betterproto.uint64_field(1)
+    vs_component_extra: "WebcastDataEpisodeExtraInfo" = betterproto.message_field(2)
+    featured_public_screen_data: "WebcastDataFeaturedPublicScreenConf" = betterproto.message_field(3)
+    public_screen_speed_conf: "WebcastDataPublicScreenSpeedConf" = betterproto.message_field(4)
+    public_room_intro_label: "WebcastDataRoomIntroLabel" = betterproto.message_field(5)
+    input_default_config: "WebcastDataInputDefaultConfig" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomRevenueData(_HotMessage):
+    open_game: "WebcastDataOpenGame" = betterproto.message_field(1)
+    anchor_linkmic: "WebcastDataAnchorLinkmic" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomReqUserData(_HotMessage):
+    user_share_room_score: float = betterproto.float_field(1)
+    enter_user_device_type: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAnchorData(_HotMessage):
+    finish_schema: str = betterproto.string_field(1)
+    game_anchor_info: "WebcastDataGameAnchorInfo" = betterproto.message_field(2)
+    frame_scale: str = betterproto.string_field(3)
+    group_id_list: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameAnchorInfo(_HotMessage):
+    category_id: str = betterproto.string_field(1)
+    is_key_anchor: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomOthersData(_HotMessage):
+    deco_detail: "WebcastDataDecotationDetail" = betterproto.message_field(1)
+    more_panel_info: "WebcastDataMorePanelData" = betterproto.message_field(2)
+    appointment_info: "WebcastDataAppointmentData" = betterproto.message_field(3)
+    web_skin: "WebcastDataWebSkinData" = betterproto.message_field(4)
+    programme: "WebcastDataWebProgramme" = betterproto.message_field(5)
+    live_matrix_info: "WebcastDataLiveMatrixInfo" = betterproto.message_field(6)
+    web_live_port_optimization: "WebcastDataWebLivePortOptimization" = betterproto.message_field(7)
+    gift_panel_topper_tray: "WebcastDataGiftPanelTopperTray" = betterproto.message_field(8)
+    enter_gift_animation: "WebcastDataEnterGiftAnimation" = betterproto.message_field(9)
+    paid_live_subscribe: "WebcastDataPaidLiveSubscribe" = betterproto.message_field(10)
+    group_live_data: "WebcastDataGroupLiveData" = betterproto.message_field(11)
+    lvideo_item_id: int = betterproto.uint64_field(12)
+    web_enter_benefit_point_data: "WebcastDataWebEnterBenefitPointData" = betterproto.message_field(13)
+    recognition_containers: "WebcastDataStreamRecognitionContainers" = betterproto.message_field(14)
+    anchor_bottom_tool_bar: "WebcastDataAnchorBottomToolBar" = betterproto.message_field(15)
+    anchor_together_live: "WebcastDataAnchorTogetherLive" = betterproto.message_field(16)
+    mosaic_version: int = betterproto.uint64_field(17)
+    web_data: "WebcastDataWebData" = betterproto.message_field(18)
+    metric_tracker_data_list: "WebcastDataMetricTrackerData" = betterproto.message_field(19)
+    vr_info: "WebcastDataVrInfo" = betterproto.message_field(20)
+    cloud_collaborate_data: "WebcastDataCloudCollaborateData" = betterproto.message_field(21)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebLivePortOptimization(_HotMessage):
+    strategy_config: Dict[str, "WebcastDataWebLivePortConfig"] = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    strategy_extra: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebLivePortConfig(_HotMessage):
+    strategy_type: int = betterproto.int32_field(1)
+    use_config_duration: bool = betterproto.bool_field(2)
+    pause_monitor_duration: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebSkinData(_HotMessage):
+    enable_skin: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebProgramme(_HotMessage):
+    enable_programme: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLiveMatrixInfo(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    name: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomGameData(_HotMessage):
+    room_game_data_channel_config: "WebcastDataRoomGameDataChannelConfig" = betterproto.message_field(1)
+    game_tag_info: "WebcastDataGameTagInfo" = betterproto.message_field(2)
+    sandwich_border_info: "WebcastDataSandwichBorderInfo" = betterproto.message_field(3)
+    game_room_sticker: "WebcastDataGameRoomSticker" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppointmentData(_HotMessage):
+    appointment_id: int = betterproto.uint64_field(1)
+    is_subscribe: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMorePanelData(_HotMessage):
+    load_strategy: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityData(_HotMessage):
+    xg_play: bool = betterproto.bool_field(1)
+    match: "WebcastDataMatchRoomData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCastScreenData(_HotMessage):
+    show_text: str = betterproto.string_field(1)
+    allow_list: List[int] = betterproto.uint64_field(2)
+    sdk_version: int = betterproto.int32_field(3)
+    permission: "WebcastDataCastOttPermission" = betterproto.message_field(4)
+    force_cast_only: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCastOttPermission(_HotMessage):
+    enable: bool = betterproto.bool_field(1)
+    failure_toast: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDesireInfo(_HotMessage):
+    desire_id: int = betterproto.uint64_field(1)
+    desire_id_str: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCard(_HotMessage):
+    title: str = betterproto.string_field(1)
+    feedback_id: int = betterproto.uint64_field(2)
+    question: List["WebcastDataFeedbackCardQuestion"] = betterproto.message_field(3)
+    condition: "WebcastDataFeedbackCardCondition" = betterproto.message_field(4)
+    room_id: int = betterproto.uint64_field(5)
+    room_data: "WebcastDataRoom" = betterproto.message_field(6)
+    negative_text: str = betterproto.string_field(7)
+    bgm: "WebcastDataImage" = betterproto.message_field(8)
+    feedback_type: int = betterproto.int32_field(9)
+    inflow_feedback_type: int = betterproto.int32_field(10)
+    anchor_feedback_type: int = betterproto.int32_field(11)
+    scene: int = betterproto.int32_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardClientImpression(_HotMessage):
+    ignore_submit_counts: int = betterproto.uint64_field(1)
+    ignore_submit_show_interval: int = betterproto.uint64_field(2)
+    ending_page_show_duration: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardOption(_HotMessage):
+    key: str = betterproto.string_field(1)
+    text: str = betterproto.string_field(2)
+    sub_question_id: int = betterproto.uint64_field(3)
+    negative: bool = betterproto.bool_field(4)
+    toast_text: str = betterproto.string_field(5)
+    tendency: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardRoomCardStruct(_HotMessage):
+    data: "WebcastDataRoom" = betterproto.message_field(1)
+    title: str = betterproto.string_field(2)
+    sub_title: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardQuestion(_HotMessage):
+    question_key: str = betterproto.string_field(1)
+    question_text: str = betterproto.string_field(2)
+    type: int = betterproto.uint64_field(3)
+    options: List["WebcastDataFeedbackCardOption"] = betterproto.message_field(4)
+    question_id: int = betterproto.uint64_field(5)
+    room_cards: List["WebcastDataFeedbackCardRoomCardStruct"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardCondition(_HotMessage):
+    from_time: int = betterproto.uint64_field(1)
+    to_time: int = betterproto.uint64_field(2)
+    action_ids: int = betterproto.uint64_field(3)
+    action_type: int = betterproto.uint64_field(4)
+    preview_time: int = betterproto.uint64_field(5)
+    pcu_lower_threshold: int = betterproto.uint64_field(6)
+    client_impression: "WebcastDataFeedbackCardClientImpression" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUpperRightWidgetData(_HotMessage):
+    name: str = betterproto.string_field(1)
+    widget_type: int = betterproto.int32_field(2)
+    extra: str = betterproto.string_field(3)
+    priority: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVipData(_HotMessage):
+    vip_room: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorTabLabel(_HotMessage):
+    content: str = betterproto.string_field(1)
+    label: "WebcastDataImage" = betterproto.message_field(2)
+    icon: "WebcastDataImage" = betterproto.message_field(3)
+    style: int = betterproto.int32_field(4)
+    type: int = betterproto.int32_field(5)
+    key: str = betterproto.string_field(6)
+    accessible_content: str = betterproto.string_field(7)
+    track_params: Dict[str, str] = betterproto.map_field(
+        8, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    dsl_label: "WebcastDataDslDetail" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBeautifyInfo(_HotMessage):
+    use_filter: bool = betterproto.bool_field(1)
+    commerce_use_filter: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUnionLiveInfo(_HotMessage):
+    guest_anchors: List["WebcastDataUnionLiveInfoGuestAnchor"] = betterproto.message_field(1)
+    avatar_description: str = betterproto.string_field(2)
+    fixed_sort: bool = betterproto.bool_field(3)
+    tag: str = betterproto.string_field(4)
+    type: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUnionLiveInfoGuestAnchor(_HotMessage):
+    user: "WebcastDataUser" = betterproto.message_field(1)
+    tag: str = betterproto.string_field(2)
+    status: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomSpecificSceneTypeInfo(_HotMessage):
+    is_union_live_room: bool = betterproto.bool_field(1)
+    is_life: bool = betterproto.bool_field(2)
+    is_protected_room: int = betterproto.int32_field(3)
+    is_lasted_goods_room: int = betterproto.int32_field(4)
+    is_desire_room: int = betterproto.int32_field(5)
+    commentary_type: bool = betterproto.bool_field(6)
+    is_sub_orientation_vertical_room: int = betterproto.int32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendation(_HotMessage):
+    relevant_type: int = betterproto.int32_field(1)
+    bottom_bar_category: int = betterproto.int32_field(2)
+    icon: "WebcastDataImage" = betterproto.message_field(3)
+    bar_text_prefix: str = betterproto.string_field(4)
+    bar_text_postfix: str = betterproto.string_field(5)
+    high_light_info: "WebcastDataRelevantRecommendationHighLightInfo" = betterproto.message_field(6)
+    ecom_info: "WebcastDataRelevantRecommendationEcomInfo" = betterproto.message_field(7)
+    vs_info: "WebcastDataRelevantRecommendationVsInfo" = betterproto.message_field(8)
+    white_category_info: "WebcastDataRelevantRecommendationWhiteCategoryInfo" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationHighLightInfo(_HotMessage):
+    main_url: str = betterproto.string_field(1)
+    bak_url: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationEcomInfo(_HotMessage):
+    product_id: int = betterproto.uint64_field(1)
+    product_name: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationEpisode(_HotMessage):
+    episode_id: int = betterproto.uint64_field(1)
+    episode_name: str = betterproto.string_field(2)
+    episode_cover: "WebcastDataImage" = betterproto.message_field(3)
+    current_period: str = betterproto.string_field(4)
+    season_id: int = betterproto.uint64_field(5)
+    item_id: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationVsInfo(_HotMessage):
+    episodes: List["WebcastDataRelevantRecommendationEpisode"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationWhiteCategoryInfo(_HotMessage):
+    first_level_tag_id: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryServiceInfo(_HotMessage):
+    entrance_open: bool = betterproto.bool_field(1)
+    icon_image: "WebcastDataImage" = betterproto.message_field(2)
+    consult_info: "WebcastDataIndustryServiceInfoConsultInfo" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryServiceInfoConsultInfo(_HotMessage):
+    biz_info: str = betterproto.string_field(1)
+    consult_role: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomData(_HotMessage):
+    live_card: "WebcastDataEcomLiveCard" = betterproto.message_field(1)
+    pop: "WebcastDataEcomPop" = betterproto.message_field(2)
+    goods_card: "WebcastDataEcomGoodsCard" = betterproto.message_field(3)
+    reds_show_infos: List["WebcastDataRedsShowInfo"] = betterproto.message_field(4)
+    room_cart_v2: "WebcastDataRoomCartV2" = betterproto.message_field(5)
+    instant_type: int = betterproto.int32_field(6)
+    route_rule: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAvatarLiveInfo(_HotMessage):
+    type: str = betterproto.string_field(1)
+    text: str = betterproto.string_field(2)
+    text_size: int = betterproto.int32_field(3)
+    image: "WebcastDataImage" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWelfareProjectInfo(_HotMessage):
+    project_id: int = betterproto.uint64_field(1)
+    show_frequency: int = betterproto.uint64_field(2)
+    container_card_url: str = betterproto.string_field(3)
+    welfare_detail_page_url: str = betterproto.string_field(4)
+    project_id_str: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCornerMarkReach(_HotMessage):
+    need_reach: bool = betterproto.bool_field(1)
+    duration: int = betterproto.uint64_field(2)
+    elem_type: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVerticalTypeInfo(_HotMessage):
+    name: str = betterproto.string_field(1)
+    tab_type: int = betterproto.uint64_field(2)
+    tag_id: int = betterproto.uint64_field(3)
+    is_sub_tag: bool = betterproto.bool_field(4)
+    icon: "WebcastDataImage" = betterproto.message_field(5)
+    valid_time: int = betterproto.uint64_field(6)
+    priority: int = betterproto.uint64_field(7)
+    extra: str = betterproto.string_field(8)
+    event_extra: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFilterWord(_HotMessage):
+    id: str = betterproto.string_field(1)
+    is_selected: bool = betterproto.bool_field(2)
+    name: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLabelInfo(_HotMessage):
+    label_type: int = betterproto.uint64_field(1)
+    display_type: int = betterproto.uint64_field(2)
+    splice_label: "WebcastDataSpliceLabel" = betterproto.message_field(3)
+    whole_label: "WebcastDataImage" = betterproto.message_field(4)
+    extra: str = betterproto.string_field(5)
+    profile_pic_splice_label: "WebcastDataProfilePicSpliceLabel" = betterproto.message_field(6)
+    et_extra: Dict[str, str] = betterproto.map_field(
+        7, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsLinkInfo(_HotMessage):
+    title: str = betterproto.string_field(1)
+    tab_title: str = betterproto.string_field(2)
+    rooms: List["WebcastDataVsLinkNode"] = betterproto.message_field(3)
+    pattern: int = betterproto.int32_field(4)
+    project_name: str = betterproto.string_field(5)
+    is_main_room: bool = betterproto.bool_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsLinkNode(_HotMessage):
+    room_id: int = betterproto.uint64_field(1)
+    room_id_str: str = betterproto.string_field(2)
+    title: str = betterproto.string_field(3)
+    live_room_mode: int = betterproto.uint64_field(4)
+    owner: "WebcastDataUser" = betterproto.message_field(5)
+    source: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSpliceLabel(_HotMessage):
+    text: str = betterproto.string_field(1)
+    text_color: str = betterproto.string_field(2)
+    background_image: "WebcastDataImage" = betterproto.message_field(3)
+    icon_image: "WebcastDataImage" = betterproto.message_field(4)
+    background_color: str = betterproto.string_field(5)
+    icon_width: int = betterproto.uint64_field(6)
+    icon_height: int = betterproto.uint64_field(7)
+    icon_raduis: int = betterproto.uint64_field(8)
+    text_front_size: int = betterproto.uint64_field(9)
+    text_front_bold: int = betterproto.uint64_field(10)
+    text_front_italic: int = betterproto.uint64_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProfilePicSpliceLabel(_HotMessage):
+    profile_list: "WebcastDataLabelProfileItem" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLabelProfileItem(_HotMessage):
+    user_id: int = betterproto.uint64_field(1)
+    nick_name: str = betterproto.string_field(2)
+    profile_pic: "WebcastDataImage" = betterproto.message_field(3)
+    open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLiveStatusInfo(_HotMessage):
+    live_status: int = betterproto.int32_field(1)
+    live_user: "WebcastDataUser" = betterproto.message_field(2)
+    live_notify_light: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        3, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    preview_text: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShortTouchAuth(_HotMessage):
+    commerce_lottery: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodeMod(_HotMessage):
+    episode_stage: int = betterproto.int32_field(1)
+    episode_type: int = betterproto.int32_field(2)
+    episode_sub_type: int = betterproto.int32_field(3)
+    episode_record_type: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarItemConfig(_HotMessage):
+    toolbar_type: int = betterproto.int32_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    jump_schema: str = betterproto.string_field(3)
+    display_type: int = betterproto.int32_field(4)
+    dynamic_icon: "WebcastDataImage" = betterproto.message_field(5)
+    icon_vertical: "WebcastDataImage" = betterproto.message_field(6)
+    dynamic_bottom_icon: "WebcastDataImage" = betterproto.message_field(7)
+    bottom_icon: "WebcastDataImage" = betterproto.message_field(8)
+    toast_list: List["WebcastDataToast"] = betterproto.message_field(9)
+    extra: str = betterproto.string_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToast(_HotMessage):
+    start_time: int = betterproto.uint64_field(1)
+    end_time: int = betterproto.uint64_field(2)
+    content: str = betterproto.string_field(3)
+    schema: str = betterproto.string_field(4)
+    toast_id: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWatchInfo(_HotMessage):
+    desc: str = betterproto.string_field(1)
+    count: str = betterproto.string_field(2)
+    count_with_backup: str = betterproto.string_field(3)
+    real_count: int = betterproto.int32_field(4)
+    real_count_int64: int = betterproto.uint64_field(5)
+    live_count_display_type: int = betterproto.int32_field(6)
+    display_type_start_time: int = betterproto.uint64_field(7)
+    format_count: str = betterproto.string_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodeExtraInfo(_HotMessage):
+    episode_mod: "WebcastDataEpisodeMod" = betterproto.message_field(1)
+    current_period: str = betterproto.string_field(2)
+    title: str = betterproto.string_field(3)
+    episode_list_h5: str = betterproto.string_field(4)
+    watch_info: "WebcastDataWatchInfo" = betterproto.message_field(5)
+    episode_id: int = betterproto.uint64_field(6)
+    episode_id_str: str = betterproto.string_field(7)
+    item_id: str = betterproto.string_field(8)
+    selection_url: str = betterproto.string_field(9)
+    relation_place_text: str = betterproto.string_field(10)
+    operation_place_text_list: List[str] = betterproto.string_field(11)
+    toolbar_list: "WebcastDataToolbarItemConfig" = betterproto.message_field(12)
+    collected: bool = betterproto.bool_field(13)
+    season_id: int = betterproto.uint64_field(14)
+    finish_url: str = betterproto.string_field(15)
+    release_time: str = betterproto.string_field(16)
+    watch_period: int = betterproto.uint64_field(17)
+    latest_period: int = betterproto.uint64_field(18)
+    show_name: str = betterproto.string_field(19)
+    current_period_raw: int = betterproto.int32_field(20)
+    video_code: int = betterproto.int32_field(21)
+    season_id_str: str = betterproto.string_field(22)
+    watch_pv_raw: str = betterproto.string_field(23)
+    next_special_episode_id: int = betterproto.uint64_field(24)
+    cover: "WebcastDataImage" = betterproto.message_field(25)
+    cover_vertical: "WebcastDataImage" = betterproto.message_field(26)
+    style: int = betterproto.int32_field(27)
+    play_control: "WebcastDataEpisodePremierePlay" = betterproto.message_field(28)
+    preview_image: "WebcastDataEpisodePreviewImage" = betterproto.message_field(29)
+    gift_pannel: "WebcastDataVsGiftPannel" = betterproto.message_field(30)
+    pannel_icon: "WebcastDataVsPannelIcon" = betterproto.message_field(31)
+    pannel_toolbar: List["WebcastDataToolbarItemConfig"] = betterproto.message_field(32)
+    preview_bottom: "WebcastDataEpisodePreviewBottom" = betterproto.message_field(33)
+    draw_sub_title: str = betterproto.string_field(34)
+    season_cover_vertical: "WebcastDataImage" = betterproto.message_field(35)
+    camera_infos: List["WebcastDataVsCameraInfo"] = betterproto.message_field(36)
+    default_camera_id: int = betterproto.uint64_field(37)
+    default_camera_id_str: int = betterproto.uint64_field(38)
+    default_camera_id_str_v2: str = betterproto.string_field(39)
+    priority_camera: "WebcastDataVsCameraInfo" = betterproto.message_field(40)
+    multi_season_tag: str = betterproto.string_field(41)
+    preview_background: "WebcastDataImage" = betterproto.message_field(42)
+    background: "WebcastDataImage" = betterproto.message_field(43)
+    mod: "WebcastDataEpisodeMod" = betterproto.message_field(44)
+    item_comment_icon: "WebcastDataImage" = betterproto.message_field(45)
+    vs_watermark: "WebcastDataVsWatermark" = betterproto.message_field(46)
+    item_comment: "WebcastDataVsItemComment" = betterproto.message_field(47)
+    season_type_name: str = betterproto.string_field(48)
+    vs_bar: "WebcastDataVsBar" = betterproto.message_field(49)
+    season_watch_info: "WebcastDataWatchInfo" = betterproto.message_field(50)
+    link_room_info: "WebcastDataVsLinkInfo" = betterproto.message_field(51)
+    comment_config: "WebcastDataCommentConfig" = betterproto.message_field(52)
+    camera_infos_table_title: str = betterproto.string_field(53)
+    episode_status: int = betterproto.int32_field(54)
+    match_room_info: "WebcastDataMatchRoomInfo" = betterproto.message_field(55)
+    multi_camera_basic_info: "WebcastDataMultiCameraBasicInfo" = betterproto.message_field(56)
+    share_poster_info: "WebcastDataSharePosterInfo" = betterproto.message_field(57)
+    premiere_toast: "WebcastDataVsPremiereToast" = betterproto.message_field(58)
+    preview_bottom_text: str = betterproto.string_field(59)
+    business_configure: List["WebcastDataBusinessConfigure"] = betterproto.message_field(60)
+    public_screen_color: str = betterproto.string_field(61)
+    chat_tray_color: str = betterproto.string_field(62)
+    multi_tab: "WebcastDataMultiTab" = betterproto.message_field(63)
+    main_camera_cover: "WebcastDataImage" = betterproto.message_field(64)
+    main_camera_title: str = betterproto.string_field(65)
+    privilege_info: Dict[int, "WebcastDataPrivilegeInfo"] = betterproto.map_field(
+        66, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    is_interact_config_exist: bool = betterproto.bool_field(67)
+    main_camera_match_info: "WebcastDataMainCameraMatchInfo" = betterproto.message_field(68)
+    group_id: int = betterproto.uint64_field(69)
+    vs_config_drawer: "WebcastDataVsConfigDrawer" = betterproto.message_field(70)
+    title_icon: "WebcastDataTitleIcon" = betterproto.message_field(71)
+    group_id_str: str = betterproto.string_field(72)
+    privilege_info_v2: Dict[str, "WebcastDataPrivilegeInfo"] = betterproto.map_field(
+        73, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTitleIcon(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    size_type: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsConfigDrawer(_HotMessage):
+    drawer: "WebcastDataMatchDrawer" = betterproto.message_field(1)
+    drawer_label: "WebcastDataImage" = betterproto.message_field(2)
+    drawer_background: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsPremiereToast(_HotMessage):
+    left_top_toast: str = betterproto.string_field(1)
+    player_toast: str = betterproto.string_field(2)
+    player_top_toast: str = betterproto.string_field(3)
+    icon: "WebcastDataImage" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentConfig(_HotMessage):
+    comment_colors: List["WebcastDataCommentColor"] = betterproto.message_field(1)
+    comment_roles: List["WebcastDataCommentRole"] = betterproto.message_field(2)
+    role_suffix: str = betterproto.string_field(3)
+    role_title: str = betterproto.string_field(4)
+    unlock_role_tip: str = betterproto.string_field(5)
+    comment_medals: List["WebcastDataCommentMedal"] = betterproto.message_field(6)
+    medal_title: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentMedal(_HotMessage):
+    name: str = betterproto.string_field(1)
+    image: "WebcastDataImage" = betterproto.message_field(2)
+    jump_schema: Dict[str, str] = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    keyboard_image: "WebcastDataImage" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentColor(_HotMessage):
+    name: str = betterproto.string_field(1)
+    color: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentRole(_HotMessage):
+    role_id: int = betterproto.uint64_field(1)
+    name: str = betterproto.string_field(2)
+    avatar: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBonus(_HotMessage):
+    bonus_type: int = betterproto.uint64_field(1)
+    author: "WebcastDataBonusAuthor" = betterproto.message_field(2)
+    title: str = betterproto.string_field(3)
+    sub_title: str = betterproto.string_field(4)
+    text: str = betterproto.string_field(5)
+    style: str = betterproto.string_field(6)
+    commerce_info: "WebcastDataBonusCommerce" = betterproto.message_field(7)
+    open_url: str = betterproto.string_field(8)
+    token: str = betterproto.string_field(9)
+    source: int = betterproto.uint64_field(10)
+    label: "WebcastDataImage" = betterproto.message_field(11)
+    scene_id: int = betterproto.uint64_field(12)
+    maybe_carp: bool = betterproto.bool_field(13)
+    countdown_second: int = betterproto.uint64_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBonusCommerce(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBonusAuthor(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    name: str = betterproto.string_field(2)
+    avatar_larger: "WebcastDataImage" = betterproto.message_field(3)
+    avatar_thumb: "WebcastDataImage" = betterproto.message_field(4)
+    avatar_medium: "WebcastDataImage" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBorderInfo(_HotMessage):
+    border_type: int = betterproto.uint64_field(1)
+    static_border: "WebcastDataStaticBorderInfo" = betterproto.message_field(2)
+    dynamic_border: "WebcastDataDynamicBorderInfo" = betterproto.message_field(3)
+    duration: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStaticBorderInfo(_HotMessage):
+    top: "WebcastDataImage" = betterproto.message_field(1)
+    bottom: "WebcastDataImage" = betterproto.message_field(2)
+    left: "WebcastDataImage" = betterproto.message_field(3)
+    right: "WebcastDataImage" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDynamicBorderInfo(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkerUsers(_HotMessage):
+    count: int = betterproto.uint64_field(1)
+    users_info: List["WebcastDataUser"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOfficialChannelInfo(_HotMessage):
+    channel_user: "WebcastDataUser" = betterproto.message_field(1)
+    channel_name: str = betterproto.string_field(2)
+    channel_intro: str = betterproto.string_field(3)
+    end_timestamp: int = betterproto.uint64_field(4)
+    forbidden_before_end: int = betterproto.uint64_field(5)
+    current_show_id: int = betterproto.int32_field(6)
+    max_enter_time: int = betterproto.uint64_field(7)
+    max_next_time: int = betterproto.uint64_field(8)
+    delay_enter_time: Dict[int, int] = betterproto.map_field(
+        9, betterproto.TYPE_INT64, betterproto.TYPE_INT64
+    )
+    host_permission: bool = betterproto.bool_field(10)
+    backup_room_id: int = betterproto.uint64_field(11)
+    living_user: "WebcastDataUser" = betterproto.message_field(12)
+    host_can_accept_gift: bool = betterproto.bool_field(13)
+    host_uids: List[int] = betterproto.uint64_field(14)
+    backup_room_id_str: str = betterproto.string_field(15)
+    enable_host: bool = betterproto.bool_field(16)
+    host_open_ids: List[str] = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOfficialChannelExtraInfo(_HotMessage):
+    show_start_ts: int = betterproto.uint64_field(1)
+    showlist_schema: str = betterproto.string_field(2)
+    showlist_id: int = betterproto.uint64_field(3)
+    showlist_name: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfig(_HotMessage):
+    elements: Dict[int, "WebcastDataRoomShortTouchAreaConfigElement"] = betterproto.map_field(
+        1, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    forbidden_types_map: Dict[int, "WebcastDataRoomShortTouchAreaConfigForbiddenType"] = betterproto.map_field(
+        3, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    temp_state_condition_map: Dict[int, "WebcastDataRoomShortTouchAreaConfigTempStateCondition"] = betterproto.map_field(
+        4, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    temp_state_strategy: Dict[int, "WebcastDataRoomShortTouchAreaConfigTempStateStrategy"] = betterproto.map_field(
+        5, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    strategy_feat_whitelist: List[str] = betterproto.string_field(6)
+    temp_state_global_condition: "WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigElement(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    priority: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigForbiddenType(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    reason: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateType(_HotMessage):
+    strategy_type: int = betterproto.int32_field(1)
+    priority: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateCondition(_HotMessage):
+    type: "WebcastDataRoomShortTouchAreaConfigTempStateType" = betterproto.message_field(1)
+    minimum_gap: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateStrategy(_HotMessage):
+    short_touch_type: int = betterproto.int32_field(1)
+    strategy_map: Dict[int, "WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo"] = betterproto.map_field(
+        2, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo(_HotMessage):
+    type: "WebcastDataRoomShortTouchAreaConfigTempStateType" = betterproto.message_field(1)
+    duration: int = betterproto.int32_field(2)
+    strategy_method: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition(_HotMessage):
+    duration_gap: int = betterproto.int32_field(1)
+    allow_count: int = betterproto.int32_field(2)
+    ignore_strategy_types: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchInfo(_HotMessage):
+    skin: "WebcastDataMatchSkinInfo" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchSkinInfo(_HotMessage):
+    unfollow_skin: "WebcastDataMatchSkinInfoFollowBtnSkin" = betterproto.message_field(1)
+    followed_skin: "WebcastDataMatchSkinInfoFollowBtnSkin" = betterproto.message_field(2)
+    tab_selected_color: str = betterproto.string_field(3)
+    tab_unselected_color: str = betterproto.string_field(4)
+    comment_place_holder_color: str = betterproto.string_field(5)
+    anchor_name_color: str = betterproto.string_field(6)
+    anchor_info_color: str = betterproto.string_field(7)
+    user_banner_image: "WebcastDataImage" = betterproto.message_field(8)
+    tool_bar_image: "WebcastDataImage" = betterproto.message_field(9)
+    comment_place_holder_bg_color: str = betterproto.string_field(10)
+    share_icon: "WebcastDataImage" = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchSkinInfoFollowBtnSkin(_HotMessage):
+    left_color: str = betterproto.string_field(1)
+    right_color: str = betterproto.string_field(2)
+    font_color: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomActivityTag(_HotMessage):
+    activity_type: int = betterproto.int32_field(1)
+    name: str = betterproto.string_field(2)
+    url: str = betterproto.string_field(3)
+    extra: str = betterproto.string_field(4)
+    icon: "WebcastDataImage" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatus(_HotMessage):
+    chat: bool = betterproto.bool_field(1)
+    danmaku: bool = betterproto.bool_field(2)
+    gift: bool = betterproto.bool_field(3)
+    luck_money: bool = betterproto.bool_field(4)
+    digg: bool = betterproto.bool_field(5)
+    room_contributor: bool = betterproto.bool_field(7)
+    props: bool = betterproto.bool_field(8)
+    user_card: bool = betterproto.bool_field(9)
+    poi: bool = betterproto.bool_field(10)
+    more_anchor: int = betterproto.uint64_field(11)
+    banner: int = betterproto.uint64_field(12)
+    share: int = betterproto.uint64_field(13)
+    user_corner: int = betterproto.uint64_field(14)
+    landscape: int = betterproto.uint64_field(15)
+    landscape_chat: int = betterproto.uint64_field(16)
+    public_screen: int = betterproto.uint64_field(17)
+    gift_anchor_mt: int = betterproto.uint64_field(18)
+    record_screen: int = betterproto.uint64_field(19)
+    donation_sticker: int = betterproto.uint64_field(20)
+    hour_rank: int = betterproto.uint64_field(21)
+    commerce_card: int = betterproto.uint64_field(22)
+    audio_chat: int = betterproto.uint64_field(23)
+    danmaku_default: int = betterproto.uint64_field(24)
+    ktv_order_song: int = betterproto.uint64_field(25)
+    selection_album: int = betterproto.uint64_field(26)
+    like: int = betterproto.uint64_field(27)
+    multiplier_playback: int = betterproto.uint64_field(28)
+    download_video: int = betterproto.uint64_field(29)
+    collect: int = betterproto.uint64_field(30)
+    timed_shutdown: int = betterproto.uint64_field(31)
+    seek: int = betterproto.uint64_field(32)
+    denounce: int = betterproto.uint64_field(33)
+    dislike: int = betterproto.uint64_field(34)
+    only_ta: int = betterproto.uint64_field(35)
+    cast_screen: int = betterproto.uint64_field(36)
+    comment_wall: int = betterproto.uint64_field(37)
+    bullet_style: int = betterproto.uint64_field(38)
+    show_game_plugin: int = betterproto.uint64_field(39)
+    vs_gift: int = betterproto.uint64_field(40)
+    vs_topic: int = betterproto.uint64_field(41)
+    vs_rank: int = betterproto.uint64_field(42)
+    admin_comment_wall: int = betterproto.uint64_field(43)
+    commerce_component: int = betterproto.uint64_field(44)
+    dou_plus: int = betterproto.uint64_field(45)
+    game_points_playing: int = betterproto.uint64_field(46)
+    poster: int = betterproto.uint64_field(47)
+    highlights: int = betterproto.uint64_field(48)
+    typing_comment_state: int = betterproto.uint64_field(49)
+    stroke_up_down_guide: int = betterproto.uint64_field(50)
+    up_right_stats_floating_layer: int = betterproto.uint64_field(51)
+    cast_screen_explicit: int = betterproto.uint64_field(52)
+    selection: int = betterproto.uint64_field(53)
+    industry_service: int = betterproto.uint64_field(54)
+    vertical_rank: int = betterproto.uint64_field(55)
+    enter_effects: int = betterproto.uint64_field(56)
+    fans_club: int = betterproto.uint64_field(57)
+    emoji_outside: int = betterproto.uint64_field(58)
+    can_sell_ticket: int = betterproto.uint64_field(59)
+    dou_plus_popularity_gem: int = betterproto.uint64_field(60)
+    mission_center: int = betterproto.uint64_field(61)
+    expand_screen: int = betterproto.uint64_field(62)
+    fans_group: int = betterproto.uint64_field(63)
+    topic: int = betterproto.uint64_field(64)
+    anchor_mission: int = betterproto.uint64_field(65)
+    teleprompter: int = betterproto.uint64_field(66)
+    chat_dynamic_slide_speed: int = betterproto.uint64_field(67)
+    small_window_display: int = betterproto.uint64_field(68)
+    message_dispatch: int = betterproto.uint64_field(69)
+    room_channel: int = betterproto.uint64_field(70)
+    chat_dispatch: int = betterproto.uint64_field(71)
+    linkmic_guest_like: int = betterproto.uint64_field(72)
+    media_linkmic: int = betterproto.uint64_field(73)
+    video_share: int = betterproto.uint64_field(74)
+    chat_guide_emoji: int = betterproto.uint64_field(75)
+    chat_guide_image: int = betterproto.uint64_field(76)
+    pc_play: int = betterproto.uint64_field(77)
+    pad_play: int = betterproto.uint64_field(78)
+    long_touch: int = betterproto.uint64_field(79)
+    first_feed_hist_chat: int = betterproto.uint64_field(80)
+    more_hist_chat: int = betterproto.uint64_field(81)
+    word_association: int = betterproto.uint64_field(82)
+    landscape_screen_capture: int = betterproto.uint64_field(83)
+    landscape_screen_recording: int = betterproto.uint64_field(84)
+    screen_projection_barrage: int = betterproto.uint64_field(85)
+    small_window_player: int = betterproto.uint64_field(86)
+    chat_operate: int = betterproto.uint64_field(87)
+    ecom_fans_club: int = betterproto.uint64_field(88)
+    audio_chat_totext: int = betterproto.uint64_field(89)
+    common_card: int = betterproto.uint64_field(90)
+    short_touch: int = betterproto.uint64_field(91)
+    host_team_channel: int = betterproto.uint64_field(92)
+    landscape_chat_dynamic_slide_speed: int = betterproto.uint64_field(93)
+    host_team: int = betterproto.uint64_field(94)
+    anchor_hot_message_aggregated: int = betterproto.uint64_field(95)
+    anchor_cold_message_tiled: int = betterproto.uint64_field(96)
+    screen_bottom_info: int = betterproto.uint64_field(97)
+    preview_hot_comment_switch: int = betterproto.uint64_field(98)
+    room_widget: int = betterproto.uint64_field(99)
+    off_reason: "WebcastDataRoomAuthStatusRoomAuthOffReasons" = betterproto.message_field(100)
+    special_style: "WebcastDataRoomAuthStatusRoomAuthSpecialStyle" = betterproto.message_field(101)
+    panel_ec_service: int = betterproto.uint64_field(102)
+    fixed_chat: int = betterproto.uint64_field(103)
+    landscape_gift: int = betterproto.uint64_field(104)
+    hot_chat_tray: int = betterproto.uint64_field(105)
+    item_share: int = betterproto.uint64_field(106)
+    short_touch_temp_state: int = betterproto.uint64_field(107)
+    sticky_message: int = betterproto.uint64_field(108)
+    projection_btn: int = betterproto.uint64_field(109)
+    chat_dynamic_slide_speed_anchor: int = betterproto.uint64_field(110)
+    poster_cache: int = betterproto.uint64_field(111)
+    media_history_message: int = betterproto.uint64_field(112)
+    toolbar_bubble: int = betterproto.uint64_field(113)
+    im_heat_value: int = betterproto.uint64_field(114)
+    interactive_component: int = betterproto.uint64_field(115)
+    chat_reply: int = betterproto.uint64_field(116)
+    chat_mention: int = betterproto.uint64_field(117)
+    frequently_chat: int = betterproto.uint64_field(118)
+    stream_adaptation: int = betterproto.uint64_field(119)
+    video_amplification_type: int = betterproto.uint64_field(120)
+    featured_public_screen: int = betterproto.uint64_field(121)
+    landscape_screen_share: int = betterproto.uint64_field(122)
+    vertical_screen_share: int = betterproto.uint64_field(123)
+    anchor_audio_chat: int = betterproto.uint64_field(124)
+    preview_chat_expose: int = betterproto.uint64_field(125)
+    fusion_emoji: int = betterproto.uint64_field(126)
+    my_live_entrance: int = betterproto.uint64_field(127)
+    chat_identity: int = betterproto.uint64_field(128)
+    mark_user: int = betterproto.uint64_field(129)
+    long_press_option: int = betterproto.uint64_field(130)
+    clear_entrance_option: int = betterproto.uint64_field(131)
+    player_rank_list: int = betterproto.uint64_field(132)
+    ai_clone: int = betterproto.uint64_field(133)
+    gift_vote: int = betterproto.uint64_field(134)
+    text_gift: int = betterproto.uint64_field(135)
+    fans_club_letter: int = betterproto.uint64_field(136)
+    fans_club_blessing: int = betterproto.uint64_field(137)
+    fans_club_notice: int = betterproto.uint64_field(138)
+    fans_club_declaration: int = betterproto.uint64_field(139)
+    message_gift: int = betterproto.uint64_field(140)
+    enhanced_touch: int = betterproto.uint64_field(141)
+    chat_mention_v2: int = betterproto.uint64_field(142)
+    room_chat_operate_panel: int = betterproto.uint64_field(143)
+    room_chat_like_display: int = betterproto.uint64_field(144)
+    room_secret_chat: int = betterproto.uint64_field(145)
+    room_anchor_fans_channel: int = betterproto.uint64_field(146)
+    room_pin_highlight: int = betterproto.uint64_field(147)
+    preview_dan_ma_ku: int = betterproto.uint64_field(160)
+    vs_comment_bar: int = betterproto.uint64_field(200)
+    vs_welcome_danmaku: int = betterproto.uint64_field(201)
+    vs_fans_club: int = betterproto.uint64_field(202)
+    vs_extension_enable_follow: int = betterproto.uint64_field(203)
+    vs_dou_plus: int = betterproto.uint64_field(204)
+    quiz_game_points_playing: int = betterproto.uint64_field(205)
+    ugc_vs_replay_delete: int = betterproto.uint64_field(206)
+    ugc_vs_replay_visibility: int = betterproto.uint64_field(207)
+    interaction_gift: int = betterproto.uint64_field(208)
+    subscribe_card_package: int = betterproto.uint64_field(209)
+    show_qualification: int = betterproto.uint64_field(210)
+    use_host_info: int = betterproto.uint64_field(301)
+    count_type: int = betterproto.uint64_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatusRoomAuthOffReasons(_HotMessage):
+    gift: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatusRoomAuthSpecialStyle(_HotMessage):
+    chat: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(1)
+    gift: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(2)
+    room_contributor: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(3)
+    like: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(4)
+    room_channel: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(5)
+    share: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(6)
+    cast_screen_auth: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(7)
+    landscape: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle(_HotMessage):
+    unable_style: int = betterproto.int32_field(1)
+    content: str = betterproto.string_field(2)
+    off_type: int = betterproto.int32_field(3)
+    anchor_switch: int = betterproto.int32_field(4)
+    switch_status_tip_msg: str = betterproto.string_field(5)
+    switch_status_anchor_tip_msg: str = betterproto.string_field(6)
+    anchor_switch_for_paid_live: int = betterproto.int32_field(7)
+    content_for_paid_live: str = betterproto.string_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMoreEntrance(_HotMessage):
+    title: str = betterproto.string_field(1)
+    type: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomTab(_HotMessage):
+    tab_type: int = betterproto.int32_field(1)
+    tab_name: str = betterproto.string_field(2)
+    tab_url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomExtra(_HotMessage):
+    is_sandbox: bool = betterproto.bool_field(1)
+    enter_region_restriction: "WebcastDataRegionRestriction" = betterproto.message_field(2)
+    enter_region_match: "WebcastDataRegionMatch" = betterproto.message_field(3)
+    filter_with_no_context: "WebcastDataSafeReason" = betterproto.message_field(4)
+    xigua_uid: int = betterproto.uint64_field(5)
+    limit_strategy: int = betterproto.uint64_field(6)
+    limit_appid: str = betterproto.string_field(7)
+    geo_block: int = betterproto.int32_field(8)
+    vr_type: int = betterproto.int32_field(9)
+    is_virtual_anchor: bool = betterproto.bool_field(10)
+    create_scene: str = betterproto.string_field(11)
+    realtime_replay_enabled: bool = betterproto.bool_field(12)
+    realtime_playback_shift: int = betterproto.uint64_field(13)
+    realtime_playback_start_shift: int = betterproto.uint64_field(14)
+    realtime_playback_qualities: List["WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality"] = betterproto.message_field(15)
+    facial_unrecognised: int = betterproto.int32_field(16)
+    vs_type: int = betterproto.uint64_field(17)
+    location_info: "WebcastDataLocationInfo" = betterproto.message_field(18)
+    max_audience_cnt: int = betterproto.int32_field(19)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSafeReason(_HotMessage):
+    safe_type: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRegionRestriction(_HotMessage):
+    type: int = betterproto.uint64_field(1)
+    white_list: List[str] = betterproto.string_field(2)
+    black_list: List[str] = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRegionMatch(_HotMessage):
+    type: int = betterproto.uint64_field(1)
+    allow_list: List[str] = betterproto.string_field(2)
+    deny_list: List[str] = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrl(_HotMessage):
+    provider: int = betterproto.uint64_field(1)
+    id: int = betterproto.uint64_field(2)
+    id_str: str = betterproto.string_field(3)
+    resolution_name: Dict[str, str] = betterproto.map_field(
+        4, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    default_resolution: str = betterproto.string_field(5)
+    extra: "WebcastDataStreamUrlStreamUrlExtra" = betterproto.message_field(6)
+    rtmp_push_url: str = betterproto.string_field(7)
+    rtmp_pull_url: str = betterproto.string_field(8)
+    flv_pull_url: Dict[str, str] = betterproto.map_field(
+        9, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    candidate_resolution: List[str] = betterproto.string_field(10)
+    hls_pull_url: str = betterproto.string_field(11)
+    hls_pull_url_params: str = betterproto.string_field(12)
+    rtmp_pull_url_params: str = betterproto.string_field(13)
+    flv_pull_url_params: Dict[str, str] = betterproto.map_field(
+        14, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    rtmp_push_url_params: str = betterproto.string_field(15)
+    push_urls: str = betterproto.string_field(16)
+    live_core_sdk_data: "WebcastDataStreamUrlLiveCoreSdkData" = betterproto.message_field(17)
+    hls_pull_url_map: Dict[str, str] = betterproto.map_field(
+        18, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    complete_push_urls: List[str] = betterproto.string_field(19)
+    stream_control_type: int = betterproto.int32_field(20)
+    stream_orientation: int = betterproto.int32_field(21)
+    push_stream_type: int = betterproto.int32_field(22)
+    pull_datas: Dict[str, "WebcastDataStreamUrlLiveCoreSdkDataPullData"] = betterproto.map_field(
+        23, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    play: "WebcastDataStreamUrlPlaySetting" = betterproto.message_field(24)
+    push_datas: Dict[str, "WebcastDataStreamUrlLiveCoreSdkDataPushData"] = betterproto.map_field(
+        25, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    vr_type: int = betterproto.int32_field(26)
+    open_stream_url_encrypt: "WebcastDataOpenStreamUrlEncrypt" = betterproto.message_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtra(_HotMessage):
+    height: int = betterproto.uint64_field(1)
+    width: int = betterproto.uint64_field(2)
+    fps: int = betterproto.uint64_field(3)
+    max_bitrate: int = betterproto.uint64_field(4)
+    min_bitrate: int = betterproto.uint64_field(5)
+    default_bitrate: int = betterproto.uint64_field(6)
+    bitrate_adapt_strategy: int = betterproto.uint64_field(7)
+    anchor_interact_profile: int = betterproto.uint64_field(8)
+    audience_interact_profile: int = betterproto.uint64_field(9)
+    hardware_encode: bool = betterproto.bool_field(10)
+    video_profile: int = betterproto.uint64_field(12)
+    super_resolution: "WebcastDataStreamUrlStreamUrlExtraSuperResolution" = betterproto.message_field(14)
+    h265_enable: bool = betterproto.bool_field(15)
+    gop_sec: int = betterproto.uint64_field(16)
+    bframe_enable: bool = betterproto.bool_field(17)
+    roi: bool = betterproto.bool_field(18)
+    sw_roi: bool = betterproto.bool_field(19)
+    bytevc1_enable: bool = betterproto.bool_field(20)
+    anchor_client_info: "WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo" = betterproto.message_field(21)
+    adaption_info: "WebcastDataStreamUrlStreamUrlExtraAdaptionInfo" = betterproto.message_field(22)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtraSuperResolution(_HotMessage):
+    enable: bool = betterproto.bool_field(1)
+    strength: int = betterproto.uint64_field(2)
+    antialiasing: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo(_HotMessage):
+    custom_info: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtraAdaptionInfo(_HotMessage):
+    vertical_resize_mode: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkData(_HotMessage):
+    pull_data: "WebcastDataStreamUrlLiveCoreSdkDataPullData" = betterproto.message_field(1)
+    push_data: "WebcastDataStreamUrlLiveCoreSdkDataPushData" = betterproto.message_field(2)
+    size: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullData(_HotMessage):
+    stream_data: str = betterproto.string_field(1)
+    options: "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions" = betterproto.message_field(2)
+    version: int = betterproto.uint64_field(3)
+    hls_data_unencrypted: Dict[str, str] = betterproto.map_field(
+        4, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    kind: int = betterproto.int32_field(5)
+    extension: "WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension" = betterproto.message_field(6)
+    hls: List["WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo"] = betterproto.message_field(7)
+    flv: List["WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo"] = betterproto.message_field(8)
+    codec: str = betterproto.string_field(9)
+    display: "WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay" = betterproto.message_field(10)
+    compensatory_data: str = betterproto.string_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions(_HotMessage):
+    default_quality: "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality" = betterproto.message_field(1)
+    qualities: List["WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality"] = betterproto.message_field(2)
+    vpass_default: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality(_HotMessage):
+    name: str = betterproto.string_field(1)
+    sdk_key: str = betterproto.string_field(2)
+    v_codec: str = betterproto.string_field(3)
+    resolution: str = betterproto.string_field(4)
+    level: int = betterproto.int32_field(5)
+    v_bit_rate: int = betterproto.int32_field(6)
+    additional_content: str = betterproto.string_field(7)
+    fps: int = betterproto.int32_field(8)
+    disable: int = betterproto.int32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataClip(_HotMessage):
+    x: float = betterproto.float_field(1)
+    y: float = betterproto.float_field(2)
+    w: float = betterproto.float_field(3)
+    h: float = betterproto.float_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition(_HotMessage):
+    anchor: int = betterproto.int32_field(1)
+    x: float = betterproto.float_field(2)
+    y: float = betterproto.float_field(3)
+    w: float = betterproto.float_field(4)
+    h: float = betterproto.float_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension(_HotMessage):
+    game_clip: "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip" = betterproto.message_field(1)
+    camera_clip: "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip" = betterproto.message_field(2)
+    camera_hidden: int = betterproto.int32_field(3)
+    ts: str = betterproto.string_field(4)
+    refresh: int = betterproto.uint64_field(5)
+    display_mode: int = betterproto.int32_field(6)
+    game_hidden: int = betterproto.int32_field(7)
+    game_room_id: str = betterproto.string_field(8)
+    layout: int = betterproto.int32_field(9)
+    camera_clip_custom: "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip" = betterproto.message_field(10)
+    camera_vertical_type: int = betterproto.int32_field(11)
+    camera_horizontal_position: "WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition" = betterproto.message_field(12)
+    camera_horizontal_hidden: int = betterproto.int32_field(13)
+    camera_horizontal_type: int = betterproto.int32_field(14)
+    multi_view_data: str = betterproto.string_field(15)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo(_HotMessage):
+    url: str = betterproto.string_field(1)
+    quality_name: str = betterproto.string_field(2)
+    params: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay(_HotMessage):
+    scale_width: int = betterproto.uint64_field(1)
+    scale_height: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPushData(_HotMessage):
+    resolution_params: Dict[str, "WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams"] = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    push_stream_level: int = betterproto.int32_field(2)
+    pre_schedule: bool = betterproto.bool_field(3)
+    rtmp_push_url: str = betterproto.string_field(4)
+    push_params: str = betterproto.string_field(5)
+    kind: int = betterproto.int32_field(6)
+    stream_id: int = betterproto.uint64_field(7)
+    stream_id_str: str = betterproto.string_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams(_HotMessage):
+    width: int = betterproto.uint64_field(1)
+    height: int = betterproto.uint64_field(2)
+    default_bitrate: int = betterproto.uint64_field(3)
+    min_bitrate: int = betterproto.uint64_field(4)
+    max_bitrate: int = betterproto.uint64_field(5)
+    fps: int = betterproto.uint64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlPlaySetting(_HotMessage):
+    horizontal: str = betterproto.string_field(1)
+    vertical: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsCameraInfo(_HotMessage):
+    camera_id: int = betterproto.uint64_field(1)
+    camera_id_str: str = betterproto.string_field(2)
+    title: str = betterproto.string_field(3)
+    cover: "WebcastDataImage" = betterproto.message_field(4)
+    cover_vertical: "WebcastDataImage" = betterproto.message_field(5)
+    stream_info: "WebcastDataStreamUrl" = betterproto.message_field(6)
+    start_time: int = betterproto.uint64_field(7)
+    end_time: int = betterproto.uint64_field(8)
+    style: int = betterproto.int32_field(9)
+    camera_room_auth: "WebcastDataRoomAuthStatus" = betterproto.message_field(10)
+    vr_type: int = betterproto.int32_field(11)
+    camera_paid_info: "WebcastDataCameraPaidInfo" = betterproto.message_field(12)
+    camera_match_info: "WebcastDataCameraMatchInfo" = betterproto.message_field(13)
+    group_id: int = betterproto.uint64_field(14)
+    camera_type: int = betterproto.int32_field(15)
+    label: "WebcastDataImage" = betterproto.message_field(16)
+    pcu: int = betterproto.uint64_field(17)
+    is_subscribed: bool = betterproto.bool_field(18)
+    group_id_str: str = betterproto.string_field(19)
+    preview_image: "WebcastDataEpisodePreviewImage" = betterproto.message_field(20)
+    ban_switch: bool = betterproto.bool_field(21)
+    paid_live_type: int = betterproto.uint64_field(22)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraPaidInfo(_HotMessage):
+    max_duration: int = betterproto.int32_field(1)
+    duration: int = betterproto.uint64_field(2)
+    price_info: "WebcastDataCameraPaidInfoPriceInfo" = betterproto.message_field(3)
+    paid_live_base_info: "WebcastDataPaidLiveBaseInfo" = betterproto.message_field(4)
+    paid_live_biz_extra: "WebcastDataCameraPaidInfoPaidLiveBizExtra" = betterproto.message_field(5)
+    async_auth_data: "WebcastDataAsyncAuthData" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraPaidInfoPriceInfo(_HotMessage):
+    amount: str = betterproto.string_field(1)
+    currency: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraPaidInfoPaidLiveBizExtra(_HotMessage):
+    ticket_panel_six_jump_url: str = betterproto.string_field(1)
+    is_replay: bool = betterproto.bool_field(2)
+    paid_conversion_jump_url: str = betterproto.string_field(3)
+    prepay_cashier_jump_url: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraMatchInfo(_HotMessage):
+    match_id: int = betterproto.uint64_field(1)
+    content_id: int = betterproto.uint64_field(2)
+    event_ids: List[int] = betterproto.uint64_field(3)
+    hide_tab_ids: List[int] = betterproto.uint64_field(4)
+    match_id_str: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveBaseInfo(_HotMessage):
+    paid_live_type: int = betterproto.int32_field(1)
+    ticket_session_id: int = betterproto.uint64_field(2)
+    ticket_price: int = betterproto.uint64_field(3)
+    view_right: int = betterproto.int32_field(4)
+    delivery: int = betterproto.int32_field(5)
+    ticket_session_id_str: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMic(_HotMessage):
+    channel_id: int = betterproto.uint64_field(1)
+    channel_info: "WebcastDataLinkMicLinkMicChannelInfo" = betterproto.message_field(2)
+    battle_scores: List["WebcastDataLinkMicLinkMicBattleScore"] = betterproto.message_field(3)
+    battle_settings: "WebcastDataLinkMicLinkMicBattleSetting" = betterproto.message_field(4)
+    rival_anchor_id: int = betterproto.uint64_field(5)
+    linkmic_anchor_count: int = betterproto.uint64_field(6)
+    rival_anchor_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMicLinkMicChannelInfo(_HotMessage):
+    layout: int = betterproto.uint64_field(1)
+    vendor: int = betterproto.uint64_field(2)
+    dimension: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMicLinkMicBattleScore(_HotMessage):
+    user_id: int = betterproto.uint64_field(1)
+    score: int = betterproto.uint64_field(2)
+    open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMicLinkMicBattleSetting(_HotMessage):
+    channel_id: int = betterproto.uint64_field(1)
+    duration: int = betterproto.uint64_field(2)
+    start_time: int = betterproto.uint64_field(3)
+    start_time_ms: int = betterproto.uint64_field(4)
+    theme: str = betterproto.string_field(5)
+    finished: int = betterproto.uint64_field(6)
+    battle_id: int = betterproto.uint64_field(7)
+    match_type: int = betterproto.uint64_field(8)
+    play_mode: int = betterproto.uint64_field(9)
+    team_mode: int = betterproto.uint64_field(10)
+    activity_mode: int = betterproto.uint64_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataReservation(_HotMessage):
+    appointment_id: int = betterproto.uint64_field(1)
+    anchor_id: int = betterproto.uint64_field(2)
+    room_id: int = betterproto.uint64_field(3)
+    start_time: int = betterproto.uint64_field(4)
+    end_time: int = betterproto.uint64_field(5)
+    btn_rect: List[int] = betterproto.uint64_field(6)
+    btn_color: str = betterproto.string_field(7)
+    is_reserved: bool = betterproto.bool_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDecotationDetail(_HotMessage):
+    text_decoration: "WebcastDataDecoration" = betterproto.message_field(1)
+    image_decoration: "WebcastDataDecoration" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDecoration(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    image: "WebcastDataImage" = betterproto.message_field(2)
+    type: int = betterproto.uint64_field(3)
+    input_rect: List[int] = betterproto.uint64_field(4)
+    text_size: int = betterproto.uint64_field(5)
+    text_color: str = betterproto.string_field(6)
+    content: str = betterproto.string_field(7)
+    max_length: int = betterproto.uint64_field(8)
+    status: int = betterproto.uint64_field(9)
+    h: int = betterproto.uint64_field(10)
+    x: int = betterproto.uint64_field(11)
+    w: int = betterproto.uint64_field(12)
+    y: int = betterproto.uint64_field(13)
+    kind: int = betterproto.uint64_field(14)
+    sub_type: int = betterproto.uint64_field(15)
+    reservation: "WebcastDataReservation" = betterproto.message_field(16)
+    nine_patch_image: "WebcastDataImage" = betterproto.message_field(17)
+    text_special_effects: List[int] = betterproto.uint64_field(18)
+    text_image_adjustable_start_position: int = betterproto.uint64_field(19)
+    text_image_adjustable_end_position: int = betterproto.uint64_field(20)
+    text_font_config: "WebcastDataDecorationFontConfig" = betterproto.message_field(21)
+    audit_text_color: str = betterproto.string_field(22)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDecorationFontConfig(_HotMessage):
+    font_id: int = betterproto.uint64_field(1)
+    download_url: str = betterproto.string_field(2)
+    status: int = betterproto.uint64_field(3)
+    font_name: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomStats(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    id_str: str = betterproto.string_field(2)
+    fan_ticket: int = betterproto.uint64_field(3)
+    money: int = betterproto.uint64_field(4)
+    total_user: int = betterproto.uint64_field(5)
+    gift_uv_count: int = betterproto.uint64_field(6)
+    follow_count: int = betterproto.uint64_field(7)
+    user_count_composition: "WebcastDataRoomStatsUserCountComposition" = betterproto.message_field(8)
+    watermelon: int = betterproto.uint64_field(9)
+    digg_count: int = betterproto.uint64_field(10)
+    enter_count: int = betterproto.uint64_field(11)
+    dou_plus_promotion: str = betterproto.string_field(12)
+    total_user_desp: str = betterproto.string_field(13)
+    like_count: int = betterproto.uint64_field(14)
+    total_user_str: str = betterproto.string_field(15)
+    user_count_str: str = betterproto.string_field(16)
+    comment_count: int = betterproto.uint64_field(17)
+    welfare_donation_amount: int = betterproto.uint64_field(18)
+    up_right_stats_str: str = betterproto.string_field(19)
+    up_right_stats_str_complete: str = betterproto.string_field(20)
+    total_user_uv_preview_str: str = betterproto.string_field(21)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomStatsUserCountComposition(_HotMessage):
+    city: float = betterproto.double_field(1)
+    video_detail: float = betterproto.double_field(2)
+    my_follow: float = betterproto.double_field(3)
+    other: float = betterproto.double_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomViewStats(_HotMessage):
+    is_hidden: bool = betterproto.bool_field(1)
+    display_short: str = betterproto.string_field(2)
+    display_middle: str = betterproto.string_field(3)
+    display_long: str = betterproto.string_field(4)
+    display_value: int = betterproto.uint64_field(5)
+    display_version: int = betterproto.uint64_field(6)
+    incremental: bool = betterproto.bool_field(7)
+    display_type: int = betterproto.int32_field(8)
+    display_short_anchor: str = betterproto.string_field(9)
+    display_middle_anchor: str = betterproto.string_field(10)
+    display_long_anchor: str = betterproto.string_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTopFan(_HotMessage):
+    fan_ticket: int = betterproto.uint64_field(1)
+    user: "WebcastDataUser" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomUserAttr(_HotMessage):
+    room_id: int = betterproto.uint64_field(1)
+    room_id_str: str = betterproto.string_field(2)
+    silence_flag: int = betterproto.uint64_field(3)
+    admin_flag: int = betterproto.uint64_field(4)
+    rank: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBurstInfo(_HotMessage):
+    burst_time_remain_seconds: int = betterproto.uint64_field(1)
+    multiple: int = betterproto.uint64_field(2)
+    property_definition_id: int = betterproto.uint64_field(3)
+    property_icon: "WebcastDataImage" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomHealthScoreInfo(_HotMessage):
+    score: float = betterproto.double_field(1)
+    bubble_message: str = betterproto.string_field(2)
+    jump_url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTvStation(_HotMessage):
+    is_idle: bool = betterproto.bool_field(1)
+    state_desc: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentBox(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    placeholder: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomCartV2(_HotMessage):
+    show_cart: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomCart(_HotMessage):
+    contain_cart: bool = betterproto.bool_field(1)
+    total: int = betterproto.uint64_field(2)
+    flash_total: int = betterproto.uint64_field(3)
+    cart_icon: str = betterproto.string_field(4)
+    show_cart: int = betterproto.int32_field(5)
+    vertical: "WebcastDataCartVertical" = betterproto.message_field(6)
+    horizontal: "WebcastDataCartHorizontal" = betterproto.message_field(7)
+    global_custom_icons: "WebcastDataGlobalCustomIcons" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCartVertical(_HotMessage):
+    allow_show_cart: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCartHorizontal(_HotMessage):
+    allow_show_cart: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGlobalCustomIcons(_HotMessage):
+    static_icon_url: str = betterproto.string_field(1)
+    animated_icon_url: str = betterproto.string_field(2)
+    animated_common_icon_url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataQuizExtra(_HotMessage):
+    quiz_infos: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudioSpeakingImageList(_HotMessage):
+    male_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage" = betterproto.message_field(1)
+    female_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage" = betterproto.message_field(2)
+    unknown_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage" = betterproto.message_field(3)
+    audio_stage_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudioSpeakingImageListSpeakingImage(_HotMessage):
+    speaking_low_image: "WebcastDataImage" = betterproto.message_field(1)
+    speaking_default_image: "WebcastDataImage" = betterproto.message_field(2)
+    speaking_high_image: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShowArea(_HotMessage):
+    x: int = betterproto.uint64_field(1)
+    y: int = betterproto.uint64_field(2)
+    h: int = betterproto.uint64_field(3)
+    w: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnimatedBgInfo(_HotMessage):
+    show_area: "WebcastDataShowArea" = betterproto.message_field(1)
+    file_format: str = betterproto.string_field(2)
+    animated_bg: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudioBgData(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    image_uri: str = betterproto.string_field(2)
+    img_type: int = betterproto.int32_field(3)
+    image: "WebcastDataImage" = betterproto.message_field(4)
+    image_thumbnail: "WebcastDataImage" = betterproto.message_field(5)
+    image_animated_bg: "WebcastDataImage" = betterproto.message_field(6)
+    image_normal_avatar: "WebcastDataImage" = betterproto.message_field(7)
+    image_startup_avatar: "WebcastDataImage" = betterproto.message_field(8)
+    image_chat_join_icon: "WebcastDataImage" = betterproto.message_field(9)
+    image_static_bg: "WebcastDataImage" = betterproto.message_field(10)
+    speaking_image_list: "WebcastDataAudioSpeakingImageList" = betterproto.message_field(11)
+    status_color_value: str = betterproto.string_field(12)
+    public_screen_color_value: str = betterproto.string_field(13)
+    time_limit: int = betterproto.int32_field(14)
+    bg_type: int = betterproto.int32_field(15)
+    empty_start_color: str = betterproto.string_field(16)
+    empty_end_color: str = betterproto.string_field(17)
+    image_cold_bg: "WebcastDataImage" = betterproto.message_field(18)
+    mic_bg_color_value: str = betterproto.string_field(19)
+    icon_mic_normals: List["WebcastDataImage"] = betterproto.message_field(20)
+    icon_mic_lock: "WebcastDataImage" = betterproto.message_field(21)
+    color_mic_text: str = betterproto.string_field(22)
+    color_mic_line: str = betterproto.string_field(23)
+    color_mic_bg: str = betterproto.string_field(24)
+    theme_label: str = betterproto.string_field(25)
+    bg_status: int = betterproto.int32_field(26)
+    animate_info: "WebcastDataAnimatedBgInfo" = betterproto.message_field(27)
+    id_str: str = betterproto.string_field(28)
+    play_mode: int = betterproto.int32_field(29)
+    theme_tag: str = betterproto.string_field(30)
+    start_time: int = betterproto.uint64_field(31)
+    end_time: int = betterproto.uint64_field(32)
+    format_type: int = betterproto.int32_field(33)
+    speaking_image_v2: "WebcastDataAudioSpeakingImageList" = betterproto.message_field(34)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityRoomSkinInfo(_HotMessage):
+    vertical_screen: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        1, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    horizontal_screen: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        2, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomReplayInfo(_HotMessage):
+    replay_duration: int = betterproto.uint64_field(1)
+    replay_url: str = betterproto.string_field(2)
+    content_uniq_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentWallInfo(_HotMessage):
+    content: str = betterproto.string_field(1)
+    id: int = betterproto.uint64_field(2)
+    comment_msg_id: int = betterproto.uint64_field(3)
+    commenter_id: int = betterproto.uint64_field(4)
+    commenter_nickname: str = betterproto.string_field(5)
+    event_time: int = betterproto.uint64_field(6)
+    msg_time: int = betterproto.uint64_field(7)
+    end_time: int = betterproto.uint64_field(8)
+    countdown_style: int = betterproto.int32_field(9)
+    operator_id: int = betterproto.uint64_field(10)
+    operator_nickname: str = betterproto.string_field(11)
+    operator_openid: str = betterproto.string_field(5000)
+    commenter_open_id: str = betterproto.string_field(5001)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentWallPosition(_HotMessage):
+    x: float = betterproto.double_field(1)
+    y: float = betterproto.double_field(2)
+    event_time: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnnouncementInfo(_HotMessage):
+    scheduled_time_text: str = betterproto.string_field(1)
+    content: str = betterproto.string_field(2)
+    subscribed: bool = betterproto.bool_field(3)
+    appointment_id: int = betterproto.uint64_field(4)
+    scheduled_time: int = betterproto.int32_field(5)
+    scheduled_date: int = betterproto.int32_field(6)
+    scheduled_weekdays: List[int] = betterproto.int32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomImInfo(_HotMessage):
+    welcome_messages: List[str] = betterproto.string_field(1)
+    room_tag: str = betterproto.string_field(2)
+    hide_gift_message: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataInteractOpenExtra(_HotMessage):
+    debug_info: Dict[str, str] = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkerDetail(_HotMessage):
+    linker_play_modes: List[int] = betterproto.uint64_field(1)
+    big_party_layout_config_version: int = betterproto.int32_field(2)
+    accept_audience_pre_apply: bool = betterproto.bool_field(3)
+    linker_ui_layout: int = betterproto.uint64_field(4)
+    enable_audience_linkmic: int = betterproto.int32_field(5)
+    function_type: str = betterproto.string_field(6)
+    linker_map_str: Dict[str, str] = betterproto.map_field(
+        7, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    ktv_lyric_mode: str = betterproto.string_field(8)
+    init_source: str = betterproto.string_field(9)
+    forbid_apply_from_other: bool = betterproto.bool_field(10)
+    ktv_exhibit_mode: int = betterproto.int32_field(11)
+    enlarge_guest_turn_on_source: int = betterproto.uint64_field(12)
+    playmode_detail: Dict[str, str] = betterproto.map_field(
+        13, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    client_ui_info: str = betterproto.string_field(14)
+    manual_open_ui: int = betterproto.uint64_field(15)
+    feature_list: int = betterproto.uint64_field(16)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeData(_HotMessage):
+    style: int = betterproto.int32_field(1)
+    preview_guide: "WebcastDataPreviewExposeDataPreviewGuide" = betterproto.message_field(2)
+    metas: List["WebcastDataPreviewExposeDataMeta"] = betterproto.message_field(3)
+    chat_msgs: List["WebcastDataPreviewExposeDataChatMessage"] = betterproto.message_field(4)
+    force_insertion: List["WebcastDataPreviewExposeDataMeta"] = betterproto.message_field(5)
+    scroll_after_ms: int = betterproto.int32_field(6)
+    need_realtime: bool = betterproto.bool_field(7)
+    message_scroll_after_ms: int = betterproto.int32_field(8)
+    message_scroll_interval_ms: int = betterproto.int32_field(9)
+    preview_intro: str = betterproto.string_field(10)
+    preview_extend_area: "WebcastDataPreviewExposeDataPreviewExtendArea" = betterproto.message_field(11)
+    show_uv_pv: int = betterproto.int32_field(12)
+    show_name_abbreviation: int = betterproto.int32_field(13)
+    switch: "WebcastDataPreviewExposeDataPreviewSwitch" = betterproto.message_field(14)
+    is_preview_use_websocket: int = betterproto.int32_field(15)
+    is_aweme_video_feed: bool = betterproto.bool_field(16)
+    show_preview_cards: bool = betterproto.bool_field(17)
+    preview_promotion: "WebcastDataPreviewExposeDataPreviewPromotion" = betterproto.message_field(18)
+    preview_im_extend: "WebcastDataPreviewExposeDataPreviewImExtend" = betterproto.message_field(19)
+    et_data: "WebcastDataPreviewExposeDataEtData" = betterproto.message_field(20)
+    alive_checker: int = betterproto.int32_field(21)
+    enter_public_area_animation: "WebcastDataEnterPublicAreaAnimation" = betterproto.message_field(22)
+    preview_promotion_sync_data: "WebcastDataPreviewExposeDataPreviewPromotionSyncData" = betterproto.message_field(23)
+    growth_task: "WebcastDataPreviewExposeDataGrowthTask" = betterproto.message_field(24)
+    preview_exit_guide: "WebcastDataPreviewExposeDataPreviewExitGuide" = betterproto.message_field(25)
+    preview_exit_guide_list: List["WebcastDataPreviewExposeDataPreviewExitGuide"] = betterproto.message_field(26)
+    client_component: "WebcastDataClientComponent" = betterproto.message_field(27)
+    ios_client_component: "WebcastDataIosClientComponent" = betterproto.message_field(28)
+    chat_group_extend_data: List["WebcastDataChatGroupExtendData"] = betterproto.message_field(29)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewGuide(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    tip: str = betterproto.string_field(2)
+    type: int = betterproto.uint64_field(3)
+    roll_tips: List[str] = betterproto.string_field(4)
+    coupon_mate_id: int = betterproto.uint64_field(5)
+    user_tag_get_coin: int = betterproto.uint64_field(6)
+    live_mession_style: int = betterproto.uint64_field(7)
+    et_type: str = betterproto.string_field(8)
+    extra: str = betterproto.string_field(9)
+    et_extra: Dict[str, str] = betterproto.map_field(
+        10, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    enter_tip: str = betterproto.string_field(11)
+    enter_roll_tips: List[str] = betterproto.string_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataMeta(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    host: "WebcastDataPreviewExposeDataMetaHost" = betterproto.message_field(2)
+    content: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataMetaHost(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    tip: str = betterproto.string_field(2)
+    color: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataChatMessage(_HotMessage):
+    nick_name: str = betterproto.string_field(1)
+    nick_name_color: str = betterproto.string_field(2)
+    content: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExtendArea(_HotMessage):
+    extend_icon: "WebcastDataImage" = betterproto.message_field(1)
+    extend_pre_text: str = betterproto.string_field(2)
+    extend_text: str = betterproto.string_field(3)
+    extend_type: int = betterproto.int32_field(4)
+    extra: str = betterproto.string_field(5)
+    use_marquee: int = betterproto.int32_field(6)
+    icon_type: int = betterproto.int32_field(7)
+    right_part: List["WebcastDataPreviewExposeDataPreviewExtendAreaPart"] = betterproto.message_field(8)
+    button_part: str = betterproto.string_field(9)
+    mid_part: List["WebcastDataPreviewExposeDataPreviewExtendAreaPart"] = betterproto.message_field(10)
+    need_delimiter: bool = betterproto.bool_field(11)
+    bottom_part: List["WebcastDataPreviewExposeDataPreviewExtendAreaPart"] = betterproto.message_field(12)
+    ui_type: int = betterproto.int32_field(13)
+    version: int = betterproto.int32_field(14)
+    action_cfg: "WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig" = betterproto.message_field(17)
+    use_pass_through_extra_json: bool = betterproto.bool_field(18)
+    pass_through_extra_json: str = betterproto.string_field(19)
+    extra_enter_room: Dict[str, str] = betterproto.map_field(
+        20, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    extra_business: str = betterproto.string_field(21)
+    no_need_poll: bool = betterproto.bool_field(22)
+    et_extra: Dict[str, str] = betterproto.map_field(
+        23, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    clickable_area: int = betterproto.int32_field(24)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExtendAreaPart(_HotMessage):
+    font_size: int = betterproto.int32_field(1)
+    interval: int = betterproto.int32_field(2)
+    text: str = betterproto.string_field(3)
+    cuttable: bool = betterproto.bool_field(4)
+    deleted: bool = betterproto.bool_field(5)
+    font_color: str = betterproto.string_field(6)
+    bold: bool = betterproto.bool_field(7)
+    part_type: int = betterproto.int32_field(8)
+    image: "WebcastDataImage" = betterproto.message_field(9)
+    background_color: str = betterproto.string_field(10)
+    left_image: "WebcastDataImage" = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig(_HotMessage):
+    area_action: int = betterproto.int32_field(1)
+    action_prams: Dict[str, str] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewSwitch(_HotMessage):
+    title: int = betterproto.int32_field(1)
+    preview_guide: int = betterproto.int32_field(2)
+    dynamic_label: int = betterproto.int32_field(3)
+    assist_label: int = betterproto.int32_field(4)
+    extend_area: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotion(_HotMessage):
+    avatar_icons: List["WebcastDataImage"] = betterproto.message_field(1)
+    text: str = betterproto.string_field(2)
+    fast_comments: List[str] = betterproto.string_field(3)
+    fast_comments_emoji: List["WebcastDataEmojiDetail"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewImExtend(_HotMessage):
+    im_extend_type: int = betterproto.uint64_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    main_title: str = betterproto.string_field(3)
+    sub_title: str = betterproto.string_field(4)
+    extra: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataEtData(_HotMessage):
+    type_enter_room: str = betterproto.string_field(1)
+    type_mob_params: str = betterproto.string_field(2)
+    type_params: str = betterproto.string_field(3)
+    type_first_room_params: str = betterproto.string_field(4)
+    type_first_room_mob_params: str = betterproto.string_field(5)
+    type_first_show_room_params: str = betterproto.string_field(6)
+    type_first_show_mob_params: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataGrowthTask(_HotMessage):
+    task_key: str = betterproto.string_field(1)
+    main_text: str = betterproto.string_field(2)
+    sub_text: str = betterproto.string_field(3)
+    extra: Dict[str, str] = betterproto.map_field(
+        4, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotionSyncData(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    text: str = betterproto.string_field(2)
+    lucky_bag: "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag" = betterproto.message_field(3)
+    type: int = betterproto.uint64_field(4)
+    lucky_money: "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag(_HotMessage):
+    lottery_id: int = betterproto.uint64_field(1)
+    start_at: int = betterproto.uint64_field(2)
+    draw_at: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney(_HotMessage):
+    box_id: int = betterproto.uint64_field(1)
+    start_at: int = betterproto.uint64_field(2)
+    delay_seconds: int = betterproto.uint64_field(3)
+    display_end_at: int = betterproto.uint64_field(4)
+    status: int = betterproto.uint64_field(5)
+    text: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExitGuide(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    main_text: str = betterproto.string_field(2)
+    sub_text: str = betterproto.string_field(3)
+    schema_url: str = betterproto.string_field(4)
+    type: int = betterproto.int32_field(5)
+    button_text: str = betterproto.string_field(6)
+    latest_live_record: int = betterproto.uint64_field(7)
+    user_list: List["WebcastDataUser"] = betterproto.message_field(8)
+    tag: str = betterproto.string_field(9)
+    less_freq: int = betterproto.int32_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChatGroupExtendData(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    text: str = betterproto.string_field(2)
+    type: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveData(_HotMessage):
+    paid_type: int = betterproto.int32_field(1)
+    view_right: int = betterproto.int32_field(2)
+    duration: int = betterproto.uint64_field(3)
+    ticket_session: "WebcastDataTicketData" = betterproto.message_field(4)
+    order_data: "WebcastDataOrderData" = betterproto.message_field(5)
+    delivery: int = betterproto.int32_field(6)
+    need_delivery_notice: bool = betterproto.bool_field(7)
+    anchor_right: int = betterproto.int32_field(8)
+    pay_ab_type: int = betterproto.int32_field(9)
+    privilege_info: Dict[str, "WebcastDataPrivilegeInfo"] = betterproto.map_field(
+        10, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    privilege_info_map: Dict[str, "WebcastDataPrivilegeInfo"] = betterproto.map_field(
+        11, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    async_auth_data: "WebcastDataAsyncAuthData" = betterproto.message_field(12)
+    products_data: "WebcastDataProductsData" = betterproto.message_field(13)
+    max_preview_duration: int = betterproto.uint64_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAsyncAuthData(_HotMessage):
+    keep_alive_time: int = betterproto.uint64_field(1)
+    async_authentication_operate: int = betterproto.uint64_field(2)
+    async_authentication_ab_type: int = betterproto.uint64_field(3)
+    keep_alive_time_stamp: int = betterproto.uint64_field(4)
+    buffer: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLivePriceInfo(_HotMessage):
+    start_time: int = betterproto.int32_field(1)
+    end_time: int = betterproto.int32_field(2)
+    price: int = betterproto.uint64_field(3)
+    claim_ddl: int = betterproto.int32_field(4)
+    sku_id: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTicketData(_HotMessage):
+    ticket_session_id: int = betterproto.uint64_field(1)
+    title: str = betterproto.string_field(2)
+    sub_title: str = betterproto.string_field(3)
+    price: str = betterproto.string_field(4)
+    raw_release_time: int = betterproto.uint64_field(5)
+    tags: str = betterproto.string_field(6)
+    ticket_explanation_card_jump_url: str = betterproto.string_field(7)
+    ticket_panel_jump_url: str = betterproto.string_field(8)
+    ticket_session_id_str: str = betterproto.string_field(9)
+    sell_status: int = betterproto.int32_field(10)
+    cover_uri: str = betterproto.string_field(11)
+    cover_uri_vertical: str = betterproto.string_field(12)
+    introduction: str = betterproto.string_field(13)
+    raw_show_start_time: int = betterproto.uint64_field(14)
+    raw_show_end_time: int = betterproto.uint64_field(15)
+    raw_sale_start_time: int = betterproto.uint64_field(16)
+    raw_sale_end_time: int = betterproto.uint64_field(17)
+    raw_refund_deadline: int = betterproto.uint64_field(18)
+    raw_early_bird_start_time: int = betterproto.uint64_field(19)
+    raw_early_bird_end_time: int = betterproto.uint64_field(20)
+    raw_full_price_start_time: int = betterproto.uint64_field(21)
+    raw_full_price_end_time: int = betterproto.uint64_field(22)
+    raw_activity_start_time: int = betterproto.uint64_field(23)
+    raw_activity_end_time: int = betterproto.uint64_field(24)
+    early_bird_price: str = betterproto.string_field(25)
+    activity_price: str = betterproto.string_field(26)
+    status: int = betterproto.int32_field(27)
+    show_start_time: str = betterproto.string_field(28)
+    show_end_time: str = betterproto.string_field(29)
+    sale_start_time: str = betterproto.string_field(30)
+    sale_end_time: str = betterproto.string_field(31)
+    early_bird_start_time: str = betterproto.string_field(32)
+    early_bird_end_time: str = betterproto.string_field(33)
+    full_price_start_time: str = betterproto.string_field(34)
+    full_price_end_time: str = betterproto.string_field(35)
+    activity_start_time: str = betterproto.string_field(36)
+    activity_end_time: str = betterproto.string_field(37)
+    refund_deadline: str = betterproto.string_field(38)
+    activity_title: str = betterproto.string_field(39)
+    activity_jump_url: str = betterproto.string_field(40)
+    release_time: str = betterproto.string_field(41)
+    ticket_explanation_card_status: int = betterproto.int32_field(42)
+    last_duration: int = betterproto.int32_field(43)
+    paid_conversion_jump_url: str = betterproto.string_field(44)
+    ticket_panel_six_jump_url: str = betterproto.string_field(45)
+    ticket_panel_nine_jump_url: str = betterproto.string_field(46)
+    cover: "WebcastDataImage" = betterproto.message_field(47)
+    ios_pay_type: int = betterproto.int32_field(48)
+    android_pay_type: int = betterproto.int32_field(49)
+    ios_pay_price: int = betterproto.int32_field(50)
+    android_pay_price: int = betterproto.int32_field(51)
+    right_duration: int = betterproto.int32_field(52)
+    friend_price_info: "WebcastDataPaidLivePriceInfo" = betterproto.message_field(53)
+    helping_price_info: "WebcastDataPaidLivePriceInfo" = betterproto.message_field(54)
+    price_info: Dict[int, "WebcastDataTicketDataPaidLivePriceInfoV2"] = betterproto.map_field(
+        55, betterproto.TYPE_INT64, betterproto.TYPE_MESSAGE
+    )
+    ticket_anchor_id: int = betterproto.uint64_field(56)
+    extra: str = betterproto.string_field(57)
+    sku_details: List["WebcastDataTicketDataTicketSkuDetail"] = betterproto.message_field(58)
+    final_price_info: "WebcastDataTicketDataPaidLivePriceInfoV2" = betterproto.message_field(59)
+    parent_ticket_session_id: int = betterproto.uint64_field(60)
+    parent_ticket_session_id_str: str = betterproto.string_field(61)
+    ticket_category: int = betterproto.int32_field(62)
+    prepay_cashier_jump_url: str = betterproto.string_field(63)
+    subscribe_member_mark: "WebcastDataSubscribeMemberMark" = betterproto.message_field(64)
+    ticket_anchor_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTicketDataPaidLivePriceInfoV2(_HotMessage):
+    amount: str = betterproto.string_field(1)
+    currency: str = betterproto.string_field(2)
+    pos: int = betterproto.uint64_field(3)
+    pay_type: List[int] = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTicketDataTicketSkuDetail(_HotMessage):
+    ticket_type: int = betterproto.int32_field(1)
+    ticket_name: str = betterproto.string_field(2)
+    start_sell_time: int = betterproto.uint64_field(3)
+    closing_sell_time: int = betterproto.uint64_field(4)
+    sell_status: int = betterproto.int32_field(5)
+    price_info: "WebcastDataTicketDataPaidLivePriceInfoV2" = betterproto.message_field(6)
+    dou_price_info: "WebcastDataTicketDataPaidLivePriceInfoV2" = betterproto.message_field(7)
+    sku_id: int = betterproto.uint64_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOrderData(_HotMessage):
+    order_id: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearance(_HotMessage):
+    head_bubble: "WebcastDataAppearanceBubble" = betterproto.message_field(1)
+    up_right_stats_display_type: int = betterproto.uint64_field(2)
+    entrance: "WebcastDataMoreEntrance" = betterproto.message_field(3)
+    toolbar_list: List["WebcastDataToolbarItemConfig"] = betterproto.message_field(4)
+    preview_style: int = betterproto.uint64_field(5)
+    cover_gauss: "WebcastDataImage" = betterproto.message_field(6)
+    content_tags: List["WebcastDataAppearanceContentTag"] = betterproto.message_field(7)
+    preview_label: "WebcastDataPreviewLabel" = betterproto.message_field(8)
+    cover_dynamic_mask: "WebcastDataImage" = betterproto.message_field(9)
+    horizontal_background: "WebcastDataImage" = betterproto.message_field(10)
+    wide_cover_list: List["WebcastDataAppearanceWideCover"] = betterproto.message_field(11)
+    blur_placeholder_img: "WebcastDataImage" = betterproto.message_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearanceBubble(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    roll_tips: List[str] = betterproto.string_field(2)
+    icon: "WebcastDataImage" = betterproto.message_field(3)
+    roll_after_ms: int = betterproto.int32_field(4)
+    coupon_mate_id: int = betterproto.uint64_field(5)
+    et_type: str = betterproto.string_field(6)
+    extra: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearanceContentTag(_HotMessage):
+    text: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearanceWideCover(_HotMessage):
+    cover: "WebcastDataImage" = betterproto.message_field(1)
+    cover_type: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameCpData(_HotMessage):
+    is_live_a_promoted_a: int = betterproto.int32_field(1)
+    game_id: str = betterproto.string_field(2)
+    game_name: str = betterproto.string_field(3)
+    promote_instance_id: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGamePlayData(_HotMessage):
+    play_type: int = betterproto.int32_field(1)
+    play_id: int = betterproto.uint64_field(2)
+    game_id: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomGameDataChannelConfig(_HotMessage):
+    fusion_tag_id: str = betterproto.string_field(1)
+    game_id: str = betterproto.string_field(2)
+    live_stay_limit: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolBarComponentData(_HotMessage):
+    group_id: int = betterproto.int32_field(1)
+    component_type: int = betterproto.int32_field(2)
+    op_type: int = betterproto.int32_field(3)
+    text: str = betterproto.string_field(4)
+    schema_url: str = betterproto.string_field(5)
+    icon: "WebcastDataImage" = betterproto.message_field(6)
+    show_type: int = betterproto.uint64_field(7)
+    data_status: int = betterproto.uint64_field(8)
+    extra: str = betterproto.string_field(99)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolBarData(_HotMessage):
+    entrance_list: List["WebcastDataToolBarComponentData"] = betterproto.message_field(1)
+    more_panel: List["WebcastDataToolBarComponentData"] = betterproto.message_field(2)
+    max_entrance_cnt: int = betterproto.int32_field(3)
+    landscape_up_right: List["WebcastDataToolBarComponentData"] = betterproto.message_field(4)
+    skin_resource: Dict[int, "WebcastDataComponentSkin"] = betterproto.map_field(
+        5, betterproto.TYPE_INT32, betterproto.TYPE_MESSAGE
+    )
+    max_entrance_cnt_landscape: int = betterproto.int32_field(6)
+    permutation: "WebcastDataToolbarPermutation" = betterproto.message_field(7)
+    extra_info: "WebcastDataToolbarExtraInfo" = betterproto.message_field(100)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLifeGrouponInfo(_HotMessage):
+    permission_status: int = betterproto.uint64_field(1)
+    agg_card_id: int = betterproto.uint64_field(2)
+    icon_url: str = betterproto.string_field(3)
+    dynamic_url: str = betterproto.string_field(4)
+    life_live_pack_component_config: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewLabel(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    label_tips: List[str] = betterproto.string_field(2)
+    label_type: int = betterproto.int32_field(3)
+    label_image: "WebcastDataImage" = betterproto.message_field(4)
+    hit_test: bool = betterproto.bool_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataHotRoomInfo(_HotMessage):
+    bit_map: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityLiveRecommendConfig(_HotMessage):
+    name: str = betterproto.string_field(1)
+    level: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint64_field(3)
+    end_time: int = betterproto.uint64_field(4)
+    live_type: int = betterproto.int32_field(5)
+    actor_uids: List[int] = betterproto.uint64_field(6)
+    episode_info: "WebcastDataActivityLiveRecommendConfigEpisodeInfo" = betterproto.message_field(7)
+    actor_openids: List[str] = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityLiveRecommendConfigEpisodeInfo(_HotMessage):
+    content_type: int = betterproto.int32_field(1)
+    content: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomChannelData(_HotMessage):
+    status: int = betterproto.int32_field(1)
+    channel_list: List["WebcastDataRoomChannelInfo"] = betterproto.message_field(2)
+    support_room_channel_mode: int = betterproto.int32_field(3)
+    limit_of_num: int = betterproto.int32_field(4)
+    can_create: bool = betterproto.bool_field(5)
+    background: "WebcastDataImage" = betterproto.message_field(6)
+    tab_landing: bool = betterproto.bool_field(7)
+    can_link_mic: bool = betterproto.bool_field(8)
+    user_in_fans_group_map: Dict[int, bool] = betterproto.map_field(
+        9, betterproto.TYPE_INT64, betterproto.TYPE_BOOL
+    )
+    hide_landscape: bool = betterproto.bool_field(101)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPackMetaInfo(_HotMessage):
+    scene: str = betterproto.string_field(1)
+    env: str = betterproto.string_field(2)
+    dc: str = betterproto.string_field(3)
+    trace_id: str = betterproto.string_field(4)
+    cluster: str = betterproto.string_field(5)
+    extras: Dict[str, str] = betterproto.map_field(
+        6, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLikeDisplayConfig(_HotMessage):
+    show_text: int = betterproto.int32_field(1)
+    display_text: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchRoomData(_HotMessage):
+    drawer: "WebcastDataMatchDrawer" = betterproto.message_field(1)
+    match: "WebcastDataToutiaoMatchData" = betterproto.message_field(2)
+    drawer_label: "WebcastDataImage" = betterproto.message_field(3)
+    pcu_str: str = betterproto.string_field(4)
+    drawer_official_label: "WebcastDataImage" = betterproto.message_field(5)
+    match_background: "WebcastDataImage" = betterproto.message_field(6)
+    match_user_info: "WebcastDataMatchUserInfo" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchUserInfo(_HotMessage):
+    user_team_info: "WebcastDataTeamInfo" = betterproto.message_field(1)
+    user_quiz_info: Dict[int, int] = betterproto.map_field(
+        2, betterproto.TYPE_INT64, betterproto.TYPE_INT64
+    )
+    is_activity_account: bool = betterproto.bool_field(3)
+    need_retry: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTeamInfo(_HotMessage):
+    team_id: int = betterproto.uint64_field(1)
+    team_name: str = betterproto.string_field(2)
+    schema_url: str = betterproto.string_field(3)
+    team_icon: "WebcastDataImage" = betterproto.message_field(4)
+    team_badge: "WebcastDataImage" = betterproto.message_field(5)
+    team_background: "WebcastDataImage" = betterproto.message_field(6)
+    system_msg: str = betterproto.string_field(7)
+    team_id_str: str = betterproto.string_field(8)
+    team_avatar_box: "WebcastDataImage" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEnterPublicAreaAnimation(_HotMessage):
+    public_area_effect_url: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftPanelTopperTray(_HotMessage):
+    panel_schema: str = betterproto.string_field(1)
+    period_texts: List["WebcastDataGiftPanelTopperTrayPeriodText"] = betterproto.message_field(2)
+    display_duration: int = betterproto.int32_field(3)
+    jump_schema: str = betterproto.string_field(4)
+    animation_type: str = betterproto.string_field(5)
+    animation_gap: int = betterproto.int32_field(6)
+    animation_freq: int = betterproto.int32_field(7)
+    text_round_period: int = betterproto.int32_field(8)
+    extra: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftPanelTopperTrayPeriodText(_HotMessage):
+    text: str = betterproto.string_field(1)
+    daily_show_times: int = betterproto.int32_field(2)
+    priority: int = betterproto.int32_field(3)
+    panel_enum: int = betterproto.int32_field(4)
+    key: int = betterproto.int32_field(5)
+    extra: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameTagInfo(_HotMessage):
+    is_game: int = betterproto.int32_field(1)
+    game_tag_id: int = betterproto.uint64_field(2)
+    game_tag_name: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEnterGiftAnimation(_HotMessage):
+    gift_effect_id: int = betterproto.int32_field(1)
+    display_gap: int = betterproto.int32_field(2)
+    display_freq: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEmojiDetail(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    content: "WebcastDataImage" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCircleInfo(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    name: str = betterproto.string_field(2)
+    cover_img: "WebcastDataImage" = betterproto.message_field(3)
+    description: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEasterEggData(_HotMessage):
+    has_easter_egg: bool = betterproto.bool_field(1)
+    stage: int = betterproto.uint64_field(2)
+    total_stage: int = betterproto.uint64_field(3)
+    effects_num: int = betterproto.uint64_field(4)
+    start_count: int = betterproto.uint64_field(5)
+    end_count: int = betterproto.uint64_field(6)
+    count: int = betterproto.uint64_field(7)
+    panel_url: str = betterproto.string_field(8)
+    entrance_icon: "WebcastDataImage" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomLiveCard(_HotMessage):
+    product: "WebcastDataEcomProduct" = betterproto.message_field(1)
+    icon: "WebcastDataEcomIcon" = betterproto.message_field(2)
+    campaign: "WebcastDataEcomCampaign" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomProduct(_HotMessage):
+    promotion_id: int = betterproto.uint64_field(1)
+    product_id: int = betterproto.uint64_field(2)
+    title: str = betterproto.string_field(3)
+    cover_image: str = betterproto.string_field(4)
+    price: "WebcastDataEcomPrice" = betterproto.message_field(5)
+    regular_price: int = betterproto.uint64_field(6)
+    deposit_price: int = betterproto.uint64_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomPrice(_HotMessage):
+    prefix: str = betterproto.string_field(1)
+    suffix: str = betterproto.string_field(2)
+    by_cent: int = betterproto.uint64_field(3)
+    format_price: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomIcon(_HotMessage):
+    url: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomCampaign(_HotMessage):
+    remaining_seconds: int = betterproto.uint64_field(1)
+    auction: "WebcastDataEcomAuction" = betterproto.message_field(2)
+    type: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomAuction(_HotMessage):
+    price: int = betterproto.uint64_field(1)
+    price_label: str = betterproto.string_field(2)
+    button_label: str = betterproto.string_field(3)
+    user: "WebcastDataEcomBidder" = betterproto.message_field(4)
+    status: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomBidder(_HotMessage):
+    name: str = betterproto.string_field(1)
+    avatar: "WebcastDataEcomAvatar" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomAvatar(_HotMessage):
+    url: str = betterproto.string_field(1)
+    width: int = betterproto.uint64_field(2)
+    height: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomPop(_HotMessage):
+    product_id: int = betterproto.uint64_field(1)
+    promotion_id: int = betterproto.uint64_field(2)
+    title: str = betterproto.string_field(3)
+    cover: str = betterproto.string_field(4)
+    min_price: "WebcastDataEcomPrice" = betterproto.message_field(5)
+    selling_point: str = betterproto.string_field(6)
+    jumanji_json: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCoupon(_HotMessage):
+    icon: str = betterproto.string_field(1)
+    start_time: str = betterproto.string_field(2)
+    expire_time: str = betterproto.string_field(3)
+    coupon_name: str = betterproto.string_field(4)
+    url: str = betterproto.string_field(5)
+    coupon_string: str = betterproto.string_field(6)
+    countdown: int = betterproto.uint64_field(7)
+    show_type: int = betterproto.uint64_field(8)
+    coupon_meta_id: str = betterproto.string_field(9)
+    coupon_type: str = betterproto.string_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRedpack(_HotMessage):
+    redpack_type: int = betterproto.uint64_field(1)
+    redpack_activity_id: int = betterproto.uint64_field(2)
+    redpack_activity_display_text: str = betterproto.string_field(3)
+    start_apply_time: int = betterproto.uint64_field(4)
+    end_apply_time: int = betterproto.uint64_field(5)
+    preheat_time: int = betterproto.uint64_field(6)
+    server_time: int = betterproto.uint64_field(7)
+    has_applied: int = betterproto.uint64_field(8)
+    icon_url: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomGoodsCard(_HotMessage):
+    product_id: int = betterproto.uint64_field(1)
+    title: str = betterproto.string_field(2)
+    cover: str = betterproto.string_field(3)
+    min_price: "WebcastDataEcomPrice" = betterproto.message_field(4)
+    coupon: "WebcastDataCoupon" = betterproto.message_field(5)
+    promotion_id: int = betterproto.uint64_field(6)
+    jump_destination: int = betterproto.uint64_field(7)
+    card_type: int = betterproto.uint64_field(8)
+    redpack: "WebcastDataRedpack" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRedsShowInfo(_HotMessage):
+    data_type: int = betterproto.int32_field(1)
+    full_text: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOfficialRoomInfo(_HotMessage):
+    is_show_more_anchor: bool = betterproto.bool_field(1)
+    is_use_server_subtitle: bool = betterproto.bool_field(2)
+    server_subtitle: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsEpisodeHighLight(_HotMessage):
+    location: int = betterproto.uint64_field(1)
+    description: str = betterproto.string_field(2)
+    image: "WebcastDataImage" = betterproto.message_field(3)
+    pid: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodePremierePlay(_HotMessage):
+    highlights: List["WebcastDataVsEpisodeHighLight"] = betterproto.message_field(1)
+    play_type: int = betterproto.int32_field(2)
+    start_time: int = betterproto.uint64_field(3)
+    play_text: str = betterproto.string_field(4)
+    text_duration: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsWatermark(_HotMessage):
+    position: int = betterproto.uint64_field(1)
+    landscape_dis: int = betterproto.uint64_field(2)
+    vertical_dis: int = betterproto.uint64_field(3)
+    watermark_icon: List["WebcastDataVsWatermarkIcon"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsWatermarkIcon(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    icon_width: int = betterproto.uint64_field(2)
+    icon_type: int = betterproto.uint64_field(3)
+    landscape_dis: int = betterproto.uint64_field(4)
+    vertical_dis: int = betterproto.uint64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsBar(_HotMessage):
+    item_comment: "WebcastDataVsItemBar" = betterproto.message_field(1)
+    item_bar: "WebcastDataVsItemBar" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsItemComment(_HotMessage):
+    item_comment_icon_dark: "WebcastDataImage" = betterproto.message_field(1)
+    item_comment_icon_light: "WebcastDataImage" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsItemBar(_HotMessage):
+    icon_dark: "WebcastDataImage" = betterproto.message_field(1)
+    icon_light: "WebcastDataImage" = betterproto.message_field(2)
+    title: str = betterproto.string_field(3)
+    seperator: str = betterproto.string_field(4)
+    detail: str = betterproto.string_field(5)
+    watch_info_pv: int = betterproto.uint64_field(6)
+    watch_info_heat: str = betterproto.string_field(7)
+    collection_id: int = betterproto.uint64_field(8)
+    tab_id: int = betterproto.int32_field(9)
+    content_type: str = betterproto.string_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodePreviewImage(_HotMessage):
+    preview_uri_up: "WebcastDataImage" = betterproto.message_field(1)
+    preview_uri_down: "WebcastDataImage" = betterproto.message_field(2)
+    preview_type: int = betterproto.int32_field(3)
+    preview_word_up: str = betterproto.string_field(4)
+    preview_word_down: str = betterproto.string_field(5)
+    preview_background_uri: "WebcastDataImage" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsGiftPannel(_HotMessage):
+    background_colors: List[str] = betterproto.string_field(1)
+    background: "WebcastDataImage" = betterproto.message_field(2)
+    selected: "WebcastDataImage" = betterproto.message_field(3)
+    top_title: "WebcastDataImage" = betterproto.message_field(4)
+    background_bottom: "WebcastDataImage" = betterproto.message_field(5)
+    background_top: "WebcastDataImage" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodePreviewBottom(_HotMessage):
+    watch_period_str: str = betterproto.string_field(1)
+    latest_period_str: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsPannelIcon(_HotMessage):
+    sp_landscape_icon: "WebcastDataImage" = betterproto.message_field(1)
+    sp_vertical_icon: "WebcastDataImage" = betterproto.message_field(2)
+    landscape_vertical_switch_icon: "WebcastDataImage" = betterproto.message_field(3)
+    lock_screen_icon: "WebcastDataImage" = betterproto.message_field(4)
+    landscape_more_icon: "WebcastDataImage" = betterproto.message_field(9)
+    vertical_more_icon: "WebcastDataImage" = betterproto.message_field(10)
+    landscape_comment_icon: "WebcastDataImage" = betterproto.message_field(11)
+    vertical_comment_icon: "WebcastDataImage" = betterproto.message_field(12)
+    vertical_landscape_switch_icon: "WebcastDataImage" = betterproto.message_field(13)
+    vertical_lock_screen_icon: "WebcastDataImage" = betterproto.message_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiCameraBasicInfo(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    icon_background_color: str = betterproto.string_field(2)
+    panel_background_color: str = betterproto.string_field(3)
+    icon_pad: "WebcastDataImage" = betterproto.message_field(4)
+    ban_xgs: bool = betterproto.bool_field(5)
+    support_vs_core: bool = betterproto.bool_field(6)
+    name: str = betterproto.string_field(7)
+    default_display_duration: int = betterproto.int32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSharePosterInfo(_HotMessage):
+    data: "WebcastDataSharePosterInfoPosterData" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSharePosterInfoPosterData(_HotMessage):
+    poster: List["WebcastDataImage"] = betterproto.message_field(1)
+    decorator: List["WebcastDataImage"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBusinessConfigure(_HotMessage):
+    business_id: int = betterproto.uint64_field(1)
+    bus_type: int = betterproto.uint64_field(2)
+    delay_second: int = betterproto.int32_field(3)
+    precise_time: int = betterproto.uint64_field(4)
+    display_second: int = betterproto.int32_field(5)
+    res_config: "WebcastDataResourceConfigure" = betterproto.message_field(6)
+    del_type: int = betterproto.uint64_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataResourceConfigure(_HotMessage):
+    resource_id: int = betterproto.uint64_field(1)
+    barrage_conf: "WebcastDataBarrageConfigure" = betterproto.message_field(2)
+    screen_bar_conf: "WebcastDataScreenBarConfigure" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBarrageConfigure(_HotMessage):
+    logo: "WebcastDataImage" = betterproto.message_field(1)
+    text: str = betterproto.string_field(2)
+    atoms_bg_color: str = betterproto.string_field(3)
+    atoms_frame: str = betterproto.string_field(4)
+    atoms_text: str = betterproto.string_field(5)
+    image: "WebcastDataImage" = betterproto.message_field(6)
+    schema: str = betterproto.string_field(7)
+    jump_icon: "WebcastDataImage" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataScreenBarConfigure(_HotMessage):
+    image: "WebcastDataImage" = betterproto.message_field(1)
+    is_dynamic_img: int = betterproto.int32_field(2)
+    schema: str = betterproto.string_field(3)
+    jump_prompt: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiTab(_HotMessage):
+    tab_title_color: str = betterproto.string_field(1)
+    tabs: List["WebcastDataMultiTabTabItem"] = betterproto.message_field(2)
+    switch_on: int = betterproto.int32_field(3)
+    disable_background: int = betterproto.int32_field(4)
+    disable_project: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiTabBubble(_HotMessage):
+    switch: int = betterproto.int32_field(1)
+    bubble_id: int = betterproto.uint64_field(2)
+    duration: int = betterproto.uint64_field(3)
+    delay: int = betterproto.uint64_field(4)
+    bubble_text: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiTabTabItem(_HotMessage):
+    tab_type: int = betterproto.uint64_field(1)
+    tab_name: str = betterproto.string_field(2)
+    jump_link: str = betterproto.string_field(3)
+    tab_id: int = betterproto.uint64_field(4)
+    tab_show_type: int = betterproto.int32_field(5)
+    hide_camera_ids: int = betterproto.uint64_field(6)
+    bubble: "WebcastDataMultiTabBubble" = betterproto.message_field(7)
+    disable_preload: int = betterproto.int32_field(8)
+    color: str = betterproto.string_field(9)
+    expire_time: int = betterproto.uint64_field(10)
+    scene: List[int] = betterproto.int32_field(11)
+    h5_color: str = betterproto.string_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarBizSkin(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataComponentSkin(_HotMessage):
+    vertical: Dict[str, "WebcastDataToolbarBizSkin"] = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    landscape: Dict[str, "WebcastDataToolbarBizSkin"] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    general: Dict[str, "WebcastDataToolbarBizSkin"] = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBlockComponent(_HotMessage):
+    component_type: int = betterproto.int32_field(1)
+    reason: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarPermutation(_HotMessage):
+    vertical: "WebcastDataToolbarPermutationRule" = betterproto.message_field(1)
+    landscape: "WebcastDataToolbarPermutationRule" = betterproto.message_field(2)
+    general: "WebcastDataToolbarPermutationRule" = betterproto.message_field(3)
+    on_demand_component_list: List[int] = betterproto.int32_field(4)
+    block_component_list: List["WebcastDataBlockComponent"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarPermutationRule(_HotMessage):
+    group_priority: List[int] = betterproto.int32_field(1)
+    component_sequence: List[int] = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomChannelInfo(_HotMessage):
+    channel_id: int = betterproto.uint64_field(1)
+    token: str = betterproto.string_field(2)
+    is_owner: bool = betterproto.bool_field(3)
+    member_count: int = betterproto.uint64_field(4)
+    top_user: List["WebcastDataUser"] = betterproto.message_field(5)
+    channel_name: str = betterproto.string_field(6)
+    room_channel_mode: int = betterproto.int32_field(7)
+    need_approval_user: "WebcastDataUser" = betterproto.message_field(8)
+    owner: "WebcastDataUser" = betterproto.message_field(9)
+    max_member_count: int = betterproto.uint64_field(10)
+    create_type: int = betterproto.uint64_field(11)
+    secret_chat_info: "WebcastDataSecretChatInfo" = betterproto.message_field(12)
+    channel_id_str: str = betterproto.string_field(13)
+    enable_announcement: bool = betterproto.bool_field(14)
+    channel_announcement: str = betterproto.string_field(15)
+    fans_create_info: "WebcastDataFansChannelCreateInfo" = betterproto.message_field(16)
+    disable_member_invite: bool = betterproto.bool_field(17)
+    invite_disable_toast: str = betterproto.string_field(18)
+    create_app_id: int = betterproto.uint64_field(19)
+    rtc_ext_info: "WebcastDataRtcExtInfo" = betterproto.message_field(200)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRtcExtInfo(_HotMessage):
+    link_mic_id_str: str = betterproto.string_field(1)
+    rtc_ext_info: str = betterproto.string_field(2)
+    live_core_exr_info: str = betterproto.string_field(3)
+    rtc_strategy: str = betterproto.string_field(4)
+    public_stream_id: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSecretChatInfo(_HotMessage):
+    owner_uid: int = betterproto.uint64_field(1)
+    guest_uid: int = betterproto.uint64_field(2)
+    status: int = betterproto.uint64_field(3)
+    user_avatar_thumb_map: Dict[int, "WebcastDataImage"] = betterproto.map_field(
+        4, betterproto.TYPE_INT64, betterproto.TYPE_MESSAGE
+    )
+    owner_user_openid: str = betterproto.string_field(5000)
+    guest_user_openid: str = betterproto.string_field(5001)
+    open_user_avatar_thumb_map: Dict[str, "WebcastDataImage"] = betterproto.map_field(
+        5002, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFansChannelCreateInfo(_HotMessage):
+    fans_channel_type: int = betterproto.uint64_field(1)
+    group_id: int = betterproto.uint64_field(2)
+    group_id_str: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPlayByPlayItemInfo(_HotMessage):
+    timestamp: int = betterproto.uint64_field(1)
+    player_id: int = betterproto.uint64_field(2)
+    ref_player_id: int = betterproto.uint64_field(3)
+    incident_type: int = betterproto.int32_field(4)
+    elapsed: float = betterproto.double_field(5)
+    elapsed_plus: float = betterproto.double_field(6)
+    player_name: str = betterproto.string_field(7)
+    ref_player_name: str = betterproto.string_field(8)
+    player_id_str: str = betterproto.string_field(9)
+    ref_player_id_str: str = betterproto.string_field(10)
+    start_time_pts: int = betterproto.uint64_field(11)
+    end_time_pts: int = betterproto.uint64_field(12)
+    start_time_sei: int = betterproto.uint64_field(13)
+    end_time_sei: int = betterproto.uint64_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPlayerInfo(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    name: str = betterproto.string_field(2)
+    shirt: int = betterproto.int32_field(3)
+    position: str = betterproto.string_field(4)
+    lineup_type: int = betterproto.int32_field(5)
+    portrait: "WebcastDataImage" = betterproto.message_field(6)
+    last_event: "WebcastDataPlayByPlayItemInfo" = betterproto.message_field(7)
+    x_axis: float = betterproto.double_field(8)
+    y_axis: float = betterproto.double_field(9)
+    position_num: int = betterproto.int32_field(10)
+    playing_time: float = betterproto.double_field(11)
+    player_stats: "WebcastDataPlayerStats" = betterproto.message_field(12)
+    player_id_str: str = betterproto.string_field(13)
+    last_up_event: "WebcastDataPlayByPlayItemInfo" = betterproto.message_field(14)
+    event_list: List["WebcastDataPlayByPlayItemInfo"] = betterproto.message_field(15)
+    age: int = betterproto.int32_field(16)
+    worth: float = betterproto.double_field(17)
+    club_name: str = betterproto.string_field(18)
+    superstar_flag: bool = betterproto.bool_field(19)
+    superstar_img: "WebcastDataImage" = betterproto.message_field(20)
+    superstar_name: str = betterproto.string_field(21)
+    superstar_desc: str = betterproto.string_field(22)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGoalStageDetail(_HotMessage):
+    first_half_goal: str = betterproto.string_field(1)
+    second_half_goal: str = betterproto.string_field(2)
+    overtime: str = betterproto.string_field(3)
+    shots: str = betterproto.string_field(4)
+    total: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAgainst(_HotMessage):
+    left_name: str = betterproto.string_field(1)
+    left_logo: "WebcastDataImage" = betterproto.message_field(2)
+    left_goal: str = betterproto.string_field(3)
+    left_players: List["WebcastDataPlayerInfo"] = betterproto.message_field(4)
+    left_goal_stage_detail: "WebcastDataGoalStageDetail" = betterproto.message_field(5)
+    right_name: str = betterproto.string_field(6)
+    right_logo: "WebcastDataImage" = betterproto.message_field(7)
+    right_goal: str = betterproto.string_field(8)
+    right_players: List["WebcastDataPlayerInfo"] = betterproto.message_field(9)
+    right_goal_stage_detail: "WebcastDataGoalStageDetail" = betterproto.message_field(10)
+    timestamp: int = betterproto.uint64_field(11)
+    version: int = betterproto.uint64_field(12)
+    left_team_id: int = betterproto.uint64_field(13)
+    right_team_id: int = betterproto.uint64_field(14)
+    diff_sei2_abs_second: int = betterproto.uint64_field(15)
+    final_goal_stage: int = betterproto.int32_field(16)
+    current_goal_stage: int = betterproto.int32_field(17)
+    left_score_addition: int = betterproto.int32_field(18)
+    right_score_addition: int = betterproto.int32_field(19)
+    left_goal_int: int = betterproto.uint64_field(20)
+    right_goal_int: int = betterproto.uint64_field(21)
+    left_score_detail: "WebcastDataBasketBallGoalStageDetail" = betterproto.message_field(22)
+    right_score_detail: "WebcastDataBasketBallGoalStageDetail" = betterproto.message_field(23)
+    basketball_stage: "WebcastDataBasketballStage" = betterproto.message_field(24)
+    esport_stage: "WebcastDataESportsStage" = betterproto.message_field(25)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToutiaoMatchData(_HotMessage):
+    match_id: int = betterproto.uint64_field(1)
+    match_title: str = betterproto.string_field(2)
+    against: "WebcastDataAgainst" = betterproto.message_field(3)
+    started_time: str = betterproto.string_field(4)
+    city: str = betterproto.string_field(5)
+    venue_name: str = betterproto.string_field(6)
+    referee: str = betterproto.string_field(7)
+    team_stats: "WebcastDataTeamStats" = betterproto.message_field(8)
+    player_stats: List["WebcastDataPlayerStats"] = betterproto.message_field(9)
+    match_group: str = betterproto.string_field(10)
+    match_round: str = betterproto.string_field(11)
+    match_phase_name: str = betterproto.string_field(12)
+    can_subscribe: bool = betterproto.bool_field(13)
+    display_status: int = betterproto.int32_field(14)
+    bjt_format: str = betterproto.string_field(15)
+    local_time_format: str = betterproto.string_field(16)
+    live_status: int = betterproto.int32_field(17)
+    match_status: int = betterproto.int32_field(18)
+    match_id_str: str = betterproto.string_field(19)
+    started_time_unix: int = betterproto.uint64_field(20)
+    left_score_addition: int = betterproto.int32_field(21)
+    right_score_addition: int = betterproto.int32_field(22)
+    duration: str = betterproto.string_field(23)
+    event_ids: List[int] = betterproto.uint64_field(24)
+    winner_id: int = betterproto.uint64_field(25)
+    winner_id_str: str = betterproto.string_field(26)
+    winner_icon: "WebcastDataImage" = betterproto.message_field(27)
+    event_name: str = betterproto.string_field(28)
+    bo_num: str = betterproto.string_field(29)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTeamStats(_HotMessage):
+    team_id: int = betterproto.uint64_field(1)
+    possession: float = betterproto.double_field(2)
+    shot_on: float = betterproto.double_field(3)
+    shot_off: float = betterproto.double_field(4)
+    free_kick: float = betterproto.double_field(5)
+    corner: float = betterproto.double_field(6)
+    counter: float = betterproto.double_field(7)
+    saves: float = betterproto.double_field(8)
+    offside: float = betterproto.double_field(9)
+    foul_commit: float = betterproto.double_field(10)
+    yellow_cards: float = betterproto.double_field(11)
+    red_cards: float = betterproto.double_field(12)
+    pass_: float = betterproto.double_field(13)
+    key_pass: float = betterproto.double_field(14)
+    passes_completed: float = betterproto.double_field(15)
+    steal: float = betterproto.double_field(16)
+    intercept: float = betterproto.double_field(17)
+    shots: float = betterproto.double_field(18)
+    possession_five_min: float = betterproto.double_field(19)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPlayerStats(_HotMessage):
+    player_id: int = betterproto.uint64_field(1)
+    team_id: int = betterproto.uint64_field(2)
+    minutes_played: float = betterproto.double_field(3)
+    goals: float = betterproto.double_field(4)
+    assists: float = betterproto.double_field(5)
+    shots: float = betterproto.double_field(6)
+    shots_on: float = betterproto.double_field(7)
+    y_cards: float = betterproto.double_field(8)
+    r_cards: float = betterproto.double_field(9)
+    offsides: float = betterproto.double_field(10)
+    fouls_committed: float = betterproto.double_field(11)
+    own_goals: float = betterproto.double_field(12)
+    saves: float = betterproto.double_field(13)
+    caught_ball: float = betterproto.double_field(14)
+    clean_sheets: float = betterproto.double_field(15)
+    pass_: float = betterproto.double_field(16)
+    key_pass: float = betterproto.double_field(17)
+    passes_completed: float = betterproto.double_field(18)
+    steal: float = betterproto.double_field(19)
+    intercept: float = betterproto.double_field(20)
+    clearances: float = betterproto.double_field(21)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchShareBackground(_HotMessage):
+    vertical_img: "WebcastDataImage" = betterproto.message_field(1)
+    horizontal_img: "WebcastDataImage" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTitle(_HotMessage):
+    room_title: str = betterproto.string_field(1)
+    title_icon: "WebcastDataMatchTitleTitleIcon" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTitleTitleIcon(_HotMessage):
+    url: str = betterproto.string_field(1)
+    size_type: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTab(_HotMessage):
+    title: str = betterproto.string_field(1)
+    schema: str = betterproto.string_field(2)
+    id: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchDrawer(_HotMessage):
+    entry_name: str = betterproto.string_field(1)
+    entry_icon: "WebcastDataImage" = betterproto.message_field(2)
+    drawer_title: str = betterproto.string_field(3)
+    drawer_background: "WebcastDataImage" = betterproto.message_field(4)
+    return_btn_text: str = betterproto.string_field(5)
+    display_mode: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBasketBallGoalStageDetail(_HotMessage):
+    first_period: int = betterproto.int32_field(1)
+    second_period: int = betterproto.int32_field(2)
+    third_period: int = betterproto.int32_field(3)
+    forth_period: int = betterproto.int32_field(4)
+    overtime: int = betterproto.int32_field(5)
+    total: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBasketballStage(_HotMessage):
+    current_stage: int = betterproto.int32_field(1)
+    final_stage: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataESportsStage(_HotMessage):
+    current_stage: int = betterproto.int32_field(1)
+    final_stage: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveItemInfo(_HotMessage):
+    item_id: int = betterproto.uint64_field(1)
+    item_type: int = betterproto.int32_field(2)
+    item_id_str: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeInfo(_HotMessage):
+    entity_id: int = betterproto.uint64_field(1)
+    item_list: List["WebcastDataPaidLiveItemInfo"] = betterproto.message_field(2)
+    paid_live_type: int = betterproto.int32_field(3)
+    paid_live_info: "WebcastDataPrivilegeBaseInfo" = betterproto.message_field(4)
+    extra: str = betterproto.string_field(5)
+    privilege_url: "WebcastDataPrivilegeUrl" = betterproto.message_field(6)
+    ui_config: "WebcastDataPaidLiveUiBaseConfig" = betterproto.message_field(7)
+    entity_config: "WebcastDataPaidLiveConfig" = betterproto.message_field(8)
+    entity_id_str: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeBaseInfo(_HotMessage):
+    paid_live_type: int = betterproto.int32_field(1)
+    view_right: int = betterproto.int32_field(2)
+    delivery: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeUrl(_HotMessage):
+    privilege_panel_schema: str = betterproto.string_field(1)
+    privilege_card_schema: str = betterproto.string_field(2)
+    prepay_cashier_jump_url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveConfig(_HotMessage):
+    spu_id: int = betterproto.uint64_field(1)
+    spu_id_str: str = betterproto.string_field(2)
+    sku_id: int = betterproto.uint64_field(3)
+    sku_id_str: str = betterproto.string_field(4)
+    title: str = betterproto.string_field(5)
+    sub_title: str = betterproto.string_field(6)
+    tags: List[str] = betterproto.string_field(7)
+    cover: "WebcastDataImage" = betterproto.message_field(8)
+    sell_status: int = betterproto.int32_field(9)
+    status: int = betterproto.int32_field(10)
+    ios_pay_price_info: List["WebcastDataPaidLiveConfigPriceInfo"] = betterproto.message_field(11)
+    android_pay_price_info: List["WebcastDataPaidLiveConfigPriceInfo"] = betterproto.message_field(12)
+    user_right: "WebcastDataPaidLiveConfigUserRight" = betterproto.message_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveConfigPriceInfo(_HotMessage):
+    pay_type: int = betterproto.int32_field(1)
+    price: int = betterproto.uint64_field(2)
+    right_duration: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveConfigUserRight(_HotMessage):
+    view_right: int = betterproto.int32_field(1)
+    duration: int = betterproto.uint64_field(3)
+    delivery: int = betterproto.int32_field(6)
+    need_delivery_notice: bool = betterproto.bool_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveUiBaseConfig(_HotMessage):
+    paid_live_type: int = betterproto.int32_field(1)
+    paid_live_icon: "WebcastDataImage" = betterproto.message_field(2)
+    paid_live_icon_title: str = betterproto.string_field(3)
+    duration: int = betterproto.uint64_field(4)
+    no_right_end_title: str = betterproto.string_field(5)
+    no_right_end_sub_title: str = betterproto.string_field(6)
+    has_right_end_title: str = betterproto.string_field(7)
+    has_right_end_sub_title: str = betterproto.string_field(8)
+    paid_conversion_jump_url: str = betterproto.string_field(9)
+    panel_six_jump_url: str = betterproto.string_field(10)
+    feed_page_purchase_btn_word: str = betterproto.string_field(11)
+    purchase_btn_word: str = betterproto.string_field(12)
+    im_share_top_title: str = betterproto.string_field(13)
+    im_share_bottom_title: str = betterproto.string_field(14)
+    search_card_top_title: str = betterproto.string_field(15)
+    panel_feed_jump_url: str = betterproto.string_field(16)
+    panel_im_card_jump_url: str = betterproto.string_field(17)
+    panel_in_room_jump_url: str = betterproto.string_field(18)
+    panel_search_card_jump_url: str = betterproto.string_field(19)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomPublicScreenInfo(_HotMessage):
+    attachments: "WebcastDataRoomPublicScreenAttachments" = betterproto.message_field(1)
+    background_color: str = betterproto.string_field(2)
+    long_press_color: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomPublicScreenAttachments(_HotMessage):
+    hot_message_tray: int = betterproto.uint64_field(1)
+    height_setting: int = betterproto.uint64_field(2)
+    first_message_show_opt: int = betterproto.uint64_field(3)
+    anchor_cold_message_show_opt: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFullVideoBtn(_HotMessage):
+    show: int = betterproto.uint64_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    disable_icon: "WebcastDataImage" = betterproto.message_field(3)
+    show_type: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomBanner(_HotMessage):
+    auth_msg: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAvatorBorder(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    level: int = betterproto.uint64_field(2)
+    thumb_icon: "WebcastDataImage" = betterproto.message_field(3)
+    dress_id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomCore(_HotMessage):
+    room_id: int = betterproto.uint64_field(1)
+    anchor_id: int = betterproto.uint64_field(2)
+    anchor_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosFragment(_HotMessage):
+    name: str = betterproto.string_field(1)
+    is_open: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosContainerLayoutRule(_HotMessage):
+    items: List[str] = betterproto.string_field(1)
+    rule_replace: bool = betterproto.bool_field(2)
+    target: str = betterproto.string_field(3)
+    rule_type: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosContainerLayout(_HotMessage):
+    name: str = betterproto.string_field(1)
+    layout_rule: "WebcastDataIosContainerLayoutRule" = betterproto.message_field(2)
+    dsl: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosClientComponent(_HotMessage):
+    fragments: List["WebcastDataIosFragment"] = betterproto.message_field(1)
+    landscape_layout: List["WebcastDataIosContainerLayout"] = betterproto.message_field(2)
+    portrait_layout: List["WebcastDataIosContainerLayout"] = betterproto.message_field(3)
+    is_open: bool = betterproto.bool_field(4)
+    template_id: int = betterproto.uint64_field(5)
+    elements: List["WebcastDataIosFragment"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductsData(_HotMessage):
+    tool_bar: "WebcastDataProductsDataToolBar" = betterproto.message_field(1)
+    explain_card: "WebcastDataProductsDataExplainCard" = betterproto.message_field(2)
+    product_list_tool_bar: "WebcastDataProductsDataToolBar" = betterproto.message_field(3)
+    bring_product_switch_status: int = betterproto.int32_field(4)
+    paid_live_bringing_product_flag: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductsDataToolBar(_HotMessage):
+    panel_jump_url: str = betterproto.string_field(1)
+    six_jump_url: str = betterproto.string_field(2)
+    nine_jump_url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductsDataExplainCard(_HotMessage):
+    status: int = betterproto.int32_field(1)
+    card_jump_url: str = betterproto.string_field(2)
+    last_duration: int = betterproto.int32_field(3)
+    product: "WebcastDataProduct" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProduct(_HotMessage):
+    basic_info: "WebcastDataProductBasicInfo" = betterproto.message_field(1)
+    price_info: "WebcastDataProductPriceStruct" = betterproto.message_field(2)
+    live_info: "WebcastDataLiveInfo" = betterproto.message_field(3)
+    item_info: "WebcastDataItemInfo" = betterproto.message_field(4)
+    content_info: "WebcastDataContentInfo" = betterproto.message_field(5)
+    payment_arrea: "WebcastDataPaymentArea" = betterproto.message_field(6)
+    price_rich_info: "WebcastDataProductPriceRichText" = betterproto.message_field(7)
+    product_comments: "WebcastDataProductComments" = betterproto.message_field(8)
+    share_ticket: "WebcastDataShareTicket" = betterproto.message_field(29)
+    privilege: "WebcastDataPrivilegeTicket" = betterproto.message_field(30)
+    combined: "WebcastDataCombined" = betterproto.message_field(31)
+    comments: "WebcastDataComments" = betterproto.message_field(32)
+    rating: "WebcastDataRating" = betterproto.message_field(33)
+    user: "WebcastDataUser" = betterproto.message_field(35)
+    authors: List["WebcastDataAuthor"] = betterproto.message_field(36)
+    banner: "WebcastDataProductBanner" = betterproto.message_field(37)
+    sku_list: List["WebcastDataSku"] = betterproto.message_field(17)
+    subscribe_member: "WebcastDataSubscribeMember" = betterproto.message_field(18)
+    filter_node: "WebcastDataFilterReason" = betterproto.message_field(999)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFilterReason(_HotMessage):
+    failed: bool = betterproto.bool_field(1)
+    can_show: bool = betterproto.bool_field(2)
+    reason: str = betterproto.string_field(3)
+    werr_code: int = betterproto.int32_field(4)
+    filter_name: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductBasicInfo(_HotMessage):
+    id: int = betterproto.uint64_field(1)
+    id_str: str = betterproto.string_field(2)
+    owner_user_id: int = betterproto.uint64_field(3)
+    status: int = betterproto.int32_field(4)
+    biz: int = betterproto.int32_field(5)
+    category: int = betterproto.int32_field(6)
+    category_content: str = betterproto.string_field(7)
+    title: str = betterproto.string_field(8)
+    source: int = betterproto.int32_field(9)
+    cover_uri: str = betterproto.string_field(10)
+    cover: "WebcastDataImage" = betterproto.message_field(11)
+    review_status: int = betterproto.int32_field(12)
+    performance_status: int = betterproto.int32_field(13)
+    disable_reason: int = betterproto.int32_field(14)
+    sale_start_time: int = betterproto.uint64_field(15)
+    sale_end_time: int = betterproto.uint64_field(16)
+    refund_deadline: int = betterproto.uint64_field(17)
+    introduction_text: str = betterproto.string_field(18)
+    introduction: List["WebcastDataIntroduction"] = betterproto.message_field(19)
+    header_media: List["WebcastDataHeaderMedia"] = betterproto.message_field(20)
+    tags: "WebcastDataProductTag" = betterproto.message_field(21)
+    content_title: str = betterproto.string_field(22)
+    content_category: str = betterproto.string_field(23)
+    content_extent_info: str = betterproto.string_field(24)
+    sale_status: int = betterproto.int32_field(26)
+    service_period: int = betterproto.uint64_field(27)
+    geo_ban: bool = betterproto.bool_field(28)
+    combined_view_right: int = betterproto.int32_field(29)
+    jump_schema: str = betterproto.string_field(30)
+    detail_schema: str = betterproto.string_field(31)
+    new_product: int = betterproto.int32_field(32)
+    content_extent_info_color: str = betterproto.string_field(33)
+    create_time: int = betterproto.uint64_field(34)
+    show_start_time: int = betterproto.uint64_field(35)
+    content_tips: List["WebcastDataContentTip"] = betterproto.message_field(36)
+    prepay_cashier_jump_url: str = betterproto.string_field(37)
+    selling_points: List["WebcastDataProductSellingPoint"] = betterproto.message_field(38)
+    sale_info: "WebcastDataProductSaleInfo" = betterproto.message_field(39)
+    recent_purchased_user: List["WebcastDataRecentPurchasedUser"] = betterproto.message_field(40)
+    owner_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataParentProductSimpleData(_HotMessage):
+    product_id: str = betterproto.string_field(1)
+    title: str = betterproto.string_field(2)
+    sub_title: str = betterproto.string_field(3)
+    cover: "WebcastDataImage" = betterproto.message_field(4)
+    status: int = betterproto.int32_field(5)
+    view_right: int = betterproto.uint64_field(6)
+    bind_sub_product_count: int = betterproto.int32_field(7)
+    data: "WebcastDataPurchaseSimpleData" = betterproto.message_field(8)
+    sub_title_tag: str = betterproto.string_field(9)
+    current_show_num: int = betterproto.int32_field(10)
+    remain_sub_tickets_count: int = betterproto.int32_field(11)
+    latest_finish_time: int = betterproto.uint64_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPurchaseSimpleData(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    name: str = betterproto.string_field(2)
+    tags: List["WebcastDataProductTag"] = betterproto.message_field(3)
+    start_sell_time: int = betterproto.uint64_field(4)
+    closing_sell_time: int = betterproto.uint64_field(5)
+    sell_status: int = betterproto.int32_field(6)
+    purchase_status: int = betterproto.int32_field(7)
+    price_info: "WebcastDataProductPriceStruct" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBindSubProductData(_HotMessage):
+    product_id: str = betterproto.string_field(1)
+    parent_product_id: str = betterproto.string_field(2)
+    title: str = betterproto.string_field(3)
+    live_status: int = betterproto.int32_field(4)
+    ticket_status: int = betterproto.int32_field(5)
+    detail: str = betterproto.string_field(6)
+    vid: str = betterproto.string_field(7)
+    room_id: str = betterproto.string_field(8)
+    delivery_status: int = betterproto.int32_field(9)
+    live_time: int = betterproto.uint64_field(10)
+    end_time: int = betterproto.uint64_field(11)
+    live_start_time: int = betterproto.uint64_field(12)
+    live_end_time: int = betterproto.uint64_field(13)
+    view_right: int = betterproto.uint64_field(14)
+    is_replay: bool = betterproto.bool_field(15)
+    replay_id: int = betterproto.uint64_field(16)
+    replay_id_str: str = betterproto.string_field(17)
+    disable_reason: int = betterproto.int32_field(18)
+    camera_id: str = betterproto.string_field(19)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCombined(_HotMessage):
+    bind_sub_ticket_list: List["WebcastDataBindSubProductData"] = betterproto.message_field(1)
+    parent_ticket_panel_data: "WebcastDataParentProductSimpleData" = betterproto.message_field(2)
+    bind_sub_ticket_list_has_more: bool = betterproto.bool_field(3)
+    bind_sub_ticket_total: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareTicket(_HotMessage):
+    has_share: bool = betterproto.bool_field(1)
+    from_user: "WebcastDataUser" = betterproto.message_field(2)
+    package_record_id: str = betterproto.string_field(3)
+    has_grab_share: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeTicket(_HotMessage):
+    sku_id: List[str] = betterproto.string_field(1)
+    privilege_conf: List["WebcastDataPrivilegeTicketPrivilegeConfigure"] = betterproto.message_field(2)
+    privilege_has_paid: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeTicketPrivilegeConfigure(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    name: str = betterproto.string_field(2)
+    entity_type: int = betterproto.int32_field(3)
+    privilege_tab_key: int = betterproto.uint64_field(4)
+    privilege_type: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRating(_HotMessage):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataComments(_HotMessage):
+    title: str = betterproto.string_field(1)
+    count: int = betterproto.int32_field(2)
+    has_more: bool = betterproto.bool_field(3)
+    jump_schema: str = betterproto.string_field(4)
+    texts: List["WebcastDataCommentsTextInfo"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentsTextInfo(_HotMessage):
+    comment_id: int = betterproto.uint64_field(1)
+    user_info: "WebcastDataCommentsTextInfoUserInfo" = betterproto.message_field(2)
+    text: str = betterproto.string_field(3)
+    digg_count: int = betterproto.int32_field(4)
+    create_time_stamp: int = betterproto.uint64_field(5)
+    comment_id_str: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentsTextInfoUserInfo(_HotMessage):
+    user_id: int = betterproto.uint64_field(1)
+    name: str = betterproto.string_field(2)
+    avatar: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAuthor(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    user_info: "WebcastDataUser" = betterproto.message_field(2)
+    author_basic_info: "WebcastDataAuthorAuthorBasicInfo" = betterproto.message_field(3)
+    jump_schema: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAuthorAuthorBasicInfo(_HotMessage):
+    name: str = betterproto.string_field(1)
+    intorduce: str = betterproto.string_field(2)
+    cover: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaymentArea(_HotMessage):
+    pay_button: "WebcastDataPaymentAreaPayButton" = betterproto.message_field(1)
+    additional_button: "WebcastDataPaymentAreaAdditionalButton" = betterproto.message_field(2)
+    pay_button_list: "WebcastDataPaymentAreaPayButton" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaymentAreaPayButton(_HotMessage):
+    content: str = betterproto.string_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    jump_schema: str = betterproto.string_field(3)
+    avilable: int = betterproto.int32_field(4)
+    copy_writing: str = betterproto.string_field(5)
+    click_type: int = betterproto.int32_field(6)
+    is_new_ent_trade: bool = betterproto.bool_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaymentAreaAdditionalButton(_HotMessage):
+    content: str = betterproto.string_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    jump_schema: str = betterproto.string_field(3)
+    avilable: int = betterproto.int32_field(4)
+    copy_writing: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLiveInfo(_HotMessage):
+    room_id: int = betterproto.uint64_field(1)
+    title: str = betterproto.string_field(2)
+    episode_stage: int = betterproto.int32_field(3)
+    room_start_time: int = betterproto.uint64_field(4)
+    live_status: int = betterproto.int32_field(5)
+    vid: str = betterproto.string_field(6)
+    replay_id_str: str = betterproto.string_field(7)
+    is_replay: bool = betterproto.bool_field(8)
+    delivery: int = betterproto.int32_field(9)
+    view_right: int = betterproto.uint64_field(10)
+    anchor_sign_tag_content: str = betterproto.string_field(11)
+    room_id_str: str = betterproto.string_field(12)
+    paid_live_bring_product_flag: int = betterproto.int32_field(13)
+    living_sku_id: str = betterproto.string_field(14)
+    replay_auto_offline_time: int = betterproto.uint64_field(15)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataItemInfo(_HotMessage):
+    item_id: int = betterproto.uint64_field(1)
+    title: str = betterproto.string_field(2)
+    tag_type: str = betterproto.string_field(3)
+    lastest: int = betterproto.int32_field(4)
+    total: int = betterproto.int32_field(5)
+    play_counts: str = betterproto.string_field(6)
+    view_right: int = betterproto.uint64_field(7)
+    item_id_str: str = betterproto.string_field(8)
+    duration: int = betterproto.int32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataContentInfo(_HotMessage):
+    content_id: int = betterproto.uint64_field(1)
+    title: str = betterproto.string_field(2)
+    tag_type: str = betterproto.string_field(3)
+    lastest: int = betterproto.int32_field(4)
+    total: int = betterproto.int32_field(5)
+    category: str = betterproto.string_field(6)
+    view_right: int = betterproto.uint64_field(7)
+    content_id_str: str = betterproto.string_field(8)
+    duration: int = betterproto.int32_field(9)
+    promise_update_time: int = betterproto.uint64_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIntroduction(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    content: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductPriceStruct(_HotMessage):
+    amount: str = betterproto.string_field(1)
+    currency: str = betterproto.string_field(2)
+    pos: int = betterproto.uint64_field(3)
+    pay_type: List[int] = betterproto.int32_field(4)
+    full_price: str = betterproto.string_field(5)
+    countdown_timestamp: int = betterproto.uint64_field(6)
+    start: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichText(_HotMessage):
+    rich_type: int = betterproto.int32_field(1)
+    text: "WebcastDataProductRichTextText" = betterproto.message_field(2)
+    image: "WebcastDataProductRichTextImage" = betterproto.message_field(3)
+    count_down: "WebcastDataProductRichTextCountDown" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichTextText(_HotMessage):
+    text: str = betterproto.string_field(1)
+    font_size: int = betterproto.int32_field(2)
+    color: str = betterproto.string_field(3)
+    background_color: str = betterproto.string_field(4)
+    font_weight: int = betterproto.int32_field(5)
+    font_style: str = betterproto.string_field(6)
+    text_decoration: str = betterproto.string_field(7)
+    font_family: str = betterproto.string_field(8)
+    line_height: int = betterproto.int32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichTextImage(_HotMessage):
+    img: "WebcastDataProductRichTextImage" = betterproto.message_field(1)
+    width: int = betterproto.int32_field(2)
+    height: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichTextCountDown(_HotMessage):
+    countdown: int = betterproto.int32_field(1)
+    font_size: int = betterproto.int32_field(2)
+    color: str = betterproto.string_field(3)
+    place_holder: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductPriceRichText(_HotMessage):
+    rich_texts: List["WebcastDataProductRichText"] = betterproto.message_field(1)
+    extra: Dict[str, str] = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSku(_HotMessage):
+    id: str = betterproto.string_field(1)
+    category: int = betterproto.int32_field(2)
+    price: int = betterproto.uint64_field(3)
+    sale_start_time: int = betterproto.uint64_field(4)
+    sale_end_time: int = betterproto.uint64_field(5)
+    refundable: int = betterproto.int32_field(6)
+    cover_uri: str = betterproto.string_field(7)
+    cover: "WebcastDataImage" = betterproto.message_field(8)
+    introduction: str = betterproto.string_field(9)
+    title: str = betterproto.string_field(10)
+    sale_status: int = betterproto.int32_field(11)
+    product_id: str = betterproto.string_field(12)
+    related_sku_simple_infos: List["WebcastDataSkuRelatedSkuSimpleInfo"] = betterproto.message_field(13)
+    order_item_type: int = betterproto.int32_field(14)
+    order_biz_ext_info: str = betterproto.string_field(15)
+    limit_count: int = betterproto.int32_field(16)
+    purchase_status: int = betterproto.int32_field(17)
+    can_purchase: bool = betterproto.bool_field(18)
+    episode: int = betterproto.uint64_field(19)
+    introduction_text: str = betterproto.string_field(20)
+    price_type: int = betterproto.int32_field(21)
+    camera_info: "WebcastDataSkuCaremaInfo" = betterproto.message_field(22)
+    entity_ids_map: List["WebcastDataSkuEntityIDsMap"] = betterproto.message_field(23)
+    free_status: int = betterproto.int32_field(24)
+    limited_free_notice: "WebcastDataSkuLimitedFreeNotice" = betterproto.message_field(25)
+    live_status: int = betterproto.int32_field(26)
+    enable_renew_vip: bool = betterproto.bool_field(27)
+    bonus_amount: int = betterproto.uint64_field(28)
+    right_valid_duration: int = betterproto.uint64_field(29)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuRelatedSkuSimpleInfo(_HotMessage):
+    sku_id: str = betterproto.string_field(1)
+    product_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuCaremaInfo(_HotMessage):
+    camera_id: int = betterproto.uint64_field(1)
+    camera_id_str: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuEntityIDsMap(_HotMessage):
+    entity_type: int = betterproto.int32_field(1)
+    releated_entity_ids: List[int] = betterproto.uint64_field(23)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuLimitedFreeNotice(_HotMessage):
+    icon_uri: str = betterproto.string_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    content: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataHeaderMedia(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    image_info: "WebcastDataImage" = betterproto.message_field(2)
+    view_button: "WebcastDataHeaderMediaViewButton" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataHeaderMediaViewButton(_HotMessage):
+    content: str = betterproto.string_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    jump_schema: str = betterproto.string_field(3)
+    schema_type: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductTag(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    content: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDslDetail(_HotMessage):
+    dsl_id: int = betterproto.uint64_field(1)
+    dsl_type: int = betterproto.uint64_field(2)
+    dsl_gecko_download_uri: str = betterproto.string_field(3)
+    dsl_slice_info: str = betterproto.string_field(4)
+    version: int = betterproto.uint64_field(5)
+    dsl_data: str = betterproto.string_field(6)
+    extra: "WebcastDataDslDetailExtraInfo" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDslDetailExtraInfo(_HotMessage):
+    height: int = betterproto.uint64_field(1)
+    width: int = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomIntroLabel(_HotMessage):
+    label_tag: int = betterproto.int32_field(1)
+    label_name: str = betterproto.string_field(2)
+    label_text: str = betterproto.string_field(3)
+    label_icon: str = betterproto.string_field(4)
+    type_name: str = betterproto.string_field(5)
+    show_text: str = betterproto.string_field(6)
+    selected: bool = betterproto.bool_field(7)
+    show_order: int = betterproto.uint64_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChatReplyRespInfo(_HotMessage):
+    reply_msg_id: int = betterproto.uint64_field(1)
+    reply_id: int = betterproto.uint64_field(2)
+    reply_text: "WebcastDataText" = betterproto.message_field(3)
+    reply_uid: int = betterproto.uint64_field(4)
+    reply_webcast_uid: str = betterproto.string_field(5)
+    reply_open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftImPriority(_HotMessage):
+    queue_sizes: List[int] = betterproto.uint64_field(1)
+    self_queue_priority: int = betterproto.uint64_field(2)
+    priority: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSendInteractEmojiConfig(_HotMessage):
+    interact_emoji: "WebcastDataImage" = betterproto.message_field(1)
+    duration_ms: int = betterproto.uint64_field(2)
+    start: int = betterproto.uint64_field(3)
+    own_emoji: "WebcastDataImage" = betterproto.message_field(4)
+    own_emoji_duration_ms: int = betterproto.uint64_field(5)
+    offset: int = betterproto.uint64_field(6)
+    scale_up: int = betterproto.uint64_field(7)
+    reshape: bool = betterproto.bool_field(8)
+    sound_url: str = betterproto.string_field(9)
+    reshape_start: int = betterproto.uint64_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEmojiInteractResource(_HotMessage):
+    from_image: "WebcastDataSendInteractEmojiConfig" = betterproto.message_field(1)
+    pass_image: "WebcastDataSendInteractEmojiConfig" = betterproto.message_field(2)
+    to_image: "WebcastDataSendInteractEmojiConfig" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftPreviewInfo(_HotMessage):
+    lock_status: int = betterproto.uint64_field(1)
+    client_block_use_scheme_url: bool = betterproto.bool_field(2)
+    block_scheme_url: str = betterproto.string_field(3)
+    client_check_left_diamond: bool = betterproto.bool_field(4)
+    block_toast: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBuffLockInfo(_HotMessage):
+    locked: bool = betterproto.bool_field(1)
+    toast: str = betterproto.string_field(2)
+    schema: str = betterproto.string_field(3)
+    cell_text: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftBuffInfo(_HotMessage):
+    text: str = betterproto.string_field(1)
+    text_color: str = betterproto.string_field(2)
+    bg_img: "WebcastDataImage" = betterproto.message_field(3)
+    sweep_light_img: "WebcastDataImage" = betterproto.message_field(4)
+    buff_gift_describe_img: "WebcastDataImage" = betterproto.message_field(5)
+    buff_gift_id: int = betterproto.uint64_field(6)
+    buff_level: int = betterproto.int32_field(7)
+    buff_can_send: bool = betterproto.bool_field(8)
+    buff_diamond_count: int = betterproto.uint64_field(9)
+    lock_toast: str = betterproto.string_field(10)
+    default_chose_action: int = betterproto.uint64_field(11)
+    start_time: int = betterproto.uint64_field(12)
+    buff_lock_info: "WebcastDataBuffLockInfo" = betterproto.message_field(13)
+    bg_img_v2: "WebcastDataImage" = betterproto.message_field(14)
+    tab_chose_action: Dict[int, int] = betterproto.map_field(
+        15, betterproto.TYPE_INT32, betterproto.TYPE_INT64
+    )
+    label_icon: "WebcastDataImage" = betterproto.message_field(16)
+    diy_gift_card_button: "WebcastDataDiyGiftCardButton" = betterproto.message_field(17)
+    default_expand: bool = betterproto.bool_field(18)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftTip(_HotMessage):
+    display_text: "WebcastDataText" = betterproto.message_field(1)
+    background_color: str = betterproto.string_field(2)
+    prefix_image: "WebcastDataImage" = betterproto.message_field(3)
+    remaining_duration: int = betterproto.uint64_field(4)
+    remaining_duration_suffix_text: "WebcastDataText" = betterproto.message_field(5)
+    countdown_deadline_time: int = betterproto.uint64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftStruct(_HotMessage):
+    image: "WebcastDataImage" = betterproto.message_field(1)
+    describe: str = betterproto.string_field(2)
+    notify: bool = betterproto.bool_field(3)
+    duration: int = betterproto.uint64_field(4)
+    id: int = betterproto.uint64_field(5)
+    fansclub_info: "WebcastDataGiftStructGiftStructFansClubInfo" = betterproto.message_field(6)
+    for_linkmic: bool = betterproto.bool_field(7)
+    doodle: bool = betterproto.bool_field(8)
+    for_fansclub: bool = betterproto.bool_field(9)
+    combo: bool = betterproto.bool_field(10)
+    type: int = betterproto.int32_field(11)
+    diamond_count: int = betterproto.int32_field(12)
+    is_displayed_on_panel: bool = betterproto.bool_field(13)
+    primary_effect_id: int = betterproto.uint64_field(14)
+    gift_label_icon: "WebcastDataImage" = betterproto.message_field(15)
+    name: str = betterproto.string_field(16)
+    region: str = betterproto.string_field(17)
+    manual: str = betterproto.string_field(18)
+    for_custom: bool = betterproto.bool_field(19)
+    special_effects: Dict[str, int] = betterproto.map_field(
+        20, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+    icon: "WebcastDataImage" = betterproto.message_field(21)
+    action_type: int = betterproto.int32_field(22)
+    watermelon_seeds: int = betterproto.int32_field(23)
+    gold_effect: str = betterproto.string_field(24)
+    subs: List["WebcastDataLuckyMoneyGiftMeta"] = betterproto.message_field(25)
+    golden_beans: int = betterproto.uint64_field(26)
+    honor_level: int = betterproto.uint64_field(27)
+    item_type: int = betterproto.int32_field(28)
+    scheme_url: str = betterproto.string_field(29)
+    gift_operation: "WebcastDataGiftPanelOperation" = betterproto.message_field(30)
+    event_name: str = betterproto.string_field(31)
+    noble_level: int = betterproto.uint64_field(32)
+    guide_url: str = betterproto.string_field(33)
+    punish_medicine: bool = betterproto.bool_field(34)
+    for_portal: bool = betterproto.bool_field(35)
+    business_text: str = betterproto.string_field(36)
+    cny_gift: bool = betterproto.bool_field(37)
+    app_id: int = betterproto.uint64_field(38)
+    vip_level: int = betterproto.uint64_field(39)
+    is_gray: bool = betterproto.bool_field(40)
+    gray_scheme_url: str = betterproto.string_field(41)
+    gift_scene: int = betterproto.uint64_field(42)
+    gift_banner: "WebcastDataGiftBanner" = betterproto.message_field(43)
+    trigger_words: List[str] = betterproto.string_field(44)
+    gift_buff_infos: List["WebcastDataGiftBuffInfo"] = betterproto.message_field(45)
+    for_first_recharge: bool = betterproto.bool_field(46)
+    dynamic_img_for_selected: "WebcastDataImage" = betterproto.message_field(47)
+    after_send_action: int = betterproto.int32_field(48)
+    gift_offline_time: int = betterproto.uint64_field(49)
+    top_bar_text: str = betterproto.string_field(50)
+    top_right_avatar: "WebcastDataImage" = betterproto.message_field(51)
+    banner_scheme_url: str = betterproto.string_field(52)
+    is_locked: bool = betterproto.bool_field(53)
+    req_extra_type: int = betterproto.uint64_field(54)
+    asset_ids: List[int] = betterproto.uint64_field(55)
+    gift_preview_info: "WebcastDataGiftPreviewInfo" = betterproto.message_field(56)
+    gift_tip: "WebcastDataGiftTip" = betterproto.message_field(57)
+    need_sweep_light_count: int = betterproto.int32_field(58)
+    group_info: List["WebcastDataGiftGroupInfo"] = betterproto.message_field(59)
+    bottom_text: "WebcastDataText" = betterproto.message_field(60)
+    mystery_shop_status: int = betterproto.int32_field(61)
+    optional_asset_ids: List[int] = betterproto.uint64_field(62)
+    disable_wish_list: bool = betterproto.bool_field(63)
+    gift_msg_board: "WebcastDataGiftStructGiftMsgBoard" = betterproto.message_field(64)
+    emoji_interact_resource: "WebcastDataEmojiInteractResource" = betterproto.message_field(65)
+    tray_dynamic_img_flippable: bool = betterproto.bool_field(66)
+    pico_show_action: int = betterproto.uint64_field(67)
+    selected_dynamic_effect: int = betterproto.uint64_field(68)
+    gift_touch_label: "WebcastDataGiftTouchLabel" = betterproto.message_field(69)
+    unselected_bottom_info: "WebcastDataGiftUnselectedBottomInfo" = betterproto.message_field(70)
+    gift_confirm_info: "WebcastDataGiftConfirmInfo" = betterproto.message_field(71)
+    biz_type: int = betterproto.int32_field(72)
+    biz_item: "WebcastDataGoodsBizItem" = betterproto.message_field(73)
+    webp_image: "WebcastDataImage" = betterproto.message_field(74)
+    gift_source: int = betterproto.int32_field(75)
+    required_assets: List[int] = betterproto.uint64_field(76)
+    selected_label: "WebcastDataImage" = betterproto.message_field(77)
+    sort_score: int = betterproto.uint64_field(78)
+    topic_id: int = betterproto.uint64_field(79)
+    sort_extra: str = betterproto.string_field(80)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftStructGiftStructFansClubInfo(_HotMessage):
+    min_level: int = betterproto.int32_field(1)
+    insert_pos: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftStructGiftMsgBoard(_HotMessage):
+    for_msg_board: bool = betterproto.bool_field(1)
+    prompt_text: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGoodsBizItem(_HotMessage):
+    goods: "WebcastDataBizGoods" = betterproto.message_field(1)
+    entrance: "WebcastDataBizEntrance" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBizGoods(_HotMessage):
+    goods: "WebcastDataGoodsStruct" = betterproto.message_field(1)
+    extra: str = betterproto.string_field(2)
+    consume_scene: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBizEntrance(_HotMessage):
+    scheme_url: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftConfirmInfo(_HotMessage):
+    title: str = betterproto.string_field(1)
+    text: str = betterproto.string_field(2)
+    cancel_button_text: str = betterproto.string_field(3)
+    confirm_button_text: str = betterproto.string_field(4)
+    confirm_type: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftUnselectedBottomInfo(_HotMessage):
+    text: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftTouchLabel(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    unique_key: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftGroupInfo(_HotMessage):
+    group_count: int = betterproto.int32_field(1)
+    group_text: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftPanelOperation(_HotMessage):
+    left_image: "WebcastDataImage" = betterproto.message_field(1)
+    right_image: "WebcastDataImage" = betterproto.message_field(2)
+    title: str = betterproto.string_field(3)
+    title_color: str = betterproto.string_field(4)
+    title_size: int = betterproto.uint64_field(5)
+    scheme_url: str = betterproto.string_field(6)
+    event_name: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLuckyMoneyGiftMeta(_HotMessage):
+    image: "WebcastDataImage" = betterproto.message_field(1)
+    describe: str = betterproto.string_field(2)
+    id: int = betterproto.uint64_field(3)
+    diamond_count: int = betterproto.int32_field(4)
+    icon: "WebcastDataImage" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorGiftData(_HotMessage):
+    anchor_diy_origin_img: "WebcastDataImage" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftBanner(_HotMessage):
+    display_text: "WebcastDataText" = betterproto.message_field(1)
+    display_text_bg_color: str = betterproto.string_field(2)
+    box_img: "WebcastDataImage" = betterproto.message_field(3)
+    bg_img: "WebcastDataImage" = betterproto.message_field(4)
+    scheme_url: str = betterproto.string_field(5)
+    animate: bool = betterproto.bool_field(6)
+    box_id: int = betterproto.uint64_field(7)
+    available_box_count: int = betterproto.uint64_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEffectMixImageInfo(_HotMessage):
+    image_key: str = betterproto.string_field(1)
+    mix_image: "WebcastDataImage" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAssetEffectMixInfo(_HotMessage):
+    effect_mix_image_infos: List["WebcastDataEffectMixImageInfo"] = betterproto.message_field(1)
+    effect_mix_text_infos: List["WebcastDataEffectMixTextInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftTrayInfo(_HotMessage):
+    tray_display_text: "WebcastDataText" = betterproto.message_field(1)
+    tray_base_img: "WebcastDataImage" = betterproto.message_field(2)
+    tray_head_img: "WebcastDataImage" = betterproto.message_field(3)
+    tray_right_img: "WebcastDataImage" = betterproto.message_field(4)
+    tray_level: int = betterproto.uint64_field(5)
+    tray_dynamic_img: "WebcastDataImage" = betterproto.message_field(6)
+    tray_schema_url: str = betterproto.string_field(7)
+    tray_type: int = betterproto.int32_field(8)
+    tray_base_img_v2: "WebcastDataImage" = betterproto.message_field(9)
+    tray_right_img_v2: "WebcastDataImage" = betterproto.message_field(10)
+    use_high_layer: bool = betterproto.bool_field(11)
+    duration: int = betterproto.uint64_field(12)
+    toast: str = betterproto.string_field(13)
+    tray_slide_rate: int = betterproto.int32_field(14)
+    tray_pre_effect: "WebcastDataTrayPreEffect" = betterproto.message_field(15)
+    tray_post_effect: "WebcastDataTrayPostEffect" = betterproto.message_field(16)
+    origin_gift_id: int = betterproto.uint64_field(17)
+    buff_level: int = betterproto.uint64_field(18)
+    toolbar_card_name: str = betterproto.string_field(19)
+    tray_base_webp_img: "WebcastDataImage" = betterproto.message_field(20)
+    tray_group_mode: int = betterproto.int32_field(21)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTrayPreEffect(_HotMessage):
+    pre_effect_img: "WebcastDataImage" = betterproto.message_field(1)
+    tray_start_time: int = betterproto.uint64_field(2)
+    tray_ripple: "WebcastDataImage" = betterproto.message_field(3)
+    pre_schema: str = betterproto.string_field(4)
+    pre_duration: int = betterproto.uint64_field(5)
+    pre_effect_source: int = betterproto.int32_field(6)
+    extra: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTrayPostEffect(_HotMessage):
+    post_effect_img: "WebcastDataImage" = betterproto.message_field(1)
+    post_schema: str = betterproto.string_field(2)
+    post_duration: int = betterproto.uint64_field(3)
+    post_effect_source: int = betterproto.int32_field(4)
+    event_tracking: Dict[str, str] = betterproto.map_field(
+        10, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSeriesPlayGift(_HotMessage):
+    gift_struct: "WebcastDataGiftStruct" = betterproto.message_field(1)
+    series_tray_info: "WebcastDataSeriesTrayInfo" = betterproto.message_field(2)
+    send_together: "WebcastDataSendTogether" = betterproto.message_field(3)
+    diy_item_info: str = betterproto.string_field(4)
+    anchor_gift: "WebcastDataAnchorGiftData" = betterproto.message_field(5)
+    asset_effect_mix_info: "WebcastDataAssetEffectMixInfo" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSeriesTrayInfo(_HotMessage):
+    duration: int = betterproto.uint64_field(1)
+    static_img: "WebcastDataImage" = betterproto.message_field(2)
+    dynamic_img: "WebcastDataImage" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDiyGiftCardButton(_HotMessage):
+    action: int = betterproto.int32_field(1)
+    button_content: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSendTogether(_HotMessage):
+    id: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint64_field(2)
+    end_time: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataExtraEffect(_HotMessage):
+    asset_id: int = betterproto.uint64_field(1)
+    display_form: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGoodsStruct(_HotMessage):
+    goods_id: int = betterproto.uint64_field(1)
+    goods_type: int = betterproto.uint64_field(2)
+    name: str = betterproto.string_field(3)
+    diamond_count: int = betterproto.uint64_field(4)
+    icon: "WebcastDataImage" = betterproto.message_field(5)
+    description: str = betterproto.string_field(6)
+    offline_time: int = betterproto.uint64_field(7)
+    extra: str = betterproto.string_field(8)
+    options: List[int] = betterproto.uint64_field(50)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenHostInfo(_HotMessage):
+    nickname: str = betterproto.string_field(1)
+    gender: int = betterproto.int32_field(2)
+    signature: str = betterproto.string_field(3)
+    avatar_thumb: "WebcastDataImage" = betterproto.message_field(4)
+    avatar_medium: "WebcastDataImage" = betterproto.message_field(5)
+    avatar_large: "WebcastDataImage" = betterproto.message_field(6)
+    follow_info: "WebcastDataUserFollowInfo" = betterproto.message_field(7)
+    schemas: Dict[str, str] = betterproto.map_field(
+        8, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    extra: Dict[str, str] = betterproto.map_field(
+        100, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataContainerLayout(_HotMessage):
+    width: int = betterproto.int32_field(1)
+    height: int = betterproto.int32_field(2)
+    margin_left: int = betterproto.int32_field(3)
+    margin_top: int = betterproto.int32_field(4)
+    margin_bottom: int = betterproto.int32_field(5)
+    margin_right: int = betterproto.int32_field(6)
+    padding_left: int = betterproto.int32_field(7)
+    padding_right: int = betterproto.int32_field(8)
+    padding_bottom: int = betterproto.int32_field(9)
+    padding_top: int = betterproto.int32_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenGame(_HotMessage):
+    stream_id: str = betterproto.string_field(1)
+    app_id: str = betterproto.string_field(2)
+    anchor_type: int = betterproto.uint64_field(3)
+    interact_type: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorBottomToolBar(_HotMessage):
+    anchor_linkmic_entrance: "WebcastDataAnchorLinkmicEntranceInfo" = betterproto.message_field(1)
+    audience_linkmic_entrance: "WebcastDataAudienceLinkmicEntranceInfo" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorLinkmicEntranceInfo(_HotMessage):
+    panel_type: int = betterproto.int32_field(1)
+    icon: "WebcastDataImage" = betterproto.message_field(2)
+    text: str = betterproto.string_field(3)
+    pk_to_linkmic_image: "WebcastDataImage" = betterproto.message_field(4)
+    linkmic_to_pk_image: "WebcastDataImage" = betterproto.message_field(5)
+    lead_pk_image: "WebcastDataImage" = betterproto.message_field(6)
+    lead_pk_freq_key: str = betterproto.string_field(7)
+    pk_icon: "WebcastDataImage" = betterproto.message_field(8)
+    anchor_icon: "WebcastDataImage" = betterproto.message_field(9)
+    word_type: str = betterproto.string_field(10)
+    button_lead: Dict[int, "WebcastDataAnchorLinkmicEntranceInfoLeadInfo"] = betterproto.map_field(
+        11, betterproto.TYPE_INT64, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorLinkmicEntranceInfoLeadInfo(_HotMessage):
+    lead_image: "WebcastDataImage" = betterproto.message_field(1)
+    bubble_text: str = betterproto.string_field(2)
+    bubble_panel: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudienceLinkmicEntranceInfo(_HotMessage):
+    icon: "WebcastDataImage" = betterproto.message_field(1)
+    text: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorLinkmic(_HotMessage):
+    channel_id: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamRecognitionCandidate(_HotMessage):
+    scene_enum: int = betterproto.int32_field(1)
+    priority: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamRecognitionContainers(_HotMessage):
+    recognition_candidates: "WebcastDataStreamRecognitionCandidate" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameRoomSticker(_HotMessage):
+    need_render_sticker_type: int = betterproto.uint64_field(1)
+    need_render_sticker_list: List[int] = betterproto.uint64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSandwichBorderInfo(_HotMessage):
+    top: float = betterproto.double_field(1)
+    bottom: float = betterproto.double_field(2)
+    left: float = betterproto.double_field(3)
+    right: float = betterproto.double_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebEnterBenefitPointData(_HotMessage):
+    has_ongoing_lottery: bool = betterproto.bool_field(1)
+    has_ongoing_lucky_money: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAddressInfo(_HotMessage):
+    country_geo_name_id: int = betterproto.uint64_field(1)
+    province_code: int = betterproto.uint64_field(2)
+    city_code: int = betterproto.uint64_field(3)
+    country: str = betterproto.string_field(4)
+    province: str = betterproto.string_field(5)
+    city: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLocationInfo(_HotMessage):
+    gps_info: "WebcastDataAddressInfo" = betterproto.message_field(1)
+    ip_info: "WebcastDataAddressInfo" = betterproto.message_field(2)
+    enable_permission: bool = betterproto.bool_field(3)
+    enable_location_mode: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenStreamUrlEncrypt(_HotMessage):
+    rtmp_pull_url: str = betterproto.string_field(1)
+    hls_pull_url: str = betterproto.string_field(2)
+    flv_pull_url: Dict[str, str] = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    stream_data: str = betterproto.string_field(4)
+    hls: List["WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo"] = betterproto.message_field(5)
+    flv: List["WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo"] = betterproto.message_field(6)
+    hls_pull_url_map: Dict[str, str] = betterproto.map_field(
+        7, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    pull_datas: Dict[str, "WebcastDataStreamUrlLiveCoreSdkDataPullData"] = betterproto.map_field(
+        8, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSubscribeMemberMark(_HotMessage):
+    subscribe_member_watch_free: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarExtraInfo(_HotMessage):
+    game_promotion_coexist: int = betterproto.uint64_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorTogetherLive(_HotMessage):
+    is_together_live: int = betterproto.uint64_field(1)
+    user_list: List["WebcastDataUser"] = betterproto.message_field(2)
+    title: str = betterproto.string_field(3)
+    schema_url: str = betterproto.string_field(4)
+    scene: int = betterproto.uint64_field(5)
+    is_show: bool = betterproto.bool_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebData(_HotMessage):
+    additional_stream_url: "WebcastDataStreamUrl" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMetricTrackerData(_HotMessage):
+    event_name: str = betterproto.string_field(1)
+    is_common_metric: bool = betterproto.bool_field(2)
+    current_room_tracker: Dict[str, str] = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    use_once_tracker: Dict[str, str] = betterproto.map_field(
+        4, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    all_room_tracker: Dict[str, str] = betterproto.map_field(
+        5, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSubscribeMember(_HotMessage):
+    pay_schema: str = betterproto.string_field(1)
+    title: str = betterproto.string_field(2)
+    sub_title: str = betterproto.string_field(3)
+    price_info: "WebcastDataProductPriceStruct" = betterproto.message_field(4)
+    subscribe_status: int = betterproto.int32_field(5)
+    valid_start_time: int = betterproto.uint64_field(6)
+    valid_end_time: int = betterproto.uint64_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductBanner(_HotMessage):
+    cover: "WebcastDataImage" = betterproto.message_field(1)
+    schema: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductSaleInfo(_HotMessage):
+    sale_cnt: int = betterproto.uint64_field(1)
+    helping_sale_cnt: int = betterproto.uint64_field(2)
+    written_off_amount: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataContentTip(_HotMessage):
+    title: str = betterproto.string_field(1)
+    context: str = betterproto.string_field(2)
+    click_title: str = betterproto.string_field(3)
+    click_context: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductSellingPoint(_HotMessage):
+    type: int = betterproto.int32_field(1)
+    content: str = betterproto.string_field(2)
+    original_value: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRecentPurchasedUser(_HotMessage):
+    uid: str = betterproto.string_field(1)
+    avatar_uri: str = betterproto.string_field(2)
+    avatar: "WebcastDataImage" = betterproto.message_field(3)
+    episodes: int = betterproto.uint64_field(4)
+    open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductComments(_HotMessage):
+    title: str = betterproto.string_field(1)
+    total_count: str = betterproto.string_field(2)
+    jump_title: str = betterproto.string_field(3)
+    jump_schema: str = betterproto.string_field(4)
+    comments: List["WebcastDataProductComment"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductCommentUser(_HotMessage):
+    uid: str = betterproto.string_field(1)
+    nick_name: str = betterproto.string_field(2)
+    avatar: "WebcastDataImage" = betterproto.message_field(3)
+    open_id: str = betterproto.string_field(5000)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductComment(_HotMessage):
+    comment_id: str = betterproto.string_field(1)
+    text: str = betterproto.string_field(2)
+    rate: str = betterproto.string_field(3)
+    create_time: str = betterproto.string_field(4)
+    digg_count: str = betterproto.string_field(5)
+    user_digged: int = betterproto.int32_field(6)
+    status: str = betterproto.string_field(7)
+    anonymous: int = betterproto.int32_field(8)
+    user: "WebcastDataProductCommentUser" = betterproto.message_field(9)
+    is_author_digged: int = betterproto.int32_field(10)
+    location: str = betterproto.string_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataInputDefaultConfig(_HotMessage):
+    first_level_text: str = betterproto.string_field(1)
+    second_level_text: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChatMentionInfo(_HotMessage):
+    mention_user_ids: List[str] = betterproto.string_field(1)
+    mention_webcast_user_ids: List[str] = betterproto.string_field(2)
+    show_time: int = betterproto.uint64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEffectMixTextInfo(_HotMessage):
+    text_key: str = betterproto.string_field(1)
+    content: str = betterproto.string_field(2)
+    font_size: int = betterproto.uint64_field(3)
+    font_color: str = betterproto.string_field(4)
@@ -0,0 +1,30 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    douyin_lazy.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+protobuf/douyin.py 的惰性版本，导出的名字与 douyin.__all__ 相同，
+但消息类只在第一次被访问时才定义
+
+    from protobuf.douyin_lazy import WebcastImChatMessage
+
+注意不要对本模块使用 import *，那会把所有类都加载一遍
+"""
+
+import os
+
+from protobuf.lazy import LazyProtoLoader
+
+_loader = LazyProtoLoader(os.path.join(os.path.dirname(__file__), 'douyin.py'), globals())
+
+__all__ = _loader.names
+
+
+def __getattr__(name):
+    return _loader.load(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
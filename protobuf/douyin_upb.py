@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    douyin_upb.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+用官方 protobuf 运行时（upb，C 实现）加载 douyin.proto
+
+不依赖 protoc：直接由 schema.parse_proto 的结果构建 FileDescriptorProto，交给描述符池生成消息类。
+嵌套消息被展开成顶层消息，类名与 betterproto 一致（WebcastImChatMessage），
+字段名按 betterproto 的规则转成 snake_case（LogID -> log_id），线上格式只看字段编号，不受影响。
+因此处理函数读取的字段在两种后端上名字相同。
+
+默认只构建热集合（schema.ROOTS 的依赖闭包），设置 DOUYIN_UPB_FULL=1 构建完整 schema。
+
+    pip install protobuf
+"""
+
+import os
+
+from betterproto import casing
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from protobuf.schema import ROOTS, SCALAR_TYPES, class_name, closure, parse_proto, resolve
+
+_FDP = descriptor_pb2.FieldDescriptorProto
+_PACKAGE = 'douyin_upb'
+
+_TYPES = {
+    'double': _FDP.TYPE_DOUBLE,
+    'float': _FDP.TYPE_FLOAT,
+    'int32': _FDP.TYPE_INT32,
+    'int64': _FDP.TYPE_INT64,
+    'uint32': _FDP.TYPE_UINT32,
+    'uint64': _FDP.TYPE_UINT64,
+    'sint32': _FDP.TYPE_SINT32,
+    'sint64': _FDP.TYPE_SINT64,
+    'fixed32': _FDP.TYPE_FIXED32,
+    'fixed64': _FDP.TYPE_FIXED64,
+    'sfixed32': _FDP.TYPE_SFIXED32,
+    'sfixed64': _FDP.TYPE_SFIXED64,
+    'bool': _FDP.TYPE_BOOL,
+    'string': _FDP.TYPE_STRING,
+    'bytes': _FDP.TYPE_BYTES,
+}
+
+
+def _set_type(field, messages: dict, owner: str, type_name: str):
+    if type_name in SCALAR_TYPES:
+        field.type = _TYPES[type_name]
+    else:
+        field.type = _FDP.TYPE_MESSAGE
+        field.type_name = f".{_PACKAGE}.{class_name(resolve(messages, owner, type_name))}"
+
+
+def build_file(messages: dict, names) -> descriptor_pb2.FileDescriptorProto:
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name='douyin_upb.proto',
+        package=_PACKAGE,
+        syntax='proto3',
+    )
+    for name in names:
+        msg = file_proto.message_type.add(name=class_name(name))
+        for f in messages[name]:
+            field = msg.field.add(name=casing.safe_snake_case(f.name), number=f.number)
+            if f.key_type:
+                entry_name = casing.pascal_case(f.name) + 'Entry'
+                entry = msg.nested_type.add(name=entry_name)
+                entry.options.map_entry = True
+                key = entry.field.add(name='key', number=1, label=_FDP.LABEL_OPTIONAL)
+                _set_type(key, messages, name, f.key_type)
+                value = entry.field.add(name='value', number=2, label=_FDP.LABEL_OPTIONAL)
+                _set_type(value, messages, name, f.type)
+                field.label = _FDP.LABEL_REPEATED
+                field.type = _FDP.TYPE_MESSAGE
+                field.type_name = f".{_PACKAGE}.{msg.name}.{entry_name}"
+            else:
+                field.label = _FDP.LABEL_REPEATED if f.repeated else _FDP.LABEL_OPTIONAL
+                _set_type(field, messages, name, f.type)
+    return file_proto
+
+
+def _build():
+    messages = parse_proto()
+    if os.environ.get('DOUYIN_UPB_FULL'):
+        names = list(messages)
+    else:
+        names = closure(messages, ROOTS)
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(build_file(messages, names))
+    file_desc = pool.FindFileByName('douyin_upb.proto')
+    classes = {}
+    for name, desc in file_desc.message_types_by_name.items():
+        classes[name] = message_factory.GetMessageClass(desc)
+    return classes
+
+
+_classes = _build()
+globals().update(_classes)
+
+__all__ = tuple(_classes)
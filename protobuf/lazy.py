@@ -0,0 +1,113 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    lazy.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+betterproto 生成模块的按需加载器
+
+protobuf/douyin.py 有 2300 多个 dataclass，整体 import 会占用大量启动时间和内存，
+而抓取器只用到其中十几个消息类型。这里只扫描一遍源码，记录每个类的源码位置和它
+引用的其他类，第一次访问某个类时才执行它（以及它依赖的类）的定义。
+
+betterproto 解析字段类型时用 sys.modules[cls.__module__].__dict__ 求值类型注解，
+所以类会被定义在惰性模块自己的命名空间里，并且依赖会在同一时刻一并加载。
+"""
+
+import re
+import threading
+
+_CLASS_RE = re.compile(r'^@dataclass\(eq=False, repr=False\)\nclass (\w+)\(', re.M)
+_REF_RE = re.compile(r'"(\w+)"')
+_ALL_RE = re.compile(r'^__all__ = \((.*?)^\)', re.M | re.S)
+
+
+def _shift_lines(code, offset: int):
+    consts = tuple(
+        _shift_lines(c, offset) if hasattr(c, 'co_firstlineno') else c
+        for c in code.co_consts
+    )
+    return code.replace(co_firstlineno=code.co_firstlineno + offset, co_consts=consts)
+
+
+class LazyProtoLoader:
+    """
+    参数:
+        source_path: betterproto 生成的 .py 文件路径
+        namespace:   惰性模块的 globals()，类会定义在这里
+    """
+
+    def __init__(self, source_path: str, namespace: dict):
+        self.source_path = source_path
+        self.namespace = namespace
+        self._lock = threading.RLock()
+
+        with open(source_path, 'r', encoding='utf-8') as f:
+            self._source = f.read()
+
+        matches = list(_CLASS_RE.finditer(self._source))
+        self._spans = {}
+        lineno = 0
+        prev = 0
+        for i, m in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(self._source)
+            lineno += self._source.count('\n', prev, m.start())
+            prev = m.start()
+            self._spans[m.group(1)] = (m.start(), end, lineno)
+
+        all_match = _ALL_RE.search(self._source)
+        if all_match:
+            self.names = tuple(re.findall(r'"(\w+)"', all_match.group(1)))
+        else:
+            self.names = tuple(self._spans)
+
+        # 文件头里的 import（dataclass / typing / betterproto）
+        header_end = matches[0].start() if matches else len(self._source)
+        header = _ALL_RE.sub('', self._source[:header_end])
+        exec(compile(header, source_path, 'exec'), namespace)
+
+        self._deps = {}
+        self.loaded = set()
+
+    def _dependencies(self, name: str) -> list:
+        deps = self._deps.get(name)
+        if deps is None:
+            start, end, _ = self._spans[name]
+            refs = _REF_RE.findall(self._source, start, end)
+            deps = self._deps[name] = [r for r in dict.fromkeys(refs) if r in self._spans and r != name]
+        return deps
+
+    def _define(self, name: str):
+        start, end, lineno = self._spans[name]
+        code = compile(self._source[start:end], self.source_path, 'exec')
+        # 平移行号，保证异常栈指向 douyin.py 中的真实位置
+        code = _shift_lines(code, lineno)
+        exec(code, self.namespace)
+        self.loaded.add(name)
+
+    def load(self, name: str):
+        if name not in self._spans:
+            raise AttributeError(name)
+
+        with self._lock:
+            if name in self.loaded:
+                return self.namespace[name]
+
+            # 被引用的类只在注解里以字符串出现，定义顺序无所谓，只需在解析前全部就位
+            pending = [name]
+            seen = {name}
+            while pending:
+                current = pending.pop()
+                if current not in self.loaded:
+                    self._define(current)
+                for dep in self._dependencies(current):
+                    if dep not in seen:
+                        seen.add(dep)
+                        pending.append(dep)
+
+            return self.namespace[name]
+
+    def load_all(self):
+        for name in self.names:
+            self.load(name)
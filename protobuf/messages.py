@@ -0,0 +1,54 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    messages.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+抓取器使用的消息类型入口，按环境变量 DOUYIN_PROTO 选择实现：
+
+    hot   精简热集合 protobuf/douyin_hot.py（默认，由 build_hot.py 生成）
+    lazy  完整 schema，按需加载 protobuf/douyin_lazy.py
+    full  完整 protobuf/douyin.py，调试时使用（保留未知字段）
+
+例如： set DOUYIN_PROTO=full && python main.py
+"""
+
+import importlib
+import os
+
+MODULES = {
+    'hot': 'protobuf.douyin_hot',
+    'lazy': 'protobuf.douyin_lazy',
+    'full': 'protobuf.douyin',
+}
+
+PROTO_MODULE = os.environ.get('DOUYIN_PROTO', 'hot').strip().lower() or 'hot'
+if PROTO_MODULE not in MODULES:
+    print(f"【X】未知的 DOUYIN_PROTO={PROTO_MODULE}，使用 hot")
+    PROTO_MODULE = 'hot'
+
+try:
+    module = importlib.import_module(MODULES[PROTO_MODULE])
+except ImportError as e:
+    # douyin_hot.py 未生成时退回完整 schema
+    print(f"【X】加载 {MODULES[PROTO_MODULE]} 失败（{e}），改用 protobuf.douyin_lazy")
+    PROTO_MODULE = 'lazy'
+    module = importlib.import_module(MODULES[PROTO_MODULE])
+
+WebcastImPushFrame = module.WebcastImPushFrame
+WebcastImResponse = module.WebcastImResponse
+WebcastImMessage = module.WebcastImMessage
+WebcastImChatMessage = module.WebcastImChatMessage
+WebcastImGiftMessage = module.WebcastImGiftMessage
+WebcastImLikeMessage = module.WebcastImLikeMessage
+WebcastImMemberMessage = module.WebcastImMemberMessage
+WebcastImSocialMessage = module.WebcastImSocialMessage
+WebcastImRoomUserSeqMessage = module.WebcastImRoomUserSeqMessage
+WebcastImFansclubMessage = module.WebcastImFansclubMessage
+WebcastImControlMessage = module.WebcastImControlMessage
+WebcastImEmojiChatMessage = module.WebcastImEmojiChatMessage
+WebcastImRoomStatsMessage = module.WebcastImRoomStatsMessage
+WebcastImRoomMessage = module.WebcastImRoomMessage
+WebcastImRoomRankMessage = module.WebcastImRoomRankMessage
+WebcastImRoomStreamAdaptationMessage = module.WebcastImRoomStreamAdaptationMessage
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    schema.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+douyin.proto 的轻量解析：消息/字段表、类型引用解析、依赖闭包
+
+只支持本项目 proto 用到的语法（proto3、嵌套 message、repeated、map、标量/消息字段），
+供 build_hot.py 生成热集合模块、douyin_upb.py 构建 upb 描述符使用。
+"""
+
+import os
+import re
+
+from betterproto import casing
+
+PROTO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'douyin.proto')
+
+# 帧外壳 + _wsOnMessage 分发的 13 种消息
+ROOTS = (
+    'Webcast.Im.PushFrame',
+    'Webcast.Im.Response',
+    'Webcast.Im.Message',
+    'Webcast.Im.ChatMessage',
+    'Webcast.Im.GiftMessage',
+    'Webcast.Im.LikeMessage',
+    'Webcast.Im.MemberMessage',
+    'Webcast.Im.SocialMessage',
+    'Webcast.Im.RoomUserSeqMessage',
+    'Webcast.Im.FansclubMessage',
+    'Webcast.Im.ControlMessage',
+    'Webcast.Im.EmojiChatMessage',
+    'Webcast.Im.RoomStatsMessage',
+    'Webcast.Im.RoomMessage',
+    'Webcast.Im.RoomRankMessage',
+    'Webcast.Im.RoomStreamAdaptationMessage',
+)
+
+SCALAR_TYPES = frozenset((
+    'double', 'float', 'int32', 'int64', 'uint32', 'uint64', 'sint32', 'sint64',
+    'fixed32', 'fixed64', 'sfixed32', 'sfixed64', 'bool', 'string', 'bytes',
+))
+
+_TOKEN_RE = re.compile(r'//[^\n]*|/\*.*?\*/|"[^"]*"|[A-Za-z_][\w.]*|\d+|[{}<>=;,\[\]()]', re.S)
+
+
+class ProtoField:
+    __slots__ = ('name', 'number', 'type', 'repeated', 'key_type')
+
+    def __init__(self, name, number, type_, repeated=False, key_type=None):
+        self.name = name
+        self.number = number
+        self.type = type_
+        self.repeated = repeated
+        self.key_type = key_type
+
+
+def parse_proto(path: str = PROTO_PATH) -> dict:
+    """
+    解析 douyin.proto，返回 {全名: [ProtoField]}，全名形如 Webcast.Im.ChatMessage
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tokens = [t for t in _TOKEN_RE.findall(f.read()) if not t.startswith(('//', '/*'))]
+
+    messages = {}
+    scope = []
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok in ('syntax', 'package', 'option', 'import', 'reserved'):
+            while tokens[i] != ';':
+                i += 1
+        elif tok == 'message':
+            scope.append(tokens[i + 1])
+            messages['.'.join(scope)] = []
+            i += 2  # 跳过名字和 {
+        elif tok == '}':
+            scope.pop()
+        elif tok == 'map':
+            # map < key , value > name = number ;
+            key, value, name, number = tokens[i + 2], tokens[i + 4], tokens[i + 6], tokens[i + 8]
+            messages['.'.join(scope)].append(ProtoField(name, int(number), value, key_type=key))
+            i += 9
+        elif scope and tok != ';':
+            repeated = tok == 'repeated'
+            if repeated:
+                i += 1
+            type_, name, number = tokens[i], tokens[i + 1], tokens[i + 3]
+            messages['.'.join(scope)].append(ProtoField(name, int(number), type_, repeated))
+            i += 4
+            while tokens[i] != ';':  # [packed = true] 等字段选项
+                i += 1
+        i += 1
+    return messages
+
+
+def resolve(messages: dict, scope: str, ref: str) -> str:
+    """按 protobuf 的作用域规则，从内向外查找类型引用"""
+    parts = scope.split('.')
+    head = ref.split('.')[0]
+    for n in range(len(parts), -1, -1):
+        prefix = '.'.join(parts[:n])
+        if (f"{prefix}.{head}" if prefix else head) in messages:
+            full = f"{prefix}.{ref}" if prefix else ref
+            if full in messages:
+                return full
+            break
+    raise KeyError(f"{scope}: 无法解析类型 {ref}")
+
+
+def closure(messages: dict, roots) -> list:
+    """从根消息出发收集所有被引用的消息，保持 proto 中的定义顺序"""
+    seen = set()
+    pending = list(roots)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        for field in messages[name]:
+            if field.type not in SCALAR_TYPES:
+                pending.append(resolve(messages, name, field.type))
+    return [name for name in messages if name in seen]
+
+
+def class_name(full_name: str) -> str:
+    """与 betterproto 插件一致的类名：Webcast.Im.ChatMessage -> WebcastImChatMessage"""
+    return casing.pascal_case('_'.join(full_name.split('.')))
@@ -0,0 +1,292 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    reconnect.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+断线重连策略：指数退避 + 全抖动、每个直播间一个熔断器、进程内共用的重连令牌桶
+
+    Backoff         第 n 次重试等待 random(0, min(cap, base * multiplier ** n))（full jitter），
+                    平台故障时各直播间的重连时间被打散，不会同一时刻一起重连、一起重新签名
+    CircuitBreaker  连续失败 failure_threshold 次后熔断（open），reset_timeout 秒内不再重连；
+                    到期后半开（half_open）放一次试探连接，成功则闭合，失败则重新熔断
+    TokenBucket     整个进程每秒最多 rate 次重连（允许 burst 次突发），用预约的方式返回需要再等的秒数
+
+ReconnectPolicy 把三者组合起来，抓取器只调用：
+    policy.connected()              握手成功
+    policy.healthy()                收到并解出第一帧
+    delay = policy.next_delay()     连接断开/失败后，下一次连接前要等多久
+握手成功不算恢复：服务器接受后马上断开（封禁、抖动）时照样退避、计入熔断；
+收到第一帧或连接保持 min_uptime 秒以上，才清零退避、闭合熔断器。
+
+时间都取自 clock（monotonic() / sleep()），换成 FakeClock 就能在不真正等待的情况下验证策略：
+
+    clock = FakeClock()
+    policy = ReconnectPolicy(clock=clock, limiter=TokenBucket(1, 1, clock=clock))
+    clock.sleep(policy.next_delay())
+"""
+
+import os
+import random
+import threading
+import time
+
+
+class SystemClock:
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class FakeClock:
+    """手动推进的时钟；sleep 直接把时间往前拨"""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self.now += seconds
+
+    advance = sleep
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class Backoff:
+    """
+    参数:
+        base:       第一次重试的等待上限（秒）
+        cap:        等待上限的封顶（秒）
+        multiplier: 每次失败等待上限的倍数
+        rng:        返回 [0, 1) 的随机函数，测试时可替换成固定值
+    """
+
+    def __init__(self, base: float = 5, cap: float = 300, multiplier: float = 2, rng=random.random):
+        self.base = base
+        self.cap = cap
+        self.multiplier = multiplier
+        self.rng = rng
+
+    def ceiling(self, attempt: int) -> float:
+        # 指数部分封顶，避免 attempt 很大时溢出
+        if attempt > 64:
+            return self.cap
+        return min(self.cap, self.base * self.multiplier ** attempt)
+
+    def delay(self, attempt: int) -> float:
+        return self.rng() * self.ceiling(attempt)
+
+
+class CircuitBreaker:
+    """
+    参数:
+        failure_threshold: 连续失败多少次后熔断
+        reset_timeout:     熔断多久后半开，放一次试探连接（秒）
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60, clock=SYSTEM_CLOCK):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self.remaining() <= 0:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def remaining(self) -> float:
+        """距离允许试探还有多少秒；未熔断时为 0"""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - self.clock.monotonic())
+
+    def allow(self) -> bool:
+        return self.state != self.OPEN
+
+    def record_success(self):
+        self._state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        # 半开状态下的试探失败立即重新熔断
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                self.trips += 1
+            self._state = self.OPEN
+            self.opened_at = self.clock.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "remaining": round(self.remaining(), 3),
+        }
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶，预约式：reserve() 立即扣一个令牌（可以欠），返回还要等多少秒才轮到
+
+    参数:
+        rate:  每秒补充的令牌数
+        burst: 桶容量，允许的突发次数
+    """
+
+    def __init__(self, rate: float = 2, burst: int = 10, clock=SYSTEM_CLOCK):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated = clock.monotonic()
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.delayed = 0
+
+    def reserve(self, after: float = 0.0) -> float:
+        """预约 after 秒之后的一个令牌，返回在 after 之外还需等待的秒数"""
+        with self._lock:
+            now = self.clock.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # after 秒内自然补充的令牌也算进去，但不超过桶容量
+            available = min(self.burst, self._tokens + after * self.rate)
+            self._tokens -= 1
+            self.granted += 1
+            if available >= 1:
+                return 0.0
+            self.delayed += 1
+            return (1 - available) / self.rate
+
+    def stats(self) -> dict:
+        with self._lock:
+            tokens = self._tokens
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(tokens, 3),
+            "granted": self.granted,
+            "delayed": self.delayed,
+        }
+
+
+class ReconnectPolicy:
+    """
+    一个直播间的重连策略
+
+    参数:
+        backoff:  Backoff，默认 base=5 秒、封顶 300 秒
+        breaker:  CircuitBreaker，默认连续失败 5 次熔断 60 秒
+        limiter:  TokenBucket，默认进程内共用的 get_reconnect_limiter()；传 False 表示不限速
+        clock:    时钟，默认系统时钟
+        min_uptime: 没收到帧时，连接至少保持多少秒才算恢复
+    """
+
+    def __init__(self, backoff: Backoff = None, breaker: CircuitBreaker = None, limiter=None, clock=SYSTEM_CLOCK,
+                 min_uptime: float = 30):
+        self.clock = clock
+        self.min_uptime = min_uptime
+        self.backoff = backoff or Backoff()
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        if limiter is None:
+            limiter = get_reconnect_limiter()
+        self.limiter = limiter or None
+        self.attempt = 0
+        self._opened_at = None
+        self._healthy = False
+        self.reconnects = 0
+        self.flaps = 0
+        # 上一次断开是否是“握手成功但没收到帧就断了”
+        self.flapped = False
+
+    def connected(self):
+        """握手成功；要等 healthy() 或保持 min_uptime 秒才清零退避"""
+        self._opened_at = self.clock.monotonic()
+        self._healthy = False
+
+    def healthy(self):
+        """连接已确认可用（收到第一帧）：退避清零，熔断器闭合；可重复调用，不在连接中时忽略"""
+        if self._healthy or self._opened_at is None:
+            return
+        self._healthy = True
+        self.attempt = 0
+        self.breaker.record_success()
+
+    def next_delay(self) -> float:
+        """连接断开或连接失败后调用，返回下一次连接前应等待的秒数"""
+        opened_at = self._opened_at
+        if opened_at is not None and self.clock.monotonic() - opened_at >= self.min_uptime:
+            self.healthy()
+        self.flapped = opened_at is not None and not self._healthy
+        if self.flapped:
+            self.flaps += 1
+        if not self._healthy:
+            self.breaker.record_failure()
+        self._opened_at = None
+        self._healthy = False
+
+        delay = max(self.backoff.delay(self.attempt), self.breaker.remaining())
+        self.attempt += 1
+        if self.limiter is not None:
+            delay += self.limiter.reserve(delay)
+        self.reconnects += 1
+        return delay
+
+    @property
+    def state(self) -> str:
+        return self.breaker.state
+
+    def stats(self) -> dict:
+        result = {
+            "attempt": self.attempt,
+            "reconnects": self.reconnects,
+            "flaps": self.flaps,
+            "breaker": self.breaker.stats(),
+        }
+        if self.limiter is not None:
+            result["limiter"] = self.limiter.stats()
+        return result
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # 每个工作进程各有一个令牌桶
+    global _limiter, _limiter_lock
+    _limiter = None
+    _limiter_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_reconnect_limiter() -> TokenBucket:
+    """获取进程内共享的重连令牌桶"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = TokenBucket()
+        return _limiter
@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    recorder.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+录制收到的原始 WebSocket 帧（给 benchmarks 回放用）
+
+文件格式：每帧前面是 4 字节大端长度，后面是原始的 PushFrame 二进制
+
+    抓取时设置环境变量（或给抓取器传 record_frames=路径），路径里的 {live_id} 换成直播间 id：
+        DOUYIN_RECORD_FRAMES=frames-{live_id}.bin python main.py
+    回放：
+        python -m benchmarks.decoder_speed --frames frames-<live_id>.bin
+"""
+
+import struct
+import threading
+
+_LEN = struct.Struct('>I')
+
+
+def load_frames(path: str) -> list:
+    frames = []
+    with open(path, 'rb') as f:
+        while True:
+            head = f.read(_LEN.size)
+            if len(head) < _LEN.size:
+                break
+            frames.append(f.read(_LEN.unpack(head)[0]))
+    return frames
+
+
+def dump_frames(path: str, frames):
+    with open(path, 'wb') as f:
+        for frame in frames:
+            f.write(_LEN.pack(len(frame)))
+            f.write(frame)
+
+
+class FrameRecorder:
+    """边抓边录，按上面的格式追加写入；线程安全"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'ab')
+        self._lock = threading.Lock()
+        self.frames = 0
+
+    def write(self, frame: bytes):
+        with self._lock:
+            if self._file is not None:
+                self._file.write(_LEN.pack(len(frame)) + frame)
+                self.frames += 1
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    room_page.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+流式提取直播页里的 room_id 等启动字段
+
+直播页 live.douyin.com/<live_id> 有几百 KB，room_id 在页面里的 JSON（转义后的字符串）中。
+RoomPageScanner 按块喂入原始字节，在块与块之间保留一小段重叠，字段不会被切断；
+必需字段（room_id）和可选字段（nickname / status）全部找到就返回 True，调用方停止读取并关闭连接，
+不用下载、解码整个页面。可选字段可能在 room_id 之后很远的地方，所以找到 room_id 后最多再读 extra_window 字节
+（默认 256 KiB，与整个页面同一量级）才放弃可选字段；页面里缺少某个可选字段时才会读到这个上限。
+只要 room_id、可以不要可选字段时传 extra_window=0。
+
+    scanner = RoomPageScanner()
+    for chunk in resp.iter_content(16 * 1024):
+        if scanner.feed(chunk):
+            break
+    resp.close()
+    scanner.result    # {'room_id': '7392...', 'nickname': '...', 'status': 2}
+"""
+
+import json
+import re
+
+# 字段名 -> 页面中转义 JSON 的匹配（字节），第一个分组是值；长度都有上限，便于确定块间重叠
+ROOM_PAGE_FIELDS = {
+    'room_id': re.compile(rb'roomId\\":\\"(\d{1,32})\\"'),
+    'status': re.compile(rb'\\"id_str\\":\\"\d{1,32}\\",\\"status\\":(\d{1,3}),'),
+    'nickname': re.compile(rb'\\"anchor\\":\{\\"id_str\\":\\"\d{1,32}\\",[^{}]{0,512}?\\"nickname\\":\\"((?:[^"\\]|\\\\u[0-9a-fA-F]{4}){0,128})\\"'),
+}
+
+# 房间状态：2 正在直播，4 已结束
+LIVE_STATUS = {2: '正在直播', 4: '已结束'}
+
+
+def _value(name: str, raw: bytes):
+    if name == 'status':
+        return int(raw)
+    text = raw.decode('utf-8', 'replace')
+    if '\\' in text:
+        # 转义 JSON 里的 \\uXXXX
+        try:
+            text = json.loads('"' + text.replace('\\\\', '\\') + '"')
+        except ValueError:
+            pass
+    return text
+
+
+class RoomPageScanner:
+    """
+    参数:
+        fields:       要提取的字段，默认 ROOM_PAGE_FIELDS
+        required:     必需字段，全部找到后才可能提前结束
+        extra_window: 必需字段找齐后，为可选字段最多再读多少字节；0 表示找到必需字段就结束
+        overlap:      块间保留的字节数，需不小于最长的一次匹配
+    """
+
+    def __init__(self, fields: dict = None, required=('room_id',), extra_window: int = 256 * 1024,
+                 overlap: int = 2048):
+        self.fields = ROOM_PAGE_FIELDS if fields is None else fields
+        self.required = tuple(required)
+        self.extra_window = extra_window
+        self.overlap = overlap
+        self.result = {}
+        self.bytes_read = 0
+        self.done = False
+        self._pending = dict(self.fields)
+        self._tail = b''
+        self._required_at = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """喂入一块数据，可以停止读取时返回 True"""
+        if self.done:
+            return True
+        self.bytes_read += len(chunk)
+        buf = self._tail + chunk
+        for name, pattern in list(self._pending.items()):
+            match = pattern.search(buf)
+            if match is not None:
+                self.result[name] = _value(name, match.group(1))
+                del self._pending[name]
+        self._tail = buf[-self.overlap:]
+
+        if self._required_at is None and all(name in self.result for name in self.required):
+            self._required_at = self.bytes_read
+        if self._required_at is not None:
+            if not self._pending or self.bytes_read - self._required_at >= self.extra_window:
+                self.done = True
+        return self.done
+
+    @property
+    def room_id(self):
+        return self.result.get('room_id')
@@ -0,0 +1,341 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    scheduler.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+多进程分片调度：把房间列表按 live_id 一致性哈希分到 N 个工作进程
+
+    python scheduler.py rooms.txt                  # 默认进程数 = CPU 核数
+    python scheduler.py rooms.txt -w 4 --decoder partial
+
+每个工作进程内部是一个 RoomSupervisor（不读文件，由调度进程下发 add/remove）。
+工作进程退出后用同一编号重启，直播间原样恢复；反复退出的进程从哈希环上摘掉，
+一致性哈希保证只有它名下的直播间迁到其余进程，其他直播间不动。
+
+预热与共享：调度进程先导入 protobuf 消息模块、构建解码器、加载原生 sign，再 fork 出工作进程，
+这些状态直接继承（写时复制），新进程不用重新加载。V8（a_bogus）不能安全地跨 fork 使用，
+由工作进程在第一次查询直播间状态时各自创建；连接弹幕只用到原生 sign，不等 V8。
+Windows 没有 fork，只能 spawn，各进程自行加载。
+"""
+
+import argparse
+import bisect
+import hashlib
+import importlib
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+from archive import FORMATS
+from console import CONSOLE_MODES
+from credentials import default_path
+from supervisor import CREDENTIALS_HELP, MODES, STOP_TIMEOUT, RoomSupervisor, read_rooms
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+
+
+class HashRing:
+    """一致性哈希环，每个节点放 replicas 个虚拟节点"""
+
+    def __init__(self, nodes=(), replicas: int = 64):
+        self.replicas = replicas
+        self._keys = []
+        self._nodes = {}
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node):
+        for i in range(self.replicas):
+            key = _hash(f"{node}#{i}")
+            bisect.insort(self._keys, key)
+            self._nodes[key] = node
+
+    def remove(self, node):
+        for i in range(self.replicas):
+            key = _hash(f"{node}#{i}")
+            index = bisect.bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                del self._keys[index]
+                del self._nodes[key]
+
+    def get(self, key: str):
+        if not self._keys:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._nodes[self._keys[index]]
+
+    def __len__(self):
+        return len(self._keys) // self.replicas
+
+
+def _worker_main(worker_id: int, commands, results, log_root: str, mode: str, fetcher_kwargs: dict):
+    """工作进程：按调度进程的指令增删直播间、回报统计，空闲时检查已退出的直播间"""
+    supervisor = RoomSupervisor(None, log_root=log_root, mode=mode, **fetcher_kwargs)
+    try:
+        while True:
+            try:
+                command, arg = commands.get(timeout=supervisor.poll_interval)
+            except queue.Empty:
+                command, arg = None, None
+            supervisor.check()
+            if command == 'add':
+                supervisor.add(arg)
+            elif command == 'remove':
+                supervisor.remove(arg)
+            elif command == 'stats':
+                results.put((worker_id, arg, {"pid": os.getpid(), "rooms": supervisor.stats()}))
+            elif command == 'stop':
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+
+
+class _Worker:
+    __slots__ = ('id', 'process', 'commands', 'rooms')
+
+    def __init__(self, worker_id, process, commands):
+        self.id = worker_id
+        self.process = process
+        self.commands = commands
+        self.rooms = set()
+
+
+class ShardedScheduler:
+    """
+    参数:
+        rooms_file:    房间列表文件（同 supervisor.py）
+        workers:       工作进程数，默认 CPU 核数
+        log_root:      日志根目录，每个直播间一个子目录
+        mode:          工作进程内的运行方式，见 supervisor.MODES
+        poll_interval: 检查房间列表与工作进程存活的间隔（秒）
+        max_restarts / restart_window: 工作进程在窗口内退出超过这个次数就不再重启，直播间迁到其余进程
+        fetcher_kwargs: 透传给抓取器（restart_delay 交给工作进程的 RoomSupervisor）；
+                        credential_cache 默认用 sqlite（credentials.db），各工作进程共用
+    """
+
+    def __init__(self, rooms_file: str, workers: int = None, log_root: str = None, mode: str = 'thread',
+                 poll_interval: float = 5, max_restarts: int = 3, restart_window: float = 60, **fetcher_kwargs):
+        if mode not in MODES:
+            raise ValueError(f"未知的运行模式: {mode}，可选 {MODES}")
+        self.rooms_file = rooms_file
+        self.size = workers or os.cpu_count() or 1
+        self.log_root = log_root
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        # 多个工作进程同时写凭据缓存，默认用 sqlite，由 sqlite 加锁
+        if fetcher_kwargs.get('credential_cache') is None:
+            fetcher_kwargs['credential_cache'] = default_path('.db')
+        self.fetcher_kwargs = fetcher_kwargs
+
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        self._results = self._ctx.Queue()
+        self._workers = {}
+        self._next_id = 0
+        self._ring = HashRing()
+        self._restarts = {}
+        self._rooms = []
+        self._mtime = None
+        self._stopped = False
+
+    def warmup(self):
+        """fork 之前在调度进程里加载可共享的状态"""
+        from decoder import get_decoder
+        from signer import get_signer
+
+        importlib.import_module('liveMan')
+        get_decoder(self.fetcher_kwargs.get('decoder', 'betterproto'))
+        signer = get_signer()
+        if signer.native:
+            signer.sign('0' * 32)
+
+    def _spawn(self, worker_id: int = None) -> _Worker:
+        if worker_id is None:
+            worker_id = self._next_id
+            self._next_id += 1
+            self._ring.add(worker_id)
+        commands = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, commands, self._results, self.log_root, self.mode, self.fetcher_kwargs),
+            name=f"rooms-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        worker = _Worker(worker_id, process, commands)
+        self._workers[worker_id] = worker
+        print(f"【√】工作进程 {worker_id} 已启动 (pid={process.pid})")
+        return worker
+
+    def _rebalance(self):
+        """按哈希环把每个直播间放到应在的进程上，只移动归属变化的直播间"""
+        wanted = set(self._rooms)
+        for worker in self._workers.values():
+            for live_id in list(worker.rooms):
+                if live_id not in wanted or self._ring.get(live_id) != worker.id:
+                    worker.commands.put(('remove', live_id))
+                    worker.rooms.discard(live_id)
+        for live_id in self._rooms:
+            worker = self._workers[self._ring.get(live_id)]
+            if live_id not in worker.rooms:
+                worker.commands.put(('add', live_id))
+                worker.rooms.add(live_id)
+
+    def check_workers(self) -> bool:
+        """
+        处理已退出的工作进程，有变化时返回 True：
+        用同一个编号补一个新进程，哈希环不变，直播间原样回到新进程；
+        同一编号在 restart_window 秒内退出超过 max_restarts 次，就把它从哈希环上摘掉，直播间迁到其余进程。
+        """
+        dead = [worker for worker in self._workers.values() if not worker.process.is_alive()]
+        if not dead:
+            return False
+
+        now = time.monotonic()
+        for worker in dead:
+            del self._workers[worker.id]
+            history = [t for t in self._restarts.get(worker.id, ()) if now - t < self.restart_window]
+            history.append(now)
+            self._restarts[worker.id] = history
+
+            if len(history) > self.max_restarts and self._workers:
+                self._ring.remove(worker.id)
+                print(f"【X】工作进程 {worker.id} 频繁退出，摘除并迁移 {len(worker.rooms)} 个直播间")
+            else:
+                print(f"【!】工作进程 {worker.id} 已退出 (exitcode={worker.process.exitcode})，重启并恢复 {len(worker.rooms)} 个直播间")
+                self._spawn(worker.id)
+        self._rebalance()
+        return True
+
+    def reload(self) -> bool:
+        try:
+            mtime = os.stat(self.rooms_file).st_mtime
+        except OSError as e:
+            print(f"【X】读取房间列表失败: {e}")
+            return False
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        self._rooms = read_rooms(self.rooms_file)
+        self._rebalance()
+        return True
+
+    def start(self):
+        self.warmup()
+        for _ in range(self.size):
+            self._spawn()
+
+    def run(self):
+        """阻塞运行，直到 stop() 或 Ctrl+C"""
+        self.start()
+        try:
+            while not self._stopped:
+                self.reload()
+                self.check_workers()
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = STOP_TIMEOUT + 5):
+        """
+        通知所有工作进程停止，共用同一个截止时间等待，超时的强制结束；
+        工作进程里各直播间并行停止（最多 STOP_TIMEOUT 秒），另留几秒关闭共用的 HTTP 会话
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        for worker in self._workers.values():
+            if worker.process.is_alive():
+                worker.commands.put(('stop', None))
+        deadline = time.monotonic() + timeout
+        for worker in self._workers.values():
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+        self._workers.clear()
+
+    def assignments(self) -> dict:
+        """当前分配：{worker_id: [live_id, ...]}"""
+        return {worker.id: sorted(worker.rooms) for worker in self._workers.values()}
+
+    def stats(self, timeout: float = 5) -> dict:
+        """向所有工作进程要统计并合并：每个直播间的指标 + 每个进程的直播间数"""
+        token = time.monotonic_ns()
+        alive = [worker for worker in self._workers.values() if worker.process.is_alive()]
+        for worker in alive:
+            worker.commands.put(('stats', token))
+
+        workers = {}
+        rooms = {}
+        deadline = time.monotonic() + timeout
+        while len(workers) < len(alive):
+            try:
+                worker_id, reply_token, data = self._results.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if reply_token != token:
+                continue
+            workers[worker_id] = {"pid": data["pid"], "rooms": len(data["rooms"])}
+            for live_id, room in data["rooms"].items():
+                room["worker"] = worker_id
+                rooms[live_id] = room
+
+        acks = sum(room["ack"]["lag"]["count"] for room in rooms.values())
+        return {
+            "workers": workers,
+            "rooms": rooms,
+            "total": {"workers": len(workers), "rooms": len(rooms), "acks": acks},
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多进程分片调度")
+    parser.add_argument("rooms_file", help="房间列表文件，每行一个 live_id")
+    parser.add_argument("-w", "--workers", type=int, help="工作进程数，默认 CPU 核数")
+    parser.add_argument("--log-root", help="日志根目录，每个直播间一个子目录")
+    parser.add_argument("--mode", choices=MODES, default='thread')
+    parser.add_argument("--decoder", default='betterproto')
+    parser.add_argument("--abogus-backend", default='mini_racer')
+    parser.add_argument("--poll-interval", type=float, default=5)
+    parser.add_argument("--restart-delay", type=float, default=60, help="直播间退出后多久重新连接（秒）")
+    parser.add_argument("--console", choices=CONSOLE_MODES, default='all',
+                        help="控制台输出：all 全部打印，throttle 限速并汇总，quiet 不打印（日志照常写入）")
+    parser.add_argument("--credentials", help=CREDENTIALS_HELP)
+    parser.add_argument("--archive", choices=tuple(FORMATS),
+                        help="每场的事件另存为 Parquet / Arrow 列式文件（需要 pyarrow）")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.rooms_file):
+        print(f"【X】房间列表不存在: {args.rooms_file}")
+        sys.exit(1)
+
+    scheduler = ShardedScheduler(
+        args.rooms_file,
+        workers=args.workers,
+        log_root=args.log_root,
+        mode=args.mode,
+        poll_interval=args.poll_interval,
+        restart_delay=args.restart_delay,
+        decoder=args.decoder,
+        abogus_backend=args.abogus_backend,
+        console=args.console,
+        archive=args.archive,
+        credential_cache=args.credentials,
+    )
+    scheduler.run()
+
+
+if __name__ == '__main__':
+    main()
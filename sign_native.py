@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    sign_native.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+sign.js 中 get_sign 的纯 Python 实现
+
+get_sign(md5) 实际调用的是 byted_acrawler 的 frontierSign({'X-MS-STUB': md5})，
+输出 X-Bogus 的 WebSocket 变体（16 个字符）。结构如下：
+
+    header  = kWebsocket << 6 | initialized << 5 | (随机位) << 4
+    body    = [bogusIndex & 63, envcode >> 8, envcode & 255, ubcode,
+               md5(md5(''))[14:16], md5(bytes(stub))[14:16], 随机字节, 前 9 字节异或]
+    key     = 随机字节
+    result  = base64_s1(header + key + rc4(key, body))
+
+sign.js 在无浏览器事件的环境中 initialized=0、envcode=1、ubcode=14 恒定，
+随机数的取用顺序与 JS 一致，因此注入相同的随机序列时输出与 sign.js 完全相同。
+"""
+
+import hashlib
+import math
+import random
+import threading
+from functools import lru_cache
+
+_ALPHABET = "Dkdpgh4ZKsQB80/Mfvw36XI1R25+WUAlEi7NLboqYTOPuzmFjJnryx9HVGcaStCe"
+
+_KIND_WEBSOCKET = 1
+_INITIALIZED = 0
+_ENVCODE = 1
+_UBCODE = 14  # kNoMove | kNoClickTouch | kNoKeyboardEvent
+_EMPTY_STUB = '00000000000000000000000000000000'
+_EMPTY_QUERY_TAIL = hashlib.md5(hashlib.md5(b'').digest()).digest()[14:]
+
+_BODY_LEN = 10
+
+
+@lru_cache(maxsize=256)
+def _keystream(key: int) -> bytes:
+    """单字节密钥的 RC4 密钥流，body 长度固定，按密钥缓存"""
+    s = list(range(256))
+    j = 0
+    for i in range(256):
+        j = (j + s[i] + key) & 255
+        s[i], s[j] = s[j], s[i]
+    i = j = 0
+    out = bytearray()
+    for _ in range(_BODY_LEN):
+        i = (i + 1) & 255
+        j = (j + s[i]) & 255
+        s[i], s[j] = s[j], s[i]
+        out.append(s[(s[i] + s[j]) & 255])
+    return bytes(out)
+
+
+def _encode(data: bytes) -> str:
+    chars = []
+    for i in range(0, len(data), 3):
+        n = data[i] << 16 | data[i + 1] << 8 | data[i + 2]
+        chars.append(_ALPHABET[n >> 18 & 63])
+        chars.append(_ALPHABET[n >> 12 & 63])
+        chars.append(_ALPHABET[n >> 6 & 63])
+        chars.append(_ALPHABET[n & 63])
+    return ''.join(chars)
+
+
+class NativeSigner:
+    """
+    get_sign 的 Python 实现
+
+    参数:
+        rand: 随机数来源，返回 [0, 1) 的浮点数，默认 random.random；
+              对拍时注入与 JS 相同的序列即可得到一致的结果
+    """
+
+    def __init__(self, rand=None):
+        self._rand = rand or random.random
+        self._index = 0
+        self._lock = threading.Lock()
+
+    def get_sign(self, md5_param: str) -> str:
+        stub = bytes.fromhex(md5_param or _EMPTY_STUB)
+        rand = self._rand
+
+        with self._lock:
+            self._index += 1
+            index = self._index & 63
+            flag = 1 & math.floor(100 * rand())
+            salt = 255 & math.floor(255 * rand())
+            key = 255 & math.floor(255 * rand())
+
+        header = _KIND_WEBSOCKET << 6 | _INITIALIZED << 5 | flag << 4
+        body = bytearray((index, _ENVCODE >> 8 & 255, _ENVCODE & 255, _UBCODE))
+        body += _EMPTY_QUERY_TAIL
+        body += hashlib.md5(stub).digest()[14:]
+        body.append(salt)
+
+        check = 0
+        for b in body:
+            check ^= b
+        body.append(check)
+
+        stream = _keystream(key)
+        return _encode(bytes([header, key]) + bytes(b ^ k for b, k in zip(body, stream)))
+
+
+_default = NativeSigner()
+
+
+def get_sign(md5_param: str) -> str:
+    return _default.get_sign(md5_param)
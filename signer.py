@@ -0,0 +1,310 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    signer.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+常驻 JS 签名器
+
+sign.js 只加载一次到长期存活的 V8 上下文中，所有 DouyinLiveWebFetcher 实例共享，
+避免每次重连都重新读取脚本、创建 MiniRacer 并 eval 整个 sign.js。
+a_bogus.js 同理，由 ABogusSigner 编译一次后常驻，按池分发 get_ab 调用。
+"""
+
+import codecs
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+
+import sign_native
+from metrics import LatencyStats
+
+
+def resource_path(relative_path: str) -> str:
+    """
+    获取资源文件的实际路径，兼容 PyInstaller 打包后的环境
+    """
+    if hasattr(sys, '_MEIPASS'):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(__file__)
+    return os.path.join(base_path, relative_path)
+
+
+def execute_js(js_file: str):
+    import execjs
+
+    js_path = resource_path(js_file)
+    with open(js_path, 'r', encoding='utf-8') as file:
+        js_code = file.read()
+    ctx = execjs.compile(js_code)
+    return ctx
+
+
+class SignatureSigner:
+    """
+    sign.js 的 get_sign 签名器，线程安全，上下文崩溃后自动重建
+
+    native 为 True 时优先使用 sign_native 的 Python 实现，不加载 V8；
+    Python 实现出错时回退到 MiniRacer。默认只对 sign.js 启用。
+    """
+
+    def __init__(self, script_file: str = 'sign.js', native: bool = None):
+        self.script_file = script_file
+        self.native = script_file == 'sign.js' if native is None else native
+        self._script = None
+        self._ctx = None
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.failures = 0
+        self.loads = 0
+        self.latency = LatencyStats()
+        self.native_calls = 0
+        self.native_failures = 0
+        self.native_latency = LatencyStats()
+
+    def _load(self):
+        from py_mini_racer import MiniRacer
+
+        if self._script is None:
+            script_path = resource_path(self.script_file)
+            with codecs.open(script_path, 'r', encoding='utf8') as f:
+                self._script = f.read()
+
+        ctx = MiniRacer()
+        ctx.eval(self._script)
+        self._ctx = ctx
+        self.loads += 1
+
+    def warmup(self):
+        """提前加载 sign.js，避免第一次连接时才付出加载开销"""
+        if self.native:
+            return
+        with self._lock:
+            if self._ctx is None:
+                self._load()
+
+    def sign(self, md5_param: str) -> str:
+        if self.native:
+            try:
+                with self.native_latency.time():
+                    signature = sign_native.get_sign(md5_param)
+                self.native_calls += 1
+                return signature
+            except Exception:
+                self.native_failures += 1
+
+        with self._lock, self.latency.time():
+            self.calls += 1
+            if self._ctx is None:
+                self._load()
+            try:
+                return self._ctx.call("get_sign", md5_param)
+            except Exception:
+                # 上下文可能已经损坏（OOM、被终止等），丢弃后重建再试一次
+                self.failures += 1
+                self._ctx = None
+                self._load()
+                return self._ctx.call("get_sign", md5_param)
+
+    def reset(self):
+        """丢弃当前上下文，下次调用时重新加载"""
+        with self._lock:
+            self._ctx = None
+
+    def stats(self) -> dict:
+        return {
+            "script": self.script_file,
+            "calls": self.calls,
+            "failures": self.failures,
+            "loads": self.loads,
+            "latency": self.latency.snapshot(),
+            "native": self.native,
+            "native_calls": self.native_calls,
+            "native_failures": self.native_failures,
+            "native_latency": self.native_latency.snapshot(),
+        }
+
+
+_signers = {}
+_signers_lock = threading.Lock()
+
+
+def get_signer(script_file: str = 'sign.js') -> SignatureSigner:
+    """获取进程内共享的签名器，同一个脚本只会有一个实例"""
+    with _signers_lock:
+        signer = _signers.get(script_file)
+        if signer is None:
+            signer = _signers[script_file] = SignatureSigner(script_file)
+        return signer
+
+
+class _NodeRuntime:
+    """常驻的 node 子进程，脚本只加载一次，之后按行收发 JSON 调用"""
+
+    _BOOTSTRAP = r"""
+const fs = require('fs');
+const vm = require('vm');
+const readline = require('readline');
+vm.runInThisContext(fs.readFileSync(process.argv[1], 'utf8'));
+readline.createInterface({input: process.stdin}).on('line', (line) => {
+    let out;
+    try {
+        const req = JSON.parse(line);
+        out = {ok: globalThis[req[0]].apply(null, req[1])};
+    } catch (e) {
+        out = {error: String(e)};
+    }
+    process.stdout.write(JSON.stringify(out) + '\n');
+});
+"""
+
+    def __init__(self, script_path: str, node: str = 'node'):
+        self._proc = subprocess.Popen(
+            [node, '-e', self._BOOTSTRAP, script_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding='utf-8',
+            bufsize=1,
+        )
+
+    def call(self, name: str, *args):
+        self._proc.stdin.write(json.dumps([name, list(args)]) + '\n')
+        self._proc.stdin.flush()
+        line = self._proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"node 进程已退出: {self._proc.poll()}")
+        resp = json.loads(line)
+        if 'error' in resp:
+            raise RuntimeError(resp['error'])
+        return resp.get('ok')
+
+    def close(self):
+        try:
+            self._proc.kill()
+        except Exception:
+            pass
+
+
+class ABogusSigner:
+    """
+    a_bogus.js 签名服务：脚本只编译一次，运行时常驻，get_ab 调用从池中取运行时执行
+
+    backend:
+        mini_racer  进程内 V8（与 sign.js 相同的引擎），默认
+        node        常驻 node 子进程，只启动一次
+        execjs      PyExecJS 编译一次；外部运行时下每次调用仍会拉起进程，仅作兼容
+    """
+
+    BACKENDS = ('mini_racer', 'node', 'execjs')
+
+    def __init__(self, script_file: str = 'a_bogus.js', backend: str = 'mini_racer', pool_size: int = 2):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"未知的 a_bogus 后端: {backend}")
+        self.script_file = script_file
+        self.backend = backend
+        self.pool_size = max(1, pool_size)
+        self._script = None
+        self._pool = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.failures = 0
+        self.latency = LatencyStats()
+
+    def _create(self):
+        if self.backend == 'execjs':
+            return execute_js(self.script_file)
+        if self.backend == 'node':
+            return _NodeRuntime(resource_path(self.script_file))
+
+        from py_mini_racer import MiniRacer
+
+        if self._script is None:
+            with open(resource_path(self.script_file), 'r', encoding='utf-8') as f:
+                self._script = f.read()
+        ctx = MiniRacer()
+        ctx.eval(self._script)
+        return ctx
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.pool_size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if not create:
+            return self._pool.get()
+        try:
+            return self._create()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _discard(self, runtime):
+        with self._lock:
+            self._created -= 1
+        if isinstance(runtime, _NodeRuntime):
+            runtime.close()
+
+    def warmup(self):
+        """预先创建一个运行时放入池中"""
+        self._pool.put(self._acquire())
+
+    def get_ab(self, params: str, user_agent: str) -> str:
+        with self.latency.time():
+            with self._lock:
+                self.calls += 1
+            runtime = self._acquire()
+            try:
+                result = runtime.call("get_ab", params, user_agent)
+            except Exception:
+                # 运行时异常后丢弃，换一个新的再试一次
+                with self._lock:
+                    self.failures += 1
+                self._discard(runtime)
+                runtime = self._acquire()
+                try:
+                    result = runtime.call("get_ab", params, user_agent)
+                except Exception:
+                    self._discard(runtime)
+                    raise
+            self._pool.put(runtime)
+            return result
+
+    def stats(self) -> dict:
+        return {
+            "script": self.script_file,
+            "backend": self.backend,
+            "pool_size": self.pool_size,
+            "runtimes": self._created,
+            "calls": self.calls,
+            "failures": self.failures,
+            "latency": self.latency.snapshot(),
+        }
+
+
+_abogus_signers = {}
+
+
+def get_abogus_signer(script_file: str = 'a_bogus.js', backend: str = 'mini_racer') -> ABogusSigner:
+    """获取进程内共享的 a_bogus 签名服务，同一脚本同一后端只会有一个实例"""
+    with _signers_lock:
+        key = (script_file, backend)
+        signer = _abogus_signers.get(key)
+        if signer is None:
+            signer = _abogus_signers[key] = ABogusSigner(script_file, backend)
+        return signer
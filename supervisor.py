@@ -0,0 +1,306 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    supervisor.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+多直播间守护：一个进程跑房间列表里的所有直播间
+
+    python supervisor.py rooms.txt
+    python supervisor.py rooms.txt --mode async --decoder partial --log-root D:\\douyin_logs
+
+房间列表每行一个 live_id，# 之后是注释；文件修改后自动增删直播间（按修改时间轮询）。
+直播结束或抓取器异常退出的直播间，restart_delay 秒后重新连接，等待下一场开播。
+每个直播间的正式日志和 tmp.log 都在 <log-root>/<live_id>/ 下。
+
+进程内共用：
+    签名   signer.get_signer / get_abogus_signer（启动时预热）
+    解码器 decoder.get_decoder
+    HTTP   thread 模式下所有 requests.Session 挂同一个连接池适配器；async 模式共用一个 aiohttp 会话
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+
+from archive import FORMATS
+from console import CONSOLE_MODES
+from liveMan import DouyinLiveWebFetcher
+from signer import get_abogus_signer, get_signer
+
+MODES = ('thread', 'async')
+
+# 停止时等待直播间退出（排空流水线、关闭日志）的秒数；stop() 时所有直播间并行等待，总共不超过这个时间
+STOP_TIMEOUT = 10
+
+CREDENTIALS_HELP = "凭据缓存文件，.db / .sqlite 后缀用 sqlite（默认 credentials.json；scheduler 默认 credentials.db）"
+
+
+def read_rooms(path: str) -> list:
+    """读取房间列表，保持顺序并去重"""
+    rooms = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            live_id = line.split('#', 1)[0].strip()
+            if live_id and live_id not in rooms:
+                rooms.append(live_id)
+    return rooms
+
+
+class RoomSupervisor:
+    """
+    参数:
+        rooms_file:    房间列表文件
+        log_root:      日志根目录，默认 <项目目录>/formal_logs
+        mode:          thread 每个直播间一个 DouyinLiveWebFetcher 线程；async 所有直播间共用一个事件循环
+        poll_interval: 检查房间列表变化的间隔（秒）
+        pool_size:     thread 模式共享连接池的大小
+        restart_delay: 直播间退出（直播结束等）后多久重新连接（秒）
+        fetcher_kwargs: 透传给抓取器（decoder、abogus_backend 等）
+    """
+
+    def __init__(self, rooms_file: str, log_root: str = None, mode: str = 'thread', poll_interval: float = 5,
+                 pool_size: int = 32, restart_delay: float = 60, **fetcher_kwargs):
+        if mode not in MODES:
+            raise ValueError(f"未知的运行模式: {mode}，可选 {MODES}")
+        self.rooms_file = rooms_file
+        if log_root is None:
+            log_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "formal_logs")
+        self.log_root = os.path.abspath(log_root)
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.restart_delay = restart_delay
+        self.fetcher_kwargs = fetcher_kwargs
+
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._rooms = {}
+        # 已退出的直播间 -> 重新连接的时间（monotonic）
+        self._ended = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._mtime = None
+
+        self._loop = None
+        self._http = None
+
+    def warmup(self):
+        """预热共用的签名运行时，第一批直播间连接时不用再各自加载"""
+        get_signer().warmup()
+        get_abogus_signer(
+            self.fetcher_kwargs.get('abogus_file', 'a_bogus.js'),
+            self.fetcher_kwargs.get('abogus_backend', 'mini_racer'),
+        ).warmup()
+
+    def _room_dir(self, live_id: str) -> str:
+        path = os.path.join(self.log_root, live_id)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def add(self, live_id: str):
+        with self._lock:
+            if live_id in self._rooms:
+                return
+            self._ended.pop(live_id, None)
+            room_dir = self._room_dir(live_id)
+            if self.mode == 'thread':
+                fetcher = DouyinLiveWebFetcher(live_id, log_dir=room_dir, **self.fetcher_kwargs)
+                fetcher.session.mount('https://', self._adapter)
+                fetcher.session.mount('http://', self._adapter)
+                fetcher.tmp_log_path = os.path.join(room_dir, "tmp.log")
+                runner = threading.Thread(target=fetcher.start, name=f"room-{live_id}", daemon=True)
+                runner.start()
+            else:
+                from async_fetcher import AsyncDouyinLiveWebFetcher
+
+                loop = self._ensure_loop()
+                fetcher = AsyncDouyinLiveWebFetcher(live_id, session=self._http, log_dir=room_dir, **self.fetcher_kwargs)
+                fetcher.tmp_log_path = os.path.join(room_dir, "tmp.log")
+                runner = asyncio.run_coroutine_threadsafe(fetcher.run(), loop)
+            self._rooms[live_id] = (fetcher, runner)
+        print(f"【√】已添加直播间 {live_id}，日志目录 {room_dir}")
+
+    def remove(self, live_id: str, timeout: float = STOP_TIMEOUT):
+        with self._lock:
+            room = self._rooms.pop(live_id, None)
+            self._ended.pop(live_id, None)
+        if room is None:
+            return
+        fetcher, runner = room
+        fetcher.stop()
+        try:
+            if self.mode == 'thread':
+                runner.join(timeout)
+            else:
+                runner.result(timeout)
+        except Exception as e:
+            print(f"【!】直播间 {live_id} 未能按时退出: {e!r}")
+        print(f"【√】已移除直播间 {live_id}")
+
+    def reload(self) -> bool:
+        """房间列表有变化时同步增删，返回是否重新读取了文件"""
+        try:
+            mtime = os.stat(self.rooms_file).st_mtime
+        except OSError as e:
+            print(f"【X】读取房间列表失败: {e}")
+            return False
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        wanted = read_rooms(self.rooms_file)
+        with self._lock:
+            current = list(self._rooms) + list(self._ended)
+        for live_id in current:
+            if live_id not in wanted:
+                self.remove(live_id)
+        for live_id in wanted:
+            self.add(live_id)
+        return True
+
+    def check(self):
+        """处理已退出的直播间：移出运行列表，restart_delay 秒后重新连接；由轮询循环定期调用"""
+        now = time.monotonic()
+        ended = []
+        with self._lock:
+            for live_id, (fetcher, runner) in list(self._rooms.items()):
+                if self.mode == 'thread':
+                    done = not runner.is_alive()
+                else:
+                    done = runner.done()
+                if done:
+                    del self._rooms[live_id]
+                    self._ended[live_id] = now + self.restart_delay
+                    ended.append((live_id, runner))
+            due = [live_id for live_id, restart_at in self._ended.items() if restart_at <= now]
+
+        for live_id, runner in ended:
+            error = None
+            if self.mode == 'async' and not runner.cancelled():
+                error = runner.exception()
+            reason = f"异常退出: {error!r}" if error else "已结束"
+            print(f"【!】直播间 {live_id} {reason}，{self.restart_delay:g} 秒后重新连接")
+        for live_id in due:
+            self.add(live_id)
+
+    def run(self):
+        """阻塞运行，直到 stop() 或 Ctrl+C"""
+        self.warmup()
+        try:
+            while not self._stopped.is_set():
+                self.reload()
+                self.check()
+                self._stopped.wait(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = STOP_TIMEOUT):
+        """停止所有直播间：各自在一个线程里 stop() 并等待退出，共用同一个截止时间"""
+        self._stopped.set()
+        with self._lock:
+            live_ids = list(self._rooms)
+            self._ended.clear()
+        stoppers = [threading.Thread(target=self.remove, args=(live_id, timeout), name=f"stop-{live_id}", daemon=True)
+                    for live_id in live_ids]
+        for stopper in stoppers:
+            stopper.start()
+        deadline = time.monotonic() + timeout
+        for stopper in stoppers:
+            stopper.join(max(0.0, deadline - time.monotonic()))
+        with self._lock:
+            loop, http = self._loop, self._http
+            self._loop = self._http = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(http.close(), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+
+    @property
+    def rooms(self) -> list:
+        with self._lock:
+            return list(self._rooms)
+
+    def stats(self) -> dict:
+        with self._lock:
+            rooms = dict(self._rooms)
+            ended = dict(self._ended)
+        result = {}
+        for live_id, (fetcher, _) in rooms.items():
+            room = {
+                "state": "running",
+                "ack": fetcher.ack_stats(),
+                "decompress": fetcher.decompressor.stats(),
+                "keepalive": fetcher.keepalive.stats(),
+                "reconnect": fetcher.reconnect.stats(),
+                "log": fetcher.log_stats(),
+                "console": fetcher.console.stats(),
+            }
+            if fetcher.pipeline is not None:
+                room["pipeline"] = fetcher.pipeline.stats()
+            result[live_id] = room
+        now = time.monotonic()
+        for live_id, restart_at in ended.items():
+            result[live_id] = {"state": "ended", "restart_in": round(max(0.0, restart_at - now), 1)}
+        return result
+
+    def _ensure_loop(self):
+        """async 模式：在后台线程里跑一个共用的事件循环和 aiohttp 会话"""
+        if self._loop is None:
+            from async_fetcher import new_session
+
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="rooms-loop", daemon=True).start()
+
+            async def create():
+                return new_session()
+
+            self._http = asyncio.run_coroutine_threadsafe(create(), loop).result()
+            self._loop = loop
+        return self._loop
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多直播间守护")
+    parser.add_argument("rooms_file", help="房间列表文件，每行一个 live_id")
+    parser.add_argument("--log-root", help="日志根目录，每个直播间一个子目录")
+    parser.add_argument("--mode", choices=MODES, default='thread')
+    parser.add_argument("--decoder", default='betterproto')
+    parser.add_argument("--abogus-backend", default='mini_racer')
+    parser.add_argument("--poll-interval", type=float, default=5)
+    parser.add_argument("--restart-delay", type=float, default=60, help="直播间退出后多久重新连接（秒）")
+    parser.add_argument("--console", choices=CONSOLE_MODES, default='all',
+                        help="控制台输出：all 全部打印，throttle 限速并汇总，quiet 不打印（日志照常写入）")
+    parser.add_argument("--credentials", help=CREDENTIALS_HELP)
+    parser.add_argument("--archive", choices=tuple(FORMATS),
+                        help="每场的事件另存为 Parquet / Arrow 列式文件（需要 pyarrow）")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.rooms_file):
+        print(f"【X】房间列表不存在: {args.rooms_file}")
+        sys.exit(1)
+
+    supervisor = RoomSupervisor(
+        args.rooms_file,
+        log_root=args.log_root,
+        mode=args.mode,
+        poll_interval=args.poll_interval,
+        restart_delay=args.restart_delay,
+        decoder=args.decoder,
+        abogus_backend=args.abogus_backend,
+        console=args.console,
+        archive=args.archive,
+        credential_cache=args.credentials,
+    )
+    start = time.time()
+    supervisor.run()
+    print(f"【√】守护结束，运行 {time.time() - start:.0f} 秒")
+
+
+if __name__ == '__main__':
+    main()
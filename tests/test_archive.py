@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_archive.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+列式存档（archive.py）的测试：子进程写入若干组后不 close 直接退出，已写完的组要能用 pyarrow 读回
+
+    python -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+# 子进程：写 gift 360 条、chat 120 条，每组 50 行，然后不调用 close 直接 os._exit
+CHILD = r"""
+import os, sys
+sys.path.insert(0, os.getcwd())
+from archive import ColumnarArchiveSink
+from events import ChatEvent, GiftEvent
+
+directory, fmt = sys.argv[1], sys.argv[2]
+sink = ColumnarArchiveSink(directory, fmt=fmt, row_group_size=50)
+sink.open_session('2026-10-18_10-00-00', directory)
+for i in range(360):
+    sink(GiftEvent(msg_id=i, create_time=1700000000000 + i, time='2026-10-18 10:00:%02d' % (i % 60),
+                   user_id=1000 + i, user_name='用户%d' % i, gift_id=463, gift_name='玫瑰', count=1 + i % 3,
+                   repeat_count=i, group_count=1, diamond_count=1))
+    if i % 3 == 0:
+        sink(ChatEvent(msg_id=10000 + i, create_time=1700000000000 + i, time='2026-10-18 10:00:00',
+                       user_id=1000 + i, user_name='用户%d' % i, content='第%d条' % i))
+os._exit(0)
+"""
+
+
+@unittest.skipIf(pyarrow is None, "需要 pyarrow")
+class CrashRecoveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.session = os.path.join(self.tmp.name, '2026-10-18_10-00-00')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def crash(self, fmt):
+        subprocess.run([sys.executable, '-c', CHILD, self.tmp.name, fmt], cwd=ROOT, check=True, timeout=120)
+
+    def check_gifts(self, table, rows):
+        self.assertEqual(table.num_rows, rows)
+        self.assertEqual(table.column('msg_id').to_pylist(), list(range(rows)))
+        self.assertEqual(table.column('user_name').to_pylist()[-1], f"用户{rows - 1}")
+        # Parquet 里 time 存为毫秒精度
+        self.assertTrue(pyarrow.types.is_timestamp(table.schema.field('time').type))
+        self.assertEqual(table.column('time').to_pylist()[1].second, 1)
+        self.assertEqual(table.schema.field('msg_id').type, pyarrow.uint64())
+
+    def test_parquet_parts_survive(self):
+        import pyarrow.parquet as pq
+
+        self.crash('parquet')
+        gift = os.path.join(self.session, 'gift')
+        # 每组一个分片文件，7 组写完，最后 10 行没满一组
+        self.assertEqual(sorted(os.listdir(gift)), [f"part-{n:05d}.parquet" for n in range(7)])
+        self.check_gifts(pq.read_table(gift), 350)
+        chat = pq.read_table(os.path.join(self.session, 'chat'))
+        self.assertEqual(chat.num_rows, 100)
+        self.assertEqual(chat.column('content').to_pylist()[:2], ['第0条', '第3条'])
+
+    def test_arrow_stream_survives(self):
+        import pyarrow as pa
+
+        self.crash('arrow')
+        with pa.ipc.open_stream(os.path.join(self.session, 'gift.arrows')) as reader:
+            batches = list(reader)
+        self.assertEqual([batch.num_rows for batch in batches], [50] * 7)
+        self.check_gifts(pa.Table.from_batches(batches), 350)
+        with pa.ipc.open_stream(os.path.join(self.session, 'chat.arrows')) as reader:
+            self.assertEqual(reader.read_all().num_rows, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
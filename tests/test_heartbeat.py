@@ -0,0 +1,214 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_heartbeat.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+心跳调度（heartbeat.py）的测试，时间轮用 FakeClock + advance() 手动推进，不启动调度线程；
+Keepalive 用表驱动，逐步推进 FakeClock 核对每次 next() 的间隔和状态
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heartbeat  # noqa: E402
+from heartbeat import HeartbeatScheduler, Keepalive  # noqa: E402
+from reconnect import FakeClock  # noqa: E402
+
+
+class HeartbeatSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = HeartbeatScheduler(tick=0.1, slots=512, clock=self.clock, autostart=False)
+        self.sent = []
+
+    def register(self, interval, delay=0, name='a'):
+        return self.scheduler.register(lambda: self.sent.append((name, round(self.clock.now, 1))),
+                                       interval=interval, name=name, delay=delay)
+
+    def test_no_thread_without_autostart(self):
+        self.register(10)
+        self.assertIsNone(self.scheduler._thread)
+
+    def test_fires_every_interval(self):
+        self.register(10)
+        self.scheduler.advance(301)
+        self.assertEqual(self.sent, [('a', 0.1), ('a', 10.1), ('a', 20.1), ('a', 30.1)])
+
+    def test_slot_and_rounds(self):
+        # 时间轮一圈 512 * 0.1 = 51.2 秒，超过一圈的间隔要多转几圈
+        for ticks, rounds in [(1, 0), (511, 0), (512, 0), (513, 1), (600, 1), (1024, 1), (1025, 2), (3000, 5)]:
+            with self.subTest(ticks=ticks):
+                clock = FakeClock()
+                scheduler = HeartbeatScheduler(tick=0.1, slots=512, clock=clock, autostart=False)
+                scheduler.advance(37)
+                sent = []
+                handle = scheduler.register(lambda: sent.append(clock.now), interval=1000, delay=ticks * 0.1)
+                self.assertEqual(handle._rounds, rounds)
+                self.assertEqual(handle._slot, (37 + ticks) % 512)
+                scheduler.advance(ticks - 1)
+                self.assertEqual(sent, [])
+                scheduler.advance(1)
+                self.assertEqual(len(sent), 1)
+                self.assertAlmostEqual(sent[0], (37 + ticks) * 0.1)
+
+    def test_long_interval_repeats(self):
+        self.register(60)
+        self.scheduler.advance(1 + 1200)
+        self.assertEqual(self.sent, [('a', 0.1), ('a', 60.1), ('a', 120.1)])
+
+    def test_shorten_interval_while_armed(self):
+        handle = self.register(30)
+        self.scheduler.advance(1)
+        self.scheduler.advance(20)
+        # 上一次在 0.1 秒发送，改成 5 秒后应在 5.1 秒发送，不必等到 30.1
+        handle.interval = 5
+        self.scheduler.advance(80)
+        self.assertEqual(self.sent, [('a', 0.1), ('a', 5.1), ('a', 10.1)])
+
+    def test_shorten_past_due_fires_next_tick(self):
+        handle = self.register(30)
+        self.scheduler.advance(1 + 100)
+        handle.interval = 5
+        self.scheduler.advance(1)
+        self.assertEqual(self.sent, [('a', 0.1), ('a', 10.2)])
+
+    def test_lengthen_applies_after_next_send(self):
+        handle = self.register(10)
+        self.scheduler.advance(1)
+        handle.interval = 20
+        self.scheduler.advance(300)
+        self.assertEqual(self.sent, [('a', 0.1), ('a', 10.1), ('a', 30.1)])
+
+    def test_cancel(self):
+        first = self.register(10, name='a')
+        self.register(10, name='b')
+        self.scheduler.advance(1)
+        first.cancel()
+        self.assertEqual(len(self.scheduler), 1)
+        self.scheduler.advance(100)
+        self.assertEqual(self.sent, [('a', 0.1), ('b', 0.1), ('b', 10.1)])
+        self.assertTrue(first.cancelled)
+        self.assertEqual(first.sent, 1)
+        # 取消后再改间隔不会重新排进时间轮
+        first.interval = 1
+        self.scheduler.advance(100)
+        self.assertNotIn(('a', 20.1), self.sent)
+        self.assertEqual([n for n, _ in self.sent].count('a'), 1)
+
+    def test_send_error_cancels(self):
+        errors = []
+
+        def send():
+            raise OSError('closed')
+
+        handle = self.scheduler.register(send, interval=10, on_error=errors.append)
+        self.scheduler.advance(200)
+        self.assertTrue(handle.cancelled)
+        self.assertEqual((handle.failures, handle.sent), (1, 0))
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(len(self.scheduler), 0)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "需要 os.fork")
+    def test_fork_resets_shared_scheduler(self):
+        parent = heartbeat.get_heartbeat_scheduler()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # 子进程：拿到新的调度器，它的线程能正常发送
+            code = 1
+            try:
+                child = heartbeat.get_heartbeat_scheduler()
+                fired = threading.Event()
+                child.register(fired.set, interval=10)
+                if child is not parent and child is heartbeat.get_heartbeat_scheduler() and fired.wait(5):
+                    code = 0
+            finally:
+                os.write(write_fd, bytes([code]))
+                os._exit(code)
+        os.close(write_fd)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        self.assertEqual(result, b'\x00')
+        self.assertIs(heartbeat.get_heartbeat_scheduler(), parent)
+
+
+OK, SILENT, DEAD = Keepalive.OK, Keepalive.SILENT, Keepalive.DEAD
+
+# (名称, Keepalive 参数, update(heartbeat_duration 毫秒, fetch_interval 毫秒) 或 None,
+#  [(时钟前进秒数, 前进后是否收到帧, 期望的 next() 结果), ...])
+KEEPALIVE_CASES = [
+    ("ok 放宽到 max_interval", {}, None,
+     [(1, True, (15, OK)), (1, True, (20, OK)), (1, True, (20, OK))]),
+    ("ok 放宽到服务器 heartbeat_duration", {}, (12000, 0),
+     [(1, True, (12, OK)), (1, True, (12, OK))]),
+    ("服务器间隔更短时立即收紧", {}, (8000, 0),
+     [(0, True, (8, OK)), (1, True, (8, OK))]),
+    ("silent 减半到 min_interval", {}, None,
+     [(11, False, (5, SILENT)), (1, False, (2.5, SILENT)), (1, False, (2, SILENT)), (1, False, (2, SILENT))]),
+    ("silent 阈值为 2 个 fetch_interval", {}, (0, 1000),
+     [(2, False, (15, OK)), (1, False, (7.5, SILENT))]),
+    ("silent 后收到帧重新放宽", {}, None,
+     [(11, False, (5, SILENT)), (1, True, (7.5, OK)), (1, True, (11.25, OK))]),
+    ("dead_after 默认 3 个 base", {}, None,
+     [(29, False, (5, SILENT)), (1, False, (5, DEAD))]),
+    ("dead_after 跟随服务器 base", {}, (4000, 0),
+     [(11, False, (2, SILENT)), (1, False, (2, DEAD))]),
+    ("显式 dead_after", {'dead_after': 5}, None,
+     [(4.9, False, (15, OK)), (0.1, False, (15, DEAD))]),
+    ("adaptive=False 只跟随服务器间隔", {'adaptive': False}, (12000, 0),
+     [(1, True, (12, OK)), (100, False, (12, OK))]),
+]
+
+
+class KeepaliveTest(unittest.TestCase):
+
+    def test_transitions(self):
+        for name, kwargs, update, steps in KEEPALIVE_CASES:
+            with self.subTest(name):
+                clock = FakeClock()
+                keepalive = Keepalive(interval=10, min_interval=2, max_interval=20, clock=clock, **kwargs)
+                if update is not None:
+                    keepalive.update(*update)
+                for i, (seconds, frame, expected) in enumerate(steps):
+                    clock.advance(seconds)
+                    if frame:
+                        keepalive.frame()
+                    interval, state = keepalive.next()
+                    self.assertEqual(state, expected[1], f"第 {i} 步")
+                    self.assertAlmostEqual(interval, expected[0], msg=f"第 {i} 步")
+
+    def test_counters_and_reset(self):
+        clock = FakeClock()
+        keepalive = Keepalive(interval=10, clock=clock)
+        keepalive.update(8000, 0)
+        clock.advance(20)
+        self.assertEqual(keepalive.next(), (4, SILENT))
+        clock.advance(4)
+        self.assertEqual(keepalive.next()[1], DEAD)
+        self.assertEqual((keepalive.tightened, keepalive.deaths), (1, 1))
+        self.assertEqual(keepalive.stats()['silence'], 24)
+
+        keepalive.reset()
+        self.assertEqual((keepalive.interval, keepalive.state, keepalive.last_frame), (8, OK, 24))
+
+    def test_update_reports_changes(self):
+        keepalive = Keepalive(interval=10, clock=FakeClock())
+        self.assertFalse(keepalive.update(0, 500))
+        self.assertEqual(keepalive.fetch_interval, 0.5)
+        self.assertTrue(keepalive.update(9000, 0))
+        self.assertFalse(keepalive.update(9000, 0))
+        self.assertEqual((keepalive.base, keepalive.ceiling), (9, 9))
+
+
+if __name__ == '__main__':
+    unittest.main()
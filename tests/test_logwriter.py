@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_logwriter.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+日志写入（logwriter.py）的测试：组提交的顺序与落盘方式、分段日志的轮转
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logwriter  # noqa: E402
+from logwriter import GroupCommitWriter, SegmentedLog  # noqa: E402
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+class GroupCommitWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'live.log')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_threads_all_lines_in_order(self):
+        writer = GroupCommitWriter(self.path, durability='none', interval=0.001, max_lines=64, max_pending=500)
+        order = []
+        order_lock = threading.Lock()
+
+        def produce(name):
+            for n in range(2000):
+                # 与 write() 在同一把锁里记录顺序，文件中的顺序必须与之一致
+                with order_lock:
+                    line = f"{name} {n} 礼物"
+                    writer.write(line)
+                    order.append(line)
+
+        threads = [threading.Thread(target=produce, args=(f"t{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(read_lines(self.path), order)
+        self.assertEqual(writer.lines, 16000)
+        self.assertEqual(writer.stats()['pending'], 0)
+        with self.assertRaises(ValueError):
+            writer.write('late')
+
+    def test_flush_waits_for_commit(self):
+        writer = GroupCommitWriter(self.path, durability='flush', interval=10)
+        for n in range(5):
+            writer.write(f"line {n}")
+        self.assertTrue(writer.flush(timeout=5))
+        # flush 返回时已经写到操作系统，另一个句柄能读到
+        self.assertEqual(read_lines(self.path), [f"line {n}" for n in range(5)])
+        writer.close()
+
+    def test_appends_to_existing_file(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('old\n')
+        writer = GroupCommitWriter(self.path)
+        writer.write('new')
+        writer.close()
+        self.assertEqual(read_lines(self.path), ['old', 'new'])
+
+    def test_durability_modes(self):
+        for durability, fsync_per_batch in (('fsync', True), ('flush', False), ('none', False)):
+            with self.subTest(durability), mock.patch.object(logwriter.os, 'fsync') as fsync:
+                path = os.path.join(self.tmp.name, f"{durability}.log")
+                writer = GroupCommitWriter(path, durability=durability, interval=10)
+                for batch in range(3):
+                    for n in range(4):
+                        writer.write(f"{batch}-{n}")
+                    self.assertTrue(writer.flush(timeout=5))
+                    if durability != 'none':
+                        self.assertEqual(len(read_lines(path)), (batch + 1) * 4)
+                writer.close()
+
+                self.assertEqual(writer.batches, 3)
+                if fsync_per_batch:
+                    self.assertEqual(fsync.call_count, writer.batches)
+                    fileno = fsync.call_args[0][0]
+                    self.assertIsInstance(fileno, int)
+                else:
+                    fsync.assert_not_called()
+                self.assertEqual(len(read_lines(path)), 12)
+
+    def test_unknown_durability(self):
+        with self.assertRaises(ValueError):
+            GroupCommitWriter(self.path, durability='sync')
+
+
+class SegmentedLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'logs', 'tmp.log')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rollover_by_lines(self):
+        log = SegmentedLog(self.path, max_lines=10, max_bytes=1 << 20, backups=2)
+        for n in range(35):
+            log.write(f"line {n}")
+        log.close()
+
+        self.assertEqual(log.rotations, 3)
+        self.assertEqual(log.segments(), [self.path, self.path + '.1', self.path + '.2'])
+        self.assertEqual(read_lines(self.path), [f"line {n}" for n in range(30, 35)])
+        self.assertEqual(read_lines(self.path + '.1'), [f"line {n}" for n in range(20, 30)])
+        self.assertEqual(read_lines(self.path + '.2'), [f"line {n}" for n in range(10, 20)])
+        self.assertFalse(os.path.exists(self.path + '.3'))
+
+    def test_rollover_by_bytes(self):
+        # 每行 10 个汉字 + 换行 = 31 字节，按 UTF-8 字节数计
+        line = '礼' * 10
+        log = SegmentedLog(self.path, max_lines=1000, max_bytes=100, backups=1)
+        for _ in range(9):
+            log.write(line)
+        log.close()
+
+        self.assertEqual(log.rotations, 2)
+        self.assertEqual(log.segments(), [self.path, self.path + '.1'])
+        self.assertEqual(read_lines(self.path), [line])
+        self.assertEqual(read_lines(self.path + '.1'), [line] * 4)
+        for path in log.segments():
+            self.assertLessEqual(os.path.getsize(path), 100 + 31)
+
+    def test_no_backups(self):
+        log = SegmentedLog(self.path, max_lines=3, backups=0)
+        for n in range(7):
+            log.write(str(n))
+        log.close()
+        self.assertEqual(log.segments(), [self.path])
+        self.assertEqual(read_lines(self.path), ['6'])
+
+    def test_resumes_existing_size(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('x' * 95 + '\n')
+        log = SegmentedLog(self.path, max_bytes=100, backups=1)
+        log.write('a' * 9)
+        log.write('b')
+        log.close()
+        self.assertEqual(read_lines(self.path + '.1'), ['x' * 95, 'a' * 9])
+        self.assertEqual(read_lines(self.path), ['b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_reconnect.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+重连策略（reconnect.py）的测试，全部用 FakeClock，不真正等待
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reconnect import Backoff, CircuitBreaker, FakeClock, ReconnectPolicy, TokenBucket  # noqa: E402
+
+
+class BackoffTest(unittest.TestCase):
+
+    def test_ceiling_doubles_until_cap(self):
+        backoff = Backoff(base=5, cap=60, multiplier=2)
+        self.assertEqual([backoff.ceiling(n) for n in range(6)], [5, 10, 20, 40, 60, 60])
+        self.assertEqual(backoff.ceiling(1000), 60)
+
+    def test_delay_is_full_jitter(self):
+        self.assertEqual(Backoff(base=5, rng=lambda: 0.0).delay(3), 0.0)
+        self.assertAlmostEqual(Backoff(base=5, cap=300, rng=lambda: 0.5).delay(10), 150)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def test_trip_half_open_close(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock)
+        for _ in range(2):
+            breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.trips, 1)
+        self.assertFalse(breaker.allow())
+
+        clock.advance(59)
+        self.assertAlmostEqual(breaker.remaining(), 1)
+        clock.advance(1)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.failures, 0)
+
+    def test_half_open_failure_trips_again(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.advance(10)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.trips, 2)
+        self.assertAlmostEqual(breaker.remaining(), 10)
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_burst_then_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        self.assertEqual(bucket.delayed, 2)
+
+    def test_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.advance(0.5)
+        self.assertEqual(bucket.reserve(), 0.0)
+        # 补充不超过桶容量
+        clock.advance(100)
+        self.assertEqual([bucket.reserve() for _ in range(2)], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+
+    def test_reserve_counts_tokens_refilled_while_waiting(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+        bucket.reserve()
+        self.assertEqual(bucket.reserve(after=1), 0.0)
+
+
+class ReconnectPolicyTest(unittest.TestCase):
+
+    def policy(self, clock, **kwargs):
+        return ReconnectPolicy(Backoff(base=5, cap=300, rng=lambda: 1.0),
+                               CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock),
+                               limiter=False, clock=clock, **kwargs)
+
+    def test_handshake_then_close_keeps_backing_off(self):
+        clock = FakeClock()
+        policy = self.policy(clock)
+        delays = []
+        for _ in range(3):
+            policy.connected()
+            clock.advance(1)
+            delays.append(policy.next_delay())
+        self.assertEqual(delays[:2], [5, 10])
+        # 第 3 次仍未收到帧，熔断
+        self.assertEqual(policy.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(delays[2], 60)
+        self.assertTrue(policy.flapped)
+        self.assertEqual(policy.flaps, 3)
+
+    def test_first_frame_resets(self):
+        clock = FakeClock()
+        policy = self.policy(clock)
+        policy.next_delay()
+        policy.next_delay()
+        policy.connected()
+        policy.healthy()
+        self.assertEqual(policy.attempt, 0)
+        self.assertEqual(policy.next_delay(), 5)
+        self.assertFalse(policy.flapped)
+        self.assertEqual(policy.breaker.failures, 0)
+
+    def test_min_uptime_counts_as_healthy(self):
+        clock = FakeClock()
+        policy = self.policy(clock, min_uptime=30)
+        policy.next_delay()
+        policy.connected()
+        clock.advance(30)
+        self.assertEqual(policy.next_delay(), 5)
+        self.assertFalse(policy.flapped)
+
+    def test_healthy_ignored_when_not_connected(self):
+        clock = FakeClock()
+        policy = self.policy(clock)
+        policy.next_delay()
+        policy.healthy()
+        self.assertEqual(policy.attempt, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
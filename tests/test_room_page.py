@@ -0,0 +1,119 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_room_page.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+直播页流式提取（room_page.py）的测试：同一页面按不同方式切块喂入，结果必须一致
+
+    python -m pytest tests
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from room_page import RoomPageScanner  # noqa: E402
+
+ROOM_ID = '7392014521234567890'
+EXPECTED = {'room_id': ROOM_ID, 'status': 2, 'nickname': '主播ab'}
+
+ROOM = rb'\"roomId\":\"' + ROOM_ID.encode() + rb'\",\"web_rid\":\"123456\"'
+STATUS = rb'\"room\":{\"id_str\":\"' + ROOM_ID.encode() + rb'\",\"status\":2,\"status_str\":\"2\"'
+NICKNAME = (rb'\"anchor\":{\"id_str\":\"98765\",\"sec_uid\":\"MS4wLjABAAAA\",'
+            rb'\"nickname\":\"\\u4e3b\\u64adab\",\"avatar_thumb\":{}')
+
+
+def filler(size: int) -> bytes:
+    unit = b'<script>window.__x = {"a": [1, 2, 3], "b": "padding"};</script>\n'
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def page(*parts) -> bytes:
+    """parts 依次为填充长度或片段"""
+    return b''.join(filler(part) if isinstance(part, int) else part for part in parts)
+
+
+def scan(data: bytes, sizes, **kwargs) -> RoomPageScanner:
+    scanner = RoomPageScanner(**kwargs)
+    pos = 0
+    for size in sizes:
+        if pos >= len(data) or scanner.feed(data[pos:pos + size]):
+            break
+        pos += size
+    return scanner
+
+
+def fixed(size):
+    while True:
+        yield size
+
+
+def randomized(seed, low=1, high=4096):
+    rng = random.Random(seed)
+    while True:
+        yield rng.randint(low, high)
+
+
+class RoomPageScannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = page(3000, ROOM, 2500, STATUS, 6000, NICKNAME, 5000)
+
+    def test_splits_give_identical_results(self):
+        whole = scan(self.data, [len(self.data)])
+        self.assertEqual(whole.result, EXPECTED)
+        self.assertTrue(whole.done)
+        for name, sizes in [('1 byte', fixed(1)), ('7 bytes', fixed(7)), ('16 KiB', fixed(16 * 1024))] + \
+                [(f"random {seed}", randomized(seed)) for seed in range(5)]:
+            with self.subTest(name):
+                scanner = scan(self.data, sizes)
+                self.assertEqual(scanner.result, EXPECTED)
+                self.assertTrue(scanner.done)
+
+    def test_room_id_straddles_chunk_boundary(self):
+        start = self.data.index(ROOM)
+        for cut in range(start, start + len(ROOM) + 1):
+            with self.subTest(cut=cut):
+                scanner = scan(self.data, [cut, len(self.data)])
+                self.assertEqual(scanner.result, EXPECTED)
+
+    def test_stops_once_all_fields_found(self):
+        end = self.data.index(NICKNAME) + len(NICKNAME)
+        scanner = scan(self.data, fixed(1024))
+        self.assertTrue(scanner.done)
+        self.assertLess(scanner.bytes_read, end + 1024)
+        self.assertLess(scanner.bytes_read, len(self.data))
+
+    def test_optional_fields_far_from_room_id(self):
+        data = page(1000, ROOM, 60 * 1024, STATUS, 60 * 1024, NICKNAME, 1000)
+        self.assertEqual(scan(data, fixed(16 * 1024)).result, EXPECTED)
+
+    def test_missing_optional_field_reads_up_to_window(self):
+        data = page(1000, ROOM, 1000, STATUS, 20 * 1024)
+        scanner = scan(data, fixed(1024), extra_window=8 * 1024)
+        self.assertTrue(scanner.done)
+        self.assertEqual(scanner.result, {'room_id': ROOM_ID, 'status': 2})
+        room_end = data.index(ROOM) + len(ROOM)
+        self.assertGreaterEqual(scanner.bytes_read, room_end + 8 * 1024)
+        self.assertLess(scanner.bytes_read, room_end + 8 * 1024 + 1024 * 2)
+
+    def test_zero_window_stops_at_room_id(self):
+        scanner = scan(self.data, fixed(1024), extra_window=0)
+        self.assertTrue(scanner.done)
+        self.assertEqual(scanner.room_id, ROOM_ID)
+        self.assertLess(scanner.bytes_read, self.data.index(ROOM) + len(ROOM) + 1024)
+
+    def test_no_room_id(self):
+        scanner = scan(page(50 * 1024), fixed(4096))
+        self.assertFalse(scanner.done)
+        self.assertIsNone(scanner.room_id)
+        self.assertEqual(scanner.bytes_read, 50 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
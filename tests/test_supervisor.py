@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_supervisor.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+多直播间守护（supervisor.py）停止流程的测试：用假的抓取器，不联网
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from supervisor import RoomSupervisor  # noqa: E402
+
+
+class SlowFetcher:
+    """stop() 后还要 linger 秒才退出（模拟排空流水线、关闭日志）"""
+
+    def __init__(self, linger: float):
+        self.linger = linger
+        self.stopped = threading.Event()
+
+    def run(self):
+        self.stopped.wait()
+        time.sleep(self.linger)
+
+    def stop(self):
+        self.stopped.set()
+
+
+class StopTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.supervisor = RoomSupervisor(None, log_root=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add(self, live_id, linger):
+        fetcher = SlowFetcher(linger)
+        runner = threading.Thread(target=fetcher.run, daemon=True)
+        runner.start()
+        self.supervisor._rooms[live_id] = (fetcher, runner)
+        return fetcher, runner
+
+    def test_rooms_stop_in_parallel(self):
+        rooms = [self.add(str(i), 0.5) for i in range(8)]
+        start = time.monotonic()
+        self.supervisor.stop(timeout=5)
+        elapsed = time.monotonic() - start
+        # 逐个等待要 4 秒
+        self.assertLess(elapsed, 2)
+        self.assertEqual(self.supervisor.rooms, [])
+        for fetcher, runner in rooms:
+            self.assertTrue(fetcher.stopped.is_set())
+            self.assertFalse(runner.is_alive())
+
+    def test_shared_deadline(self):
+        fast = self.add('fast', 0)
+        slow = [self.add(f"slow{i}", 30) for i in range(3)]
+        start = time.monotonic()
+        self.supervisor.stop(timeout=0.5)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertFalse(fast[1].is_alive())
+        for fetcher, runner in slow:
+            self.assertTrue(fetcher.stopped.is_set())
+            self.assertTrue(runner.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    test_wire.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+wire.py 的测试：用 betterproto 编码，对比选择性扫描（extract / peek_ack / MessageScanner）取出的字段
+
+    python -m pytest tests
+"""
+
+import gzip
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import protobuf.douyin as pb  # noqa: E402
+from protobuf.schema import parse_proto  # noqa: E402
+from wire import MessageScanner, compile_plan, extract, peek_ack  # noqa: E402
+
+_messages = None
+
+
+def plan(type_name, paths):
+    global _messages
+    if _messages is None:
+        _messages = parse_proto()
+    return compile_plan(_messages, type_name, paths)
+
+
+def chat(nickname='小明', content='主播好', user_id=42, tags=()):
+    message = pb.WebcastImChatMessage(content=content, chat_tags=list(tags), agree_msg_id=7, event_time=99)
+    message.user = pb.WebcastDataUser(id=user_id, nickname=nickname, level=3, display_id='dy1')
+    message.common = pb.WebcastImCommon(method='WebcastImChatMessage', msg_id=2 ** 62 + 5, create_time=1700000000000)
+    return message
+
+
+def response(messages, need_ack=True, internal_ext='internal_src:dim|seq:1'):
+    return pb.WebcastImResponse(
+        messages=messages, cursor='t-1_r-1', fetch_interval=1000, now=1700000000000,
+        internal_ext=internal_ext, heartbeat_duration=8000, need_ack=need_ack,
+    )
+
+
+def wrap(method, message):
+    return pb.WebcastImMessage(method=method, payload=bytes(message), msg_id=1)
+
+
+class ExtractTest(unittest.TestCase):
+
+    def test_chat_fields_match_betterproto(self):
+        data = bytes(chat(tags=(1, 300, 70000)))
+        full = pb.WebcastImChatMessage().parse(data)
+        msg = extract(plan('WebcastImChatMessage', [
+            'common.msg_id', 'common.create_time', 'user.nickname', 'user.id', 'content', 'chat_tags',
+        ]), data)
+        self.assertEqual(msg.common.msg_id, full.common.msg_id)
+        self.assertEqual(msg.common.create_time, full.common.create_time)
+        self.assertEqual(msg.user.nickname, full.user.nickname)
+        self.assertEqual(msg.user.id, full.user.id)
+        self.assertEqual(msg.content, full.content)
+        self.assertEqual(list(msg.chat_tags), list(full.chat_tags))
+
+    def test_memoryview_input(self):
+        data = bytes(chat())
+        msg = extract(plan('WebcastImChatMessage', ['user.nickname', 'content']), memoryview(data))
+        self.assertEqual((msg.user.nickname, msg.content), ('小明', '主播好'))
+
+    def test_defaults_for_missing_fields(self):
+        msg = extract(plan('WebcastImChatMessage', ['user.nickname', 'content', 'chat_tags', 'visible_to_sender']), b'')
+        self.assertEqual((msg.user.nickname, msg.content, msg.chat_tags, msg.visible_to_sender), ('', '', (), False))
+
+    def test_unknown_fields_are_skipped(self):
+        data = bytes(chat())
+        # 追加 schema 里没有的字段：varint / fixed64 / 长度前缀 / fixed32
+        extra = (b'\xf8\x3e\x96\x01' + b'\xf9\x3e' + b'\x01' * 8 + b'\xfa\x3e\x03abc' + b'\xfd\x3e' + b'\x02' * 4)
+        msg = extract(plan('WebcastImChatMessage', ['user.nickname', 'content']), extra + data + extra)
+        self.assertEqual((msg.user.nickname, msg.content), ('小明', '主播好'))
+
+    def test_unpacked_repeated_scalars(self):
+        # chat_tags = 19，逐个编码（未打包）的 varint
+        data = b''.join(b'\x98\x01' + bytes([value]) for value in (1, 2, 3))
+        msg = extract(plan('WebcastImChatMessage', ['chat_tags']), data)
+        self.assertEqual(list(msg.chat_tags), [1, 2, 3])
+        self.assertEqual(list(pb.WebcastImChatMessage().parse(data).chat_tags), [1, 2, 3])
+
+    def test_negative_int32(self):
+        data = bytes(pb.WebcastImChatMessage(chat_tags=[-1, 5]))
+        msg = extract(plan('WebcastImChatMessage', ['chat_tags']), data)
+        self.assertEqual(list(msg.chat_tags), [-1, 5])
+
+    def test_repeated_messages(self):
+        rank = pb.WebcastImRoomRankMessage()
+        for i in range(3):
+            item = pb.WebcastImRoomRankMessageRoomRank(score_str=str(i * 10))
+            item.user = pb.WebcastDataUser(nickname=f"u{i}")
+            rank.ranks.append(item)
+        msg = extract(plan('WebcastImRoomRankMessage', ['ranks.user.nickname', 'ranks.score_str']), bytes(rank))
+        self.assertEqual([(r.user.nickname, r.score_str) for r in msg.ranks], [('u0', '0'), ('u1', '10'), ('u2', '20')])
+
+    def test_truncated_input(self):
+        data = bytes(chat())
+        p = plan('WebcastImChatMessage', ['user.nickname', 'content'])
+        for cut in (1, 5, len(data) // 2, len(data) - 1):
+            with self.subTest(cut=cut), self.assertRaises((ValueError, IndexError)):
+                extract(p, data[:cut])
+
+
+class PeekAckTest(unittest.TestCase):
+
+    def test_matches_betterproto(self):
+        for need_ack, ext in ((True, 'internal_src:dim|seq:1'), (False, ''), (True, '中文' * 100)):
+            data = bytes(response([wrap('WebcastImChatMessage', chat())] * 3, need_ack, ext))
+            full = pb.WebcastImResponse().parse(data)
+            self.assertEqual(peek_ack(data), (full.need_ack, full.internal_ext))
+            self.assertEqual(peek_ack(memoryview(data)), (need_ack, ext))
+
+    def test_push_frame_payload(self):
+        payload = bytes(response([wrap('WebcastImChatMessage', chat())]))
+        frame = bytes(pb.WebcastImPushFrame(log_id=9, payload_encoding='gzip', payload_type='msg',
+                                            payload=gzip.compress(payload)))
+        p = plan('WebcastImPushFrame', ['log_id', 'payload_encoding', 'payload_type', 'payload'])
+        package = extract(p, frame)
+        self.assertEqual((package.log_id, package.payload_encoding, package.payload_type), (9, 'gzip', 'msg'))
+        self.assertEqual(peek_ack(gzip.decompress(package.payload)), (True, 'internal_src:dim|seq:1'))
+
+    def test_truncated_input(self):
+        data = bytes(response([wrap('WebcastImChatMessage', chat())]))
+        with self.assertRaises((ValueError, IndexError)):
+            peek_ack(data[:-3])
+
+
+class MessageScannerTest(unittest.TestCase):
+
+    def setUp(self):
+        gift = pb.WebcastImGiftMessage(gift_id=5, combo_count=3)
+        like = pb.WebcastImLikeMessage(count=2, total=100)
+        self.items = [
+            ('WebcastImChatMessage', chat(nickname='a')),
+            ('WebcastImGiftMessage', gift),
+            ('WebcastImInRoomBannerMessage', chat(content='x' * 300)),
+            ('WebcastImChatMessage', chat(nickname='b', content='')),
+            ('WebcastImLikeMessage', like),
+            ('WebcastImUnknownMessage', pb.WebcastImLikeMessage()),
+            ('WebcastImLikeMessage', like),
+        ]
+        self.data = bytes(response([wrap(method, message) for method, message in self.items]))
+
+    def test_matches_full_decode(self):
+        subscribers = {'WebcastImChatMessage', 'WebcastImGiftMessage', 'WebcastImLikeMessage'}
+        scanned = MessageScanner().scan(self.data, subscribers)
+        full = pb.WebcastImResponse().parse(self.data)
+        expected = [(m.method, bytes(m.payload)) for m in full.messages if m.method in subscribers]
+        self.assertEqual([(m.method, bytes(m.payload)) for m in scanned.messages], expected)
+        self.assertEqual(len(expected), 5)
+        self.assertEqual((scanned.need_ack, scanned.internal_ext, scanned.heartbeat_duration, scanned.fetch_interval),
+                         (full.need_ack, full.internal_ext, full.heartbeat_duration, full.fetch_interval))
+
+    def test_skipped_methods_counted_once(self):
+        scanner = MessageScanner()
+        subscribers = {'WebcastImChatMessage'}
+        first = scanner.scan(self.data, subscribers)
+        second = scanner.scan(memoryview(self.data), subscribers)
+        self.assertEqual(sorted(first.unhandled),
+                         ['WebcastImGiftMessage', 'WebcastImInRoomBannerMessage', 'WebcastImLikeMessage',
+                          'WebcastImUnknownMessage'])
+        self.assertEqual(list(second.unhandled), [])
+        stats = scanner.stats()
+        self.assertEqual(stats['WebcastImLikeMessage']['messages'], 4)
+        self.assertEqual(stats['WebcastImGiftMessage']['messages'], 2)
+
+    def test_payload_is_zero_copy_slice(self):
+        scanned = MessageScanner().scan(self.data, {'WebcastImGiftMessage'})
+        payload = scanned.messages[0].payload
+        self.assertIsInstance(payload, memoryview)
+        self.assertEqual(pb.WebcastImGiftMessage().parse(bytes(payload)).combo_count, 3)
+
+    def test_truncated_input(self):
+        with self.assertRaises((ValueError, IndexError)):
+            MessageScanner().scan(self.data[:len(self.data) // 2], {'WebcastImChatMessage'})
+
+
+if __name__ == '__main__':
+    unittest.main()
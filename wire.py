@@ -0,0 +1,399 @@
+#!/usr/bin/python
+# coding:utf-8
+
+# @FileName:    wire.py
+# @Project:     douyinLiveWebFetcher
+
+"""
+protobuf 线上格式的选择性扫描
+
+按 "字段路径" 规格（如 user.nickname、gift.name、combo_count）只取出需要的字段，
+其他字段只读长度直接跳过，不构造任何对象。返回的对象只有被请求的属性，
+缺省值与 protobuf 一致（''、0、False、空消息、空序列）。
+数据被截断（长度超出所在消息的范围）时抛出 ValueError（varint 读到末尾时为 IndexError）。
+
+    plan = compile_plan(parse_proto(), 'WebcastImGiftMessage', ['user.nickname', 'gift.name', 'combo_count'])
+    msg = extract(plan, payload)
+    msg.user.nickname, msg.gift.name, msg.combo_count
+"""
+
+import struct
+import sys
+import threading
+
+from betterproto import casing
+
+from protobuf.schema import class_name, resolve
+
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LEN = 2
+WIRE_FIXED32 = 5
+
+_WIRE_TYPES = {
+    'double': WIRE_FIXED64, 'fixed64': WIRE_FIXED64, 'sfixed64': WIRE_FIXED64,
+    'float': WIRE_FIXED32, 'fixed32': WIRE_FIXED32, 'sfixed32': WIRE_FIXED32,
+    'string': WIRE_LEN, 'bytes': WIRE_LEN,
+}
+
+_DEFAULTS = {
+    'double': 0.0, 'float': 0.0, 'bool': False, 'string': '', 'bytes': b'',
+}
+
+_FLOAT = struct.Struct('<f')
+_DOUBLE = struct.Struct('<d')
+
+
+def read_varint(buf, pos: int):
+    b = buf[pos]
+    if b < 0x80:
+        return b, pos + 1
+    result = b & 0x7f
+    shift = 7
+    while True:
+        pos += 1
+        b = buf[pos]
+        result |= (b & 0x7f) << shift
+        if b < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+def skip_field(buf, pos: int, wire_type: int) -> int:
+    if wire_type == WIRE_VARINT:
+        while buf[pos] & 0x80:
+            pos += 1
+        return pos + 1
+    if wire_type == WIRE_LEN:
+        length, pos = read_varint(buf, pos)
+        return pos + length
+    if wire_type == WIRE_FIXED64:
+        return pos + 8
+    if wire_type == WIRE_FIXED32:
+        return pos + 4
+    raise ValueError(f"不支持的 wire type: {wire_type}")
+
+
+def _truncated(type_name: str, pos: int, end: int):
+    raise ValueError(f"{type_name} 数据被截断：需要读到 {pos}，只有 {end}")
+
+
+def _convert(kind: str, value):
+    """把 varint / 定长原始值转换成 proto 类型对应的 Python 值"""
+    if kind in ('int32', 'int64'):
+        return value - (1 << 64) if value >= 1 << 63 else value
+    if kind in ('sint32', 'sint64'):
+        return (value >> 1) ^ -(value & 1)
+    if kind == 'bool':
+        return value != 0
+    if kind == 'fixed32' or kind == 'fixed64':
+        return int.from_bytes(value, 'little')
+    if kind == 'sfixed32' or kind == 'sfixed64':
+        return int.from_bytes(value, 'little', signed=True)
+    if kind == 'float':
+        return _FLOAT.unpack(value)[0]
+    if kind == 'double':
+        return _DOUBLE.unpack(value)[0]
+    return value
+
+
+class Partial:
+    """选择性解码的结果，只带有被请求的字段"""
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.__dict__!r})"
+
+
+class Plan:
+    """某个消息类型的扫描计划：字段编号 -> (属性名, proto 类型, 期望 wire type, 子计划, 是否 repeated)"""
+
+    __slots__ = ('type_name', 'cls', 'fields')
+
+    def __init__(self, type_name: str):
+        self.type_name = type_name
+        self.fields = {}
+        self.cls = None
+
+
+def compile_plan(messages: dict, type_name: str, paths) -> Plan:
+    """
+    参数:
+        messages:  schema.parse_proto() 的结果
+        type_name: betterproto 类名，如 WebcastImGiftMessage
+        paths:     要取出的字段路径（snake_case），如 ['user.nickname', 'combo_count']
+    """
+    by_class = {class_name(full): full for full in messages}
+    return _compile(messages, by_class[type_name], [p.split('.') for p in paths])
+
+
+def _compile(messages: dict, full_name: str, paths) -> Plan:
+    plan = Plan(class_name(full_name))
+    fields = {casing.safe_snake_case(f.name): f for f in messages[full_name]}
+
+    grouped = {}
+    for path in paths:
+        if path[0] not in fields:
+            raise KeyError(f"{plan.type_name} 没有字段 {path[0]}")
+        grouped.setdefault(path[0], []).append(path[1:])
+
+    defaults = {}
+    for attr, subpaths in grouped.items():
+        f = fields[attr]
+        if f.key_type:
+            raise ValueError(f"{plan.type_name}.{attr}: 不支持 map 字段")
+
+        child = None
+        if f.type in _WIRE_TYPES or f.type in ('int32', 'int64', 'uint32', 'uint64', 'sint32', 'sint64', 'bool'):
+            kind = f.type
+            wire_type = _WIRE_TYPES.get(kind, WIRE_VARINT)
+            default = _DEFAULTS.get(kind, 0)
+        else:
+            kind = 'message'
+            wire_type = WIRE_LEN
+            child = _compile(messages, resolve(messages, full_name, f.type), [p for p in subpaths if p])
+            default = child.cls()
+
+        plan.fields[f.number] = (attr, kind, wire_type, child, f.repeated)
+        defaults[attr] = () if f.repeated else default
+
+    plan.cls = type(f"Partial{plan.type_name}", (Partial,), defaults)
+    return plan
+
+
+def extract(plan: Plan, buf, pos: int = 0, end: int = None):
+    """按计划扫描 buf[pos:end]，buf 可以是 bytes 或 memoryview"""
+    if end is None:
+        end = len(buf)
+    obj = plan.cls()
+    values = obj.__dict__
+    fields = plan.fields
+
+    while pos < end:
+        key = buf[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = read_varint(buf, pos)
+        wire_type = key & 7
+        spec = fields.get(key >> 3)
+
+        if spec is None or (spec[2] != wire_type and not (wire_type == WIRE_LEN and spec[4])):
+            pos = skip_field(buf, pos, wire_type)
+            continue
+
+        attr, kind, expected, child, repeated = spec
+        if wire_type == WIRE_LEN:
+            length, pos = read_varint(buf, pos)
+            stop = pos + length
+            if stop > end:
+                _truncated(plan.type_name, stop, end)
+            if kind == 'message':
+                value = extract(child, buf, pos, stop)
+            elif kind == 'string':
+                value = str(buf[pos:stop], 'utf-8', 'replace')
+            elif kind == 'bytes':
+                value = buf[pos:stop]
+            else:
+                # packed repeated 标量
+                items = values.get(attr)
+                if items is None:
+                    items = values[attr] = []
+                while pos < stop:
+                    if expected == WIRE_VARINT:
+                        raw, pos = read_varint(buf, pos)
+                    else:
+                        size = 8 if expected == WIRE_FIXED64 else 4
+                        raw, pos = bytes(buf[pos:pos + size]), pos + size
+                    items.append(_convert(kind, raw))
+                continue
+            pos = stop
+        elif wire_type == WIRE_VARINT:
+            value, pos = read_varint(buf, pos)
+            if kind != 'uint64' and kind != 'uint32':
+                value = _convert(kind, value)
+        else:
+            size = 8 if wire_type == WIRE_FIXED64 else 4
+            value = _convert(kind, bytes(buf[pos:pos + size]))
+            pos += size
+
+        if repeated:
+            items = values.get(attr)
+            if items is None:
+                items = values[attr] = []
+            items.append(value)
+        else:
+            values[attr] = value
+    if pos > end:
+        _truncated(plan.type_name, pos, end)
+    return obj
+
+
+def peek_ack(data):
+    """
+    只读 WebcastImResponse 顶层的 need_ack（字段 9）与 internal_ext（字段 5），
+    messages 等字段按长度跳过，不解码。用于收到帧后立即回 ACK。
+    """
+    end = len(data)
+    pos = 0
+    need_ack = False
+    internal_ext = ''
+    while pos < end:
+        key = data[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = read_varint(data, pos)
+        if key == 0x48:
+            value, pos = read_varint(data, pos)
+            need_ack = value != 0
+        elif key == 0x2a:
+            length, pos = read_varint(data, pos)
+            internal_ext = str(data[pos:pos + length], 'utf-8', 'replace')
+            pos += length
+        else:
+            pos = skip_field(data, pos, key & 7)
+    if pos > end:
+        _truncated('WebcastImResponse', pos, end)
+    return need_ack, internal_ext
+
+
+class RawMessage:
+    """Response.messages 里的一条消息：只解出 method，payload 是原缓冲区上的 memoryview"""
+
+    __slots__ = ('method', 'payload')
+
+    def __init__(self, method: str, payload):
+        self.method = method
+        self.payload = payload
+
+
+class ScannedResponse:
+    """预扫描得到的 WebcastImResponse：帧头字段 + 有订阅者的消息"""
+
+    __slots__ = ('messages', 'unhandled', 'need_ack', 'internal_ext', 'heartbeat_duration', 'fetch_interval')
+
+    def __init__(self):
+        self.messages = []
+        self.unhandled = ()
+        self.need_ack = False
+        self.internal_ext = ''
+        self.heartbeat_duration = 0
+        self.fetch_interval = 0
+
+
+class MessageScanner:
+    """
+    帧级预扫描：WebcastImResponse 只扫一遍，每条 Message 只读 method（字段 1），
+    payload（字段 2）保留为 memoryview 切片，不复制也不解码。
+    method 不在 subscribers 里的消息直接丢弃，按 method 累计跳过的条数和字节数；
+    某个 method 第一次被跳过时放进 ScannedResponse.unhandled，方便上层只提示一次。
+    method 经过 sys.intern，和 dispatch 分发表里的键是同一个对象。
+
+    字段编号（douyin.proto）：
+        Response: messages=1, fetch_interval=3, internal_ext=5, heartbeat_duration=8, need_ack=9
+        Message:  method=1, payload=2
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._skipped = {}
+
+    def scan(self, data, subscribers) -> ScannedResponse:
+        """
+        参数:
+            data:        解压后的 Response 二进制（bytes / memoryview）
+            subscribers: 支持 in 的容器（处理函数表、集合等），决定哪些 method 需要保留
+        """
+        buf = memoryview(data)
+        end = len(buf)
+        pos = 0
+        response = ScannedResponse()
+        messages = response.messages
+        skipped = None
+
+        while pos < end:
+            key = buf[pos]
+            if key < 0x80:
+                pos += 1
+            else:
+                key, pos = read_varint(buf, pos)
+
+            if key == 0x0a:  # messages
+                length, pos = read_varint(buf, pos)
+                stop = pos + length
+                if stop > end:
+                    _truncated('WebcastImResponse', stop, end)
+                method, payload = _scan_message(buf, pos, stop)
+                if method in subscribers:
+                    messages.append(RawMessage(method, payload))
+                else:
+                    if skipped is None:
+                        skipped = {}
+                    count = skipped.get(method)
+                    skipped[method] = (count[0] + 1, count[1] + length) if count else (1, length)
+                pos = stop
+            elif key == 0x48:  # need_ack
+                value, pos = read_varint(buf, pos)
+                response.need_ack = value != 0
+            elif key == 0x2a:  # internal_ext
+                length, pos = read_varint(buf, pos)
+                response.internal_ext = str(buf[pos:pos + length], 'utf-8', 'replace')
+                pos += length
+            elif key == 0x40:  # heartbeat_duration
+                response.heartbeat_duration, pos = read_varint(buf, pos)
+            elif key == 0x18:  # fetch_interval
+                response.fetch_interval, pos = read_varint(buf, pos)
+            else:
+                pos = skip_field(buf, pos, key & 7)
+        if pos > end:
+            _truncated('WebcastImResponse', pos, end)
+
+        if skipped:
+            response.unhandled = self._count(skipped)
+        return response
+
+    def _count(self, skipped: dict) -> list:
+        """累加跳过计数，返回第一次出现的 method"""
+        new = []
+        with self._lock:
+            for method, (count, size) in skipped.items():
+                total = self._skipped.get(method)
+                if total:
+                    self._skipped[method] = (total[0] + count, total[1] + size)
+                else:
+                    self._skipped[method] = (count, size)
+                    new.append(method)
+        return new
+
+    def stats(self) -> dict:
+        """按 method 统计跳过的消息: {method: {'messages': n, 'bytes': n}}"""
+        with self._lock:
+            return {
+                method: {'messages': count, 'bytes': size}
+                for method, (count, size) in sorted(self._skipped.items(), key=lambda item: -item[1][1])
+            }
+
+
+def _scan_message(buf, pos: int, end: int):
+    """在 Message 内只取 method 与 payload，其余字段跳过"""
+    method = ''
+    payload = buf[pos:pos]
+    while pos < end:
+        key = buf[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = read_varint(buf, pos)
+        if key == 0x0a:
+            length, pos = read_varint(buf, pos)
+            method = sys.intern(str(buf[pos:pos + length], 'utf-8', 'replace'))
+            pos += length
+        elif key == 0x12:
+            length, pos = read_varint(buf, pos)
+            payload = buf[pos:pos + length]
+            pos += length
+        else:
+            pos = skip_field(buf, pos, key & 7)
+    if pos > end:
+        _truncated('WebcastImMessage', pos, end)
+    return method, payload